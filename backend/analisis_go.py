@@ -0,0 +1,104 @@
+"""
+Pipeline completo del Analizador de Código Go
+Ejecuta las tres fases (léxica, sintáctica y semántica) sobre un mismo código
+y construye la respuesta con el formato que consume el frontend.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from lexico_go import analyze_code_string, get_lexer
+from sintactico_go import analyze_syntax_string
+from semantico_go import analyze_semantic_string
+
+
+def analyze_full_string(code_string):
+    """
+    Ejecuta las tres fases de análisis sobre el código recibido.
+    Devuelve el diccionario de respuesta usado por los endpoints de la API.
+    """
+    lexico_result = analyze_code_string(code_string)
+    sintactico_result = analyze_syntax_string(code_string)
+    semantico_result = analyze_semantic_string(code_string)
+    return build_response(lexico_result, sintactico_result, semantico_result)
+
+
+def build_response(lexico_result, sintactico_result, semantico_result):
+    """Combina los resultados de cada fase en el formato de respuesta de la API."""
+    return {
+        'lexico': {
+            'tokens': lexico_result['tokens'],
+            'errores': lexico_result['errors']
+        },
+        'sintactico': {
+            'errores': sintactico_result['errors']
+        },
+        'semantico': {
+            'errores': semantico_result['errors'],
+            'tabla_simbolos': semantico_result['symbol_table']
+        }
+    }
+
+
+class CacheResultados:
+    """
+    Caché LRU de respuestas completas indexada por el hash del código.
+    El editor reenvía muchas veces el mismo código (por ejemplo al cambiar de pestaña),
+    así que repetir el análisis es trabajo perdido.
+    Con copiar=False guarda y devuelve los objetos tal cual (posiciones_go guarda así
+    sus índices, que nadie modifica).
+    """
+
+    def __init__(self, tamano, copiar=True):
+        self.tamano = tamano
+        self.copiar = copiar
+        self.entradas = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(code_string):
+        return hashlib.sha256(code_string.encode('utf-8')).hexdigest()
+
+    def get(self, clave):
+        """Devuelve una copia superficial (los endpoints añaden claves a la respuesta) o None."""
+        with self.lock:
+            resultado = self.entradas.get(clave)
+            if resultado is None:
+                return None
+            self.entradas.move_to_end(clave)
+            return dict(resultado) if self.copiar else resultado
+
+    def put(self, clave, resultado):
+        if self.tamano <= 0:
+            return
+        with self.lock:
+            self.entradas[clave] = dict(resultado) if self.copiar else resultado
+            self.entradas.move_to_end(clave)
+            while len(self.entradas) > self.tamano:
+                self.entradas.popitem(last=False)
+
+
+cache_resultados = CacheResultados(int(os.environ.get('ANALYZER_CACHE_TAMANO', '128')))
+
+# Los analizadores guardan el estado del análisis en curso en variables de módulo, así
+# que los análisis que se hacen en este proceso (el servidor LSP y las sesiones en vivo)
+# se ejecutan de a uno
+analisis_lock = threading.Lock()
+
+
+def warm_up():
+    """
+    Construye el lexer y las tablas de ambos parsers en el proceso actual.
+    El servidor de producción lo llama en el proceso maestro antes de crear los
+    workers, que así comparten estas estructuras por copy-on-write.
+    """
+    import sintactico_go
+    import semantico_go
+    get_lexer()
+    return sintactico_go.get_parser(), semantico_go.get_parser()
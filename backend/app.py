@@ -3,19 +3,124 @@ Backend Flask para el analizador de código GO
 '''
 
 '''Importaciones básicas para el uso de flask'''
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response, g
 from flask_cors import CORS
 import os
+import time
+import uuid
 
 ''' Importamos la función necesaria para el análisis de código '''
-from lexico_go import analyze_code_string
-from sintactico_go import analyze_syntax_string
-from semantico_go import analyze_semantic_string
+from lote_go import extract_sources, analyze_batch, LoteInvalido
+from trabajos_go import get_queue, ColaLlena, ColaNoDisponible, UMBRAL_SINCRONO
+from limites_go import analyze_with_budget, analyze_positions, analyze_sources_with_budget, PoolSaturado, FASES
+from analisis_go import cache_resultados
+from posiciones_go import cache_posiciones
+from sesiones_go import sesiones, RevisionInvalida, SesionDemasiadoGrande, SesionNoEncontrada
+from cancelacion_go import Cancelacion, editores, MOTIVOS as MOTIVOS_CANCELACION
+from metricas_go import registro, render as render_metrics
+from instrumentacion_go import Medicion
+from bitacora_go import get_logger, log_request
+from perfiles_go import should_profile, save_profile, summarize_profiles, PERFIL_CABECERA, PERFIL_MUESTREO
 
 ''' Creamos la aplicación flask con soporte para servir frontend '''
 app = Flask(__name__, static_folder='../frontend/dist', static_url_path='')
 CORS(app)
 
+'''Medición de la petición; con ?timings=1 la respuesta incluye el bloque "timings" y con ?memoria=1 el bloque "memoria"'''
+def new_medicion():
+    return Medicion(
+        detalle=request.args.get('timings', '').lower() in ('1', 'true'),
+        perfilar=should_profile(request.headers.get('X-Analyzer-Profile', '').lower()),
+        memoria=request.args.get('memoria', '').lower() in ('1', 'true')
+    )
+
+'''Serializa la respuesta a JSON midiendo el tiempo de la fase de serialización'''
+def serialize(data, medicion=None):
+    if medicion is not None and medicion.detalle:
+        data['timings'] = medicion.to_dict()
+    if medicion is not None and medicion.memoria:
+        data['memoria'] = medicion.memoria_fases
+    inicio = time.perf_counter()
+    response = jsonify(data)
+    duracion = time.perf_counter() - inicio
+    registro.observe('analyzer_phase_seconds', duracion, phase='serializacion')
+    if medicion is not None:
+        medicion.add('serializacion', duracion)
+        response.headers['Server-Timing'] = medicion.server_timing()
+        if medicion.perfil is not None:
+            response.headers['X-Analyzer-Profile-Id'] = save_profile(medicion.perfil, g.request_id)
+    return response
+
+'''Asigna a cada petición un identificador (o respeta el X-Request-ID del cliente)'''
+@app.before_request
+def start_request():
+    g.inicio = time.perf_counter()
+    g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+
+'''Cuenta las peticiones a la API por endpoint y código de estado y las registra en la bitácora'''
+@app.after_request
+def count_request(response):
+    if request.path.startswith('/api/'):
+        endpoint = request.url_rule.rule if request.url_rule else 'desconocido'
+        registro.inc('analyzer_requests_total', endpoint=endpoint, status=str(response.status_code))
+        response.headers['X-Request-ID'] = g.request_id
+
+        duracion = time.perf_counter() - g.inicio
+        campos = {
+            'request_id': g.request_id,
+            'metodo': request.method,
+            'endpoint': endpoint,
+            'status': response.status_code,
+            'resultado': request_outcome(response.status_code),
+            'duracion_ms': round(duracion * 1000, 3),
+        }
+        if 'code' in g:
+            campos['code'] = g.code
+        if 'medicion' in g:
+            campos['cache'] = g.medicion.cache
+            campos['fases_ms'] = {fase: round(segundos * 1000, 3) for fase, segundos in g.medicion.fases.items()}
+        log_request(campos, campos['resultado'] == 'ok', duracion)
+    return response
+
+'''Resultado de la petición para la bitácora'''
+def request_outcome(status):
+    if g.get('cancelado'):
+        return 'cancelado'
+    if g.get('incompleto'):
+        return 'incompleto'
+    if status in (429, 503):
+        return 'rechazado'
+    if status >= 500:
+        return 'error'
+    if status >= 400:
+        return 'invalido'
+    return 'ok'
+
+'''Respuesta común cuando todos los workers aislados están ocupados'''
+def pool_saturado_response(error):
+    response = jsonify({'error': str(error)})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
+'''
+Analiza el código de la petición con una cancelación que se activa si el cliente cierra
+la conexión o si llega otra petición con el mismo X-Editor-ID (el editor sólo espera la última)
+'''
+def analyze_cancellable(code, medicion):
+    conexion = request.environ.get('gunicorn.socket') or request.environ.get('werkzeug.socket')
+    with editores.track(request.headers.get('X-Editor-ID'), Cancelacion(conexion)) as cancelacion:
+        response = analyze_with_budget(code, medicion=medicion, cancelacion=cancelacion)
+    g.incompleto = 'incompleto' in response
+    if g.incompleto and response['incompleto']['motivo'] in MOTIVOS_CANCELACION:
+        g.cancelado = response['incompleto']['motivo']
+    return response
+
+'''Respuesta de un análisis cancelado: 409 si lo reemplazó otra petición, 499 si el cliente se desconectó'''
+def cancelled_response(response):
+    incompleto = response['incompleto']
+    status = 409 if incompleto['motivo'] == 'reemplazada' else 499
+    return jsonify({'error': f"Análisis cancelado: {incompleto['mensaje']}", 'cancelado': incompleto['motivo']}), status
+
 '''Ruta principal - Sirve el frontend'''
 @app.route('/')
 def serve_frontend():
@@ -50,31 +155,20 @@ def analyze_code():
         if not code or not code.strip():
             return jsonify({'error': 'El código proporcionado está vacío'}), 400
         
-        print(f"\n{'='*50}")
-        print("Analizando código desde editor...")
-        print(f"{'='*50}")
-
-        lexico_result = analyze_code_string(code)
-        sintactico_result = analyze_syntax_string(code)
-        semantico_result = analyze_semantic_string(code)
-
         "Construyo las respuestas"
-        response = {
-            'lexico': {
-                'tokens': lexico_result['tokens'],
-                'errores': lexico_result['errors']
-            },
-            'sintactico': {
-                'errores': sintactico_result['errors']
-            },
-            'semantico': {
-                'errores': semantico_result['errors'],
-                'tabla_simbolos': semantico_result['symbol_table']
-            }
-        }
-        return jsonify(response), 200
+        g.code = code
+        g.medicion = medicion = new_medicion()
+        response = analyze_cancellable(code, medicion)
+        if g.get('cancelado'):
+            return cancelled_response(response)
+        if not g.incompleto:
+            # Con esta clave el editor consulta posiciones (/api/hover...) sin reenviar el código
+            response['clave'] = cache_resultados.key(code)
+        return serialize(response, medicion), 200
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
     except Exception as e:
-        print(f"Error en analyze_code: {str(e)}")
+        get_logger().exception('Error en analyze_code', extra={'campos': {'request_id': g.request_id}})
         return jsonify({'error': str(e)}), 500
 
 "Creación del endpoint para analizar los archivos subidos por el usuario"
@@ -96,39 +190,305 @@ def analyze_file():
             }), 400
         code = file.read().decode('utf-8')
                 
-        lexico_result = analyze_code_string(code)
-        sintactico_result = analyze_syntax_string(code)
-        semantico_result = analyze_semantic_string(code)
+        g.code = code
+        g.medicion = medicion = new_medicion()
+        response = analyze_cancellable(code, medicion)
+        if g.get('cancelado'):
+            return cancelled_response(response)
+        if not g.incompleto:
+            response['clave'] = cache_resultados.key(code)
+        response['filename'] = file.filename
+        response['code'] = code
         
-        response = {
-            'lexico': {
-                'tokens': lexico_result['tokens'],
-                'errores': lexico_result['errors']
-            },
-            'sintactico': {
-                'errores': sintactico_result['errors']
-            },
-            'semantico': {
-                'errores': semantico_result['errors'],
-                'tabla_simbolos': semantico_result['symbol_table']
-            },
-            'filename': file.filename,
-            'code': code  
-        }
-        
-        return jsonify(response), 200
+        return serialize(response, medicion), 200
     
     except UnicodeDecodeError:
         return jsonify({
             'error': 'El archivo no está en formato UTF-8 válido'
         }), 400
     
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except Exception as e:
+        get_logger().exception('Error en analyze_file', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+'''Endpoint para analizar varios archivos .go (o un .zip con un proyecto) en una sola petición'''
+@app.route('/api/analyze-batch', methods=['POST'])
+def analyze_batch_files():
+    try:
+        files = request.files.getlist('files') + request.files.getlist('file')
+        if not files:
+            return jsonify({
+                'error': 'No se subió ningún archivo'
+            }), 400
+        uploads = [(file.filename, file.read()) for file in files if file.filename]
+        if not uploads:
+            return jsonify({
+                'error': 'Archivo sin nombre'
+            }), 400
+
+        sources = extract_sources(uploads)
+        if not sources:
+            return jsonify({
+                'error': 'El lote no contiene archivos .go'
+            }), 400
+
+        g.medicion = medicion = new_medicion()
+        return serialize(analyze_batch(sources, medicion), medicion), 200
+
+    except LoteInvalido as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
     except Exception as e:
-        print(f"Error en analyze_file: {str(e)}")
+        get_logger().exception('Error en analyze_batch', extra={'campos': {'request_id': g.request_id}})
         return jsonify({
             'error': f'Error interno del servidor: {str(e)}'
         }), 500
 
+'''Endpoint para analizar como paquetes los archivos de cada directorio (índice global compartido entre archivos)'''
+@app.route('/api/analyze-package', methods=['POST'])
+def analyze_package_files():
+    try:
+        files = request.files.getlist('files') + request.files.getlist('file')
+        uploads = [(file.filename, file.read()) for file in files if file.filename]
+        if not uploads:
+            return jsonify({
+                'error': 'No se subió ningún archivo'
+            }), 400
+
+        sources = extract_sources(uploads)
+        if not sources:
+            return jsonify({
+                'error': 'El lote no contiene archivos .go'
+            }), 400
+
+        g.medicion = medicion = new_medicion()
+        return serialize(analyze_sources_with_budget(sources, medicion), medicion), 200
+
+    except LoteInvalido as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except Exception as e:
+        get_logger().exception('Error en analyze_package', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+'''
+Consulta por posición sobre el análisis guardado de un código: el cuerpo lleva line y
+column (desde 1) y la clave que devolvió /api/analyze o, si ya no está guardado, el código
+'''
+def position_query(consulta):
+    try:
+        data = request.get_json(silent=True)
+        if not data or not isinstance(data.get('line'), int) or not isinstance(data.get('column'), int):
+            return jsonify({'error': 'Se requieren line y column (enteros, desde 1)'}), 400
+
+        indice = cache_posiciones.get(data['clave']) if data.get('clave') else None
+        if indice is None and data.get('code'):
+            g.code = data['code']
+            indice = analyze_positions(data['code'])
+        if indice is None:
+            return jsonify({'error': 'No hay un análisis guardado para esa clave; envía el código'}), 404
+
+        return jsonify(consulta(indice, data['line'], data['column'])), 200
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except Exception as e:
+        get_logger().exception('Error en position_query', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({'error': str(e)}), 500
+
+'''Nombre y símbolo en una posición del código (tipo, ámbito, firma y su declaración)'''
+@app.route('/api/hover', methods=['POST'])
+def hover():
+    return position_query(lambda indice, linea, columna: {'simbolo': indice.hover(linea, columna)})
+
+'''Sitio donde se declara el nombre que está en una posición'''
+@app.route('/api/definition', methods=['POST'])
+def definition():
+    return position_query(lambda indice, linea, columna: {'definicion': indice.definition(linea, columna)})
+
+'''Todos los sitios (declaración y usos) del símbolo que está en una posición'''
+@app.route('/api/references', methods=['POST'])
+def references():
+    return position_query(lambda indice, linea, columna: {'referencias': indice.references(linea, columna)})
+
+'''Abre una sesión de análisis en vivo: responde el análisis completo del código y el id de la sesión'''
+@app.route('/api/sessions', methods=['POST'])
+def open_session():
+    try:
+        data = request.get_json(silent=True)
+        if not data or not isinstance(data.get('code'), str):
+            return jsonify({'error': 'No se proporcionó ningún código'}), 400
+        g.code = data['code']
+        _, response = sesiones.open(data['code'])
+        return serialize(response), 201
+
+    except SesionDemasiadoGrande as e:
+        return jsonify({'error': str(e)}), 413
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except Exception as e:
+        get_logger().exception('Error en open_session', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({'error': str(e)}), 500
+
+'''
+Aplica una revisión a la sesión: el cuerpo lleva revision y los cambios sobre la revisión
+anterior ({desde, hasta, texto} en unidades UTF-16) o el código completo. Responde sólo
+los tramos de tokens, errores y símbolos que cambiaron desde la última revisión enviada
+'''
+@app.route('/api/sessions/<sesion_id>/edits', methods=['POST'])
+def edit_session(sesion_id):
+    try:
+        sesion = sesiones.get(sesion_id)
+        if sesion is None:
+            return jsonify({'error': 'Sesión no encontrada o expirada; abre otra'}), 404
+        data = request.get_json(silent=True)
+        if not data or not isinstance(data.get('revision'), int):
+            return jsonify({'error': 'Se requiere revision (entero)'}), 400
+        cambios, code = data.get('cambios'), data.get('code')
+        if code is None and not isinstance(cambios, list):
+            return jsonify({'error': 'Se requieren cambios o code'}), 400
+
+        sesion.apply(data['revision'], cambios, code)
+        response = sesion.analyze(data['revision'])
+        if response is None:
+            # Ya llegó una revisión más nueva: su respuesta trae también estos cambios
+            return jsonify({'revision': data['revision'], 'reemplazada': True}), 200
+        return serialize(response), 200
+
+    except SesionNoEncontrada:
+        return jsonify({'error': 'Sesión no encontrada o expirada; abre otra'}), 404
+
+    except RevisionInvalida as e:
+        return jsonify({'error': str(e), 'revision': e.revision}), 409
+
+    except SesionDemasiadoGrande as e:
+        return jsonify({'error': str(e)}), 413
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except (KeyError, TypeError):
+        return jsonify({'error': 'Cada cambio requiere desde, hasta (enteros) y texto'}), 400
+
+    except Exception as e:
+        get_logger().exception('Error en edit_session', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({'error': str(e)}), 500
+
+'''Cierra una sesión de análisis en vivo'''
+@app.route('/api/sessions/<sesion_id>', methods=['DELETE'])
+def close_session(sesion_id):
+    if not sesiones.close(sesion_id):
+        return jsonify({'error': 'Sesión no encontrada o expirada'}), 404
+    return '', 204
+
+'''Endpoint para enviar un análisis asíncrono; devuelve el id del trabajo a consultar'''
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    try:
+        filename = None
+        if 'file' in request.files:
+            file = request.files['file']
+            if not file.filename.endswith('.go'):
+                return jsonify({
+                    'error': 'El archivo debe tener extensión .go'
+                }), 400
+            filename = file.filename
+            code = file.read().decode('utf-8')
+        else:
+            data = request.get_json(silent=True)
+            if not data or 'code' not in data:
+                return jsonify({'error': 'No se proporcionó ningún código'}), 400
+            code = data['code']
+
+        if not code or not code.strip():
+            return jsonify({'error': 'El código proporcionado está vacío'}), 400
+        g.code = code
+
+        # Las entradas pequeñas se analizan directamente, sin pasar por la cola
+        if len(code) < UMBRAL_SINCRONO:
+            resultado = analyze_with_budget(code)
+            if filename:
+                resultado['filename'] = filename
+                resultado['code'] = code
+            return serialize({
+                'estado': 'incompleto' if 'incompleto' in resultado else 'completado',
+                'progreso': {nombre: 'completado' for nombre, _ in FASES},
+                'resultado': resultado
+            }), 200
+
+        trabajo = get_queue().submit(code, filename)
+        response = jsonify(trabajo.to_dict())
+        response.headers['Location'] = f'/api/jobs/{trabajo.id}'
+        return response, 202
+
+    except ColaLlena as e:
+        response = jsonify({'error': str(e)})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
+
+    except ColaNoDisponible as e:
+        response = jsonify({'error': str(e)})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+
+    except PoolSaturado as e:
+        return pool_saturado_response(e)
+
+    except UnicodeDecodeError:
+        return jsonify({
+            'error': 'El archivo no está en formato UTF-8 válido'
+        }), 400
+
+    except Exception as e:
+        get_logger().exception('Error en submit_job', extra={'campos': {'request_id': g.request_id}})
+        return jsonify({
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+'''Endpoint para consultar el estado, el progreso por fase y el resultado de un trabajo'''
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    trabajo = get_queue().get(job_id)
+    if trabajo is None:
+        return jsonify({'error': 'Trabajo no encontrado'}), 404
+    return jsonify(trabajo), 200
+
+'''Endpoint con las funciones más costosas de los perfiles guardados (sólo con el perfilado activo)'''
+@app.route('/api/profiles', methods=['GET'])
+def profiles_summary():
+    if not PERFIL_CABECERA and PERFIL_MUESTREO <= 0:
+        return jsonify({'error': 'El perfilado no está habilitado'}), 404
+    orden = request.args.get('orden', 'tottime')
+    if orden not in ('tottime', 'cumtime'):
+        return jsonify({'error': "El orden debe ser 'tottime' o 'cumtime'"}), 400
+    top = request.args.get('top', 20, type=int)
+    return jsonify(summarize_profiles(top=top, orden=orden, filtro=request.args.get('filtro'))), 200
+
+'''Endpoint de métricas en formato de texto de Prometheus'''
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
 '''Endpoint de health check para verificar que el servidor está funcionando'''
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -0,0 +1,14 @@
+"""
+Benchmarks del Analizador de Código Go
+- corpus: generador reproducible de programas Go sintéticos (válidos e inválidos)
+- runner: mide rendimiento y memoria pico de cada fase y compara con una línea base
+- carga: prueba de carga HTTP de los endpoints
+- complejidad: comprueba que ninguna fase crezca más rápido que una cota con entradas adversarias
+- arranque: mide el tiempo de arranque de app.py y de cada CLI frente a su presupuesto
+- incremental: compara el re-análisis incremental (sintáctico, semántico y de paquetes) con el completo tras ediciones típicas
+Uso: python -m benchmarks --help (desde la carpeta backend)
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
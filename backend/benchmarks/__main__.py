@@ -0,0 +1,82 @@
+"""
+Punto de entrada de los benchmarks: python -m benchmarks (desde la carpeta backend)
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.runner import run_benchmarks, build_report, compare, load_report, save_report
+
+BASE_POR_DEFECTO = os.path.join(os.path.dirname(__file__), 'base.json')
+
+
+def _print_row(caso, fase, medida):
+    pico = f"{medida['pico_bytes'] / 1024:>10.0f}" if 'pico_bytes' in medida else f"{'-':>10}"
+    print(f"{caso:24} {fase:11} {medida['segundos'] * 1000:>10.2f} "
+          f"{medida['bytes_por_segundo'] / 1024:>10.0f} {medida['tokens_por_segundo']:>12.0f} {pico}")
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Benchmarks del analizador sobre el corpus sintético.')
+    argumentos.add_argument('--escala', type=float, default=1.0, help='multiplica el tamaño de cada programa')
+    argumentos.add_argument('--semilla', type=int, default=0)
+    argumentos.add_argument('--repeticiones', type=int, default=3)
+    argumentos.add_argument('--casos', nargs='*', help='sólo estos casos (por ejemplo funciones lineas_invalido)')
+    argumentos.add_argument('--solo-validos', action='store_true', help='omite las variantes inválidas')
+    argumentos.add_argument('--sin-memoria', action='store_true', help='no mide la memoria pico')
+    argumentos.add_argument('--base', default=BASE_POR_DEFECTO, help='archivo de la línea base')
+    argumentos.add_argument('--guardar-base', action='store_true', help='guarda los resultados como nueva línea base')
+    argumentos.add_argument('--salida', help='guarda los resultados en este archivo JSON')
+    argumentos.add_argument('--umbral', type=float, default=0.2,
+                            help='caída de rendimiento tolerada (0.2 = 20%%)')
+    argumentos.add_argument('--umbral-memoria', type=float, default=0.2,
+                            help='aumento de memoria pico tolerado (0.2 = 20%%)')
+    opciones = argumentos.parse_args()
+
+    corpus = generate_corpus(opciones.escala, opciones.semilla, invalidos=not opciones.solo_validos)
+    if opciones.casos:
+        desconocidos = set(opciones.casos) - set(corpus)
+        if desconocidos:
+            print(f"Casos desconocidos: {', '.join(sorted(desconocidos))}. Disponibles: {', '.join(corpus)}")
+            return 2
+        corpus = {caso: corpus[caso] for caso in opciones.casos}
+
+    print(f"{'Caso':24} {'Fase':11} {'ms':>10} {'KB/s':>10} {'tokens/s':>12} {'pico KB':>10}")
+    print('=' * 82)
+    resultados = run_benchmarks(corpus, opciones.repeticiones, not opciones.sin_memoria, progreso=_print_row)
+    reporte = build_report(resultados, opciones.escala, opciones.repeticiones)
+
+    if opciones.salida:
+        save_report(reporte, opciones.salida)
+    if opciones.guardar_base:
+        save_report(reporte, opciones.base)
+        print(f"\nLínea base guardada en {opciones.base}")
+        return 0
+
+    if not os.path.exists(opciones.base):
+        print(f"\nNo hay línea base en {opciones.base}; usa --guardar-base para crearla.")
+        return 0
+    base = load_report(opciones.base)
+    if base.get('escala') != opciones.escala:
+        print(f"\nLa línea base se midió con escala {base.get('escala')}; no se compara.")
+        return 2
+
+    regresiones = compare(reporte, base, opciones.umbral, opciones.umbral_memoria)
+    if not regresiones:
+        print(f"\nSin regresiones respecto a la línea base del {base['fecha']}.")
+        return 0
+    print(f"\n{len(regresiones)} regresión(es) respecto a la línea base del {base['fecha']}:")
+    for regresion in regresiones:
+        print(f"  {regresion['caso']:24} {regresion['fase']:11} {regresion['metrica']:18} "
+              f"{regresion['base']:>14} -> {regresion['actual']:>14} ({regresion['cambio']:+.1%})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark de arranque del Analizador de Código Go
+Mide, en procesos nuevos, cuánto tarda en importarse app.py y en ejecutarse cada
+CLI de una fase sobre un archivo pequeño, y lo compara con un presupuesto.
+Uso: python -m benchmarks.arranque (desde la carpeta backend); termina con código 1
+si algún comando supera su presupuesto.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EJEMPLO = os.path.join(BACKEND_DIR, 'algoritmo1.go')
+
+# Comando: (argumentos de Python, presupuesto en segundos)
+COMANDOS = {
+    'import app': (['-c', 'import app'], 0.6),
+    'lexico_go.py': ([os.path.join(BACKEND_DIR, 'lexico_go.py'), EJEMPLO], 0.3),
+    'sintactico_go.py': ([os.path.join(BACKEND_DIR, 'sintactico_go.py'), EJEMPLO], 0.4),
+    'semantico_go.py': ([os.path.join(BACKEND_DIR, 'semantico_go.py'), EJEMPLO], 0.4),
+}
+
+
+def _run(argumentos, directorio):
+    # Los CLI escriben su log en ./logs, por eso corren en un directorio temporal
+    entorno = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    inicio = time.perf_counter()
+    resultado = subprocess.run([sys.executable] + argumentos, cwd=directorio, env=entorno,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    duracion = time.perf_counter() - inicio
+    if resultado.returncode != 0:
+        raise RuntimeError(f"'{' '.join(argumentos)}' terminó con código {resultado.returncode}:\n{resultado.stderr}")
+    return duracion, resultado.stderr
+
+
+def measure_startup(argumentos, repeticiones=5):
+    """Mejor tiempo de varias ejecuciones en procesos nuevos (tras una de calentamiento)."""
+    with tempfile.TemporaryDirectory() as directorio:
+        # El calentamiento genera los .pyc y, si la gramática cambió, las tablas de los parsers
+        _, avisos = _run(argumentos, directorio)
+        mejor = min(_run(argumentos, directorio)[0] for _ in range(repeticiones))
+    return mejor, 'Generating LALR tables' in avisos
+
+
+def import_breakdown(modulo='app', top=10):
+    """Módulos que más tardan en importarse (tiempo acumulado de python -X importtime)."""
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'], cwd=BACKEND_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    filas = []
+    for linea in resultado.stderr.splitlines():
+        coincidencia = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)', linea)
+        if coincidencia:
+            filas.append((int(coincidencia.group(2)), coincidencia.group(4)))
+    return sorted(filas, reverse=True)[:top]
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Mide el tiempo de arranque frente a su presupuesto.')
+    argumentos.add_argument('--repeticiones', type=int, default=5)
+    argumentos.add_argument('--factor', type=float, default=1.0,
+                            help='multiplica los presupuestos (por ejemplo 2 en máquinas lentas)')
+    argumentos.add_argument('--detalle', action='store_true', help='muestra los módulos más lentos de importar app')
+    opciones = argumentos.parse_args()
+
+    print(f"{'Comando':20} {'ms':>10} {'presupuesto':>12}")
+    print('=' * 44)
+    excedidos = []
+    for nombre, (comando, presupuesto) in COMANDOS.items():
+        presupuesto *= opciones.factor
+        segundos, regenero = measure_startup(comando, opciones.repeticiones)
+        marca = '' if segundos <= presupuesto else '  EXCEDIDO'
+        print(f"{nombre:20} {segundos * 1000:>10.1f} {presupuesto * 1000:>12.0f}{marca}")
+        if regenero:
+            print(f"  (las tablas de los parsers se regeneraron al calentar {nombre}; conviene versionarlas)")
+        if marca:
+            excedidos.append(nombre)
+
+    if opciones.detalle:
+        print(f"\n{'Módulo':40} {'ms acumulados':>14}")
+        for microsegundos, modulo in import_breakdown():
+            print(f"{modulo:40} {microsegundos / 1000:>14.1f}")
+
+    if excedidos:
+        print(f"\n{len(excedidos)} comando(s) superan su presupuesto: {', '.join(excedidos)}")
+        return 1
+    print('\nTodos los comandos arrancan dentro de su presupuesto.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Prueba de carga HTTP del Analizador de Código Go
+Levanta el servidor localmente (o usa uno ya iniciado con --url), envía
+peticiones concurrentes a /api/analyze y /api/analyze-file con una mezcla de
+programas del corpus y reporta latencias p50/p95/p99, rendimiento y tasa de
+errores. Cada respuesta se compara con el análisis local del mismo código, para
+detectar resultados mezclados entre peticiones concurrentes.
+Uso: python -m benchmarks.carga --concurrencia 8 --duracion 20 (desde la carpeta backend)
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+from benchmarks.corpus import generate_corpus
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FASES = ('lexico', 'sintactico', 'semantico')
+
+
+# ============================================================================
+# Servidor local
+# ============================================================================
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(modo, puerto, workers):
+    """
+    Inicia el servidor en un grupo de procesos propio.
+    modo 'desarrollo' usa el servidor de Flask de app.py (sin el recargador);
+    modo 'produccion' usa gunicorn con gunicorn.conf.py.
+    """
+    entorno = dict(os.environ, ANALYZER_LOG_MUESTREO=os.environ.get('ANALYZER_LOG_MUESTREO', '0'))
+    if modo == 'produccion':
+        entorno['ANALYZER_BIND'] = f'127.0.0.1:{puerto}'
+        entorno['ANALYZER_WORKERS'] = str(workers)
+        comando = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app']
+    else:
+        comando = [sys.executable, '-c',
+                   f"from app import app; app.run(host='127.0.0.1', port={puerto}, threaded=True)"]
+    return subprocess.Popen(comando, cwd=BACKEND_DIR, env=entorno, start_new_session=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_ready(url, proceso, timeout=60):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if proceso is not None and proceso.poll() is not None:
+            raise RuntimeError('El servidor terminó antes de estar listo')
+        try:
+            with urllib.request.urlopen(f'{url}/api/health', timeout=2) as respuesta:
+                if respuesta.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'El servidor no respondió en {timeout} s')
+
+
+def stop_server(proceso):
+    try:
+        os.killpg(proceso.pid, signal.SIGTERM)
+        proceso.wait(timeout=15)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(proceso.pid, signal.SIGKILL)
+
+
+# ============================================================================
+# Peticiones
+# ============================================================================
+
+def _post_json(url, code, timeout):
+    cuerpo = json.dumps({'code': code}).encode('utf-8')
+    peticion = urllib.request.Request(f'{url}/api/analyze', data=cuerpo,
+                                      headers={'Content-Type': 'application/json'})
+    return urllib.request.urlopen(peticion, timeout=timeout)
+
+
+def _post_file(url, nombre, code, timeout):
+    limite = uuid.uuid4().hex
+    cuerpo = (f'--{limite}\r\nContent-Disposition: form-data; name="file"; filename="{nombre}"\r\n'
+              f'Content-Type: text/plain\r\n\r\n').encode('utf-8') + code.encode('utf-8') + \
+        f'\r\n--{limite}--\r\n'.encode('utf-8')
+    peticion = urllib.request.Request(f'{url}/api/analyze-file', data=cuerpo,
+                                      headers={'Content-Type': f'multipart/form-data; boundary={limite}'})
+    return urllib.request.urlopen(peticion, timeout=timeout)
+
+
+def _expected(code):
+    """Resultado esperado de las tres fases, calculado localmente y normalizado como JSON."""
+    from analisis_go import analyze_full_string
+    return json.loads(json.dumps(analyze_full_string(code)))
+
+
+def load_inputs(escala):
+    """Mezcla de entradas: los algoritmos de ejemplo y el corpus sintético, con su resultado esperado."""
+    entradas = []
+    for ruta in sorted(glob.glob(os.path.join(BACKEND_DIR, 'algoritmo*.go'))):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            entradas.append((os.path.basename(ruta), archivo.read()))
+    for nombre, code in generate_corpus(escala).items():
+        entradas.append((f'{nombre}.go', code))
+    return [(nombre, code, _expected(code)) for nombre, code in entradas]
+
+
+class Resultados:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencias = {}
+        self.errores = {}
+        self.mezclados = []
+
+    def add(self, endpoint, latencia, error=None, mezclado=None):
+        with self.lock:
+            self.latencias.setdefault(endpoint, []).append(latencia)
+            if error is not None:
+                self.errores[error] = self.errores.get(error, 0) + 1
+            if mezclado is not None:
+                self.mezclados.append(mezclado)
+
+
+def _client(url, entradas, proporcion_archivos, fin, resultados, contador, unicos, timeout, semilla):
+    rng = random.Random(semilla)
+    while time.monotonic() < fin:
+        nombre, code, esperado = rng.choice(entradas)
+        n = next(contador)
+        # Un comentario final único evita la caché sin cambiar líneas, tokens ni errores
+        enviado = f'{code}\n// carga {n}\n' if unicos else code
+        por_archivo = rng.random() < proporcion_archivos
+        endpoint = '/api/analyze-file' if por_archivo else '/api/analyze'
+        inicio = time.perf_counter()
+        try:
+            if por_archivo:
+                respuesta = _post_file(url, nombre, enviado, timeout)
+            else:
+                respuesta = _post_json(url, enviado, timeout)
+            with respuesta:
+                datos = json.loads(respuesta.read())
+            latencia = time.perf_counter() - inicio
+        except urllib.error.HTTPError as e:
+            resultados.add(endpoint, time.perf_counter() - inicio, error=f'HTTP {e.code}')
+            continue
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            resultados.add(endpoint, time.perf_counter() - inicio, error=type(e).__name__)
+            continue
+
+        distintas = [fase for fase in FASES if datos.get(fase) != esperado[fase]]
+        if por_archivo and datos.get('filename') != nombre:
+            distintas.append('filename')
+        resultados.add(endpoint, latencia, mezclado={'entrada': nombre, 'fases': distintas} if distintas else None)
+
+
+def percentile(valores, p):
+    """Percentil por rango más cercano."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, int(round(p / 100 * len(ordenados) + 0.5)) - 1))
+    return ordenados[indice]
+
+
+def run_load(url, entradas, concurrencia, duracion, proporcion_archivos=0.3, unicos=True, timeout=60):
+    resultados = Resultados()
+    contador = itertools.count()
+    fin = time.monotonic() + duracion
+    inicio = time.perf_counter()
+    hilos = [threading.Thread(target=_client, args=(url, entradas, proporcion_archivos, fin, resultados,
+                                                    contador, unicos, timeout, i), daemon=True)
+             for i in range(concurrencia)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    transcurrido = time.perf_counter() - inicio
+
+    todas = [latencia for latencias in resultados.latencias.values() for latencia in latencias]
+    errores = sum(resultados.errores.values())
+    reporte = {
+        'concurrencia': concurrencia,
+        'duracion_s': round(transcurrido, 2),
+        'peticiones': len(todas),
+        'rendimiento_rps': round(len(todas) / transcurrido, 2) if transcurrido else 0,
+        'tasa_errores': round(errores / len(todas), 4) if todas else 0,
+        'errores': resultados.errores,
+        'mezclados': len(resultados.mezclados),
+        'ejemplos_mezclados': resultados.mezclados[:5],
+        'endpoints': {},
+    }
+    for endpoint, latencias in [('total', todas)] + sorted(resultados.latencias.items()):
+        reporte['endpoints'][endpoint] = {
+            'peticiones': len(latencias),
+            'p50_ms': round(percentile(latencias, 50) * 1000, 2),
+            'p95_ms': round(percentile(latencias, 95) * 1000, 2),
+            'p99_ms': round(percentile(latencias, 99) * 1000, 2),
+        }
+    return reporte
+
+
+def print_report(reporte):
+    print(f"\nConcurrencia: {reporte['concurrencia']}   Duración: {reporte['duracion_s']} s   "
+          f"Peticiones: {reporte['peticiones']}   Rendimiento: {reporte['rendimiento_rps']} req/s")
+    print(f"Tasa de errores: {reporte['tasa_errores']:.2%} {reporte['errores'] or ''}")
+    print(f"Resultados mezclados o incorrectos: {reporte['mezclados']}")
+    for ejemplo in reporte['ejemplos_mezclados']:
+        print(f"  {ejemplo['entrada']}: difiere en {', '.join(ejemplo['fases'])}")
+    print(f"\n{'Endpoint':22} {'Peticiones':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    print('=' * 66)
+    for endpoint, datos in reporte['endpoints'].items():
+        print(f"{endpoint:22} {datos['peticiones']:>10} {datos['p50_ms']:>10} {datos['p95_ms']:>10} {datos['p99_ms']:>10}")
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Prueba de carga HTTP del analizador.')
+    argumentos.add_argument('--url', help='servidor ya iniciado (por defecto se levanta uno local)')
+    argumentos.add_argument('--modo', choices=('desarrollo', 'produccion'), default='desarrollo')
+    argumentos.add_argument('--workers', type=int, default=2, help='workers de gunicorn en modo produccion')
+    argumentos.add_argument('--concurrencia', type=int, default=4)
+    argumentos.add_argument('--duracion', type=float, default=10, help='segundos')
+    argumentos.add_argument('--escala', type=float, default=0.1, help='tamaño de los programas del corpus')
+    argumentos.add_argument('--archivos', type=float, default=0.3,
+                            help='proporción de peticiones a /api/analyze-file')
+    argumentos.add_argument('--con-cache', action='store_true',
+                            help='repite el código exacto (mide aciertos de caché en lugar del análisis)')
+    argumentos.add_argument('--max-errores', type=float, default=0.0, help='tasa de errores tolerada')
+    argumentos.add_argument('--salida', help='guarda el reporte en este archivo JSON')
+    opciones = argumentos.parse_args()
+
+    entradas = load_inputs(opciones.escala)
+    proceso = None
+    url = opciones.url
+    if url is None:
+        puerto = _free_port()
+        url = f'http://127.0.0.1:{puerto}'
+        proceso = start_server(opciones.modo, puerto, opciones.workers)
+    try:
+        inicio = time.perf_counter()
+        wait_until_ready(url, proceso)
+        print(f'Servidor listo en {url} ({time.perf_counter() - inicio:.1f} s); {len(entradas)} entradas distintas')
+        reporte = run_load(url, entradas, opciones.concurrencia, opciones.duracion, opciones.archivos,
+                           not opciones.con_cache)
+    finally:
+        if proceso is not None:
+            stop_server(proceso)
+
+    print_report(reporte)
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+    if reporte['mezclados'] or reporte['tasa_errores'] > opciones.max_errores:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Guardia de complejidad del Analizador de Código Go
+Alimenta cada fase con entradas adversarias de tamaño creciente (bloques muy
+anidados, expresiones enormes, líneas de un millón de caracteres, rachas de
+caracteres ilegales y comentarios sin cerrar), ajusta el exponente k de
+tiempo ~ tamaño^k y falla si alguna fase crece más rápido que la cota.
+Uso: python -m benchmarks.complejidad (desde la carpeta backend); termina con
+código 1 si alguna fase supera la cota.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+from benchmarks.corpus import generate_expression, generate_long_line
+from benchmarks.runner import FASES
+
+
+def generate_deep_nesting(profundidad, rng):
+    """
+    Bloques if/for anidados sin sangría (con sangría el archivo crecería con el
+    cuadrado de la profundidad). Cada nivel usa una variable declarada en el más externo.
+    """
+    partes = ['package main\n\nfunc main() {\nx := 0\n']
+    for nivel in range(profundidad):
+        if nivel % 2 == 0:
+            partes.append(f'if x < {rng.randint(1, 1000)} {{\n')
+        else:
+            partes.append(f'for i{nivel} := 0; i{nivel} < 2; i{nivel}++ {{\n')
+        partes.append(f'x += {nivel}\n')
+    partes.append('}\n' * profundidad)
+    partes.append('x++\n}\n')
+    return ''.join(partes)
+
+
+def generate_illegal(caracteres, rng):
+    """Una racha de caracteres ilegales en medio de una función (un error léxico por carácter)."""
+    racha = ''.join(rng.choice('@$?#') for _ in range(caracteres))
+    return f'package main\n\nfunc main() {{\n    x := 1 {racha}\n    x++\n}}\n'
+
+
+def generate_unterminated_comment(caracteres, rng):
+    """Un comentario multilínea sin cerrar que ocupa el resto del archivo."""
+    palabras = ' '.join(rng.choice(('x', 'if', 'func', '42', '*', '/')) for _ in range(caracteres // 3))
+    lineas = '\n'.join(palabras[i:i + 80] for i in range(0, len(palabras), 80))
+    return f'package main\n\nfunc main() {{\n    x := 1\n}}\n/* {lineas}\n'
+
+
+# Caso: (generador, tamaño máximo, unidad)
+CASOS = {
+    'anidamiento': (generate_deep_nesting, 10000, 'niveles'),
+    'expresion': (generate_expression, 100000, 'operandos'),
+    'linea': (generate_long_line, 1000000, 'caracteres'),
+    'ilegales': (generate_illegal, 200000, 'caracteres'),
+    'comentario': (generate_unterminated_comment, 1000000, 'caracteres'),
+}
+
+
+def sizes(maximo, puntos):
+    """Tamaños en progresión geométrica (factor 2) que terminan en el máximo."""
+    return [max(1, maximo >> (puntos - 1 - i)) for i in range(puntos)]
+
+
+def fit_exponent(tamanos, tiempos):
+    """Pendiente por mínimos cuadrados de log(tiempo) frente a log(tamaño)."""
+    xs = [math.log(n) for n in tamanos]
+    ys = [math.log(max(t, 1e-9)) for t in tiempos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    covarianza = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    varianza = sum((x - media_x) ** 2 for x in xs)
+    return covarianza / varianza if varianza else 0.0
+
+
+def _measure(funcion, code, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(code)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def run_case(caso, escala=1.0, puntos=4, repeticiones=2, progreso=None):
+    """
+    Mide cada fase sobre las entradas del caso y ajusta su exponente.
+    Devuelve {'tamanos': [...], 'fases': {fase: {'segundos': [...], 'exponente'}}}.
+    """
+    generador, maximo, _ = CASOS[caso]
+    tamanos = sizes(max(puntos, int(maximo * escala)), puntos)
+    codigos = [generador(n, random.Random(f'{caso}-{n}')) for n in tamanos]
+    fases = {}
+    for fase, funcion in FASES:
+        segundos = [_measure(funcion, code, repeticiones) for code in codigos]
+        fases[fase] = {'segundos': [round(s, 6) for s in segundos],
+                       'exponente': round(fit_exponent(tamanos, segundos), 3)}
+        if progreso:
+            progreso(caso, fase, tamanos, fases[fase])
+    return {'tamanos': tamanos, 'fases': fases}
+
+
+def _print_row(caso, fase, tamanos, medida):
+    tiempos = ' '.join(f'{s * 1000:>9.1f}' for s in medida['segundos'])
+    print(f"{caso:12} {fase:11} {tiempos}   k={medida['exponente']:.2f}")
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Comprueba que ninguna fase crezca más rápido que la cota.')
+    argumentos.add_argument('--casos', nargs='*', choices=list(CASOS), help='sólo estos casos')
+    argumentos.add_argument('--escala', type=float, default=1.0,
+                            help='fracción de los tamaños máximos (0.1 para una pasada rápida)')
+    argumentos.add_argument('--puntos', type=int, default=4, help='tamaños medidos por caso (cada uno el doble)')
+    argumentos.add_argument('--repeticiones', type=int, default=2)
+    argumentos.add_argument('--exponente-max', type=float, default=1.3,
+                            help='cota del exponente ajustado (1 = lineal, 2 = cuadrático)')
+    argumentos.add_argument('--salida', help='guarda los resultados en este archivo JSON')
+    opciones = argumentos.parse_args()
+
+    # Los bloques muy anidados generan pilas de parser profundas
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    resultados = {}
+    fallos = []
+    for caso in opciones.casos or CASOS:
+        _, maximo, unidad = CASOS[caso]
+        tamanos = sizes(max(opciones.puntos, int(maximo * opciones.escala)), opciones.puntos)
+        print(f"\n{caso} ({unidad}: {', '.join(map(str, tamanos))}; ms por tamaño)")
+        resultados[caso] = run_case(caso, opciones.escala, opciones.puntos, opciones.repeticiones, _print_row)
+        for fase, medida in resultados[caso]['fases'].items():
+            if medida['exponente'] > opciones.exponente_max:
+                fallos.append((caso, fase, medida['exponente']))
+
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump({'exponente_max': opciones.exponente_max, 'casos': resultados}, archivo, indent=2)
+    if not fallos:
+        print(f"\nTodas las fases crecen con exponente <= {opciones.exponente_max}.")
+        return 0
+    print(f"\n{len(fallos)} fase(s) crecen más rápido que tamaño^{opciones.exponente_max}:")
+    for caso, fase, exponente in fallos:
+        print(f"  {caso:12} {fase:11} k={exponente:.2f}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Generador de programas Go sintéticos para los benchmarks
+Cada forma estresa una parte distinta del analizador. Con la misma semilla y
+el mismo tamaño se genera siempre el mismo programa.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import os
+import random
+
+OPERADORES = ('+', '-', '*', '/', '%')
+COMPARADORES = ('<', '<=', '>', '>=', '==', '!=')
+
+
+def _header():
+    return 'package main\n\nimport "fmt"\n\n'
+
+
+def _function(nombre, rng, sentencias=6):
+    """Función con declaraciones, aritmética, un if, un for y una impresión."""
+    # Parámetros con nombre propio: el analizador semántico registra los parámetros en el ámbito global
+    a, b = f'{nombre}_a', f'{nombre}_b'
+    lineas = [f'func {nombre}({a} int, {b} int) int {{']
+    lineas.append('    var total int = 0')
+    for i in range(sentencias):
+        op = rng.choice(OPERADORES[:3])
+        lineas.append(f'    v{i} := {a} {op} {b} * {rng.randint(1, 99)}')
+        lineas.append(f'    total += v{i}')
+    lineas.append(f'    if total {rng.choice(COMPARADORES)} {rng.randint(0, 500)} {{')
+    lineas.append(f'        total = total - {a}')
+    lineas.append('    } else {')
+    lineas.append(f'        total = total + {b}')
+    lineas.append('    }')
+    lineas.append(f'    for i := 0; i < {b}; i++ {{')
+    lineas.append('        total += i')
+    lineas.append('    }')
+    lineas.append(f'    fmt.Println("{nombre}", total)')
+    lineas.append('    return total')
+    lineas.append('}')
+    return '\n'.join(lineas) + '\n\n'
+
+
+def generate_functions(n, rng):
+    """Muchas funciones pequeñas y un main que las llama."""
+    partes = [_header()]
+    for i in range(n):
+        partes.append(_function(f'f{i}', rng))
+    partes.append('func main() {\n    resultado := 0\n')
+    for i in range(n):
+        partes.append(f'    resultado += f{i}({i}, {rng.randint(1, 9)})\n')
+    partes.append('    fmt.Println(resultado)\n}\n')
+    return ''.join(partes)
+
+
+def generate_nesting(profundidad, rng):
+    """Bloques if/for anidados hasta la profundidad indicada."""
+    partes = [_header(), 'func main() {\n    x := 0\n']
+    for nivel in range(profundidad):
+        sangria = '    ' * (nivel + 1)
+        if nivel % 2 == 0:
+            partes.append(f'{sangria}if x < {rng.randint(1, 1000)} {{\n')
+        else:
+            partes.append(f'{sangria}for i{nivel} := 0; i{nivel} < 2; i{nivel}++ {{\n')
+        partes.append(f'{sangria}    x += {nivel}\n')
+    for nivel in reversed(range(profundidad)):
+        partes.append('    ' * (nivel + 1) + '}\n')
+    partes.append('    fmt.Println(x)\n}\n')
+    return ''.join(partes)
+
+
+def generate_expression(operandos, rng):
+    """Una sola expresión aritmética con muchos operandos."""
+    terminos = [f'a{i % 8}' if rng.random() < 0.5 else str(rng.randint(1, 999)) for i in range(operandos)]
+    expresion = terminos[0]
+    for termino in terminos[1:]:
+        expresion += f' {rng.choice(OPERADORES[:3])} {termino}'
+    declaraciones = ''.join(f'    a{i} := {i + 1}\n' for i in range(8))
+    return f'{_header()}func main() {{\n{declaraciones}    resultado := {expresion}\n    fmt.Println(resultado)\n}}\n'
+
+
+def generate_literals(elementos, rng):
+    """Un slice literal enorme y una cadena muy larga."""
+    valores = ', '.join(str(rng.randint(0, 10 ** 6)) for _ in range(elementos))
+    cadena = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(elementos * 4))
+    return (f'{_header()}func main() {{\n    datos := []int{{{valores}}}\n'
+            f'    texto := "{cadena}"\n    fmt.Println(len(datos), texto)\n}}\n')
+
+
+def generate_long_line(caracteres, rng):
+    """El cuerpo de la función en una sola línea muy larga."""
+    sentencias = []
+    total = 0
+    i = 0
+    while total < caracteres:
+        sentencia = f'v{i} := {rng.randint(1, 99)} + {rng.randint(1, 99)}'
+        sentencias.append(sentencia)
+        total += len(sentencia) + 1
+        i += 1
+    return f'{_header()}func main() {{ {" ".join(sentencias)} }}\n'
+
+
+FORMAS = {
+    'funciones': (generate_functions, 200),
+    'anidamiento': (generate_nesting, 60),
+    'expresiones': (generate_expression, 2000),
+    'literales': (generate_literals, 5000),
+    'lineas': (generate_long_line, 20000),
+}
+
+
+def inject_errors(code, rng, cantidad=10):
+    """
+    Versión inválida de un programa: caracteres ilegales (léxico), paréntesis
+    sin cerrar (sintáctico) y variables no declaradas (semántico).
+    """
+    lineas = code.split('\n')
+    candidatas = [i for i, linea in enumerate(lineas) if ':=' in linea]
+    if not candidatas:
+        candidatas = list(range(len(lineas)))
+    for _ in range(cantidad):
+        i = rng.choice(candidatas)
+        tipo = rng.randrange(3)
+        if tipo == 0:
+            lineas[i] += ' @$'
+        elif tipo == 1:
+            lineas[i] = lineas[i].replace(':=', ':= (', 1)
+        else:
+            lineas[i] += f' sin_declarar_{rng.randint(0, 999)}++'
+    return '\n'.join(lineas)
+
+
+def generate(forma, escala=1.0, invalido=False, semilla=0):
+    """Genera el programa de una forma ('funciones', 'anidamiento', ...) con el tamaño base por la escala."""
+    generador, tamano = FORMAS[forma]
+    rng = random.Random(f'{forma}-{semilla}')
+    code = generador(max(1, int(tamano * escala)), rng)
+    if invalido:
+        code = inject_errors(code, rng)
+    return code
+
+
+def generate_corpus(escala=1.0, semilla=0, invalidos=True):
+    """Devuelve {nombre: código} con todas las formas, válidas y (opcionalmente) inválidas."""
+    corpus = {}
+    for forma in FORMAS:
+        corpus[forma] = generate(forma, escala, False, semilla)
+        if invalidos:
+            corpus[f'{forma}_invalido'] = generate(forma, escala, True, semilla)
+    return corpus
+
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Genera el corpus sintético de programas Go.')
+    argumentos.add_argument('--salida', default='corpus', help='carpeta donde se escriben los .go')
+    argumentos.add_argument('--escala', type=float, default=1.0)
+    argumentos.add_argument('--semilla', type=int, default=0)
+    opciones = argumentos.parse_args()
+
+    os.makedirs(opciones.salida, exist_ok=True)
+    for nombre, code in generate_corpus(opciones.escala, opciones.semilla).items():
+        ruta = os.path.join(opciones.salida, f'{nombre}.go')
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(code)
+        print(f'{ruta}: {len(code)} bytes')
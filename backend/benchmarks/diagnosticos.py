@@ -0,0 +1,120 @@
+"""
+Diagnósticos por tipo declarado del Analizador de Código Go
+Comprobación de corrección, no un benchmark: no mide tiempos y python -m
+benchmarks no la ejecuta. El análisis conserva el tipo declarado de cada
+variable y parámetro y cuenta byte y rune como tipos numéricos enteros; cada
+caso guarda los errores semánticos que debe producir el análisis actual.
+Uso: python -m benchmarks.diagnosticos (desde la carpeta backend); termina con
+código 1 si algún caso produce otros errores.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import sys
+
+from semantico_go import analyze_semantic_string
+
+
+def _main(cuerpo):
+    """Programa con el cuerpo dentro de main (la primera línea del cuerpo es la 4)."""
+    return 'package main\n\nfunc main() {\n' + cuerpo + '}\n'
+
+
+def _asignar(origen, destino):
+    return f"Error Semántico: No se puede asignar tipo '{origen}' a variable de tipo '{destino}'"
+
+
+# Caso: (código, errores esperados); cada error es (línea, mensaje)
+CASOS = {
+    # Sin error: el tipo bool o string no se lee como int
+    'bool': (
+        _main('\tvar listo bool = false\n\tlisto = true\n'),
+        [],
+    ),
+    'string': (
+        _main('\tvar nombre string\n\tnombre = "Go"\n'),
+        [],
+    ),
+    'parametro_string': (
+        'package main\n\nfunc saludar(nombre string) {\n}\n\nfunc main() {\n\tsaludar("Ana")\n}\n',
+        [],
+    ),
+    # Con error: una variable declarada con otro tipo no pasa por entera
+    'float_a_int': (
+        _main('\tvar x float64 = 1.5\n\tvar n int = 1\n\tn = x\n'),
+        [(6, _asignar('float64', 'int'))],
+    ),
+    'string_a_int': (
+        _main('\tvar s string = "a"\n\tvar n int = 1\n\tn = s\n'),
+        [(6, _asignar('string', 'int'))],
+    ),
+    'argumento_string': (
+        'package main\n\nfunc doble(n int) int {\n\treturn n * 2\n}\n\n'
+        'func main() {\n\tvar s string = "a"\n\tdoble(s)\n}\n',
+        [(9, "Error Semántico: Argumento 1 de 'doble': se esperaba tipo 'int', pero se recibió 'string'")],
+    ),
+    'suma_bool': (
+        _main('\tvar ok bool = true\n\tvar n int = 1\n\tn = n + ok\n'),
+        [(6, "Error Semántico: Operación '+' no válida entre tipo 'int' y tipo 'bool'")],
+    ),
+    # El mensaje lleva el tipo declarado
+    'condicion_string': (
+        _main('\tvar s string = "a"\n\tif s {\n\t}\n'),
+        [(5, "Error Semántico: La condición del IF debe ser 'bool', se encontró 'string'")],
+    ),
+    'byte_float': (
+        _main('\tvar b byte = 1\n\tb = 2.5\n'),
+        [(5, _asignar('float64', 'byte'))],
+    ),
+    'rune_string': (
+        _main("\tvar r rune = 'a'\n\tr = \"a\"\n"),
+        [(5, _asignar('string', 'rune'))],
+    ),
+    # byte y rune son enteros, así que aceptan constantes enteras
+    'byte_entero': (
+        _main("\tvar b byte = 65\n\tvar r rune = 'a'\n\tb = 66\n"),
+        [],
+    ),
+    'float_constante_a_int': (
+        _main('\tvar n int = 1\n\tn = 2.5\n'),
+        [(5, _asignar('float64', 'int'))],
+    ),
+}
+
+
+def run_case(codigo):
+    """Errores semánticos del código como [(línea, mensaje)]."""
+    return [(error['line'], error['message']) for error in analyze_semantic_string(codigo)['errors']]
+
+
+def _describe(errores):
+    return '; '.join(f"{linea}: {mensaje.removeprefix('Error Semántico: ')}" for linea, mensaje in errores) or '-'
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Comprueba los diagnósticos por tipo declarado.')
+    argumentos.add_argument('--casos', nargs='*', choices=sorted(CASOS), help='sólo estos casos')
+    opciones = argumentos.parse_args()
+
+    fallos = []
+    for caso in opciones.casos or CASOS:
+        codigo, esperados = CASOS[caso]
+        obtenido = run_case(codigo)
+        estado = 'ok' if obtenido == esperados else 'DIFIERE'
+        print(f"{caso:22} {estado:8} {_describe(obtenido)}")
+        if obtenido != esperados:
+            print(f"{'':31} esperado: {_describe(esperados)}")
+            fallos.append(caso)
+
+    if not fallos:
+        print("\nTodos los casos producen los diagnósticos esperados.")
+        return 0
+    print(f"\n{len(fallos)} caso(s) con otros diagnósticos: {', '.join(fallos)}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
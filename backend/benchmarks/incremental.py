@@ -0,0 +1,203 @@
+"""
+Benchmark del re-análisis incremental
+Genera un archivo con muchas funciones, le aplica ediciones típicas del editor
+(cambiar un cuerpo, cambiar una firma, añadir una global, insertar líneas al
+inicio) y compara el análisis completo de cada fase con el incremental: el
+léxico con una CacheTokens, el sintáctico retomado desde sus PuntosControl, el semántico con una
+CacheFunciones, el mismo código repartido en un paquete de varios archivos con
+una CachePaquete y una sesión en vivo que recibe sólo la edición y responde sólo
+lo que cambió. Mide el tiempo, cuánto se volvió a analizar (o, en la sesión,
+cuánto se respondió) y que el resultado sea idéntico.
+Uso: python -m benchmarks.incremental (desde la carpeta backend); termina con
+código 1 si algún resultado incremental difiere del completo.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import paralelo_go
+from analisis_go import analyze_full_string
+from benchmarks.corpus import generate
+from lexico_go import CacheTokens, analyze_code_string
+from paquete_go import CachePaquete, analyze_package
+from semantico_go import CacheFunciones, analyze_semantic_string
+from sesiones_go import Sesion, apply_diff, text_change
+from sintactico_go import PuntosControl, analyze_syntax_string
+
+
+def edit_body(code, nombre):
+    """Añade una sentencia al inicio del cuerpo (las funciones siguientes bajan una línea)."""
+    inicio = code.index('{\n', code.index(f'func {nombre}(')) + 2
+    return code[:inicio] + '    extra := 1\n' + code[inicio:]
+
+
+def edit_signature(code, nombre):
+    """Añade un parámetro: también hay que revisar a quien la llama."""
+    return code.replace(f'func {nombre}(', f'func {nombre}(extra_{nombre} int, ', 1)
+
+
+def add_global(code, nombre):
+    """Una variable global nueva que ninguna función usa todavía."""
+    return code.replace('\nfunc main()', f'\nvar global_{nombre} int = 1\n\nfunc main()', 1)
+
+
+def insert_lines(code, nombre):
+    """Comentarios tras la cabecera: todas las funciones cambian de línea, ninguna de texto."""
+    return code.replace('\n\n', f'\n\n// {nombre}\n// editado\n', 1)
+
+
+EDICIONES = {
+    'cuerpo': edit_body,
+    'firma': edit_signature,
+    'global': add_global,
+    'lineas': insert_lines,
+}
+
+# Archivos en que se reparte el código para medir el análisis de paquetes
+ARCHIVOS_PAQUETE = 20
+
+
+def split_package(code):
+    """Reparte el código en archivos de un mismo paquete, cortando entre declaraciones."""
+    return [(f'archivo{i:02}.go', texto) for i, (texto, _) in
+            enumerate(paralelo_go.build_chunks(code, ARCHIVOS_PAQUETE))]
+
+
+def edit_package(archivos, funcion, nombre):
+    """Aplica la edición al primer archivo que cambia con ella, como haría el editor."""
+    for i, (archivo, texto) in enumerate(archivos):
+        try:
+            editado = funcion(texto, nombre)
+        except ValueError:
+            continue
+        if editado != texto:
+            return archivos[:i] + [(archivo, editado)] + archivos[i + 1:]
+    return archivos
+
+
+def _edit_code(code, funcion, nombre):
+    return funcion(code, nombre)
+
+
+class ClienteSesion:
+    """
+    Lo que hace el editor con una sesión: la abre con el código y después envía sólo
+    el tramo editado y aplica la diferencia que recibe al resultado que ya tenía.
+    """
+
+    def __init__(self):
+        self.sesion = None
+        self.code = None
+        self.resultado = None
+        self.enviados = 0
+        self.recibidos = 0
+
+    def analyze(self, code):
+        if self.sesion is None:
+            self.sesion = Sesion(code)
+            respuesta = self.sesion.analyze(0)
+            self.resultado = {fase: respuesta[fase] for fase in ('lexico', 'sintactico', 'semantico')}
+        else:
+            cambio = text_change(self.code, code)
+            revision = self.sesion.revision + 1
+            self.sesion.apply(revision, [cambio])
+            respuesta = self.sesion.analyze(revision)
+            self.resultado = apply_diff(self.resultado, respuesta)
+            self.enviados = len(json.dumps(cambio))
+        self.recibidos = len(json.dumps(respuesta))
+        self.code = code
+        return self.resultado
+
+
+# Fase: (análisis completo, estado incremental, análisis incremental, cuánto se re-analizó,
+#        cómo se prepara la entrada, cómo se edita)
+FASES = {
+    'lexico': (analyze_code_string, CacheTokens,
+               lambda code, estado: analyze_code_string(code, cache=estado),
+               lambda estado, code: f'{estado.relexados}/{len(code)} B',
+               str, _edit_code),
+    'sintactico': (analyze_syntax_string, PuntosControl,
+                   lambda code, estado: analyze_syntax_string(code, puntos=estado),
+                   lambda estado, code: f'{estado.reanalizados}/{len(code)} B',
+                   str, _edit_code),
+    'semantico': (analyze_semantic_string, CacheFunciones,
+                  lambda code, estado: analyze_semantic_string(code, cache=estado),
+                  lambda estado, code: f'{estado.revisadas}/{estado.revisadas + estado.reutilizadas} func',
+                  str, _edit_code),
+    'paquete': (analyze_package, CachePaquete,
+                lambda archivos, estado: analyze_package(archivos, cache=estado),
+                lambda estado, archivos: f'{len(estado.revisados)}/{len(archivos)} arch',
+                split_package, edit_package),
+    'sesion': (analyze_full_string, ClienteSesion,
+               lambda code, estado: estado.analyze(code),
+               lambda estado, code: f'{estado.enviados} B / {estado.recibidos / 1024:.1f} KB',
+               str, _edit_code),
+}
+
+
+def _normalize(resultado):
+    return json.loads(json.dumps(resultado))
+
+
+def run_edit(fase, code, editado, repeticiones=3):
+    """
+    Mejor tiempo del análisis completo del código editado y del incremental a partir
+    del estado del código original. Devuelve (completo, incremental, estado, iguales).
+    """
+    completa, nuevo_estado, incremental_fase = FASES[fase][:3]
+    completo = float('inf')
+    incremental = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        esperado = completa(editado)
+        completo = min(completo, time.perf_counter() - inicio)
+
+        estado = nuevo_estado()
+        incremental_fase(code, estado)
+        inicio = time.perf_counter()
+        obtenido = incremental_fase(editado, estado)
+        incremental = min(incremental, time.perf_counter() - inicio)
+    return completo, incremental, estado, _normalize(esperado) == _normalize(obtenido)
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description='Compara el análisis completo con el incremental.')
+    argumentos.add_argument('--escala', type=float, default=1.0,
+                            help='tamaño del archivo (1.0 = 200 funciones, unas 5400 líneas)')
+    argumentos.add_argument('--fases', nargs='*', choices=list(FASES), help='sólo estas fases')
+    argumentos.add_argument('--repeticiones', type=int, default=3)
+    opciones = argumentos.parse_args()
+
+    code = generate('funciones', opciones.escala)
+    nombre = f'f{max(1, int(200 * opciones.escala)) // 2}'
+    print(f"{code.count(chr(10))} líneas, edición en {nombre}\n")
+    print(f"{'Fase':11} {'Edición':8} {'completo ms':>12} {'incremental ms':>15} {'re-analizado':>18} {'x':>7}  resultado")
+    print('=' * 90)
+    distintos = []
+    for fase in opciones.fases or FASES:
+        preparar, editar = FASES[fase][4:]
+        original = preparar(code)
+        for edicion, funcion in EDICIONES.items():
+            editado = editar(original, funcion, nombre)
+            completo, incremental, estado, iguales = run_edit(fase, original, editado, opciones.repeticiones)
+            print(f"{fase:11} {edicion:8} {completo * 1000:>12.1f} {incremental * 1000:>15.1f} "
+                  f"{FASES[fase][3](estado, editado):>18} {completo / incremental:>7.1f}  "
+                  f"{'igual' if iguales else 'DISTINTO'}")
+            if not iguales:
+                distintos.append(f'{fase}/{edicion}')
+
+    if distintos:
+        print(f"\nEl análisis incremental difiere del completo en: {', '.join(distintos)}")
+        return 1
+    print('\nEl análisis incremental coincide con el completo en todas las ediciones.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
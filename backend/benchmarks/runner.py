@@ -0,0 +1,128 @@
+"""
+Ejecución de los benchmarks del Analizador de Código Go
+Mide el tiempo, el rendimiento (bytes y tokens por segundo) y la memoria pico de
+cada fase sobre el corpus sintético, y compara los resultados con una línea base.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from lexico_go import analyze_code_string
+from sintactico_go import analyze_syntax_string
+from semantico_go import analyze_semantic_string
+
+FASES = (
+    ('lexico', analyze_code_string),
+    ('sintactico', analyze_syntax_string),
+    ('semantico', analyze_semantic_string),
+)
+
+
+def _measure_time(funcion, code, repeticiones):
+    """Mejor tiempo de varias ejecuciones (tras una de calentamiento)."""
+    funcion(code)
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(code)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _measure_peak(funcion, code):
+    """Memoria pico (bytes) de una ejecución, en una pasada aparte porque tracemalloc la ralentiza."""
+    tracemalloc.start()
+    try:
+        funcion(code)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def run_benchmarks(corpus, repeticiones=3, memoria=True, progreso=None):
+    """
+    Ejecuta cada fase sobre cada programa del corpus.
+    Devuelve {caso: {'bytes', 'tokens', 'fases': {fase: {'segundos', 'bytes_por_segundo',
+    'tokens_por_segundo', 'pico_bytes'}}}}.
+    """
+    resultados = {}
+    for caso, code in corpus.items():
+        tamano = len(code.encode('utf-8'))
+        tokens = len(analyze_code_string(code)['tokens'])
+        fases = {}
+        for fase, funcion in FASES:
+            segundos = _measure_time(funcion, code, repeticiones)
+            fases[fase] = {
+                'segundos': round(segundos, 6),
+                'bytes_por_segundo': round(tamano / segundos, 1),
+                'tokens_por_segundo': round(tokens / segundos, 1),
+            }
+            if memoria:
+                fases[fase]['pico_bytes'] = _measure_peak(funcion, code)
+            if progreso:
+                progreso(caso, fase, fases[fase])
+        resultados[caso] = {'bytes': tamano, 'tokens': tokens, 'fases': fases}
+    return resultados
+
+
+def build_report(resultados, escala, repeticiones):
+    """Resultados con los datos de la máquina, en el formato que se guarda como línea base."""
+    return {
+        'fecha': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'escala': escala,
+        'repeticiones': repeticiones,
+        'casos': resultados,
+    }
+
+
+def compare(actual, base, umbral=0.2, umbral_memoria=0.2):
+    """
+    Compara con la línea base. Es una regresión que el rendimiento (bytes por segundo)
+    caiga más del umbral o que la memoria pico crezca más del umbral de memoria.
+    Devuelve la lista de regresiones (vacía si no hay).
+    """
+    regresiones = []
+    for caso, datos_base in base['casos'].items():
+        datos = actual['casos'].get(caso)
+        if datos is None:
+            continue
+        for fase, medida_base in datos_base['fases'].items():
+            medida = datos['fases'].get(fase)
+            if medida is None:
+                continue
+            cambio = medida['bytes_por_segundo'] / medida_base['bytes_por_segundo'] - 1
+            if cambio < -umbral:
+                regresiones.append({
+                    'caso': caso, 'fase': fase, 'metrica': 'bytes_por_segundo',
+                    'base': medida_base['bytes_por_segundo'], 'actual': medida['bytes_por_segundo'],
+                    'cambio': round(cambio, 4),
+                })
+            if 'pico_bytes' in medida and medida_base.get('pico_bytes'):
+                cambio = medida['pico_bytes'] / medida_base['pico_bytes'] - 1
+                if cambio > umbral_memoria:
+                    regresiones.append({
+                        'caso': caso, 'fase': fase, 'metrica': 'pico_bytes',
+                        'base': medida_base['pico_bytes'], 'actual': medida['pico_bytes'],
+                        'cambio': round(cambio, 4),
+                    })
+    return regresiones
+
+
+def load_report(ruta):
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def save_report(reporte, ruta):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(reporte, archivo, indent=2, ensure_ascii=False)
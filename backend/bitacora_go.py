@@ -0,0 +1,134 @@
+"""
+Bitácora estructurada del Analizador de Código Go
+Cada petición produce un registro JSON (id de petición, hash y tamaño de la
+entrada, tiempos por fase y resultado). Los registros pasan por una cola y los
+escribe un hilo en segundo plano, así que la petición nunca espera a stdout.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# Configuración (modificable por variables de entorno)
+LOG_MUESTREO = float(os.environ.get('ANALYZER_LOG_MUESTREO', '0.1'))
+LOG_LENTO = float(os.environ.get('ANALYZER_LOG_LENTO', '1'))
+LOG_COLA = int(os.environ.get('ANALYZER_LOG_COLA', '10000'))
+LOG_NIVEL = os.environ.get('ANALYZER_LOG_NIVEL', 'INFO').upper()
+
+
+class FormatoJSON(logging.Formatter):
+    """Una línea JSON por registro. Se ejecuta en el hilo de la bitácora, no en la petición."""
+
+    def format(self, record):
+        datos = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'nivel': record.levelname,
+            'evento': record.getMessage(),
+        }
+        datos.update(getattr(record, 'campos', {}))
+        if record.exc_text:
+            datos['traza'] = record.exc_text
+        return json.dumps(datos, ensure_ascii=False)
+
+
+class ManejadorCola(QueueHandler):
+    """Encola el registro sin formatearlo y, si la cola está llena, lo descarta en lugar de esperar."""
+
+    def __init__(self, cola):
+        super().__init__(cola)
+        self.descartados = 0
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+logger = logging.getLogger('analizador')
+logger.propagate = False
+
+_lock = threading.Lock()
+_pid = None
+_listener = None
+
+
+def get_logger():
+    """
+    Devuelve el logger configurado para el proceso actual.
+    El hilo que escribe no sobrevive a un fork, así que cada worker crea el suyo.
+    """
+    global _pid, _listener
+    if _pid == os.getpid():
+        return logger
+    with _lock:
+        if _pid != os.getpid():
+            for manejador in list(logger.handlers):
+                logger.removeHandler(manejador)
+            cola = queue.Queue(LOG_COLA)
+            salida = logging.StreamHandler(sys.stdout)
+            salida.setFormatter(FormatoJSON())
+            _listener = QueueListener(cola, salida)
+            _listener.start()
+            logger.addHandler(ManejadorCola(cola))
+            logger.setLevel(LOG_NIVEL)
+            _pid = os.getpid()
+    return logger
+
+
+def shutdown_logging():
+    """Escribe los registros pendientes y detiene el hilo de la bitácora."""
+    global _pid, _listener
+    with _lock:
+        if _listener is not None and _pid == os.getpid():
+            _listener.stop()
+        _listener = None
+        _pid = None
+
+
+atexit.register(shutdown_logging)
+
+
+def summarize_code(campos):
+    """
+    Cambia el código de los campos ('code') por su hash y su tamaño. Se hace antes de
+    encolar el registro: la cola no debe retener el código completo de cada petición.
+    """
+    code = campos.pop('code', None)
+    if code is None:
+        return campos
+    datos = code.encode('utf-8')
+    resumen = {'hash': hashlib.sha256(datos).hexdigest()[:16], 'bytes': len(datos)}
+    resumen.update(campos)
+    return resumen
+
+
+def log_request(campos, exito, duracion, evento='peticion'):
+    """
+    Registra una petición (o un trabajo asíncrono). Las fallidas y las lentas (más de ANALYZER_LOG_LENTO
+    segundos) se registran siempre; las exitosas, con probabilidad ANALYZER_LOG_MUESTREO.
+    """
+    if exito and duracion < LOG_LENTO:
+        if random.random() >= LOG_MUESTREO:
+            return
+        campos['muestreo'] = LOG_MUESTREO
+    campos = summarize_code(campos)
+    get_logger().log(logging.INFO if exito else logging.WARNING, evento, extra={'campos': campos})
@@ -0,0 +1,278 @@
+"""
+Cancelación de análisis del Analizador de Código Go
+Mientras el usuario escribe, el editor envía un análisis tras otro y sólo le sirve
+el último. Cada análisis lleva una Cancelacion que se activa si el cliente cierra
+la conexión o si llega una petición más nueva del mismo editor (X-Editor-ID); el
+análisis la consulta entre fases y, a través del lexer, cada CADA_TOKENS tokens
+leídos por el lexer o los parsers, y abandona el trabajo con AnalisisCancelado.
+Con varios procesos (workers de gunicorn) la última petición de cada editor se
+anota también en ANALYZER_EDITORES_MAPA, un archivo mapeado en memoria que
+consultan las cancelaciones de todos los procesos.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import hashlib
+import mmap
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows no dispone de fcntl: cada proceso sólo ve sus propias peticiones
+    fcntl = None
+
+# Tokens leídos entre dos consultas de la cancelación dentro de los bucles del análisis
+CADA_TOKENS = int(os.environ.get('ANALYZER_CANCELACION_TOKENS', '512'))
+
+# Archivo compartido con la última petición de cada editor ('' = sólo la memoria del proceso)
+EDITORES_MAPA = os.environ.get('ANALYZER_EDITORES_MAPA', '') if fcntl is not None else ''
+RANURAS_EDITORES = int(os.environ.get('ANALYZER_EDITORES_RANURAS', '4096'))
+
+# Motivos de cancelación, con su código en la bandera compartida con los workers aislados
+MOTIVOS = ('desconexion', 'reemplazada')
+
+
+class AnalisisCancelado(BaseException):
+    """
+    Se lanza dentro del análisis cuando se activa su cancelación.
+    Hereda de BaseException para que los 'except Exception' de los analizadores no la capturen.
+    """
+
+    def __init__(self, motivo):
+        super().__init__(motivo)
+        self.motivo = motivo
+
+
+class Cancelacion:
+    """
+    Cancelación de un análisis en el proceso de la API. Con el socket de la petición
+    también se activa sola cuando el cliente cierra la conexión, y con un plazo
+    (instante de time.monotonic()), cuando se cumple.
+    """
+
+    def __init__(self, conexion=None, plazo=None):
+        self.conexion = conexion
+        self.plazo = plazo
+        # Si la pone Editores.track: dice si otro proceso recibió una petición más nueva del mismo editor
+        self.reemplazada = None
+        self.motivo = None
+        self.evento = threading.Event()
+
+    def cancel(self, motivo):
+        if self.motivo is None:
+            self.motivo = motivo
+        self.evento.set()
+
+    @property
+    def cancelled(self):
+        if not self.evento.is_set():
+            if self.conexion is not None and _disconnected(self.conexion):
+                self.cancel('desconexion')
+            elif self.plazo is not None and time.monotonic() >= self.plazo:
+                self.cancel('tiempo')
+            elif self.reemplazada is not None and self.reemplazada():
+                self.cancel('reemplazada')
+        return self.evento.is_set()
+
+    def check(self):
+        if self.cancelled:
+            raise AnalisisCancelado(self.motivo)
+
+
+class CancelacionCompartida:
+    """
+    Cancelación de un worker aislado: una bandera en memoria compartida que el
+    proceso de la API escribe con el código del motivo (1 + su índice en MOTIVOS).
+    """
+
+    def __init__(self, bandera):
+        self.bandera = bandera
+
+    @property
+    def motivo(self):
+        valor = self.bandera.value
+        return MOTIVOS[valor - 1] if valor else None
+
+    @property
+    def cancelled(self):
+        return self.bandera.value != 0
+
+    def check(self):
+        if self.bandera.value:
+            raise AnalisisCancelado(self.motivo)
+
+
+def _disconnected(conexion):
+    """Si el cliente cerró la conexión: el socket se puede leer pero no trae datos."""
+    try:
+        legible, _, _ = select.select([conexion], [], [], 0)
+        return bool(legible) and conexion.recv(1, socket.MSG_PEEK) == b''
+    except (OSError, ValueError):
+        # ValueError: socket ya cerrado o envuelto en TLS (no admite MSG_PEEK)
+        return False
+
+
+# ============================================================================
+# CANCELACIÓN ACTIVA DEL HILO
+# ============================================================================
+
+_local = threading.local()
+
+
+def current():
+    """Cancelación del análisis que corre en este hilo, o None."""
+    return getattr(_local, 'cancelacion', None)
+
+
+@contextmanager
+def activate(cancelacion):
+    """Durante el bloque, los lexers de get_lexer() consultan la cancelación."""
+    anterior = current()
+    _local.cancelacion = cancelacion
+    try:
+        yield cancelacion
+    finally:
+        _local.cancelacion = anterior
+
+
+def check():
+    """Lanza AnalisisCancelado si se canceló el análisis de este hilo."""
+    cancelacion = current()
+    if cancelacion is not None:
+        cancelacion.check()
+
+
+def checked_token(token, cancelacion, cada=CADA_TOKENS):
+    """Envuelve lexer.token para consultar la cancelación cada 'cada' tokens."""
+    restantes = cada
+
+    def siguiente():
+        nonlocal restantes
+        restantes -= 1
+        if not restantes:
+            restantes = cada
+            cancelacion.check()
+        return token()
+
+    return siguiente
+
+
+# ============================================================================
+# PETICIONES POR EDITOR
+# ============================================================================
+
+class MapaEditores:
+    """
+    Última petición de cada editor, compartida entre procesos: un archivo mapeado en
+    memoria con una ranura (hash del editor, sello de la petición) por editor, elegida
+    por el hash. Se escribe con el archivo bloqueado (flock); se lee sin lock, hasta
+    que dos lecturas seguidas coinciden. Si dos editores caen en la misma ranura, el
+    último la ocupa y las peticiones del otro dejan de cancelarse entre procesos
+    (nunca se cancela una petición de otro editor).
+    """
+
+    RANURA = struct.Struct('<QQ')
+
+    def __init__(self, ruta, ranuras=RANURAS_EDITORES):
+        self.ruta = ruta
+        self.ranuras = ranuras
+        self.fd = None
+        self.mapa = None
+        self.pid = None
+        # flock no excluye a los hilos del mismo proceso, que comparten el descriptor
+        self.lock = threading.Lock()
+
+    def _open(self):
+        # El descriptor (y su flock) no se comparte con los procesos hijos: cada proceso abre el suyo
+        if self.pid == os.getpid():
+            return self.mapa
+        with self.lock:
+            if self.pid == os.getpid():
+                return self.mapa
+            tamano = self.ranuras * self.RANURA.size
+            self.fd = os.open(self.ruta, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self.fd).st_size < tamano:
+                    os.ftruncate(self.fd, tamano)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.mapa = mmap.mmap(self.fd, tamano)
+            self.pid = os.getpid()
+            return self.mapa
+
+    def _slot(self, editor_id):
+        clave = int.from_bytes(hashlib.blake2b(editor_id.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+        return clave, (clave % self.ranuras) * self.RANURA.size
+
+    def _read(self, posicion):
+        anterior = None
+        while True:
+            actual = self.RANURA.unpack_from(self.mapa, posicion)
+            if actual == anterior:
+                return actual
+            anterior = actual
+
+    def stamp(self, editor_id):
+        """Anota una petición nueva del editor y devuelve su sello."""
+        mapa = self._open()
+        clave, posicion = self._slot(editor_id)
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                _, previo = self._read(posicion)
+                sello = max(time.time_ns(), previo + 1)
+                self.RANURA.pack_into(mapa, posicion, clave, sello)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+        return sello
+
+    def replaced(self, editor_id, sello):
+        """Si después de la petición del sello llegó otra del mismo editor (en cualquier proceso)."""
+        self._open()
+        clave, posicion = self._slot(editor_id)
+        actual, ultimo = self._read(posicion)
+        return actual == clave and ultimo != sello
+
+
+class Editores:
+    """
+    Último análisis en curso de cada editor; uno nuevo cancela el anterior. Con un
+    MapaEditores, también el que esté en curso en otro proceso.
+    """
+
+    def __init__(self, mapa=None):
+        self.activos = {}
+        self.lock = threading.Lock()
+        self.mapa = mapa
+
+    @contextmanager
+    def track(self, editor_id, cancelacion):
+        if editor_id is None:
+            yield cancelacion
+            return
+        if self.mapa is not None:
+            sello = self.mapa.stamp(editor_id)
+            cancelacion.reemplazada = lambda: self.mapa.replaced(editor_id, sello)
+        with self.lock:
+            anterior = self.activos.get(editor_id)
+            self.activos[editor_id] = cancelacion
+        if anterior is not None:
+            anterior.cancel('reemplazada')
+        try:
+            yield cancelacion
+        finally:
+            with self.lock:
+                if self.activos.get(editor_id) is cancelacion:
+                    del self.activos[editor_id]
+
+
+editores = Editores(MapaEditores(EDITORES_MAPA) if EDITORES_MAPA else None)
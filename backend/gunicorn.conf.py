@@ -0,0 +1,88 @@
+"""
+Configuración de gunicorn para el Analizador de Código Go en producción.
+Uso (desde la carpeta backend): gunicorn -c gunicorn.conf.py wsgi:app
+Todos los valores se pueden modificar con variables de entorno.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('ANALYZER_BIND', '0.0.0.0:5000')
+
+# Workers síncronos: cada uno atiende una petición a la vez y el análisis
+# corre en sus workers aislados (limites_go)
+workers = int(os.environ.get('ANALYZER_WORKERS', str(multiprocessing.cpu_count())))
+worker_class = 'sync'
+
+# Reciclar cada worker tras N peticiones (con jitter para no reiniciarlos todos a la vez)
+max_requests = int(os.environ.get('ANALYZER_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('ANALYZER_MAX_REQUESTS_JITTER', '100'))
+
+# Reinicio ordenado: segundos que tiene un worker para terminar sus peticiones en curso
+graceful_timeout = int(os.environ.get('ANALYZER_GRACEFUL_TIMEOUT', '30'))
+
+# El timeout del worker debe cubrir el presupuesto de un análisis (ANALYZER_TIEMPO_MAX)
+timeout = int(os.environ.get('ANALYZER_TIMEOUT', str(int(float(os.environ.get('ANALYZER_TIEMPO_MAX', '10'))) + 20)))
+
+# El lexer y las tablas de ambos parsers se construyen en el maestro (ver wsgi.py)
+# y los workers los heredan por copy-on-write
+preload_app = os.environ.get('ANALYZER_PRELOAD', '1') != '0'
+
+# Cada worker de gunicorn usa por defecto su parte de los núcleos para sus workers aislados
+os.environ.setdefault('ANALYZER_WORKERS_AISLADOS', str(max(1, multiprocessing.cpu_count() // workers)))
+
+accesslog = os.environ.get('ANALYZER_ACCESS_LOG', '-')
+
+# Estado compartido por los workers: (variable, descripción). Si la variable no está
+# definida se usa una ruta en /tmp con el PID del maestro, que se borra al salir
+COMPARTIDOS = (
+    # Cada worker vuelca sus métricas a este directorio y /metrics las suma
+    ('ANALYZER_METRICS_DIR', 'metricas'),
+    # Los trabajos asíncronos (/api/jobs) guardan aquí su estado para que cualquier worker responda su consulta
+    ('ANALYZER_TRABAJOS_DIR', 'trabajos'),
+    # Las sesiones en vivo se guardan aquí para que cualquier worker pueda continuarlas
+    ('ANALYZER_SESIONES_DIR', 'sesiones'),
+    # Última petición de cada editor (X-Editor-ID), para que una más nueva cancele la anterior en cualquier worker
+    ('ANALYZER_EDITORES_MAPA', 'editores'),
+)
+propios = []
+for variable, nombre in COMPARTIDOS:
+    if variable not in os.environ:
+        os.environ[variable] = os.path.join('/tmp', f'analizador-{nombre}-{os.getpid()}')
+        propios.append(os.environ[variable])
+
+
+def _remove(ruta):
+    import shutil
+    if os.path.isdir(ruta):
+        shutil.rmtree(ruta, ignore_errors=True)
+    elif os.path.exists(ruta):
+        os.remove(ruta)
+
+
+def on_starting(server):
+    # Se parte de directorios de métricas, trabajos y sesiones y de un mapa de editores vacíos en cada arranque del maestro
+    for variable, _ in COMPARTIDOS:
+        _remove(os.environ[variable])
+    os.makedirs(os.environ['ANALYZER_METRICS_DIR'], exist_ok=True)
+
+
+def on_exit(server):
+    # Las rutas por defecto llevan el PID de este maestro: nadie más las usará
+    for ruta in propios:
+        _remove(ruta)
+
+
+def post_fork(server, worker):
+    # Los workers aislados se crean en cada worker (nunca en el maestro) para
+    # que la primera petición no pague su arranque
+    import limites_go
+    if limites_go.AISLAMIENTO:
+        limites_go.get_pool()
+
+
+def worker_exit(server, worker):
+    import limites_go
+    import bitacora_go
+    limites_go.shutdown_pool()
+    bitacora_go.shutdown_logging()
@@ -0,0 +1,285 @@
+"""
+Instrumentación por petición del Analizador de Código Go
+Mide la duración de cada fase (y de subfases como la construcción de la tabla
+de símbolos o la serialización) y, si se pide el detalle, cuenta tokens,
+transiciones de los parsers y bloques de memoria asignados. Con la opción de
+memoria, registra con tracemalloc la memoria pico y retenida de cada fase y los
+sitios que más memoria asignan.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import ply.lex as lex
+
+# Medición activa del hilo actual (None fuera de una fase medida)
+_local = threading.local()
+
+
+class Medicion:
+    """Desglose de tiempos y contadores de un análisis."""
+
+    def __init__(self, detalle=False, perfilar=False, memoria=False):
+        self.detalle = detalle
+        self.perfilar = perfilar
+        self.memoria = memoria
+        self.perfil = None
+        self.fases = {}
+        self.contadores = {}
+        self.memoria_fases = {}
+        self.cache = False
+        self._pico_previo = 0
+
+    def add(self, fase, segundos):
+        self.fases[fase] = self.fases.get(fase, 0.0) + segundos
+
+    def count(self, nombre, valor=1, fase=None):
+        clave = (nombre, fase)
+        self.contadores[clave] = self.contadores.get(clave, 0) + valor
+
+    def export(self):
+        """Datos serializables para enviarlos desde un worker aislado."""
+        return {'fases': self.fases, 'contadores': self.contadores, 'memoria': self.memoria_fases}
+
+    def merge(self, datos):
+        for fase, segundos in datos['fases'].items():
+            self.add(fase, segundos)
+        for (nombre, fase), valor in datos['contadores'].items():
+            self.count(nombre, valor, fase)
+        self.memoria_fases.update(datos.get('memoria', {}))
+
+    def server_timing(self):
+        """Valor de la cabecera Server-Timing (duraciones en milisegundos)."""
+        entradas = [f'{fase};dur={segundos * 1000:.3f}' for fase, segundos in self.fases.items()]
+        if self.cache:
+            entradas.insert(0, 'cache;desc="hit"')
+        return ', '.join(entradas)
+
+    def to_dict(self):
+        """Bloque 'timings' de la respuesta JSON."""
+        datos = {
+            'cache': self.cache,
+            'fases_ms': {fase: round(segundos * 1000, 3) for fase, segundos in self.fases.items()},
+        }
+        for (nombre, fase), valor in self.contadores.items():
+            if fase is None:
+                datos[nombre] = valor
+            else:
+                datos.setdefault(nombre, {})[fase] = valor
+        return datos
+
+
+@contextmanager
+def subfase(nombre):
+    """
+    Mide un tramo dentro de una fase (por ejemplo 'tabla_simbolos').
+    Fuera de una fase medida no hace nada, así que el CLI no paga ningún coste.
+    """
+    medicion = getattr(_local, 'medicion', None)
+    if medicion is None:
+        yield
+        return
+    memoria = medicion.memoria and tracemalloc.is_tracing()
+    if memoria:
+        # Se reinicia el pico para medir sólo la subfase; el de la fase se conserva aparte
+        antes, pico_previo = tracemalloc.get_traced_memory()
+        medicion._pico_previo = max(medicion._pico_previo, pico_previo)
+        tracemalloc.reset_peak()
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        medicion.add(nombre, time.perf_counter() - inicio)
+        if memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            medicion.memoria_fases[nombre] = {
+                'pico_kb': round((pico - antes) / 1024, 1),
+                'retenido_kb': round((actual - antes) / 1024, 1),
+            }
+
+
+@contextmanager
+def _contar_transiciones(parser, fase, medicion):
+    """
+    Cuenta las transiciones del parser LR durante la fase: cada token leído
+    (desplazamiento) y cada reducción de una regla p_*.
+    """
+    reducciones = [0]
+    leidos = [0]
+    originales = [produccion.callable for produccion in parser.productions]
+
+    def envolver(funcion):
+        def contar(p):
+            reducciones[0] += 1
+            return funcion(p)
+        return contar
+
+    token_original = lex.Lexer.token
+
+    def token(self):
+        tok = token_original(self)
+        if tok is not None:
+            leidos[0] += 1
+        return tok
+
+    for produccion in parser.productions:
+        if produccion.callable is not None:
+            produccion.callable = envolver(produccion.callable)
+    lex.Lexer.token = token
+    try:
+        yield
+    finally:
+        lex.Lexer.token = token_original
+        for produccion, funcion in zip(parser.productions, originales):
+            produccion.callable = funcion
+        medicion.count('transiciones', leidos[0] + reducciones[0], fase)
+        medicion.count('reducciones', reducciones[0], fase)
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def _allocation_sites(antes, despues, top):
+    """Líneas de código que más memoria retienen entre dos instantáneas."""
+    sitios = []
+    for diferencia in despues.compare_to(antes, 'lineno'):
+        if len(sitios) == top:
+            break
+        if diferencia.size_diff <= 0:
+            continue
+        marco = diferencia.traceback[0]
+        sitios.append({
+            'archivo': os.path.basename(marco.filename),
+            'linea': marco.lineno,
+            'kb': round(diferencia.size_diff / 1024, 1),
+            'bloques': diferencia.count_diff,
+        })
+    return sitios
+
+
+def _trace_memory(medicion, nombre, funcion, argumento, top):
+    """Ejecuta funcion(argumento) bajo tracemalloc y guarda su memoria pico, retenida y sitios."""
+    propio = not tracemalloc.is_tracing()
+    if propio:
+        tracemalloc.start()
+    antes = _snapshot()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    medicion._pico_previo = 0
+    try:
+        resultado = funcion(argumento)
+    finally:
+        actual, pico = tracemalloc.get_traced_memory()
+        pico = max(pico, medicion._pico_previo)
+        despues = _snapshot()
+        if propio:
+            tracemalloc.stop()
+    medicion.memoria_fases[nombre] = {
+        'pico_kb': round((pico - base) / 1024, 1),
+        'retenido_kb': round((actual - base) / 1024, 1),
+        'sitios': _allocation_sites(antes, despues, top),
+        **medicion.memoria_fases.get(nombre, {}),
+    }
+    return resultado
+
+
+def measure_memory(nombre, funcion, argumento, top=5):
+    """Memoria de un paso que no es una fase (por ejemplo la codificación JSON de la respuesta)."""
+    medicion = Medicion(memoria=True)
+    _trace_memory(medicion, nombre, funcion, argumento, top)
+    return medicion.export()
+
+
+def run_phase(fase, funcion, code, detalle=False, parser=None, memoria=False, top=5):
+    """
+    Ejecuta una fase midiéndola. Devuelve (resultado, duración, datos de la medición).
+    La duración de la fase excluye las subfases, que se reportan por separado.
+    Con memoria=True la fase corre bajo tracemalloc (más lenta) y se reporta su memoria.
+    """
+    medicion = Medicion(detalle, memoria=memoria)
+    _local.medicion = medicion
+    bloques = sys.getallocatedblocks() if detalle else 0
+    inicio = time.perf_counter()
+    try:
+        if detalle and parser is not None:
+            with _contar_transiciones(parser, fase, medicion):
+                resultado = _run(medicion, fase, funcion, code, top)
+        else:
+            resultado = _run(medicion, fase, funcion, code, top)
+    finally:
+        duracion = time.perf_counter() - inicio
+        _local.medicion = None
+    medicion.fases = {fase: duracion - sum(medicion.fases.values()), **medicion.fases}
+    if detalle:
+        medicion.count('bloques_memoria', sys.getallocatedblocks() - bloques, fase)
+        if fase == 'lexico':
+            medicion.count('tokens', len(resultado['tokens']))
+    return resultado, duracion, medicion.export()
+
+
+def _run(medicion, fase, funcion, code, top):
+    if medicion.memoria:
+        return _trace_memory(medicion, fase, funcion, code, top)
+    return funcion(code)
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+if __name__ == '__main__':
+    import json
+    # Se importa el módulo por su nombre para compartir el estado con semantico_go (subfases)
+    from instrumentacion_go import Medicion, measure_memory, run_phase
+    from analisis_go import build_response
+    from lexico_go import analyze_code_string
+    from sintactico_go import analyze_syntax_string, get_parser as parser_sintactico
+    from semantico_go import analyze_semantic_string, get_parser as parser_semantico
+
+    argumentos = argparse.ArgumentParser(description='Desglose de tiempo y memoria por fase de un archivo .go.')
+    argumentos.add_argument('archivo')
+    argumentos.add_argument('--top', type=int, default=5, help='sitios de asignación por fase')
+    opciones = argumentos.parse_args()
+    try:
+        with open(opciones.archivo, 'r', encoding='utf-8') as archivo:
+            codigo = archivo.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error al leer '{opciones.archivo}': {e}")
+        sys.exit(1)
+
+    total = Medicion(detalle=True, memoria=True)
+    resultados = {}
+    for fase, funcion, parser in (('lexico', analyze_code_string, None),
+                                  ('sintactico', analyze_syntax_string, parser_sintactico),
+                                  ('semantico', analyze_semantic_string, parser_semantico)):
+        resultados[fase], _, datos = run_phase(fase, funcion, codigo, True, parser and parser(), True,
+                                               opciones.top)
+        total.merge(datos)
+    respuesta = build_response(resultados['lexico'], resultados['sintactico'], resultados['semantico'])
+    total.merge(measure_memory('json', json.dumps, respuesta, opciones.top))
+
+    print(f"\n{'Fase':16} {'Tiempo (ms)':>12} {'Pico (KB)':>12} {'Retenido (KB)':>14}")
+    print('=' * 58)
+    for fase, datos in total.memoria_fases.items():
+        tiempo = total.fases.get(fase)
+        tiempo = f'{tiempo * 1000:>12.2f}' if tiempo is not None else f"{'-':>12}"
+        print(f"{fase:16} {tiempo} {datos['pico_kb']:>12.1f} {datos['retenido_kb']:>14.1f}")
+    for fase, datos in total.memoria_fases.items():
+        if datos.get('sitios'):
+            print(f"\nSitios que más memoria retienen en {fase}:")
+            for sitio in datos['sitios']:
+                print(f"  {sitio['archivo'] + ':' + str(sitio['linea']):28} {sitio['kb']:>10.1f} KB {sitio['bloques']:>8} bloques")
+    print('\nNota: las fases corren bajo tracemalloc, así que los tiempos son mayores que los normales.')
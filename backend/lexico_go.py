@@ -10,9 +10,14 @@ Integrantes:
 
 import ply.lex as lex
 from datetime import datetime
+import string
 import sys
 import os
 import subprocess
+import threading
+from bisect import bisect_left
+
+import cancelacion_go
 
 # Palabras reservadas de Go
 reserved = {
@@ -158,7 +163,7 @@ def t_COMMENT_SINGLE(t):
 
 # Comentarios multilínea
 def t_COMMENT_MULTI(t):
-    r'/\*(.|\n)*?\*/'
+    r'/\*[^*]*\*+([^/*][^*]*\*+)*/'
     t.lexer.lineno += t.value.count('\n')
     pass
 
@@ -170,47 +175,95 @@ def t_newline(t):
 # Espacios, tabulaciones y retornos de carro (Windows)
 t_ignore = ' \t\r'
 
+# Caracteres con los que puede empezar algún token (o que se ignoran)
+INICIO_TOKEN = frozenset(string.ascii_letters + string.digits + '_ \t\r\n+-*/%()[]{};,.:=!<>&|^"\'')
+
 # Manejo de errores - CORREGIDO
 def t_error(t):
+    # PLY copia el resto del código en cada llamada a t_error, así que una racha de
+    # caracteres ilegales se consume de una vez (con un error por carácter)
+    lexer_data = t.lexer.lexdata
+    fin = t.lexpos + 1
+    while fin < len(lexer_data) and lexer_data[fin] not in INICIO_TOKEN:
+        fin += 1
     column = find_column(t)
-    error_obj = {
-        'char': t.value[0],
-        'line': t.lineno,
-        'column': column,
-        'message': f"Carácter ilegal '{t.value[0]}'"
-    }
-    
-    if hasattr(t.lexer, 'errors_list'):
-        t.lexer.errors_list.append(error_obj)
+    for i in range(fin - t.lexpos):
+        char = lexer_data[t.lexpos + i]
+        error_obj = {
+            'char': char,
+            'line': t.lineno,
+            'column': column + i if column else 0,
+            'message': f"Carácter ilegal '{char}'"
+        }
+        
+        if hasattr(t.lexer, 'errors_list'):
+            t.lexer.errors_list.append(error_obj)
     
-    t.lexer.skip(1)
+    t.lexer.skip(fin - t.lexpos)
 
 # Función auxiliar para encontrar la columna
 def find_column(token):
     if hasattr(token, 'lexer') and hasattr(token.lexer, 'source_code'):
-        lexer_data = token.lexer.source_code
-        line_start = lexer_data.rfind('\n', 0, token.lexpos) + 1
+        lexer = token.lexer
+        lexer_data = lexer.source_code
+        # Los tokens llegan en orden, así que sólo se busca el salto de línea desde el
+        # token anterior; buscar hasta el inicio de la línea es cuadrático en líneas largas
+        desde, line_start = getattr(lexer, 'column_cache', (0, 0))
+        if token.lexpos < desde:
+            desde, line_start = 0, 0
+        salto = lexer_data.rfind('\n', desde, token.lexpos)
+        if salto != -1:
+            line_start = salto + 1
+        lexer.column_cache = (token.lexpos, line_start)
         return (token.lexpos - line_start) + 1
     else:
         return 0
 
+# Lexer base construido una sola vez por proceso; cada análisis usa una copia
+_lexer_base = None
+
+def get_lexer():
+    """
+    Devuelve un lexer nuevo, clonado del lexer base.
+    Construir el lexer compila la expresión regular maestra, así que se hace una
+    sola vez (en el proceso maestro cuando se usa el servidor de producción).
+    Si el análisis del hilo tiene una cancelación activa (cancelacion_go), el lexer
+    la consulta cada CADA_TOKENS tokens, también cuando lo usan los parsers.
+    """
+    global _lexer_base
+    if _lexer_base is None:
+        import lexico_go
+        _lexer_base = lex.lex(module=lexico_go)
+    lexer = _lexer_base.clone()
+    cancelacion = cancelacion_go.current()
+    if cancelacion is not None:
+        lexer.token = cancelacion_go.checked_token(lexer.token, cancelacion)
+    return lexer
+
 # ============================================================================
 # Para usar en API REST
 # ============================================================================
 
-def analyze_code_string(code_string):
+def analyze_code_string(code_string, cache=None):
     """
     Analiza código Go recibido como string (para API).
     Devuelve un diccionario con tokens y errores estructurados.
+    Con una CacheTokens del mismo documento sólo se vuelve a tokenizar la zona
+    afectada por la última edición; el resultado es el mismo.
     """
+    if cache is not None:
+        with cache.lock:
+            tokens, errores = _analyze_incremental(code_string, cache)
+            return {'tokens': list(tokens), 'errors': list(errores)}
+
     # Crear un nuevo lexer para esta petición
-    import lexico_go
-    new_lexer = lex.lex(module=lexico_go)
+    new_lexer = get_lexer()
     
     # Inicializamos atributos personalizados
     new_lexer.tokens_list = []
     new_lexer.errors_list = []
     new_lexer.source_code = code_string
+    new_lexer.column_cache = (0, 0)
     
     # Reiniciamos el lexer
     new_lexer.lineno = 1
@@ -237,6 +290,148 @@ def analyze_code_string(code_string):
         'errors': new_lexer.errors_list
     }
 
+# ============================================================================
+# ANÁLISIS INCREMENTAL
+# ============================================================================
+
+class CacheTokens:
+    """
+    Tokens del último análisis de un documento que se edita, con la posición donde
+    empieza cada uno y, por cada error, cuántos tokens lo preceden. Tras una edición
+    se vuelve a tokenizar desde el último token que empieza antes del cambio hasta
+    el primer token posterior a la línea del cambio que empieza donde empezaba uno
+    del análisis anterior; el resto se reutiliza con la línea corregida.
+    Cada documento usa su propia CacheTokens.
+    """
+
+    def __init__(self):
+        self.code = None
+        self.tokens = []
+        self.inicios = []
+        self.errores = []
+        self.previos = []
+        # Tokens en o antes de una cadena o un comentario sin cerrar: el lexer probó a
+        # leer desde ahí hasta el final del archivo, así que no se retoma después de ellos
+        self.contaminados = []
+        self.lock = threading.Lock()
+        # Bytes que se volvieron a tokenizar en el último análisis
+        self.relexados = 0
+
+
+def common_prefix(a, b, bloque=4096):
+    """Longitud del prefijo común, comparando primero por bloques."""
+    limite = min(len(a), len(b))
+    i = 0
+    while i + bloque <= limite and a[i:i + bloque] == b[i:i + bloque]:
+        i += bloque
+    while i < limite and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def common_suffix(a, b, limite, bloque=4096):
+    """Longitud del sufijo común, sin pasar de 'limite' caracteres."""
+    i = 0
+    while i + bloque <= limite and a[len(a) - i - bloque:len(a) - i] == b[len(b) - i - bloque:len(b) - i]:
+        i += bloque
+    while i < limite and a[len(a) - i - 1] == b[len(b) - i - 1]:
+        i += 1
+    return i
+
+
+def _analyze_incremental(code_string, cache):
+    anterior = cache.code
+    if anterior is None:
+        m, inicio, linea = 0, 0, 1
+        reanudar = None
+    else:
+        inicio_cambio = common_prefix(anterior, code_string)
+        if inicio_cambio == len(anterior) == len(code_string):
+            cache.relexados = 0
+            return cache.tokens, cache.errores
+        sufijo = common_suffix(anterior, code_string, min(len(anterior), len(code_string)) - inicio_cambio)
+        # Último token que empieza antes del cambio: los anteriores terminan (y el lexer
+        # miró, como mucho, un carácter más allá) antes del cambio
+        m = max(0, bisect_left(cache.inicios, inicio_cambio) - 1)
+        if cache.contaminados:
+            m = min(m, cache.contaminados[0])
+        # Sin tokens anteriores se empieza desde el inicio del código
+        inicio, linea = (cache.inicios[m], cache.tokens[m]['line']) if m > 0 else (0, 1)
+        # Se retoma el análisis anterior en la línea siguiente al cambio, donde las
+        # columnas ya no cambian
+        salto = anterior.find('\n', len(anterior) - sufijo)
+        reanudar = salto + 1 if salto != -1 else None
+    desplazamiento = len(code_string) - (len(anterior) if anterior is not None else 0)
+
+    lexer = get_lexer()
+    lexer.errors_list = []
+    lexer.source_code = code_string
+    lexer.column_cache = (0, 0)
+    lexer.input(code_string)
+    lexer.lexpos = inicio
+    lexer.lineno = linea
+
+    tokens = cache.tokens[:m]
+    inicios = cache.inicios[:m]
+    n_errores = bisect_left(cache.previos, m + 1) if m > 0 else 0
+    errores = cache.errores[:n_errores]
+    previos = cache.previos[:n_errores]
+    contaminados = [c for c in cache.contaminados if c < m]
+    j = None
+    while True:
+        tok = lexer.token()
+        if lexer.errors_list:
+            # Una comilla ilegal es una cadena sin cerrar
+            if any(error['char'] == '"' for error in lexer.errors_list):
+                contaminados.append(max(0, len(tokens) - 1))
+            errores.extend(lexer.errors_list)
+            previos.extend([len(tokens)] * len(lexer.errors_list))
+            lexer.errors_list = []
+        if not tok:
+            break
+        if reanudar is not None and tok.lexpos - desplazamiento >= reanudar:
+            # Desde aquí el código es el mismo que antes, desplazado
+            k = bisect_left(cache.inicios, tok.lexpos - desplazamiento)
+            if k < len(cache.inicios) and cache.inicios[k] == tok.lexpos - desplazamiento:
+                j = k
+                break
+        if tok.type == 'DIVIDE' and code_string.startswith('*', tok.lexpos + 1):
+            # '/' seguido de '*' es un comentario sin cerrar
+            contaminados.append(len(tokens))
+        tokens.append({
+            'type': tok.type,
+            'value': str(tok.value),
+            'line': tok.lineno,
+            'column': find_column(tok)
+        })
+        inicios.append(tok.lexpos)
+
+    if j is None:
+        cache.relexados = len(code_string) - inicio
+    else:
+        # El resto es el análisis anterior con las líneas, posiciones e índices desplazados
+        lineas = tok.lineno - cache.tokens[j]['line']
+        indices = len(tokens) - j
+        if lineas:
+            tokens.extend([dict(token, line=token['line'] + lineas) for token in cache.tokens[j:]])
+        else:
+            tokens.extend(cache.tokens[j:])
+        inicios.extend(posicion + desplazamiento for posicion in cache.inicios[j:])
+        desde_error = bisect_left(cache.previos, j + 1)
+        errores.extend(dict(error, line=error['line'] + lineas) if lineas else error
+                       for error in cache.errores[desde_error:])
+        previos.extend(previo + indices for previo in cache.previos[desde_error:])
+        contaminados.extend(c + indices for c in cache.contaminados if c >= j)
+        cache.relexados = tok.lexpos - inicio
+
+    cache.code = code_string
+    cache.tokens = tokens
+    cache.inicios = inicios
+    cache.errores = errores
+    cache.previos = previos
+    cache.contaminados = contaminados
+    return tokens, errores
+
 # ============================================================================
 # Para usar en CLI
 # ============================================================================
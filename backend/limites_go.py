@@ -0,0 +1,693 @@
+"""
+Límites de tiempo, CPU y memoria para el Analizador de Código Go
+Cada análisis se ejecuta en un proceso worker aislado que puede terminarse
+si supera su presupuesto, sin afectar a las demás peticiones. Un análisis
+cancelado (cancelacion_go) se abandona sin terminar el worker.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import cProfile
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lexico_go import analyze_code_string
+import sintactico_go
+import semantico_go
+from sintactico_go import analyze_syntax_string
+from semantico_go import analyze_semantic_string
+from analisis_go import build_response, cache_resultados
+from posiciones_go import IndicePosiciones, cache_posiciones
+from metricas_go import registro, observe_analysis
+from instrumentacion_go import run_phase, measure_memory
+from cancelacion_go import AnalisisCancelado, Cancelacion, CancelacionCompartida, MOTIVOS, activate
+from analisis_go import analisis_lock
+import paralelo_go
+
+try:
+    import resource
+except ImportError:  # Windows no dispone del módulo resource
+    resource = None
+
+# Presupuestos por análisis (modificables por variables de entorno)
+TIEMPO_MAX = float(os.environ.get('ANALYZER_TIEMPO_MAX', '10'))
+CPU_MAX = float(os.environ.get('ANALYZER_CPU_MAX', '0')) or TIEMPO_MAX
+MEMORIA_MAX_MB = int(os.environ.get('ANALYZER_MEMORIA_MAX_MB', '1024'))
+WORKERS_AISLADOS = int(os.environ.get('ANALYZER_WORKERS_AISLADOS', '0')) or os.cpu_count() or 1
+AISLAMIENTO = os.environ.get('ANALYZER_AISLAMIENTO', '1') != '0'
+# Tiempo total de un análisis de paquetes (todos sus archivos); cada archivo, además, con el de un análisis
+TIEMPO_MAX_PAQUETE = float(os.environ.get('ANALYZER_TIEMPO_MAX_PAQUETE', '0')) or 3 * TIEMPO_MAX
+# Cada cuánto se revisa la cancelación de un análisis mientras se espera a su worker
+INTERVALO_CANCELACION = float(os.environ.get('ANALYZER_CANCELACION_MS', '50')) / 1000
+
+# Fases del análisis en el orden en que se ejecutan
+FASES = (
+    ('lexico', analyze_code_string),
+    ('sintactico', analyze_syntax_string),
+    ('semantico', analyze_semantic_string),
+)
+
+# Parser de cada fase (construido al primer uso), para contar sus transiciones cuando se pide el detalle
+PARSERS = {
+    'sintactico': sintactico_go.get_parser,
+    'semantico': semantico_go.get_parser,
+}
+
+MENSAJES_LIMITE = {
+    'tiempo': 'se superó el límite de tiempo',
+    'cpu': 'se superó el límite de CPU',
+    'memoria': 'se superó el límite de memoria',
+    'proceso': 'el proceso de análisis terminó inesperadamente',
+    'desconexion': 'el cliente cerró la conexión',
+    'reemplazada': 'llegó una petición más nueva del mismo editor',
+}
+
+
+class LimiteCPU(BaseException):
+    """
+    Se lanza dentro del worker cuando vence el temporizador de CPU.
+    Hereda de BaseException para que los 'except Exception' de los analizadores no la capturen.
+    """
+    pass
+
+
+class PoolSaturado(Exception):
+    """No quedó ningún worker libre dentro del tiempo máximo de espera."""
+
+    def __init__(self, retry_after):
+        super().__init__('Todos los workers de análisis están ocupados')
+        self.retry_after = retry_after
+
+
+# ============================================================================
+# Proceso worker
+# ============================================================================
+
+def _on_cpu_limit(signum, frame):
+    raise LimiteCPU()
+
+
+def _parser(fase):
+    return PARSERS[fase]() if fase in PARSERS else None
+
+
+def _measure_encoding(resultados):
+    """Memoria de codificar la respuesta completa a JSON, el último paso antes de responder."""
+    response = build_response(resultados['lexico'], resultados['sintactico'], resultados['semantico'])
+    return measure_memory('json', json.dumps, response)
+
+
+def _run_call(conn, llamada, cancelacion, usar_itimer):
+    """Ejecuta funcion(*args) de una llamada (ver PoolAislado.call) con el presupuesto de CPU de un análisis."""
+    funcion, args, cpu_max = llamada
+    final = ('fin', None, None)
+    try:
+        if usar_itimer and cpu_max > 0:
+            signal.setitimer(signal.ITIMER_PROF, cpu_max)
+        with activate(cancelacion):
+            resultado = funcion(*args)
+        if usar_itimer:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+        conn.send(('resultado', None, resultado))
+    except LimiteCPU:
+        final = ('limite', None, 'cpu')
+    except AnalisisCancelado as e:
+        final = ('limite', None, e.motivo)
+    except MemoryError:
+        final = ('limite', None, 'memoria')
+    except Exception as e:
+        final = ('error', None, str(e))
+    finally:
+        if usar_itimer:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+    conn.send(final)
+
+
+def _worker_loop(conn, memoria_max_mb, bandera):
+    """
+    Bucle del proceso hijo: recibe código, ejecuta las fases y envía cada resultado
+    (o ejecuta una llamada de PoolAislado.call y envía su resultado).
+    El proceso de la API cancela el trabajo en curso escribiendo en la bandera.
+    """
+    if resource is not None and memoria_max_mb > 0:
+        limite = memoria_max_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+        except (ValueError, OSError):
+            pass
+    usar_itimer = hasattr(signal, 'setitimer')
+    if usar_itimer:
+        signal.signal(signal.SIGPROF, _on_cpu_limit)
+    # Los parsers se cargan antes de aceptar trabajo para que la primera petición no lo pague
+    for construir in PARSERS.values():
+        construir()
+    cancelacion = CancelacionCompartida(bandera)
+
+    while True:
+        try:
+            mensaje = conn.recv()
+        except EOFError:
+            break
+        if mensaje is None:
+            break
+        tipo, datos = mensaje
+        if tipo == 'llamada':
+            _run_call(conn, datos, cancelacion, usar_itimer)
+            continue
+        code, cpu_max, detalle, perfilar, memoria = datos
+        restante = cpu_max if usar_itimer and cpu_max > 0 else 0
+        perfil = cProfile.Profile() if perfilar else None
+        fase = None
+        final = ('fin', None, None)
+        resultados = {}
+        try:
+            for fase, funcion in FASES:
+                cancelacion.check()
+                conn.send(('inicio', fase, None))
+                # El temporizador sólo corre mientras se analiza, nunca durante un envío
+                if restante:
+                    signal.setitimer(signal.ITIMER_PROF, restante)
+                if perfil is not None:
+                    perfil.enable()
+                with activate(cancelacion):
+                    medida = run_phase(fase, funcion, code, detalle, _parser(fase), memoria)
+                if restante:
+                    restante = signal.setitimer(signal.ITIMER_PROF, 0)[0] or 0.001
+                if perfil is not None:
+                    perfil.disable()
+                resultados[fase] = medida[0]
+                conn.send(('fase', fase, medida))
+            if memoria:
+                fase = None
+                conn.send(('medida', 'json', _measure_encoding(resultados)))
+        except LimiteCPU:
+            final = ('limite', fase, 'cpu')
+        except AnalisisCancelado as e:
+            final = ('limite', fase, e.motivo)
+        except MemoryError:
+            final = ('limite', fase, 'memoria')
+        except Exception as e:
+            final = ('error', fase, str(e))
+        finally:
+            if usar_itimer:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+        # El perfil también se envía si el análisis se interrumpió: es justo el caso interesante
+        if perfil is not None:
+            perfil.disable()
+            perfil.create_stats()
+            conn.send(('perfil', None, perfil.stats))
+        conn.send(final)
+
+
+class WorkerAislado:
+    """Proceso hijo persistente que se puede matar y reemplazar."""
+
+    def __init__(self, contexto, memoria_max_mb):
+        self.conn, conn_hijo = contexto.Pipe()
+        self.bandera = contexto.Value('b', 0, lock=False)
+        self.proceso = contexto.Process(target=_worker_loop, args=(conn_hijo, memoria_max_mb, self.bandera),
+                                        daemon=True)
+        self.proceso.start()
+        conn_hijo.close()
+
+    def kill(self):
+        self.proceso.kill()
+        self.proceso.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.proceso.join(timeout=1)
+        if self.proceso.is_alive():
+            self.kill()
+
+
+# ============================================================================
+# Pool de workers con presupuesto
+# ============================================================================
+
+class PoolAislado:
+    """
+    Conjunto fijo de workers aislados. Un análisis que supera su presupuesto
+    mata sólo a su worker, que se reemplaza de inmediato por uno nuevo.
+    """
+
+    def __init__(self, workers=WORKERS_AISLADOS, tiempo_max=TIEMPO_MAX, cpu_max=CPU_MAX,
+                 memoria_max_mb=MEMORIA_MAX_MB):
+        self.contexto = multiprocessing.get_context()
+        self.tiempo_max = tiempo_max
+        self.cpu_max = cpu_max
+        self.memoria_max_mb = memoria_max_mb
+        self.libres = queue.Queue()
+        self.workers = workers
+        for _ in range(workers):
+            self.libres.put(self._new_worker())
+        self.hilos = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='aislado')
+
+    def _new_worker(self):
+        return WorkerAislado(self.contexto, self.memoria_max_mb)
+
+    def run(self, code, on_fase=None, tiempo_max=None, detalle=False, perfilar=False, memoria=False,
+            cancelacion=None):
+        """
+        Ejecuta las tres fases en un worker libre respetando el presupuesto.
+        Devuelve {'resultados': {fase: resultado}, 'tiempos': {fase: segundos},
+        'medidas': {fase: desglose}, 'perfil': None | estadísticas de cProfile,
+        'limite': None | {'fase', 'motivo'}}.
+        on_fase(nombre, estado) se invoca al iniciar y al terminar cada fase.
+        detalle activa los contadores de tokens, transiciones y memoria; perfilar, cProfile;
+        memoria, la medición con tracemalloc de cada fase y de la codificación JSON ('medidas'['json']).
+        Con la cancelación (cancelacion_go.Cancelacion), 'limite' lleva su motivo si se activa.
+        """
+        resultados = {}
+        tiempos = {}
+        medidas = {}
+        perfil = None
+
+        def recibir(tipo, fase, dato):
+            nonlocal perfil
+            if tipo == 'inicio':
+                if on_fase:
+                    on_fase(fase, 'procesando')
+            elif tipo == 'fase':
+                resultados[fase], tiempos[fase], medidas[fase] = dato
+                if on_fase:
+                    on_fase(fase, 'completado')
+            elif tipo == 'medida':
+                medidas[fase] = dato
+            elif tipo == 'perfil':
+                perfil = dato
+
+        limite = self._exchange(('analisis', (code, self.cpu_max, detalle, perfilar, memoria)),
+                                tiempo_max, cancelacion, recibir)
+        return {'resultados': resultados, 'tiempos': tiempos, 'medidas': medidas, 'perfil': perfil,
+                'limite': limite}
+
+    def call(self, funcion, args, tiempo_max=None, cancelacion=None):
+        """
+        Ejecuta funcion(*args) en un worker libre con el presupuesto de un análisis
+        (tiempo, CPU y memoria). funcion debe ser una función de nivel de módulo y
+        args y el resultado, serializables con pickle.
+        Devuelve {'resultado': valor | None, 'limite': None | {'fase', 'motivo'}}.
+        """
+        resultado = None
+
+        def recibir(tipo, fase, dato):
+            nonlocal resultado
+            if tipo == 'resultado':
+                resultado = dato
+
+        limite = self._exchange(('llamada', (funcion, args, self.cpu_max)), tiempo_max, cancelacion, recibir)
+        return {'resultado': resultado, 'limite': limite}
+
+    def _exchange(self, mensaje, tiempo_max, cancelacion, recibir):
+        """
+        Envía un trabajo a un worker libre y pasa a recibir(tipo, fase, dato) cada
+        mensaje que responde hasta el final. Devuelve el límite que lo interrumpió, o
+        None; lanza RuntimeError si el trabajo falló y PoolSaturado si no hubo worker.
+        Si se activa la cancelación (cancelacion_go.Cancelacion), el worker abandona el
+        trabajo en el siguiente punto de control y el límite lleva su motivo.
+        """
+        tiempo_max = tiempo_max or self.tiempo_max
+        try:
+            worker = self.libres.get(timeout=tiempo_max)
+        except queue.Empty:
+            raise PoolSaturado(max(1, int(tiempo_max)))
+
+        fase_actual = None
+        limite = None
+        error = None
+        limite_tiempo = time.monotonic() + tiempo_max
+        espera = INTERVALO_CANCELACION if cancelacion is not None else tiempo_max
+        try:
+            worker.bandera.value = 0
+            worker.conn.send(mensaje)
+            while True:
+                restante = limite_tiempo - time.monotonic()
+                if restante <= 0:
+                    limite = {'fase': fase_actual, 'motivo': 'tiempo'}
+                    break
+                if not worker.conn.poll(min(restante, espera)):
+                    if cancelacion is not None and not worker.bandera.value and cancelacion.cancelled:
+                        # El worker lo nota en su siguiente punto de control y responde 'limite'
+                        worker.bandera.value = MOTIVOS.index(cancelacion.motivo) + 1
+                    continue
+                tipo, fase, dato = worker.conn.recv()
+                if tipo == 'inicio':
+                    fase_actual = fase
+                elif tipo == 'fase':
+                    fase_actual = None
+                elif tipo == 'limite':
+                    limite = {'fase': fase, 'motivo': dato}
+                    break
+                elif tipo == 'error':
+                    error = dato
+                    break
+                elif tipo == 'fin':
+                    break
+                recibir(tipo, fase, dato)
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            limite = {'fase': fase_actual, 'motivo': 'proceso'}
+
+        # Un worker que superó el tiempo (o murió) se reemplaza; los demás se reutilizan
+        if limite is not None and limite['motivo'] in ('tiempo', 'proceso'):
+            worker.kill()
+            worker = self._new_worker()
+        self.libres.put(worker)
+
+        if error is not None:
+            raise RuntimeError(error)
+        if limite is not None:
+            limite['limite_segundos'] = {'tiempo': tiempo_max, 'cpu': self.cpu_max}.get(limite['motivo'])
+        return limite
+
+    def map(self, codes, detalle=False):
+        """
+        Ejecuta varios análisis a la vez, uno por worker libre. Si un análisis no
+        consigue worker o su worker falla, en su lugar queda la excepción (PoolSaturado
+        o RuntimeError) y los resultados de los demás se conservan.
+        """
+        def ejecutar(code):
+            try:
+                return self.run(code, detalle=detalle)
+            except (PoolSaturado, RuntimeError) as e:
+                return e
+        return list(self.hilos.map(ejecutar, codes))
+
+    def shutdown(self):
+        self.hilos.shutdown(wait=False)
+        while True:
+            try:
+                self.libres.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+def _run_in_process(code, on_fase=None, detalle=False, perfilar=False, memoria=False, cancelacion=None):
+    """
+    Ejecución sin aislamiento (ANALYZER_AISLAMIENTO=0): sin presupuestos, pero cancelable.
+    Las fases corren bajo analisis_lock, porque los analizadores guardan su estado en
+    globales del módulo; mientras espera el lock, el análisis también se puede cancelar.
+    """
+    if cancelacion is None:
+        with analisis_lock:
+            return _run_phases(code, on_fase, detalle, perfilar, memoria, cancelacion)
+    # Se consulta la cancelación antes de tomar el lock y mientras se espera
+    while True:
+        if cancelacion.cancelled:
+            return {'resultados': {}, 'tiempos': {}, 'medidas': {}, 'perfil': None,
+                    'limite': {'fase': FASES[0][0], 'motivo': cancelacion.motivo}}
+        if analisis_lock.acquire(timeout=INTERVALO_CANCELACION):
+            break
+    try:
+        return _run_phases(code, on_fase, detalle, perfilar, memoria, cancelacion)
+    finally:
+        analisis_lock.release()
+
+
+def _run_phases(code, on_fase, detalle, perfilar, memoria, cancelacion):
+    resultados = {}
+    tiempos = {}
+    medidas = {}
+    perfil = cProfile.Profile() if perfilar else None
+    for fase, funcion in FASES:
+        if cancelacion is not None and cancelacion.cancelled:
+            return {'resultados': resultados, 'tiempos': tiempos, 'medidas': medidas, 'perfil': None,
+                    'limite': {'fase': fase, 'motivo': cancelacion.motivo}}
+        if on_fase:
+            on_fase(fase, 'procesando')
+        if perfil is not None:
+            perfil.enable()
+        try:
+            with activate(cancelacion):
+                resultados[fase], tiempos[fase], medidas[fase] = run_phase(fase, funcion, code, detalle,
+                                                                           _parser(fase), memoria)
+        except AnalisisCancelado as e:
+            return {'resultados': resultados, 'tiempos': tiempos, 'medidas': medidas, 'perfil': None,
+                    'limite': {'fase': fase, 'motivo': e.motivo}}
+        finally:
+            if perfil is not None:
+                perfil.disable()
+        if on_fase:
+            on_fase(fase, 'completado')
+    if memoria:
+        medidas['json'] = _measure_encoding(resultados)
+    if perfil is not None:
+        perfil.create_stats()
+        perfil = perfil.stats
+    return {'resultados': resultados, 'tiempos': tiempos, 'medidas': medidas, 'perfil': perfil, 'limite': None}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Devuelve el pool aislado del proceso, creándolo la primera vez."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PoolAislado()
+        return _pool
+
+
+def shutdown_pool():
+    """Detiene los workers aislados del proceso (por ejemplo, al reciclar un worker de gunicorn)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def describe_limit(limite):
+    """Mensaje del límite que interrumpió un trabajo, con el valor del límite si lo tiene."""
+    motivo = MENSAJES_LIMITE.get(limite['motivo'], limite['motivo'])
+    if limite.get('limite_segundos'):
+        motivo += f" ({limite['limite_segundos']:g} s)"
+    return motivo
+
+
+def build_budget_response(ejecucion):
+    """
+    Construye la respuesta de la API a partir de una ejecución con presupuesto.
+    Las fases que no llegaron a completarse se devuelven vacías con un error que
+    explica el motivo, y la clave 'incompleto' indica qué fase se interrumpió.
+    """
+    resultados = ejecucion['resultados']
+    limite = ejecucion['limite']
+    if limite is None:
+        return build_response(resultados['lexico'], resultados['sintactico'], resultados['semantico'])
+
+    motivo = describe_limit(limite)
+    fase_interrumpida = limite['fase']
+    vacios = {
+        'lexico': {'tokens': [], 'errors': []},
+        'sintactico': {'errors': []},
+        'semantico': {'errors': [], 'symbol_table': []},
+    }
+    for fase, vacio in vacios.items():
+        if fase not in resultados:
+            if fase == fase_interrumpida or fase_interrumpida is None:
+                mensaje = f'Análisis interrumpido en la fase {fase}: {motivo}'
+            else:
+                mensaje = f'Fase {fase} no ejecutada: el análisis se interrumpió en la fase {fase_interrumpida}'
+            vacio['errors'].append({'message': mensaje, 'line': 0})
+            resultados[fase] = vacio
+
+    response = build_response(resultados['lexico'], resultados['sintactico'], resultados['semantico'])
+    response['incompleto'] = {
+        'fase': fase_interrumpida,
+        'motivo': limite['motivo'],
+        'mensaje': motivo
+    }
+    return response
+
+
+def _from_cache(code, on_fase=None, medicion=None):
+    """Busca el resultado en la caché y registra el acierto o fallo."""
+    resultado = cache_resultados.get(cache_resultados.key(code))
+    registro.inc('analyzer_cache_requests_total', result='hit' if resultado is not None else 'miss')
+    if resultado is not None:
+        if medicion is not None:
+            medicion.cache = True
+        if on_fase:
+            for fase, _ in FASES:
+                on_fase(fase, 'completado')
+    return resultado
+
+
+def _finish(code, ejecucion, medicion=None):
+    """
+    Construye la respuesta, registra sus métricas y, si está completa, la guarda en
+    caché junto con el índice de posiciones de sus sitios (posiciones_go).
+    """
+    response = build_budget_response(ejecucion)
+    observe_analysis(code, ejecucion['tiempos'], response)
+    if medicion is not None:
+        for datos in ejecucion['medidas'].values():
+            medicion.merge(datos)
+        if ejecucion.get('perfil') is not None:
+            medicion.perfil = ejecucion['perfil']
+    if 'incompleto' not in response:
+        clave = cache_resultados.key(code)
+        cache_resultados.put(clave, response)
+        cache_posiciones.put(clave, IndicePosiciones(ejecucion['resultados']['semantico']['sitios']))
+    return response
+
+
+def analyze_with_budget(code, on_fase=None, medicion=None, cancelacion=None):
+    """
+    Analiza el código en un worker aislado y devuelve la respuesta de la API.
+    Si se pasa una Medicion, se completa con el desglose de tiempos del análisis
+    y, si pide perfilar o medir la memoria, con el perfil de cProfile o la memoria de
+    cada fase (en esos casos no se usa la caché). Un análisis cancelado devuelve una
+    respuesta 'incompleto' con el motivo de la cancelación.
+    """
+    detalle = medicion is not None and medicion.detalle
+    perfilar = medicion is not None and medicion.perfilar
+    memoria = medicion is not None and medicion.memoria
+    if not perfilar and not memoria:
+        cacheado = _from_cache(code, on_fase, medicion)
+        if cacheado is not None:
+            return cacheado
+    if not AISLAMIENTO:
+        return _finish(code, _run_in_process(code, on_fase, detalle, perfilar, memoria, cancelacion), medicion)
+    return _finish(code, get_pool().run(code, on_fase=on_fase, detalle=detalle, perfilar=perfilar,
+                                        memoria=memoria, cancelacion=cancelacion), medicion)
+
+
+def analyze_positions(code):
+    """
+    Índice de posiciones del código: el guardado por su último análisis o, si ya no
+    está en la caché, el de un análisis nuevo con el mismo presupuesto. Devuelve None
+    si el análisis no se completa.
+    """
+    clave = cache_resultados.key(code)
+    indice = cache_posiciones.get(clave)
+    if indice is not None:
+        return indice
+    ejecucion = _run_in_process(code) if not AISLAMIENTO else get_pool().run(code)
+    _finish(code, ejecucion)
+    if ejecucion['limite'] is not None:
+        return None
+    return cache_posiciones.get(clave) or IndicePosiciones(ejecucion['resultados']['semantico']['sitios'])
+
+
+def analyze_many_with_budget(codes, medicion=None):
+    """
+    Analiza varios códigos en paralelo, cada uno con su propio presupuesto. Un código
+    que no consiguió worker queda como {'error', 'reintentar_en'} (segundos), y uno
+    cuyo worker falló, como {'error'}, igual que un archivo que no se pudo leer.
+    """
+    if not AISLAMIENTO or len(codes) == 1:
+        return [analyze_with_budget(code, medicion=medicion) for code in codes]
+    resultados = [_from_cache(code) for code in codes]
+    pendientes = [i for i, resultado in enumerate(resultados) if resultado is None]
+    detalle = medicion is not None and medicion.detalle
+    ejecuciones = get_pool().map([codes[i] for i in pendientes], detalle=detalle)
+    for i, ejecucion in zip(pendientes, ejecuciones):
+        if isinstance(ejecucion, PoolSaturado):
+            resultados[i] = {'error': str(ejecucion), 'reintentar_en': ejecucion.retry_after}
+        elif isinstance(ejecucion, Exception):
+            resultados[i] = {'error': f'Error interno del servidor: {ejecucion}'}
+        else:
+            resultados[i] = _finish(codes[i], ejecucion, medicion)
+    return resultados
+
+
+def call_with_budget(funcion, args):
+    """
+    funcion(*args) con el presupuesto de un análisis: en un worker aislado (ver
+    PoolAislado.call) o, sin aislamiento, en este proceso bajo analisis_lock y con
+    TIEMPO_MAX segundos de plazo. Devuelve {'resultado', 'limite'} como PoolAislado.call.
+    """
+    if AISLAMIENTO:
+        return get_pool().call(funcion, args)
+    cancelacion = Cancelacion(plazo=time.monotonic() + TIEMPO_MAX)
+    try:
+        with analisis_lock, activate(cancelacion):
+            return {'resultado': funcion(*args), 'limite': None}
+    except AnalisisCancelado as e:
+        return {'resultado': None, 'limite': {'fase': None, 'motivo': e.motivo, 'limite_segundos': TIEMPO_MAX}}
+
+
+def _map_isolated(funcion, llamadas, plazo):
+    """
+    mapear de paquete_go.analyze_package: cada llamada en un worker aislado libre, con
+    el presupuesto de un análisis y sin pasar del plazo del paquete (time.monotonic()).
+    """
+    from paquete_go import PaqueteInterrumpido  # paquete_go importa lote_go, que importa este módulo
+    pool = get_pool()
+
+    def ejecutar(argumentos):
+        restante = plazo - time.monotonic()
+        if restante <= 0:
+            raise PaqueteInterrumpido(f"Análisis del paquete interrumpido: "
+                                      f"{describe_limit({'motivo': 'tiempo', 'limite_segundos': TIEMPO_MAX_PAQUETE})}")
+        try:
+            ejecucion = pool.call(funcion, argumentos, tiempo_max=min(pool.tiempo_max, restante))
+        except RuntimeError as e:
+            raise PaqueteInterrumpido(f'Error interno del servidor: {e}')
+        limite = ejecucion['limite']
+        if limite is not None:
+            if limite['motivo'] == 'tiempo' and restante < pool.tiempo_max:
+                limite['limite_segundos'] = TIEMPO_MAX_PAQUETE
+            raise PaqueteInterrumpido(f'Análisis del paquete interrumpido: {describe_limit(limite)}')
+        return ejecucion['resultado']
+
+    return list(pool.hilos.map(ejecutar, llamadas))
+
+
+def _map_in_process(funcion, llamadas, cancelacion):
+    """mapear sin aislamiento: las llamadas en este hilo, abandonadas al cumplirse el plazo."""
+    from paquete_go import PaqueteInterrumpido
+    try:
+        with activate(cancelacion):
+            resultados = []
+            for argumentos in llamadas:
+                cancelacion.check()
+                resultados.append(funcion(*argumentos))
+            return resultados
+    except AnalisisCancelado as e:
+        limite = {'motivo': e.motivo, 'limite_segundos': TIEMPO_MAX_PAQUETE if e.motivo == 'tiempo' else None}
+        raise PaqueteInterrumpido(f'Análisis del paquete interrumpido: {describe_limit(limite)}')
+
+
+def analyze_sources_with_budget(sources, medicion=None):
+    """
+    paquete_go.analyze_sources para la API. Con aislamiento, los archivos de cada
+    paquete se analizan en paralelo en los workers aislados, cada uno con el
+    presupuesto de un análisis. Sin aislamiento se analizan en este proceso bajo
+    analisis_lock (el estado global del parser es compartido), con los procesos de
+    paralelo_go para los archivos grandes. En ambos casos todo el lote tiene
+    TIEMPO_MAX_PAQUETE segundos: un paquete que no termina a tiempo queda con su
+    {'error'}. Lanza PoolSaturado si un archivo no consigue worker.
+    Si se pasa una Medicion, se completa con el tiempo total ('paquete') y el número
+    de archivos analizados.
+    """
+    from paquete_go import analyze_sources
+    inicio = time.perf_counter()
+    plazo = time.monotonic() + TIEMPO_MAX_PAQUETE
+    if AISLAMIENTO:
+        resultado = analyze_sources(sources, mapear=lambda funcion, llamadas: _map_isolated(funcion, llamadas, plazo))
+    else:
+        cancelacion = Cancelacion(plazo=plazo)
+        with analisis_lock:
+            resultado = analyze_sources(sources, paralelo_go.PROCESOS,
+                                        mapear=lambda funcion, llamadas: _map_in_process(funcion, llamadas, cancelacion))
+    if medicion is not None:
+        medicion.add('paquete', time.perf_counter() - inicio)
+        medicion.count('archivos', len(sources))
+    return resultado
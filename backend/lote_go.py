@@ -0,0 +1,132 @@
+"""
+Análisis por lotes para el Analizador de Código Go
+Recibe varios archivos .go (o un .zip con un proyecto) y reparte el análisis
+entre los workers aislados, uno por núcleo disponible.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import io
+import os
+import zipfile
+import zlib
+
+from limites_go import analyze_many_with_budget
+
+# Límites para evitar que un lote (o un zip malicioso) agote el servidor
+MAX_ARCHIVOS_LOTE = int(os.environ.get('ANALYZER_MAX_ARCHIVOS_LOTE', '500'))
+MAX_BYTES_LOTE = int(os.environ.get('ANALYZER_MAX_BYTES_LOTE', str(50 * 1024 * 1024)))
+
+
+class LoteInvalido(Exception):
+    """Error en el contenido del lote (zip corrupto, límites superados, etc.)."""
+    pass
+
+
+def extract_sources(uploads):
+    """
+    Convierte una lista de (nombre, bytes) en la lista de archivos .go a analizar.
+    Los .zip se expanden conservando la ruta interna de cada archivo .go.
+    """
+    sources = []
+    total_bytes = 0
+
+    def agregar(nombre, contenido):
+        nonlocal total_bytes
+        total_bytes += len(contenido)
+        if len(sources) >= MAX_ARCHIVOS_LOTE:
+            raise LoteInvalido(f'El lote supera el máximo de {MAX_ARCHIVOS_LOTE} archivos')
+        if total_bytes > MAX_BYTES_LOTE:
+            raise LoteInvalido(f'El lote supera el máximo de {MAX_BYTES_LOTE} bytes')
+        sources.append((nombre, contenido))
+
+    for nombre, contenido in uploads:
+        if nombre.endswith('.go'):
+            agregar(nombre, contenido)
+        elif nombre.endswith('.zip'):
+            try:
+                archivo_zip = zipfile.ZipFile(io.BytesIO(contenido))
+            except zipfile.BadZipFile:
+                raise LoteInvalido(f"El archivo '{nombre}' no es un zip válido")
+            with archivo_zip:
+                for info in archivo_zip.infolist():
+                    if info.is_dir() or not info.filename.endswith('.go'):
+                        continue
+                    if info.filename.startswith('__MACOSX/'):
+                        continue
+                    # Se comprueba el tamaño declarado antes de descomprimir
+                    if total_bytes + info.file_size > MAX_BYTES_LOTE:
+                        raise LoteInvalido(f'El lote supera el máximo de {MAX_BYTES_LOTE} bytes')
+                    try:
+                        datos = archivo_zip.read(info)
+                    except (zipfile.BadZipFile, zlib.error, EOFError):
+                        # Directorio válido con datos dañados (CRC incorrecto, deflate truncado...)
+                        raise LoteInvalido(f"El archivo '{info.filename}' de '{nombre}' está dañado")
+                    except (NotImplementedError, RuntimeError):
+                        # Método de compresión no soportado o archivo cifrado
+                        raise LoteInvalido(f"El archivo '{info.filename}' de '{nombre}' no se puede leer")
+                    agregar(info.filename, datos)
+        else:
+            raise LoteInvalido(f"El archivo '{nombre}' debe tener extensión .go o .zip")
+
+    return sources
+
+
+def build_summary(resultados):
+    """Construye el resumen agregado del lote."""
+    resumen = {
+        'archivos': len(resultados),
+        'analizados': 0,
+        'fallidos': 0,
+        'archivos_con_errores': 0,
+        'total_tokens': 0,
+        'errores_lexicos': 0,
+        'errores_sintacticos': 0,
+        'errores_semanticos': 0,
+    }
+    for resultado in resultados:
+        if 'error' in resultado:
+            resumen['fallidos'] += 1
+            continue
+        resumen['analizados'] += 1
+        lexicos = len(resultado['lexico']['errores'])
+        sintacticos = len(resultado['sintactico']['errores'])
+        semanticos = len(resultado['semantico']['errores'])
+        resumen['total_tokens'] += len(resultado['lexico']['tokens'])
+        resumen['errores_lexicos'] += lexicos
+        resumen['errores_sintacticos'] += sintacticos
+        resumen['errores_semanticos'] += semanticos
+        if lexicos or sintacticos or semanticos:
+            resumen['archivos_con_errores'] += 1
+    return resumen
+
+
+def analyze_batch(sources, medicion=None):
+    """
+    Analiza una lista de (nombre, bytes) y devuelve los resultados por archivo
+    junto con un resumen agregado. La medición, si se pasa, acumula los tiempos de todos.
+    """
+    resultados = [None] * len(sources)
+    pendientes = []
+    for indice, (nombre, contenido) in enumerate(sources):
+        try:
+            codigo = contenido.decode('utf-8')
+        except UnicodeDecodeError:
+            resultados[indice] = {
+                'filename': nombre,
+                'error': 'El archivo no está en formato UTF-8 válido'
+            }
+            continue
+        pendientes.append((indice, nombre, codigo))
+
+    analisis = analyze_many_with_budget([codigo for _, _, codigo in pendientes], medicion) if pendientes else []
+    for (indice, nombre, _), resultado in zip(pendientes, analisis):
+        resultado['filename'] = nombre
+        resultados[indice] = resultado
+
+    return {
+        'archivos': resultados,
+        'resumen': build_summary(resultados)
+    }
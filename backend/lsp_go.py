@@ -0,0 +1,552 @@
+"""
+Servidor LSP (Language Server Protocol) del Analizador de Código Go
+El editor lanza un proceso por sesión y le habla con mensajes JSON-RPC por la
+entrada y la salida estándar. Cada documento abierto conserva su estado entre
+ediciones: los PuntosControl del sintáctico, la CacheFunciones del semántico y
+el IndicePosiciones del último análisis, así que después de cada edición sólo
+se vuelve a analizar lo que cambió y no hay una petición HTTP por pulsación.
+Recibe las ediciones de forma incremental (didChange con rangos), publica los
+diagnósticos de las tres fases cuando el usuario deja de escribir y responde
+tokens semánticos, hover e ir a la definición.
+Uso: python lsp_go.py (desde la carpeta backend), lanzado por el editor.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import traceback
+from bisect import bisect_right
+
+from analisis_go import analisis_lock, warm_up
+from lexico_go import get_lexer, reserved
+from posiciones_go import IndicePosiciones
+from semantico_go import NUMERIC_TYPES, CacheFunciones, analyze_semantic_string
+from sintactico_go import PuntosControl, analyze_syntax_string
+
+# Pausa al escribir (en milisegundos) tras la que se publican los diagnósticos
+DEMORA = float(os.environ.get('ANALYZER_LSP_DEMORA_MS', '250')) / 1000
+
+_SALTO_LINEA = re.compile('\n')
+
+# Códigos de error de JSON-RPC
+ERROR_PARSEO = -32700
+PETICION_INVALIDA = -32600
+METODO_NO_ENCONTRADO = -32601
+PARAMETROS_INVALIDOS = -32602
+ERROR_INTERNO = -32603
+NO_INICIALIZADO = -32002
+
+# Leyenda de los tokens semánticos: el editor recibe el índice del tipo en esta
+# lista y los modificadores como bits en el orden de la segunda
+TIPOS_TOKEN = ['namespace', 'type', 'function', 'parameter', 'variable',
+               'keyword', 'string', 'number', 'operator']
+MODIFICADORES_TOKEN = ['declaration', 'readonly', 'defaultLibrary']
+
+_TIPO = {nombre: i for i, nombre in enumerate(TIPOS_TOKEN)}
+_DECLARACION, _SOLO_LECTURA, _BIBLIOTECA = 1, 2, 4
+
+# Tipo semántico de los tokens que no dependen del análisis (los delimitadores no se marcan)
+_TIPO_POR_TOKEN = dict.fromkeys(reserved.values(), _TIPO['keyword'])
+_TIPO_POR_TOKEN.update({
+    'BOOL_LITERAL': _TIPO['keyword'],
+    'STRING_LITERAL': _TIPO['string'],
+    'RUNE_LITERAL': _TIPO['string'],
+    'INT_LITERAL': _TIPO['number'],
+    'FLOAT_LITERAL': _TIPO['number'],
+    'OCTAL_LITERAL': _TIPO['number'],
+})
+_TIPO_POR_TOKEN.update(dict.fromkeys((
+    'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'MOD', 'INCREMENT', 'DECREMENT', 'EQ', 'NE',
+    'LT', 'LE', 'GT', 'GE', 'AND', 'OR', 'NOT', 'ASSIGN', 'DECLARE_ASSIGN', 'PLUS_ASSIGN',
+    'MINUS_ASSIGN', 'TIMES_ASSIGN', 'DIVIDE_ASSIGN', 'MOD_ASSIGN', 'AND_ASSIGN', 'OR_ASSIGN',
+    'XOR_ASSIGN', 'LSHIFT_ASSIGN', 'RSHIFT_ASSIGN', 'BITAND', 'BITOR', 'BITXOR', 'BITNOT',
+    'LSHIFT', 'RSHIFT', 'AND_NOT', 'ADDRESS', 'POINTER', 'CHANNEL_OP', 'ELLIPSIS',
+), _TIPO['operator']))
+
+# Nombres de tipo predeclarados: son identificadores para el lexer y no tienen sitio
+TIPOS_BASICOS = NUMERIC_TYPES | {'string', 'bool', 'error', 'any'}
+
+
+# ============================================================================
+# MENSAJES JSON-RPC
+# ============================================================================
+
+def read_message(entrada):
+    """
+    Lee un mensaje (cabeceras y cuerpo JSON) de la entrada; None si se cerró.
+    Lanza ErrorProtocolo si el cuerpo no es JSON válido (el mensaje ya se consumió).
+    """
+    while True:
+        largo = None
+        while True:
+            linea = entrada.readline()
+            if not linea:
+                return None
+            linea = linea.strip()
+            if not linea:
+                break
+            nombre, _, valor = linea.decode('ascii', 'replace').partition(':')
+            if nombre.strip().lower() == 'content-length' and valor.strip().isdigit():
+                largo = int(valor)
+        if largo is not None:
+            try:
+                return json.loads(entrada.read(largo).decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise ErrorProtocolo(ERROR_PARSEO, f"Mensaje JSON inválido: {e}")
+
+
+def write_message(salida, mensaje):
+    cuerpo = json.dumps(mensaje, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    salida.write(b'Content-Length: %d\r\n\r\n' % len(cuerpo) + cuerpo)
+    salida.flush()
+
+
+class ErrorProtocolo(Exception):
+    """Error que se devuelve al editor como respuesta a su petición."""
+
+    def __init__(self, codigo, mensaje):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+# ============================================================================
+# POSICIONES
+# ============================================================================
+
+def line_starts(texto):
+    return [0] + [salto.end() for salto in _SALTO_LINEA.finditer(texto)]
+
+
+def _to_index(linea, caracter, codificacion):
+    """Índice en la línea de una posición del editor (en unidades UTF-16 salvo con utf-32)."""
+    if codificacion == 'utf-32' or linea.isascii():
+        return min(caracter, len(linea))
+    unidades = 0
+    for i, letra in enumerate(linea):
+        if unidades >= caracter:
+            return i
+        unidades += 2 if ord(letra) > 0xFFFF else 1
+    return len(linea)
+
+
+def _to_units(linea, indice, codificacion):
+    """Inverso de _to_index: posición para el editor del índice en la línea."""
+    if codificacion == 'utf-32' or linea.isascii():
+        return indice
+    return indice + sum(1 for letra in linea[:indice] if ord(letra) > 0xFFFF)
+
+
+# ============================================================================
+# DOCUMENTOS
+# ============================================================================
+
+class Analisis:
+    """Resultado de analizar una versión de un documento."""
+
+    def __init__(self, version, texto, tokens, diagnosticos, indice):
+        self.version = version
+        self.texto = texto
+        self.inicios = line_starts(texto)
+        self.tokens = tokens
+        self.diagnosticos = diagnosticos
+        self.indice = indice
+        self.datos_tokens = {}
+
+    def line(self, linea):
+        """Texto de la línea (desde 1) sin el salto de línea."""
+        if not 1 <= linea <= len(self.inicios):
+            return ''
+        fin = self.inicios[linea] - 1 if linea < len(self.inicios) else len(self.texto)
+        return self.texto[self.inicios[linea - 1]:fin].rstrip('\r')
+
+    def lsp_range(self, linea, columna, columna_final, codificacion):
+        """Rango del editor de las columnas (desde 1, fin exclusivo) de la línea."""
+        texto = self.line(linea)
+        return {
+            'start': {'line': linea - 1, 'character': _to_units(texto, columna - 1, codificacion)},
+            'end': {'line': linea - 1, 'character': _to_units(texto, columna_final - 1, codificacion)},
+        }
+
+    def line_range(self, linea, codificacion):
+        """Rango de la línea completa; la línea 0 (fin de archivo) es la última."""
+        if linea <= 0:
+            linea = len(self.inicios)
+        return self.lsp_range(linea, 1, len(self.line(linea)) + 1, codificacion)
+
+    def semantic_tokens(self, codificacion):
+        """Tokens semánticos en el formato del protocolo: cinco enteros por token, relativos al anterior."""
+        datos = self.datos_tokens.get(codificacion)
+        if datos is not None:
+            return datos
+        datos = []
+        linea_anterior = inicio_anterior = 0
+        for linea, columna, fin, tipo_lexico, valor in self.tokens:
+            tipo = _TIPO_POR_TOKEN.get(tipo_lexico)
+            modificadores = 0
+            if tipo_lexico == 'ID':
+                tipo, modificadores = self._classify(linea, columna, valor)
+            if tipo is None:
+                continue
+            linea -= 1
+            inicio, final = columna - 1, fin - 1
+            if codificacion != 'utf-32':
+                texto = self.line(linea + 1)
+                inicio, final = _to_units(texto, inicio, codificacion), _to_units(texto, final, codificacion)
+            datos += (linea - linea_anterior, inicio - inicio_anterior if linea == linea_anterior else inicio,
+                      final - inicio, tipo, modificadores)
+            linea_anterior, inicio_anterior = linea, inicio
+        self.datos_tokens[codificacion] = datos
+        return datos
+
+    def _classify(self, linea, columna, nombre):
+        """Tipo y modificadores de un identificador según el símbolo al que se resolvió."""
+        sitio = self.indice.at(linea, columna)
+        if sitio is None or sitio[5] is None:
+            return (_TIPO['type'] if nombre in TIPOS_BASICOS else _TIPO['variable']), 0
+        tipo_simbolo, ambito, es_constante = sitio[5][:3]
+        if tipo_simbolo == 'func':
+            tipo = _TIPO['function']
+        elif tipo_simbolo == 'package':
+            tipo = _TIPO['namespace']
+        elif ambito == 'parameter':
+            tipo = _TIPO['parameter']
+        else:
+            tipo = _TIPO['variable']
+        modificadores = 0
+        if sitio[4] is None:
+            modificadores |= _DECLARACION
+        if es_constante:
+            modificadores |= _SOLO_LECTURA
+        if sitio[4] == 'externo' and ambito != 'global':
+            # Las funciones de la biblioteca estándar llevan la ruta de su paquete como ámbito
+            modificadores |= _BIBLIOTECA
+        return tipo, modificadores
+
+
+class Documento:
+    """
+    Un documento abierto en el editor: su texto y versión actuales y el estado
+    incremental de cada fase, que se conserva mientras siga abierto.
+    """
+
+    def __init__(self, uri, texto, version):
+        self.uri = uri
+        self.texto = texto
+        self.version = version
+        self.puntos = PuntosControl()
+        self.cache = CacheFunciones()
+        self.analisis = None
+        self.temporizador = None
+        self.lock = threading.Lock()
+
+    def apply_changes(self, cambios, version, codificacion):
+        """Aplica los cambios de didChange en orden: con 'range' reemplazan ese rango, sin él todo el texto."""
+        with self.lock:
+            texto = self.texto
+            for cambio in cambios:
+                if 'range' not in cambio:
+                    texto = cambio['text']
+                    continue
+                inicios = line_starts(texto)
+                desde = self._offset(texto, inicios, cambio['range']['start'], codificacion)
+                hasta = self._offset(texto, inicios, cambio['range']['end'], codificacion)
+                texto = texto[:desde] + cambio['text'] + texto[hasta:]
+            self.texto = texto
+            self.version = version
+
+    @staticmethod
+    def _offset(texto, inicios, posicion, codificacion):
+        linea = posicion['line']
+        if linea >= len(inicios):
+            return len(texto)
+        inicio = inicios[linea]
+        fin = inicios[linea + 1] - 1 if linea + 1 < len(inicios) else len(texto)
+        return inicio + _to_index(texto[inicio:fin], posicion['character'], codificacion)
+
+    def analyze(self):
+        """Análisis de la versión actual (lo reutiliza si ya se hizo)."""
+        with analisis_lock:
+            with self.lock:
+                texto, version = self.texto, self.version
+            if self.analisis is not None and self.analisis.version == version:
+                return self.analisis
+            tokens, errores_lexicos = lex_document(texto)
+            errores_sintacticos = analyze_syntax_string(texto, puntos=self.puntos)['errors']
+            semantico = analyze_semantic_string(texto, cache=self.cache)
+            diagnosticos = [('lexico', error) for error in errores_lexicos]
+            diagnosticos += [('sintactico', error) for error in errores_sintacticos]
+            diagnosticos += [('semantico', error) for error in semantico['errors']]
+            self.analisis = Analisis(version, texto, tokens, diagnosticos, IndicePosiciones(semantico['sitios']))
+            return self.analisis
+
+
+def lex_document(texto):
+    """
+    Tokens como (línea, columna, columna final, tipo, valor) y errores léxicos. Es el
+    mismo recorrido que analyze_code_string, pero guarda dónde termina cada token
+    (PLY deja lexpos al final del token) para marcarlo completo en el editor.
+    """
+    lexer = get_lexer()
+    lexer.errors_list = []
+    lexer.source_code = texto
+    lexer.column_cache = (0, 0)
+    lexer.lineno = 1
+    lexer.input(texto)
+    inicios = line_starts(texto)
+    tokens = []
+    while True:
+        tok = lexer.token()
+        if not tok:
+            break
+        # La columna con la línea del lexer, como find_column
+        inicio_linea = inicios[bisect_right(inicios, tok.lexpos) - 1]
+        columna = tok.lexpos - inicio_linea + 1
+        tokens.append((tok.lineno, columna, columna + lexer.lexpos - tok.lexpos, tok.type, tok.value))
+    return tokens, lexer.errors_list
+
+
+# ============================================================================
+# SERVIDOR
+# ============================================================================
+
+class Servidor:
+    """
+    Atiende los mensajes del editor en orden en el hilo principal. Los diagnósticos
+    se publican desde un temporizador por documento que se reinicia con cada edición;
+    las peticiones que necesitan el análisis (tokens, hover, definición) lo hacen en
+    el momento si la versión actual aún no se analizó.
+    """
+
+    def __init__(self, entrada, salida, demora=DEMORA):
+        self.entrada = entrada
+        self.salida = salida
+        self.demora = demora
+        self.documentos = {}
+        self.codificacion = 'utf-16'
+        self.inicializado = False
+        self.apagado = False
+        self.escritura_lock = threading.Lock()
+        self.metodos = {
+            'initialize': self.initialize,
+            'initialized': lambda parametros: None,
+            'shutdown': self.shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+            'textDocument/semanticTokens/full': self.semantic_tokens,
+            'textDocument/hover': self.hover,
+            'textDocument/definition': self.definition,
+        }
+
+    def send(self, mensaje):
+        mensaje['jsonrpc'] = '2.0'
+        with self.escritura_lock:
+            write_message(self.salida, mensaje)
+
+    def notify(self, metodo, parametros):
+        self.send({'method': metodo, 'params': parametros})
+
+    def run(self):
+        """Atiende mensajes hasta 'exit' o hasta que se cierre la entrada. Devuelve el código de salida."""
+        while True:
+            try:
+                mensaje = read_message(self.entrada)
+            except ErrorProtocolo as e:
+                # Sin poder leer el id, el error se responde con id null y se sigue atendiendo
+                self.send({'id': None, 'error': {'code': e.codigo, 'message': str(e)}})
+                continue
+            if mensaje is None:
+                break
+            if not isinstance(mensaje, dict):
+                self.send({'id': None, 'error': {'code': PETICION_INVALIDA, 'message': 'El mensaje no es un objeto JSON-RPC'}})
+                continue
+            if mensaje.get('method') == 'exit':
+                break
+            self.dispatch(mensaje)
+        for documento in self.documentos.values():
+            if documento.temporizador is not None:
+                documento.temporizador.cancel()
+        return 0 if self.apagado else 1
+
+    def dispatch(self, mensaje):
+        metodo = mensaje.get('method')
+        if metodo is None:
+            return  # respuesta del editor: el servidor no le hace peticiones
+        es_peticion = 'id' in mensaje
+        try:
+            if metodo not in self.metodos:
+                # Las notificaciones desconocidas ($/cancelRequest, $/setTrace...) se ignoran
+                if es_peticion:
+                    raise ErrorProtocolo(METODO_NO_ENCONTRADO, f"Método no soportado: {metodo}")
+                return
+            if not self.inicializado and metodo != 'initialize':
+                if es_peticion:
+                    raise ErrorProtocolo(NO_INICIALIZADO, 'El servidor no se ha inicializado')
+                return
+            resultado = self.metodos[metodo](mensaje.get('params') or {})
+        except ErrorProtocolo as e:
+            if es_peticion:
+                self.send({'id': mensaje['id'], 'error': {'code': e.codigo, 'message': str(e)}})
+            return
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            if es_peticion:
+                self.send({'id': mensaje['id'], 'error': {'code': ERROR_INTERNO, 'message': str(e)}})
+            return
+        if es_peticion:
+            self.send({'id': mensaje['id'], 'result': resultado})
+
+    def document(self, parametros):
+        try:
+            return self.documentos[parametros['textDocument']['uri']]
+        except KeyError:
+            raise ErrorProtocolo(PARAMETROS_INVALIDOS, 'El documento no está abierto')
+
+    # ------------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------------
+
+    def initialize(self, parametros):
+        # Las columnas del análisis son caracteres: si el editor acepta utf-32 no hay que convertir
+        codificaciones = parametros.get('capabilities', {}).get('general', {}).get('positionEncodings', [])
+        self.codificacion = 'utf-32' if 'utf-32' in codificaciones else 'utf-16'
+        warm_up()
+        self.inicializado = True
+        return {
+            'capabilities': {
+                'positionEncoding': self.codificacion,
+                'textDocumentSync': {'openClose': True, 'change': 2},
+                'hoverProvider': True,
+                'definitionProvider': True,
+                'semanticTokensProvider': {
+                    'legend': {'tokenTypes': TIPOS_TOKEN, 'tokenModifiers': MODIFICADORES_TOKEN},
+                    'full': True,
+                },
+            },
+            'serverInfo': {'name': 'analizador-go'},
+        }
+
+    def shutdown(self, parametros):
+        self.apagado = True
+        return None
+
+    # ------------------------------------------------------------------------
+    # Sincronización de documentos
+    # ------------------------------------------------------------------------
+
+    def did_open(self, parametros):
+        documento = parametros['textDocument']
+        self.documentos[documento['uri']] = Documento(documento['uri'], documento['text'], documento.get('version'))
+        self.schedule(self.documentos[documento['uri']])
+
+    def did_change(self, parametros):
+        documento = self.document(parametros)
+        documento.apply_changes(parametros['contentChanges'], parametros['textDocument'].get('version'),
+                                self.codificacion)
+        self.schedule(documento)
+
+    def did_close(self, parametros):
+        documento = self.documentos.pop(parametros['textDocument']['uri'], None)
+        if documento is not None:
+            if documento.temporizador is not None:
+                documento.temporizador.cancel()
+            self.notify('textDocument/publishDiagnostics', {'uri': documento.uri, 'diagnostics': []})
+
+    def schedule(self, documento):
+        """Reinicia la espera del documento: se analiza cuando pasa la demora sin otra edición."""
+        if documento.temporizador is not None:
+            documento.temporizador.cancel()
+        documento.temporizador = threading.Timer(self.demora, self.publish_diagnostics, (documento,))
+        documento.temporizador.daemon = True
+        documento.temporizador.start()
+
+    def publish_diagnostics(self, documento):
+        try:
+            analisis = documento.analyze()
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return
+        # Si llegó otra edición durante el análisis, su temporizador publicará la nueva versión
+        if analisis.version != documento.version or self.documentos.get(documento.uri) is not documento:
+            return
+        diagnosticos = []
+        for fase, error in analisis.diagnosticos:
+            if error.get('column') and error.get('char'):
+                rango = analisis.lsp_range(error['line'], error['column'], error['column'] + 1, self.codificacion)
+            else:
+                # Los errores sintácticos y semánticos sólo tienen la línea
+                rango = analisis.line_range(error['line'], self.codificacion)
+            diagnosticos.append({'range': rango, 'severity': 1, 'source': fase, 'message': error['message']})
+        self.notify('textDocument/publishDiagnostics',
+                    {'uri': documento.uri, 'version': analisis.version, 'diagnostics': diagnosticos})
+
+    # ------------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------------
+
+    def semantic_tokens(self, parametros):
+        return {'data': self.document(parametros).analyze().semantic_tokens(self.codificacion)}
+
+    def _query(self, parametros):
+        """Análisis del documento y (línea, columna) desde 1 de la posición de la petición."""
+        analisis = self.document(parametros).analyze()
+        posicion = parametros['position']
+        linea = posicion['line'] + 1
+        return analisis, linea, _to_index(analisis.line(linea), posicion['character'], self.codificacion) + 1
+
+    def hover(self, parametros):
+        analisis, linea, columna = self._query(parametros)
+        simbolo = analisis.indice.hover(linea, columna)
+        if simbolo is None:
+            return None
+        return {
+            'contents': {'kind': 'markdown', 'value': describe_symbol(simbolo)},
+            'range': analisis.lsp_range(simbolo['line'], simbolo['column'], simbolo['end_column'],
+                                        self.codificacion),
+        }
+
+    def definition(self, parametros):
+        analisis, linea, columna = self._query(parametros)
+        sitio = analisis.indice.definition(linea, columna)
+        if sitio is None:
+            return None
+        return {
+            'uri': parametros['textDocument']['uri'],
+            'range': analisis.lsp_range(sitio['line'], sitio['column'], sitio['end_column'], self.codificacion),
+        }
+
+
+def describe_symbol(simbolo):
+    """Texto del hover: la firma del símbolo en Go y dónde se declara."""
+    nombre, tipo, ambito = simbolo['name'], simbolo['type'], simbolo['scope']
+    if tipo == 'func':
+        retorno = simbolo['return_type'] if simbolo['return_type'] not in (None, 'void') else ''
+        firma = f"func {nombre}({', '.join(simbolo['params'])}) {retorno}".rstrip()
+    elif tipo == 'package':
+        firma = f"package {nombre}"
+    else:
+        firma = f"{'const' if simbolo['is_const'] else 'var'} {nombre} {tipo}"
+    if simbolo['definition'] is not None:
+        origen = f"Declarado en la línea {simbolo['definition']['line']} (ámbito {ambito})"
+    elif ambito not in (None, 'global'):
+        origen = f"Biblioteca estándar: paquete `{ambito}`"
+    else:
+        origen = 'Declarado en otro archivo del paquete'
+    return f"```go\n{firma}\n```\n{origen}"
+
+
+# ============================================================================
+# Para usar desde el editor
+# ============================================================================
+
+if __name__ == '__main__':
+    # La salida estándar es del protocolo: cualquier print va a la de errores
+    salida = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    sys.exit(Servidor(sys.stdin.buffer, salida).run())
@@ -0,0 +1,212 @@
+"""
+Métricas del Analizador de Código Go en formato de texto de Prometheus
+Contadores e histogramas en memoria, protegidos por un lock. Con varios
+procesos (workers de gunicorn) cada proceso vuelca su estado a un archivo en
+ANALYZER_METRICS_DIR y el endpoint /metrics suma los archivos de todos.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import json
+import os
+import threading
+import time
+
+METRICS_DIR = os.environ.get('ANALYZER_METRICS_DIR', '')
+INTERVALO_VOLCADO = float(os.environ.get('ANALYZER_METRICS_INTERVALO', '1'))
+
+BUCKETS_SEGUNDOS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# nombre -> (tipo, ayuda, buckets)
+DEFINICIONES = {
+    'analyzer_requests_total': ('counter', 'Peticiones HTTP atendidas por endpoint y código de estado', None),
+    'analyzer_input_bytes': ('histogram', 'Tamaño en bytes del código analizado', BUCKETS_BYTES),
+    'analyzer_phase_seconds': ('histogram', 'Duración de cada fase del análisis en segundos', BUCKETS_SEGUNDOS),
+    'analyzer_tokens_total': ('counter', 'Tokens reconocidos por el analizador léxico', None),
+    'analyzer_diagnostics_total': ('counter', 'Errores encontrados en el código analizado, por fase', None),
+    'analyzer_phase_failures_total': ('counter', 'Fases interrumpidas por límites o fallos, por fase y motivo', None),
+    'analyzer_cache_requests_total': ('counter', 'Consultas a la caché de resultados (hit o miss)', None),
+}
+
+
+def _labels_key(labels):
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+class Registro:
+    """Estado de las métricas de un proceso."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.contadores = {}
+        self.histogramas = {}
+        self.pendiente = False
+        self.hilo = None
+        self.pid = os.getpid()
+
+    def inc(self, nombre, valor=1, **labels):
+        self._check_fork()
+        clave = (nombre, _labels_key(labels))
+        with self.lock:
+            self.contadores[clave] = self.contadores.get(clave, 0) + valor
+        self._maybe_flush()
+
+    def observe(self, nombre, valor, **labels):
+        self._check_fork()
+        buckets = DEFINICIONES[nombre][2]
+        clave = (nombre, _labels_key(labels))
+        with self.lock:
+            histograma = self.histogramas.get(clave)
+            if histograma is None:
+                histograma = self.histogramas[clave] = [[0] * len(buckets), 0.0, 0]
+            for i, limite in enumerate(buckets):
+                if valor <= limite:
+                    histograma[0][i] += 1
+                    break
+            histograma[1] += valor
+            histograma[2] += 1
+        self._maybe_flush()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'contadores': [[nombre, list(labels), valor] for (nombre, labels), valor in self.contadores.items()],
+                'histogramas': [[nombre, list(labels), list(h[0]), h[1], h[2]]
+                                for (nombre, labels), h in self.histogramas.items()],
+            }
+
+    def _check_fork(self):
+        # Un proceso creado con fork hereda el registro: empieza desde cero con su propio archivo
+        if self.pid != os.getpid():
+            self.__init__()
+
+    def _maybe_flush(self):
+        self.pendiente = True
+        if METRICS_DIR and self.hilo is None:
+            # El volcado a disco lo hace un hilo en segundo plano, nunca la petición
+            self.hilo = threading.Thread(target=self._flush_loop, name='metricas', daemon=True)
+            self.hilo.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(INTERVALO_VOLCADO)
+            if self.pendiente:
+                try:
+                    self.flush()
+                except OSError:
+                    pass
+
+    def flush(self):
+        """Vuelca el estado del proceso a su archivo en ANALYZER_METRICS_DIR."""
+        if not METRICS_DIR:
+            return
+        self.pendiente = False
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        destino = os.path.join(METRICS_DIR, f'metricas-{os.getpid()}.json')
+        temporal = destino + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(self.snapshot(), archivo)
+        os.replace(temporal, destino)
+
+
+registro = Registro()
+
+
+def _load_snapshots():
+    """Estado de todos los procesos: los archivos del directorio o, sin él, el proceso actual."""
+    if not METRICS_DIR:
+        return [registro.snapshot()]
+    registro.flush()
+    snapshots = []
+    for nombre in os.listdir(METRICS_DIR):
+        if not nombre.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(METRICS_DIR, nombre), encoding='utf-8') as archivo:
+                snapshots.append(json.load(archivo))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def _merge(snapshots):
+    contadores = {}
+    histogramas = {}
+    for snapshot in snapshots:
+        for nombre, labels, valor in snapshot['contadores']:
+            clave = (nombre, tuple(tuple(par) for par in labels))
+            contadores[clave] = contadores.get(clave, 0) + valor
+        for nombre, labels, buckets, suma, cuenta in snapshot['histogramas']:
+            clave = (nombre, tuple(tuple(par) for par in labels))
+            actual = histogramas.get(clave)
+            if actual is None:
+                histogramas[clave] = [list(buckets), suma, cuenta]
+            else:
+                actual[0] = [a + b for a, b in zip(actual[0], buckets)]
+                actual[1] += suma
+                actual[2] += cuenta
+    return contadores, histogramas
+
+
+def _format_labels(labels, extra=None):
+    pares = list(labels) + ([extra] if extra else [])
+    if not pares:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pares) + '}'
+
+
+def render():
+    """Devuelve todas las métricas en el formato de texto de Prometheus."""
+    contadores, histogramas = _merge(_load_snapshots())
+    lineas = []
+    for nombre, (tipo, ayuda, buckets) in DEFINICIONES.items():
+        lineas.append(f'# HELP {nombre} {ayuda}')
+        lineas.append(f'# TYPE {nombre} {tipo}')
+        if tipo == 'counter':
+            for (metrica, labels), valor in sorted(contadores.items()):
+                if metrica == nombre:
+                    lineas.append(f'{nombre}{_format_labels(labels)} {valor:g}')
+        else:
+            for (metrica, labels), (cuentas, suma, total) in sorted(histogramas.items()):
+                if metrica != nombre:
+                    continue
+                acumulado = 0
+                for limite, cuenta in zip(buckets, cuentas):
+                    acumulado += cuenta
+                    lineas.append(f'{nombre}_bucket{_format_labels(labels, ("le", f"{limite:g}"))} {acumulado}')
+                lineas.append(f'{nombre}_bucket{_format_labels(labels, ("le", "+Inf"))} {total}')
+                lineas.append(f'{nombre}_sum{_format_labels(labels)} {suma:.6f}')
+                lineas.append(f'{nombre}_count{_format_labels(labels)} {total}')
+
+    # Derivadas: tokens por segundo de la fase léxica y tasa de aciertos de la caché
+    tokens = sum(v for (n, _), v in contadores.items() if n == 'analyzer_tokens_total')
+    segundos_lexico = sum(h[1] for (n, l), h in histogramas.items()
+                          if n == 'analyzer_phase_seconds' and ('phase', 'lexico') in l)
+    lineas.append('# HELP analyzer_lexer_tokens_per_second Tokens por segundo de la fase léxica (acumulado)')
+    lineas.append('# TYPE analyzer_lexer_tokens_per_second gauge')
+    lineas.append(f'analyzer_lexer_tokens_per_second {tokens / segundos_lexico if segundos_lexico else 0:.2f}')
+    hits = sum(v for (n, l), v in contadores.items() if n == 'analyzer_cache_requests_total' and ('result', 'hit') in l)
+    consultas = sum(v for (n, _), v in contadores.items() if n == 'analyzer_cache_requests_total')
+    lineas.append('# HELP analyzer_cache_hit_ratio Proporción de análisis servidos desde la caché')
+    lineas.append('# TYPE analyzer_cache_hit_ratio gauge')
+    lineas.append(f'analyzer_cache_hit_ratio {hits / consultas if consultas else 0:.4f}')
+    return '\n'.join(lineas) + '\n'
+
+
+def observe_analysis(code, tiempos, response):
+    """Registra el tamaño, la duración de cada fase y los diagnósticos de un análisis."""
+    registro.observe('analyzer_input_bytes', len(code.encode('utf-8')))
+    for fase, segundos in tiempos.items():
+        registro.observe('analyzer_phase_seconds', segundos, phase=fase)
+    registro.inc('analyzer_tokens_total', len(response['lexico']['tokens']))
+    for fase in ('lexico', 'sintactico', 'semantico'):
+        errores = len(response[fase]['errores'])
+        if errores:
+            registro.inc('analyzer_diagnostics_total', errores, phase=fase)
+    if 'incompleto' in response:
+        incompleto = response['incompleto']
+        registro.inc('analyzer_phase_failures_total', phase=incompleto['fase'] or 'ninguna',
+                     reason=incompleto['motivo'])
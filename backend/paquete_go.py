@@ -0,0 +1,418 @@
+"""
+Análisis de paquetes Go de varios archivos
+Un paquete es un directorio con varios archivos .go que comparten la cláusula
+'package'. Cada archivo se analiza léxica y sintácticamente y se reúnen sus
+declaraciones de nivel superior en un solo índice global; después se revisan los
+cuerpos de las funciones de todos los archivos contra ese índice, de modo que una
+función de main.go puede llamar a otra declarada en utils.go.
+Ambas fases se reparten entre el pool de procesos de paralelo_go o, desde la API,
+entre los workers aislados de limites_go (ver analyze_package).
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import hashlib
+import heapq
+import os
+import posixpath
+import sys
+import threading
+import time
+from datetime import datetime
+
+import paralelo_go
+from analisis_go import build_response
+from lexico_go import analyze_code_string
+from lote_go import build_summary
+from semantico_go import build_semantic_result, check_pending, collect_declarations, fingerprint, get_git_username
+from sintactico_go import analyze_syntax_string
+
+
+class PaqueteInvalido(Exception):
+    """El directorio no es un paquete analizable (sin archivos .go, paquetes distintos, etc.)."""
+    pass
+
+
+class PaqueteInterrumpido(Exception):
+    """El análisis del paquete no terminó: superó su presupuesto de tiempo, CPU o memoria."""
+    pass
+
+
+def package_name(tokens):
+    """Nombre de la cláusula 'package' (los dos primeros tokens del archivo) o None."""
+    if len(tokens) >= 2 and tokens[0]['type'] == 'PACKAGE' and tokens[1]['type'] == 'ID':
+        return tokens[1]['value']
+    return None
+
+
+def load_package(directorio):
+    """Lee los archivos .go del directorio (sin subdirectorios) y devuelve [(nombre, código)] ordenados."""
+    try:
+        nombres = sorted(nombre for nombre in os.listdir(directorio)
+                         if nombre.endswith('.go') and os.path.isfile(os.path.join(directorio, nombre)))
+    except OSError as e:
+        raise PaqueteInvalido(f"No se pudo leer el directorio '{directorio}': {e}")
+    if not nombres:
+        raise PaqueteInvalido(f"El directorio '{directorio}' no contiene archivos .go")
+    archivos = []
+    for nombre in nombres:
+        try:
+            with open(os.path.join(directorio, nombre), 'r', encoding='utf-8') as archivo:
+                archivos.append((nombre, archivo.read()))
+        except UnicodeDecodeError:
+            raise PaqueteInvalido(f"El archivo '{nombre}' no está en formato UTF-8 válido")
+    return archivos
+
+
+def _analyze_declarations(fuente):
+    """
+    Lo que sólo depende del texto del archivo: léxico, sintáctico, sus declaraciones de
+    nivel superior y los fragmentos de sus funciones.
+    """
+    _, codigo = fuente
+    lexico = analyze_code_string(codigo)
+    sintactico = analyze_syntax_string(codigo)
+    indice, _, _, funciones = collect_declarations(codigo)
+    return lexico, sintactico, indice, funciones
+
+
+def _kind(simbolo):
+    if simbolo.symbol_type == 'func':
+        return 'Función'
+    return 'Constante' if simbolo.is_const else 'Variable'
+
+
+def merge_indexes(nombres, indices):
+    """
+    Junta los índices globales de los archivos en uno solo para todo el paquete.
+    Una declaración repetida en otro archivo se queda con la del primero (en orden
+    de nombre) y se reporta en el archivo que la repite. Los imports no se juntan:
+    cada archivo sólo ve los suyos.
+    Devuelve (índice, origen {nombre: archivo}, errores por archivo).
+    """
+    indice = {}
+    origen = {}
+    duplicados = [[] for _ in nombres]
+    for i, (archivo, propio) in enumerate(zip(nombres, indices)):
+        for nombre, simbolo in propio.items():
+            if simbolo.scope == 'import':
+                continue
+            if nombre in indice:
+                previo = indice[nombre]
+                duplicados[i].append({
+                    'message': f"{_kind(simbolo)} '{nombre}' ya declarada en {origen[nombre]} (línea {previo.line})",
+                    'line': simbolo.line
+                })
+                continue
+            indice[nombre] = simbolo
+            origen[nombre] = archivo
+    for errores in duplicados:
+        errores.sort(key=lambda error: error['line'])
+    return indice, origen, duplicados
+
+
+def _symbol_dict(nombre, simbolo, archivo):
+    return {
+        'name': nombre,
+        'type': simbolo.symbol_type,
+        'file': archivo,
+        'line': simbolo.line,
+        'is_const': simbolo.is_const,
+        'return_type': simbolo.return_type
+    }
+
+
+class CachePaquete:
+    """
+    Resultados por archivo de un paquete que se re-analiza muchas veces (un proyecto
+    abierto en el editor o un directorio vigilado).
+    De cada archivo se guarda el hash de su texto, lo que sólo depende de él (léxico,
+    sintáctico, sus declaraciones), su revisión contra el resto del paquete y los
+    nombres globales que consultó. Con eso se mantienen la firma exportada de cada
+    archivo (la huella de cada declaración de nivel superior) y el mapa inverso de
+    dependencias: qué archivos consultan cada nombre. Tras un cambio sólo se revisan
+    los archivos editados y los que consultan un nombre cuya declaración cambió (o
+    apareció, desapareció o pasó a otro archivo); el resto se sirve de la caché.
+    """
+
+    def __init__(self):
+        self.archivos = {}
+        # Firma exportada de cada archivo: {archivo: {nombre: huella}}
+        self.exportaciones = {}
+        # Dueño y huella de cada nombre del índice global en el último análisis
+        self.huellas = {}
+        # Mapa inverso de dependencias: {nombre global: {archivos que lo consultan}}
+        self.dependientes = {}
+        self.lock = threading.Lock()
+        # Archivos re-leídos (cambió su texto) y revisados contra el paquete en el último análisis
+        self.releidos = []
+        self.revisados = []
+
+    @staticmethod
+    def key(codigo):
+        return hashlib.sha256(codigo.encode('utf-8')).digest()
+
+
+def _check_file(pendiente, indice, origen, procesos=1):
+    """
+    Revisa un archivo (nombre, código, sus declaraciones, funciones) contra el índice
+    del paquete: sus declaraciones contra las de los demás archivos y los cuerpos de
+    sus funciones contra el índice completo más sus propios imports.
+    Devuelve (errores de las declaraciones, tabla, resultados de los cuerpos, nombres
+    globales consultados).
+    """
+    nombre, codigo, propio, funciones = pendiente
+    externos = {global_: simbolo for global_, simbolo in indice.items() if origen[global_] != nombre}
+    _, errores, tabla, _ = collect_declarations(codigo, externos)
+    visible = dict(indice)
+    visible.update((global_, simbolo) for global_, simbolo in propio.items() if simbolo.scope == 'import')
+    cuerpos = check_pending(funciones, visible, procesos)
+    referencias = set(tabla.referencias)
+    for _, huellas, _ in cuerpos:
+        referencias.update(huellas)
+    return errores, tabla, cuerpos, referencias
+
+
+def analyze_package(archivos, procesos=1, min_bytes=paralelo_go.MIN_BYTES, cache=None, mapear=None):
+    """
+    Analiza juntos los archivos [(nombre, código)] de un mismo paquete.
+    Con procesos > 1 y un paquete de al menos min_bytes, la primera fase se reparte
+    por archivos y la segunda por funciones entre los procesos de paralelo_go.
+    Con mapear(función, [argumentos]) -> [resultados] (el de limites_go, que usa los
+    workers aislados) ambas fases se reparten por archivos a través de esa función,
+    que lanza PaqueteInterrumpido si un archivo supera su presupuesto.
+    Con una CachePaquete sólo se re-analizan los archivos que cambiaron y los que
+    dependen de una declaración que cambió; el resultado es el mismo que sin caché.
+    Devuelve {'paquete', 'archivos': [respuesta de cada archivo con su 'filename'],
+    'indice_global': [símbolos de nivel superior con su archivo], 'resumen'}.
+    Lanza PaqueteInvalido si los archivos declaran paquetes distintos.
+    """
+    if not archivos:
+        raise PaqueteInvalido('El paquete no contiene archivos .go')
+    if cache is None:
+        cache = CachePaquete()
+    if procesos < 2 or sum(len(codigo) for _, codigo in archivos) < min_bytes:
+        procesos = 1
+
+    with cache.lock:
+        nombres = [nombre for nombre, _ in archivos]
+        claves = [cache.key(codigo) for _, codigo in archivos]
+        releer = [i for i, (nombre, clave) in enumerate(zip(nombres, claves))
+                  if cache.archivos.get(nombre, {}).get('clave') != clave]
+        if mapear is not None:
+            leidos = mapear(_analyze_declarations, [(archivos[i],) for i in releer])
+        elif procesos > 1 and len(releer) > 1:
+            leidos = list(paralelo_go.get_executor(procesos).map(_analyze_declarations,
+                                                                 [archivos[i] for i in releer]))
+        else:
+            leidos = [_analyze_declarations(archivos[i]) for i in releer]
+        # Un archivo nuevo o editado empieza sin revisión; se revisa más abajo
+        for i, primera in zip(releer, leidos):
+            cache.archivos[nombres[i]] = {'clave': claves[i], 'primera': primera}
+        for nombre in set(cache.archivos) - set(nombres):
+            del cache.archivos[nombre]
+        entradas = [cache.archivos[nombre] for nombre in nombres]
+
+        paquetes = {}
+        for nombre, entrada in zip(nombres, entradas):
+            paquete = package_name(entrada['primera'][0]['tokens'])
+            if paquete is not None:
+                paquetes.setdefault(paquete, []).append(nombre)
+        if len(paquetes) > 1:
+            detalle = '; '.join(f"{paquete}: {', '.join(miembros)}" for paquete, miembros in paquetes.items())
+            raise PaqueteInvalido(f'Los archivos declaran paquetes distintos ({detalle})')
+
+        indice, origen, duplicados = merge_indexes(nombres, [entrada['primera'][2] for entrada in entradas])
+        huellas = {nombre: (origen[nombre], fingerprint(simbolo)) for nombre, simbolo in indice.items()}
+        cambiados = {nombre for nombre in set(huellas) | set(cache.huellas)
+                     if huellas.get(nombre) != cache.huellas.get(nombre)}
+        afectados = {archivo for nombre in cambiados for archivo in cache.dependientes.get(nombre, ())}
+        pendientes = [i for i, (nombre, entrada) in enumerate(zip(nombres, entradas))
+                      if 'revision' not in entrada or nombre in afectados]
+
+        por_revisar = [(nombres[i], archivos[i][1]) + entradas[i]['primera'][2:] for i in pendientes]
+        if mapear is not None:
+            revisados = mapear(_check_file, [(pendiente, indice, origen, procesos) for pendiente in por_revisar])
+        else:
+            revisados = [_check_file(pendiente, indice, origen, procesos) for pendiente in por_revisar]
+        for i, revision in zip(pendientes, revisados):
+            entradas[i]['revision'] = revision
+
+        cache.huellas = huellas
+        cache.exportaciones = {nombre: {global_: fingerprint(simbolo) for global_, simbolo in entrada['primera'][2].items()
+                                        if simbolo.scope != 'import'}
+                               for nombre, entrada in zip(nombres, entradas)}
+        cache.dependientes = {}
+        for nombre, entrada in zip(nombres, entradas):
+            for global_ in entrada['revision'][3]:
+                cache.dependientes.setdefault(global_, set()).add(nombre)
+        cache.releidos = [nombres[i] for i in releer]
+        cache.revisados = [nombres[i] for i in pendientes]
+
+        resultados = []
+        for nombre, entrada, repetidos in zip(nombres, entradas, duplicados):
+            lexico, sintactico, _, funciones = entrada['primera']
+            declaraciones, tabla, cuerpos, _ = entrada['revision']
+            declaraciones = list(heapq.merge(declaraciones, repetidos, key=lambda error: error['line']))
+            semantico = build_semantic_result(declaraciones, tabla, funciones, cuerpos)
+            respuesta = build_response(lexico, sintactico, semantico)
+            respuesta['filename'] = nombre
+            resultados.append(respuesta)
+
+    return {
+        'paquete': next(iter(paquetes), None),
+        'archivos': resultados,
+        'indice_global': [_symbol_dict(nombre, simbolo, origen[nombre]) for nombre, simbolo in indice.items()],
+        'resumen': build_summary(resultados)
+    }
+
+
+def analyze_directory(directorio, procesos=1, cache=None):
+    """Analiza como un paquete los archivos .go del directorio."""
+    return analyze_package(load_package(directorio), procesos, cache=cache)
+
+
+def analyze_sources(sources, procesos=1, mapear=None):
+    """
+    Analiza una lista de (ruta, bytes) como la de lote_go.extract_sources: los archivos
+    de cada directorio forman un paquete. Devuelve {'paquetes': [...]}, donde cada
+    paquete es el resultado de analyze_package con su 'directorio', o {'directorio', 'error'}
+    (también si su análisis se interrumpió). procesos y mapear, como en analyze_package.
+    """
+    directorios = {}
+    for ruta, contenido in sources:
+        directorios.setdefault(posixpath.dirname(ruta), []).append((ruta, contenido))
+    paquetes = []
+    for directorio, fuentes in sorted(directorios.items()):
+        try:
+            archivos = []
+            for ruta, contenido in sorted(fuentes):
+                try:
+                    archivos.append((ruta, contenido.decode('utf-8')))
+                except UnicodeDecodeError:
+                    raise PaqueteInvalido(f"El archivo '{ruta}' no está en formato UTF-8 válido")
+            resultado = analyze_package(archivos, procesos, mapear=mapear)
+        except (PaqueteInvalido, PaqueteInterrumpido) as e:
+            resultado = {'error': str(e)}
+        resultado['directorio'] = directorio
+        paquetes.append(resultado)
+    return {'paquetes': paquetes}
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+def analyze_dir_cli(directorio, procesos):
+    """Analiza el paquete del directorio y guarda el log como los CLI de cada fase."""
+    try:
+        resultado = analyze_directory(directorio, procesos)
+    except PaqueteInvalido as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        paralelo_go.shutdown_executor()
+
+    logs_dir = 'logs'
+    if not os.path.exists(logs_dir):
+        os.makedirs(logs_dir)
+
+    git_username = get_git_username()
+    base = os.path.basename(os.path.normpath(os.path.abspath(directorio)))
+    timestamp = datetime.now().strftime('%d-%m-%Y_%H-%M-%S')
+    log_filename = os.path.join(logs_dir, f'paquete-{git_username}-{base}-{timestamp}.log')
+
+    resumen = resultado['resumen']
+    log_content = f"\n{'='*80}\n"
+    log_content += f"ANÁLISIS DEL PAQUETE {resultado['paquete']} EN: {directorio}\n"
+    log_content += f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    log_content += f"Usuario: {git_username}\n"
+    log_content += f"{'='*80}\n\n"
+    log_content += f"Archivos: {resumen['archivos']} ({resumen['archivos_con_errores']} con errores)\n"
+    log_content += f"Tokens: {resumen['total_tokens']}\n"
+    log_content += f"Errores léxicos: {resumen['errores_lexicos']}\n"
+    log_content += f"Errores sintácticos: {resumen['errores_sintacticos']}\n"
+    log_content += f"Errores semánticos: {resumen['errores_semanticos']}\n"
+
+    for archivo in resultado['archivos']:
+        errores = [(f"Carácter ilegal '{error['char']}'", error['line']) for error in archivo['lexico']['errores']]
+        errores += [(error['message'], error['line']) for error in archivo['sintactico']['errores']]
+        errores += [(error['message'], error['line']) for error in archivo['semantico']['errores']]
+        if not errores:
+            continue
+        log_content += f"\n{'='*80}\n"
+        log_content += f"ERRORES EN {archivo['filename']}\n"
+        log_content += f"{'='*80}\n"
+        for mensaje, linea in errores:
+            log_content += f"Línea {linea}: {mensaje}\n"
+
+    log_content += f"\n{'='*80}\n"
+    log_content += f"ÍNDICE GLOBAL DEL PAQUETE\n"
+    log_content += f"{'='*80}\n"
+    for simbolo in resultado['indice_global']:
+        log_content += f"  - {simbolo['name']:30} {simbolo['type']:10} {simbolo['file']}:{simbolo['line']}\n"
+
+    try:
+        with open(log_filename, 'w', encoding='utf-8') as log_file:
+            log_file.write(log_content)
+        print(log_content)
+        print(f"\n✓ Log guardado en: {log_filename}")
+    except Exception as e:
+        print(f"Error al guardar el log: {e}")
+        print(log_content)
+    return 0
+
+
+def watch_directory(directorio, procesos, intervalo=1.0):
+    """
+    Vuelve a analizar el paquete cada vez que cambia un archivo .go del directorio,
+    reutilizando con una CachePaquete lo que no depende del cambio. Termina con Ctrl+C.
+    """
+    cache = CachePaquete()
+    anterior = None
+    try:
+        while True:
+            try:
+                estado = {nombre: os.stat(os.path.join(directorio, nombre)).st_mtime_ns
+                          for nombre in os.listdir(directorio) if nombre.endswith('.go')}
+            except OSError as e:
+                print(f"Error: {e}")
+                return 1
+            if estado != anterior:
+                anterior = estado
+                inicio = time.perf_counter()
+                try:
+                    resultado = analyze_directory(directorio, procesos, cache)
+                except (PaqueteInvalido, OSError) as e:
+                    print(f"Error: {e}")
+                else:
+                    duracion = time.perf_counter() - inicio
+                    resumen = resultado['resumen']
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] {resumen['archivos']} archivos en "
+                          f"{duracion * 1000:.1f} ms; revisados: {', '.join(cache.revisados) or 'ninguno'}; "
+                          f"errores léxicos {resumen['errores_lexicos']}, sintácticos "
+                          f"{resumen['errores_sintacticos']}, semánticos {resumen['errores_semanticos']}")
+                    for archivo in resultado['archivos']:
+                        for fase in ('sintactico', 'semantico'):
+                            for error in archivo[fase]['errores']:
+                                print(f"  {archivo['filename']}:{error['line']}: {error['message']}")
+            time.sleep(intervalo)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        paralelo_go.shutdown_executor()
+
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Analiza juntos los archivos .go de un paquete.')
+    argumentos.add_argument('directorio')
+    argumentos.add_argument('--procesos', type=int, default=paralelo_go.PROCESOS)
+    argumentos.add_argument('--vigilar', action='store_true',
+                            help='re-analiza al cambiar un archivo, sólo lo que depende del cambio')
+    opciones = argumentos.parse_args()
+    if opciones.vigilar:
+        sys.exit(watch_directory(opciones.directorio, opciones.procesos))
+    sys.exit(analyze_dir_cli(opciones.directorio, opciones.procesos))
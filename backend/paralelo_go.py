@@ -0,0 +1,254 @@
+"""
+Análisis sintáctico en paralelo para archivos Go muy grandes
+Un archivo Go es una secuencia de declaraciones de nivel superior (func, var,
+const, type) independientes entre sí. El código se divide en esas fronteras y
+cada trozo se analiza con la gramática de sintactico_go en un pool de procesos;
+después se juntan los errores con sus números de línea corregidos.
+El mismo pool revisa los cuerpos de las funciones en la segunda fase del
+análisis semántico (semantico_go.analyze_semantic_string).
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+import sintactico_go
+from sintactico_go import analyze_syntax_string
+
+# Por debajo de este tamaño repartir el trabajo cuesta más de lo que ahorra
+MIN_BYTES = int(os.environ.get('ANALYZER_PARALELO_MIN_BYTES', '200000'))
+PROCESOS = int(os.environ.get('ANALYZER_PARALELO_PROCESOS', '0')) or os.cpu_count() or 1
+# Trozos por proceso: más de uno reparte mejor archivos con declaraciones de tamaños dispares
+TROZOS_POR_PROCESO = 4
+
+# Los trozos que no incluyen la cabecera del archivo se analizan tras esta línea
+PREFIJO = 'package main\n'
+
+# Un solo recorrido del código: cadenas, runas y comentarios (que pueden contener llaves),
+# delimitadores y saltos de línea seguidos de una declaración en la columna 0.
+# Las cadenas, runas y comentarios siguen las mismas expresiones que lexico_go.
+_FRONTERAS = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r"|'(?:[^'\\]|\\.)'"
+    r'|//[^\n]*'
+    r'|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/'
+    r'|[{}()\[\]]'
+    r'|\n(?=(?:func|var|const|type)\b)'
+)
+_APERTURAS = frozenset('{([')
+_CIERRES = frozenset('})]')
+
+
+def scan_declarations(code):
+    """
+    Recorre el código una vez y devuelve (fronteras, cuerpos): las posiciones donde
+    empieza cada declaración de nivel superior y los rangos [inicio, fin) de los
+    cuerpos de las funciones de nivel superior, llaves incluidas.
+    Sólo se corta en una palabra func/var/const/type al inicio de una línea y fuera
+    de cualquier llave, paréntesis o corchete, así que 'var f = func() {...}' o un
+    bloque 'var (...)' nunca se parten.
+    """
+    fronteras = []
+    cuerpos = []
+    profundidad = 0
+    es_funcion = False
+    inicio_cuerpo = None
+    for coincidencia in _FRONTERAS.finditer(code):
+        texto = coincidencia.group()
+        if texto in _APERTURAS:
+            if profundidad == 0 and texto == '{' and es_funcion:
+                inicio_cuerpo = coincidencia.start()
+                es_funcion = False
+            profundidad += 1
+        elif texto in _CIERRES:
+            # Una llave de más no debe impedir seguir cortando el resto del archivo
+            profundidad = max(0, profundidad - 1)
+            if profundidad == 0 and inicio_cuerpo is not None:
+                cuerpos.append((inicio_cuerpo, coincidencia.end()))
+                inicio_cuerpo = None
+        elif texto == '\n' and profundidad == 0:
+            fronteras.append(coincidencia.end())
+            es_funcion = code.startswith('func', coincidencia.end())
+            inicio_cuerpo = None
+    return fronteras, cuerpos
+
+
+def split_declarations(code):
+    """Devuelve las posiciones donde empieza cada declaración de nivel superior."""
+    return scan_declarations(code)[0]
+
+
+def strip_bodies(code, cuerpos):
+    """
+    Código con el cuerpo de cada función reemplazado por un bloque vacío que
+    conserva sus saltos de línea, para que las declaraciones mantengan su línea.
+    """
+    partes = []
+    anterior = 0
+    for inicio, fin in cuerpos:
+        partes.append(code[anterior:inicio])
+        partes.append('{' + '\n' * code.count('\n', inicio, fin) + '}')
+        anterior = fin
+    partes.append(code[anterior:])
+    return ''.join(partes)
+
+
+def build_chunks(code, trozos):
+    """
+    Agrupa las declaraciones en como mucho 'trozos' fragmentos contiguos de tamaño
+    parecido. Devuelve [(texto, desplazamiento de línea)]; el primero conserva la
+    cabecera (package e imports) y los demás se analizan tras PREFIJO.
+    """
+    fronteras = split_declarations(code)
+    objetivo = max(1, len(code) // max(1, trozos))
+    cortes = [0]
+    for posicion in fronteras:
+        if posicion - cortes[-1] >= objetivo:
+            cortes.append(posicion)
+    cortes.append(len(code))
+
+    fragmentos = []
+    linea = 1
+    for inicio, fin in zip(cortes, cortes[1:]):
+        texto = code[inicio:fin]
+        if inicio == 0:
+            fragmentos.append((texto, 0))
+        else:
+            # La línea 2 del trozo (tras PREFIJO) es la línea 'linea' del archivo
+            fragmentos.append((PREFIJO + texto, linea - 2))
+        linea += texto.count('\n')
+    return fragmentos
+
+
+def function_units(code, fronteras, cuerpos):
+    """
+    Un fragmento (texto, desplazamiento de línea) por cada función de nivel superior,
+    desde su frontera hasta el final de su cuerpo y tras PREFIJO.
+    """
+    unidades = []
+    linea = 1
+    anterior = 0
+    for inicio_cuerpo, fin in cuerpos:
+        inicio = fronteras[bisect_right(fronteras, inicio_cuerpo) - 1]
+        linea += code.count('\n', anterior, inicio)
+        anterior = inicio
+        unidades.append((PREFIJO + code[inicio:fin], linea - 2))
+    return unidades
+
+
+def group_units(unidades, trozos):
+    """Reparte las unidades en como mucho 'trozos' grupos contiguos de tamaño parecido."""
+    objetivo = max(1, sum(len(texto) for texto, _ in unidades) // max(1, trozos))
+    grupos = [[]]
+    tamano = 0
+    for unidad in unidades:
+        if tamano >= objetivo:
+            grupos.append([])
+            tamano = 0
+        grupos[-1].append(unidad)
+        tamano += len(unidad[0])
+    return [grupo for grupo in grupos if grupo]
+
+
+def _parse_chunk(fragmento):
+    texto, desplazamiento = fragmento
+    errores = analyze_syntax_string(texto)['errors']
+    for error in errores:
+        # La línea 0 indica el fin de archivo y se deja igual
+        if error['line']:
+            error['line'] += desplazamiento
+    return errores
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(procesos=PROCESOS):
+    """Devuelve el pool de procesos del análisis en paralelo, creándolo la primera vez."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Con fork los procesos heredan los parsers ya construidos
+            import semantico_go
+            sintactico_go.get_parser()
+            semantico_go.get_parser()
+            _executor = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context())
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def analyze_syntax_parallel(code_string, procesos=PROCESOS, min_bytes=MIN_BYTES):
+    """
+    Igual que sintactico_go.analyze_syntax_string, pero repartiendo las declaraciones
+    de nivel superior entre procesos. Los archivos pequeños (o que no se pueden
+    dividir) se analizan en el proceso actual.
+    Con código válido el resultado es idéntico; con errores, la recuperación no cruza
+    de una declaración a la siguiente, así que un error justo en una frontera puede
+    reportarse de otra forma que en el análisis secuencial.
+    """
+    if len(code_string) < min_bytes or procesos < 2:
+        return analyze_syntax_string(code_string)
+    fragmentos = build_chunks(code_string, procesos * TROZOS_POR_PROCESO)
+    if len(fragmentos) < 2:
+        return analyze_syntax_string(code_string)
+    errores = []
+    for errores_trozo in get_executor(procesos).map(_parse_chunk, fragmentos):
+        errores.extend(errores_trozo)
+    return {'errors': errores}
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Análisis sintáctico en paralelo de un archivo .go grande.')
+    argumentos.add_argument('archivo')
+    argumentos.add_argument('--procesos', type=int, default=PROCESOS)
+    argumentos.add_argument('--comparar', action='store_true',
+                            help='analiza también de forma secuencial y compara tiempos y errores')
+    opciones = argumentos.parse_args()
+    try:
+        with open(opciones.archivo, 'r', encoding='utf-8') as archivo:
+            codigo = archivo.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error al leer '{opciones.archivo}': {e}")
+        sys.exit(1)
+
+    fragmentos = build_chunks(codigo, opciones.procesos * TROZOS_POR_PROCESO)
+    print(f"{len(split_declarations(codigo))} fronteras de declaración, {len(fragmentos)} trozos, "
+          f"{opciones.procesos} procesos")
+    get_executor(opciones.procesos)
+    inicio = time.perf_counter()
+    resultado = analyze_syntax_parallel(codigo, opciones.procesos, min_bytes=0)
+    paralelo = time.perf_counter() - inicio
+    print(f"Paralelo:   {paralelo * 1000:10.1f} ms, {len(resultado['errors'])} errores")
+    if opciones.comparar:
+        inicio = time.perf_counter()
+        secuencial = analyze_syntax_string(codigo)
+        duracion = time.perf_counter() - inicio
+        print(f"Secuencial: {duracion * 1000:10.1f} ms, {len(secuencial['errors'])} errores "
+              f"(aceleración x{duracion / paralelo:.2f})")
+        if secuencial['errors'] != resultado['errors']:
+            print('Los errores difieren del análisis secuencial')
+    for error in resultado['errors'][:20]:
+        print(f"Línea {error['line']}: {error['message']}")
+    shutdown_executor()
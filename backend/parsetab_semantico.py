@@ -1,12 +1,12 @@
 
-# parsetab.py
+# parsetab_semantico.py
 # This file is automatically generated. Do not edit.
 # pylint: disable=W,C,R
 _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDleftEQNEleftLTLEGTGEleftPLUSMINUSleftTIMESDIVIDEMODrightNOTrightUMINUSrightADDRESSPOINTERADDRESS AND AND_ASSIGN AND_NOT APPEND ASSIGN BITAND BITNOT BITOR BITXOR BOOL_LITERAL BREAK CASE CHAN CHANNEL_OP COLON COMMA CONST CONTINUE DECLARE_ASSIGN DECREMENT DEFAULT DEFER DELETE DIVIDE DIVIDE_ASSIGN DOT ELLIPSIS ELSE EQ FALLTHROUGH FLOAT_LITERAL FOR FUNC GE GO GOTO GT ID IF IMPORT INCREMENT INTERFACE INT_LITERAL LBRACE LBRACKET LE LEN LPAREN LSHIFT LSHIFT_ASSIGN LT MAKE MAP MINUS MINUS_ASSIGN MOD MOD_ASSIGN NE NIL NOT OCTAL_LITERAL OR OR_ASSIGN PACKAGE PLUS PLUS_ASSIGN POINTER RANGE RBRACE RBRACKET RETURN RPAREN RSHIFT RSHIFT_ASSIGN RUNE_LITERAL SELECT SEMICOLON STRING_LITERAL STRUCT SWITCH TIMES TIMES_ASSIGN TYPE UNDERSCORE VAR XOR_ASSIGNprograma : package_decl imports declaracionespackage_decl : PACKAGE IDimports : import_decl imports\n| import_decl\n| emptyimport_decl : IMPORT STRING_LITERAL\n| IMPORT LPAREN lista_imports RPAREN\n| emptylista_imports : lista_imports STRING_LITERAL\n| STRING_LITERALdeclaraciones : declaraciones declaracion\n| declaraciondeclaracion : funcion\n| declaracion_var_global\n| bloque_var\n| declaracion_const\n| emptydeclaracion_var_global : VAR ID tipo\n| VAR ID tipo ASSIGN expresion\n| VAR ID ASSIGN expresionbloque_var : VAR LPAREN lista_decl_bloque RPARENlista_decl_bloque : lista_decl_bloque decl_var_bloque\n| decl_var_bloquedecl_var_bloque : ID tipo\n| ID tipo ASSIGN expresion\n| ID ASSIGN expresiondeclaracion_var : VAR ID tipo\n| VAR ID tipo ASSIGN expresion\n| VAR ID ASSIGN expresion\n| ID DECLARE_ASSIGN expresionfuncion : funcion_header bloquefuncion_header : FUNC ID LPAREN parametros RPAREN tipo_retorno\n| FUNC ID LPAREN parametros RPARENbloque : LBRACE sentencias RBRACE\n| LBRACE RBRACEasignacion : ID ASSIGN expresion\n| ID PLUS_ASSIGN expresion\n| ID MINUS_ASSIGN expresion\n| ID TIMES_ASSIGN expresion\n| ID DIVIDE_ASSIGN expresion\n| ID LBRACKET expresion RBRACKET ASSIGN expresion\n| TIMES ID ASSIGN expresiondeclaracion_const : CONST ID ASSIGN expresion\n| CONST ID tipo ASSIGN expresiondeclaracion_var_multiple : VAR lista_ids tipo\n| VAR lista_ids tipo ASSIGN lista_expresiones\n| lista_ids DECLARE_ASSIGN lista_expresioneslista_ids : lista_ids COMMA ID\n| lista_ids COMMA UNDERSCORE\n| ID\n| UNDERSCOREasignacion_multiple : lista_ids ASSIGN lista_expresionesparametros : lista_parametros\n| emptylista_parametros : lista_parametros COMMA parametro\n| parametroparametro : ID tipo\n| ID COMMA ID tipo\n| ID ELLIPSIS tipo\n| TIMES ID\n| UNDERSCORE tipotipo_retorno : tipo\n| LPAREN lista_tipos RPAREN\n| LPAREN lista_retornos_nombrados RPARENreturn_statement : RETURN\n| RETURN expresion\n| RETURN lista_expresioneslista_retornos_nombrados : lista_retornos_nombrados COMMA ID tipo\n| ID tipolista_tipos : lista_tipos COMMA tipo\n| tipotipo : ID\n| LBRACKET INT_LITERAL RBRACKET tipo\n| LBRACKET RBRACKET tipo\n| MAP LBRACKET tipo RBRACKET tipo\n| TIMES tiposentencias : sentencias sentencia\n| sentenciaif_statement : IF condicion bloque\n| IF condicion bloque ELSE bloque\n| IF condicion bloque ELSE if_statementcondicion : expresion\n| declaracion_var_corta SEMICOLON expresiondeclaracion_var_corta : ID DECLARE_ASSIGN lista_expresiones\n| lista_ids DECLARE_ASSIGN lista_expresionesfor_range_decl : lista_ids DECLARE_ASSIGN RANGE expresionfor_statement : FOR condicion bloque\n| FOR bloque\n| FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque\n| FOR for_range_decl bloque\n| FOR ID ASSIGN RANGE expresion bloque\n| FOR ID COMMA ID ASSIGN RANGE expresion bloqueinicializacion : declaracion_var\n| asignacion\n| emptyincremento : asignacion\n| ID INCREMENT\n| ID DECREMENT\n| emptyswitch_statement : SWITCH expresion LBRACE casos RBRACE\n| SWITCH LBRACE casos RBRACE\n| SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACEcasos : casos caso\n| casocaso : CASE lista_expresiones COLON sentencias\n| DEFAULT COLON sentenciassentencia : declaracion_var\n| bloque_var\n| declaracion_const\n| asignacion\n| asignacion_multiple\n| declaracion_var_multiple\n| if_statement\n| for_statement\n| switch_statement\n| return_statement\n| expresion\n| ID INCREMENT\n| ID DECREMENT\n| emptyexpresion : expresion PLUS expresion\n| expresion MINUS expresion\n| expresion TIMES expresion\n| expresion DIVIDE expresion\n| expresion MOD expresion\n| expresion AND expresion\n| expresion OR expresion\n| expresion EQ expresion\n| expresion NE expresion\n| expresion LT expresion\n| expresion LE expresion\n| expresion GT expresion\n| expresion GE expresion\n| expresion BITAND expresion\n| expresion BITOR expresion\n| expresion BITXOR expresion\n| expresion LSHIFT expresion\n| expresion RSHIFT expresion\n| expresion AND_NOT expresionexpresion : NOT expresion\n| MINUS expresion %prec UMINUS\n| PLUS expresion %prec UMINUS\n| BITXOR expresion\n| BITNOT expresion\n| ADDRESS expresion %prec ADDRESS\n| BITAND expresion %prec ADDRESS\n| TIMES expresion %prec POINTERexpresion : LPAREN expresion RPARENexpresion : ID\n| INT_LITERAL\n| FLOAT_LITERAL\n| STRING_LITERAL\n| RUNE_LITERAL\n| BOOL_LITERAL\n| NILexpresion : ID LPAREN lista_expresiones RPAREN\n| ID LPAREN RPAREN\n| ID DOT ID LPAREN lista_expresiones RPAREN\n| ID DOT ID LPAREN RPARENexpresion : MAKE LPAREN tipo RPAREN\n| MAKE LPAREN tipo COMMA expresion RPAREN\n| MAKE LPAREN tipo COMMA expresion COMMA expresion RPARENexpresion : APPEND LPAREN expresion COMMA lista_expresiones RPAREN\n| APPEND LPAREN expresion COMMA expresion RPARENexpresion : LEN LPAREN expresion RPARENexpresion : DELETE LPAREN expresion COMMA expresion RPARENexpresion : ID DOT ID LPAREN STRING_LITERAL RPARENexpresion : ID LBRACKET expresion RBRACKETexpresion : LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE\n| LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE\n| LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACElista_filas_matriz : lista_filas_matriz COMMA fila_matriz\n| fila_matrizfila_matriz : LBRACE lista_expresiones RBRACEexpresion : LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE\n| LBRACKET RBRACKET tipo LBRACE RBRACEexpresion : ID LBRACKET expresion COLON expresion RBRACKET\n| ID LBRACKET COLON expresion RBRACKET\n| ID LBRACKET expresion COLON RBRACKET\n| ID LBRACKET COLON RBRACKETexpresion : MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE\n| MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE\n| MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACEpares_mapa : pares_mapa COMMA par_mapa\n| par_mapapar_mapa : expresion COLON expresionlista_expresiones : lista_expresiones COMMA expresion\n| expresionempty :'
+_lr_signature = 'leftORleftANDleftEQNEleftLTLEGTGEleftPLUSMINUSleftTIMESDIVIDEMODrightNOTrightUMINUSrightADDRESSPOINTERADDRESS AND AND_ASSIGN AND_NOT APPEND ASSIGN BITAND BITNOT BITOR BITXOR BOOL_LITERAL BREAK CASE CHAN CHANNEL_OP COLON COMMA CONST CONTINUE DECLARE_ASSIGN DECREMENT DEFAULT DEFER DELETE DIVIDE DIVIDE_ASSIGN DOT ELLIPSIS ELSE EQ FALLTHROUGH FLOAT_LITERAL FOR FUNC GE GO GOTO GT ID IF IMPORT INCREMENT INTERFACE INT_LITERAL LBRACE LBRACKET LE LEN LPAREN LSHIFT LSHIFT_ASSIGN LT MAKE MAP MINUS MINUS_ASSIGN MOD MOD_ASSIGN NE NIL NOT OCTAL_LITERAL OR OR_ASSIGN PACKAGE PLUS PLUS_ASSIGN POINTER RANGE RBRACE RBRACKET RETURN RPAREN RSHIFT RSHIFT_ASSIGN RUNE_LITERAL SELECT SEMICOLON STRING_LITERAL STRUCT SWITCH TIMES TIMES_ASSIGN TYPE UNDERSCORE VAR XOR_ASSIGNprograma : package_decl imports declaracionespackage_decl : PACKAGE IDimports : import_decl imports\n               | import_decl\n               | emptyimport_decl : IMPORT STRING_LITERAL\n                   | IMPORT LPAREN lista_imports RPAREN\n                   | emptylista_imports : lista_imports STRING_LITERAL\n                     | STRING_LITERALdeclaraciones : declaraciones declaracion\n                     | declaraciondeclaracion : funcion\n                   | declaracion_var_global\n                   | bloque_var\n                   | declaracion_const\n                   | emptydeclaracion_var_global : VAR ID tipo\n                              | VAR ID tipo ASSIGN expresion\n                              | VAR ID ASSIGN expresionbloque_var : VAR LPAREN lista_decl_bloque RPARENlista_decl_bloque : lista_decl_bloque decl_var_bloque\n                         | decl_var_bloquedecl_var_bloque : ID tipo\n                       | ID tipo ASSIGN expresion\n                       | ID ASSIGN expresiondeclaracion_var : VAR ID tipo\n                       | VAR ID tipo ASSIGN expresion\n                       | VAR ID ASSIGN expresion\n                       | ID DECLARE_ASSIGN expresionfuncion : funcion_header bloquefuncion_header : FUNC ID LPAREN parametros RPAREN tipo_retorno\n                      | FUNC ID LPAREN parametros RPARENbloque : LBRACE sentencias RBRACE\n              | LBRACE RBRACEasignacion : ID ASSIGN expresion\n                  | ID PLUS_ASSIGN expresion\n                  | ID MINUS_ASSIGN expresion\n                  | ID TIMES_ASSIGN expresion\n                  | ID DIVIDE_ASSIGN expresion\n                  | ID LBRACKET expresion RBRACKET ASSIGN expresion\n                  | TIMES ID ASSIGN expresiondeclaracion_const : CONST ID ASSIGN expresion\n                         | CONST ID tipo ASSIGN expresiondeclaracion_var_multiple : VAR lista_ids tipo\n                                | VAR lista_ids tipo ASSIGN lista_expresiones\n                                | lista_ids DECLARE_ASSIGN lista_expresioneslista_ids : lista_ids COMMA ID\n                 | lista_ids COMMA UNDERSCORE\n                 | ID\n                 | UNDERSCOREasignacion_multiple : lista_ids ASSIGN lista_expresionesparametros : lista_parametros\n                  | emptylista_parametros : lista_parametros COMMA parametro\n                        | parametroparametro : ID tipo\n                 | ID COMMA ID tipo\n                 | ID ELLIPSIS tipo\n                 | TIMES ID\n                 | UNDERSCORE tipotipo_retorno : tipo\n                    | LPAREN lista_tipos RPAREN\n                    | LPAREN lista_retornos_nombrados RPARENreturn_statement : RETURN\n                        | RETURN expresion\n                        | RETURN lista_expresioneslista_retornos_nombrados : lista_retornos_nombrados COMMA ID tipo\n                                | ID tipolista_tipos : lista_tipos COMMA tipo\n                   | tipotipo : ID\n            | LBRACKET INT_LITERAL RBRACKET tipo\n            | LBRACKET RBRACKET tipo\n            | MAP LBRACKET tipo RBRACKET tipo\n            | TIMES tiposentencias : sentencias sentencia\n                  | sentenciaif_statement : IF condicion bloque\n                    | IF condicion bloque ELSE bloque\n                    | IF condicion bloque ELSE if_statementcondicion : expresion\n                 | declaracion_var_corta SEMICOLON expresiondeclaracion_var_corta : ID DECLARE_ASSIGN lista_expresiones\n                             | lista_ids DECLARE_ASSIGN lista_expresionesfor_range_decl : lista_ids DECLARE_ASSIGN RANGE expresionfor_statement : FOR condicion bloque\n                     | FOR bloque\n                     | FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque\n                     | FOR for_range_decl bloque\n                     | FOR ID ASSIGN RANGE expresion bloque\n                     | FOR ID COMMA ID ASSIGN RANGE expresion bloqueinicializacion : declaracion_var\n                      | asignacion\n                      | emptyincremento : asignacion\n                  | ID INCREMENT\n                  | ID DECREMENT\n                  | emptyswitch_statement : SWITCH expresion LBRACE casos RBRACE\n                        | SWITCH LBRACE casos RBRACE\n                        | SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACEcasos : casos caso\n             | casocaso : CASE lista_expresiones COLON sentencias\n            | DEFAULT COLON sentenciassentencia : declaracion_var\n                 | bloque_var\n                 | declaracion_const\n                 | asignacion\n                 | asignacion_multiple\n                 | declaracion_var_multiple\n                 | if_statement\n                 | for_statement\n                 | switch_statement\n                 | return_statement\n                 | expresion\n                 | ID INCREMENT\n                 | ID DECREMENT\n                 | emptyexpresion : expresion PLUS expresion\n                 | expresion MINUS expresion\n                 | expresion TIMES expresion\n                 | expresion DIVIDE expresion\n                 | expresion MOD expresion\n                 | expresion AND expresion\n                 | expresion OR expresion\n                 | expresion EQ expresion\n                 | expresion NE expresion\n                 | expresion LT expresion\n                 | expresion LE expresion\n                 | expresion GT expresion\n                 | expresion GE expresion\n                 | expresion BITAND expresion\n                 | expresion BITOR expresion\n                 | expresion BITXOR expresion\n                 | expresion LSHIFT expresion\n                 | expresion RSHIFT expresion\n                 | expresion AND_NOT expresionexpresion : NOT expresion\n                 | MINUS expresion %prec UMINUS\n                 | PLUS expresion %prec UMINUS\n                 | BITXOR expresion\n                 | BITNOT expresion\n                 | ADDRESS expresion %prec ADDRESS\n                 | BITAND expresion %prec ADDRESS\n                 | TIMES expresion %prec POINTERexpresion : LPAREN expresion RPARENexpresion : ID\n                 | INT_LITERAL\n                 | FLOAT_LITERAL\n                 | STRING_LITERAL\n                 | RUNE_LITERAL\n                 | BOOL_LITERAL\n                 | NILexpresion : ID LPAREN lista_expresiones RPAREN\n                 | ID LPAREN RPAREN\n                 | ID DOT ID LPAREN lista_expresiones RPAREN\n                 | ID DOT ID LPAREN RPARENexpresion : MAKE LPAREN tipo RPAREN\n                 | MAKE LPAREN tipo COMMA expresion RPAREN\n                 | MAKE LPAREN tipo COMMA expresion COMMA expresion RPARENexpresion : APPEND LPAREN expresion COMMA lista_expresiones RPAREN\n                 | APPEND LPAREN expresion COMMA expresion RPARENexpresion : LEN LPAREN expresion RPARENexpresion : DELETE LPAREN expresion COMMA expresion RPARENexpresion : ID DOT ID LPAREN STRING_LITERAL RPARENexpresion : ID LBRACKET expresion RBRACKETexpresion : LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE\n                 | LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE\n                 | LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACElista_filas_matriz : lista_filas_matriz COMMA fila_matriz\n                          | fila_matrizfila_matriz : LBRACE lista_expresiones RBRACEexpresion : LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE\n                 | LBRACKET RBRACKET tipo LBRACE RBRACEexpresion : ID LBRACKET expresion COLON expresion RBRACKET\n                 | ID LBRACKET COLON expresion RBRACKET\n                 | ID LBRACKET expresion COLON RBRACKET\n                 | ID LBRACKET COLON RBRACKETexpresion : MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE\n                 | MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE\n                 | MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACEpares_mapa : pares_mapa COMMA par_mapa\n                  | par_mapapar_mapa : expresion COLON expresionlista_expresiones : lista_expresiones COMMA expresion\n                         | expresionempty :'
     
 _lr_action_items = {'PACKAGE':([0,],[3,]),'$end':([1,2,4,5,6,8,9,10,11,12,13,14,15,20,21,23,24,33,64,65,66,67,68,69,76,77,88,90,126,130,155,156,157,158,159,160,161,168,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,214,220,254,256,260,271,272,299,302,305,316,317,319,323,327,344,351,352,353,356,357,368,369,370,371,379,389,397,398,406,410,],[0,-189,-189,-4,-5,-2,-1,-12,-13,-14,-15,-16,-17,-3,-6,-11,-31,-35,-150,-151,-152,-153,-154,-155,-72,-18,-7,-34,-149,-147,-142,-141,-146,-143,-140,-144,-145,-20,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-157,-148,-19,-74,-44,-180,-156,-160,-165,-73,-179,-178,-159,-168,-176,-75,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,-183,-162,-181,-182,-171,]),'IMPORT':([2,5,6,8,21,88,],[7,7,-8,-2,-6,-7,]),'VAR':([2,4,5,6,8,9,10,11,12,13,14,15,20,21,23,24,25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,54,56,64,65,66,67,68,69,76,77,88,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,168,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,254,256,260,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[-189,17,-4,-5,-2,17,-12,-13,-14,-15,-16,-17,-3,-6,-11,-31,48,48,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,149,-65,-150,-151,-152,-153,-154,-155,-72,-18,-7,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-20,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-19,-74,-44,-168,-180,-156,-29,-42,-101,48,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,48,48,-75,-41,-177,-158,-167,-170,-175,-91,48,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'CONST':([2,4,5,6,8,9,10,11,12,13,14,15,20,21,23,24,25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,77,88,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,168,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,254,256,260,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[-189,18,-4,-5,-2,18,-12,-13,-14,-15,-16,-17,-3,-6,-11,-31,18,18,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-18,-7,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-20,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-19,-74,-44,-168,-180,-156,-29,-42,-101,18,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,18,18,-75,-41,-177,-158,-167,-170,-175,-91,18,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'FUNC':([2,4,5,6,8,9,10,11,12,13,14,15,20,21,23,24,33,64,65,66,67,68,69,76,77,88,90,126,130,155,156,157,158,159,160,161,168,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,214,220,254,256,260,271,272,299,302,305,316,317,319,323,327,344,351,352,353,356,357,368,369,370,371,379,389,397,398,406,410,],[-189,19,-4,-5,-2,19,-12,-13,-14,-15,-16,-17,-3,-6,-11,-31,-35,-150,-151,-152,-153,-154,-155,-72,-18,-7,-34,-149,-147,-142,-141,-146,-143,-140,-144,-145,-20,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-157,-148,-19,-74,-44,-180,-156,-160,-165,-73,-179,-178,-159,-168,-176,-75,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,-183,-162,-181,-182,-171,]),'ID':([3,17,18,19,25,26,27,28,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,75,76,78,81,82,83,84,85,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,140,148,149,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,171,172,173,174,175,176,177,178,179,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,222,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,245,247,248,255,256,258,259,260,262,263,264,265,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,304,305,306,307,308,310,314,316,317,319,321,322,323,325,327,328,329,330,335,336,337,344,349,350,351,352,353,354,356,357,362,363,364,365,367,368,369,370,371,372,374,376,379,380,383,386,389,393,396,397,398,399,400,402,406,410,],[8,26,28,29,46,76,84,76,46,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,122,126,129,137,143,137,126,126,126,126,126,126,126,126,-150,-151,-152,-153,-154,-155,-51,-72,126,76,84,-23,76,126,179,-34,-77,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-118,-119,126,126,126,126,126,126,126,126,216,76,76,126,-149,76,-149,-147,126,126,227,-88,129,241,-66,-67,-142,-141,-146,-143,-140,-144,-145,76,126,126,126,76,126,76,76,-76,-21,-22,-24,126,-43,126,76,266,76,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,126,-157,-188,-27,126,-45,-148,126,76,126,-52,-47,-48,-49,-79,126,126,126,-87,137,-90,126,288,126,126,126,76,126,126,126,76,-74,126,-26,-44,308,76,76,179,-168,126,-180,-156,126,126,-29,126,126,-42,126,126,-101,46,-187,-160,126,126,-165,126,76,-73,76,-25,76,349,126,-179,-178,-159,-28,-46,-168,126,-176,-80,-81,360,-100,46,46,-75,76,-41,-177,-158,-167,76,-170,-175,384,-91,126,46,126,-161,-164,-163,-166,126,76,393,-169,-89,126,-102,-183,76,-92,-162,-181,126,126,126,-182,-171,]),'STRING_LITERAL':([7,22,25,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[21,31,66,89,-10,66,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,66,66,66,66,66,66,66,66,66,66,66,66,66,-150,-151,-152,-153,-154,-155,-72,66,66,-9,-34,-77,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-118,-119,66,66,66,66,66,66,66,66,66,-149,-149,-147,66,66,-88,66,-66,-67,-142,-141,-146,-143,-140,-144,-145,66,66,66,66,-76,-21,66,-43,66,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,66,-157,-188,-27,66,-45,-148,66,66,-52,-47,-79,66,66,66,-87,66,-90,66,66,66,66,66,66,66,-74,66,-44,-168,66,-180,-156,320,66,-29,66,66,-42,66,66,-101,66,-187,-160,66,66,-165,66,-73,66,-179,-178,-159,-28,-46,-168,66,-176,-80,-81,-100,66,66,-75,-41,-177,-158,-167,-170,-175,-91,66,66,66,-161,-164,-163,-166,66,-169,-89,66,-102,-183,-92,-162,-181,66,66,66,-182,-171,]),'LPAREN':([7,17,25,29,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,137,140,143,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,216,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,264,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[22,27,49,87,49,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,120,-120,27,49,49,49,49,49,49,49,49,49,49,49,49,49,-150,-151,-152,-153,-154,-155,162,163,164,165,-72,49,49,-34,-77,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-118,-119,49,49,49,49,49,49,49,49,49,120,120,-147,49,49,120,-88,120,49,-66,-67,-142,-141,-146,-143,-140,-144,-145,49,49,49,49,-76,-21,49,-43,49,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,49,-157,-188,273,-27,49,-45,-148,49,49,-52,-47,-79,49,49,49,-87,49,-90,49,49,49,49,49,49,49,-74,49,-44,310,-168,49,-180,-156,49,49,-29,49,49,-42,49,49,-101,49,-187,-160,49,49,-165,49,-73,49,-179,-178,-159,-28,-46,-168,49,-176,-80,-81,-100,49,49,-75,-41,-177,-158,-167,-170,-175,-91,49,49,49,-161,-164,-163,-166,49,-169,-89,49,-102,-183,-92,-162,-181,49,49,49,-182,-171,]),'LBRACE':([16,54,55,64,65,66,67,68,69,76,126,129,130,134,135,137,139,142,143,150,155,156,157,158,159,160,161,172,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,214,220,223,256,264,271,272,279,281,282,283,297,299,302,305,311,312,316,317,319,323,327,330,331,333,334,343,344,350,351,352,353,356,357,358,359,361,368,369,370,371,373,375,378,379,381,382,385,389,394,397,398,406,410,411,],[25,25,151,-150,-151,-152,-153,-154,-155,-72,-149,-149,-147,25,-82,-149,25,25,-149,242,-142,-141,-146,-143,-140,-144,-145,-76,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-36,-37,-38,-39,-40,-157,-148,280,-74,-33,-180,-156,325,-42,25,-83,338,-160,-165,-73,-32,-62,-179,-178,-159,-168,-176,-189,25,-168,-86,372,-75,-41,-177,-158,-167,-170,-175,25,-96,-99,-161,-164,-163,-166,-63,-64,394,-169,-97,-98,25,-183,402,-162,-181,-182,-171,402,]),'RBRACE':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,243,244,256,260,268,271,272,275,280,281,292,293,294,296,298,299,302,305,316,317,319,321,322,323,325,326,327,328,329,335,336,337,344,350,351,352,353,355,356,357,363,365,366,368,369,370,371,372,379,380,386,388,389,390,396,397,398,399,403,404,406,407,408,409,410,412,413,],[33,90,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,293,-104,-74,-44,-168,-180,-156,-29,327,-42,335,-101,-103,-189,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,356,357,-176,-80,-81,-100,-189,-106,-75,-41,-177,-158,-167,379,-170,-175,-91,-105,386,-161,-164,-163,-166,389,-169,-89,-102,398,-183,-185,-92,-162,-181,406,410,-173,-182,-184,-186,412,-171,-174,-172,]),'TIMES':([25,26,28,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,75,76,78,81,84,85,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,124,125,126,128,129,130,131,132,135,137,140,143,148,150,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,176,177,178,179,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,215,217,218,219,220,221,222,224,225,226,227,228,229,230,231,232,233,234,235,236,238,239,240,241,245,247,248,250,251,252,254,255,256,258,259,260,263,264,265,268,269,270,271,272,273,274,275,276,277,280,281,283,287,289,290,291,293,296,297,298,299,300,301,302,303,304,305,306,307,308,310,314,315,316,317,319,320,321,322,323,325,327,328,329,330,331,333,334,335,336,337,339,340,342,344,349,350,351,352,353,354,356,357,363,364,365,367,368,369,370,371,372,374,379,380,383,385,386,387,389,391,393,395,396,397,398,399,400,402,406,408,410,],[51,81,81,51,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,94,-149,-120,125,125,125,148,125,125,125,125,125,125,125,125,125,-150,-151,-152,-153,-154,-155,-51,-72,125,81,81,125,184,-34,-77,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-118,-119,125,125,125,125,125,125,125,125,81,81,94,125,-149,81,-149,-147,125,125,94,-149,-88,-149,125,94,94,-67,-142,-141,-146,94,-140,94,-145,81,125,125,125,81,125,94,81,81,-76,-21,125,94,125,81,81,94,94,-123,-124,-125,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,125,-157,94,-27,125,-45,-148,125,81,125,-52,-47,-48,-49,-79,125,125,125,-87,125,-90,125,125,125,125,81,125,125,125,94,94,94,94,81,-74,125,94,94,81,81,184,-168,125,94,-180,-156,125,125,94,125,94,125,94,94,125,94,94,125,-101,51,94,94,-160,125,125,-165,125,81,-73,81,94,81,81,125,94,-179,-178,-159,-152,94,-46,-168,125,-176,-80,-81,362,94,-168,94,-100,51,51,94,94,94,-75,81,94,-177,-158,-167,81,-170,-175,-91,125,51,125,-161,-164,-163,-166,125,81,-169,-89,125,94,-102,94,-183,94,81,94,-92,-162,-181,125,125,125,-182,94,-171,]),'IF':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,256,260,268,271,272,275,281,282,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[53,53,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-74,-44,-168,-180,-156,-29,-42,53,-101,53,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,53,53,-75,-41,-177,-158,-167,-170,-175,-91,53,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'FOR':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,256,260,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[54,54,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-74,-44,-168,-180,-156,-29,-42,-101,54,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,54,54,-75,-41,-177,-158,-167,-170,-175,-91,54,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'SWITCH':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,256,260,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[55,55,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-74,-44,-168,-180,-156,-29,-42,-101,55,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,55,55,-75,-41,-177,-158,-167,-170,-175,-91,55,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'RETURN':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,256,260,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[56,56,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,-74,-44,-168,-180,-156,-29,-42,-101,56,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,56,56,-75,-41,-177,-158,-167,-170,-175,-91,56,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'NOT':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[61,61,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,61,61,61,61,61,61,61,61,61,61,61,61,61,-150,-151,-152,-153,-154,-155,-72,61,61,-34,-77,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-118,-119,61,61,61,61,61,61,61,61,61,-149,-149,-147,61,61,-88,61,-66,-67,-142,-141,-146,-143,-140,-144,-145,61,61,61,61,-76,-21,61,-43,61,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,61,-157,-188,-27,61,-45,-148,61,61,-52,-47,-79,61,61,61,-87,61,-90,61,61,61,61,61,61,61,-74,61,-44,-168,61,-180,-156,61,61,-29,61,61,-42,61,61,-101,61,-187,-160,61,61,-165,61,-73,61,-179,-178,-159,-28,-46,-168,61,-176,-80,-81,-100,61,61,-75,-41,-177,-158,-167,-170,-175,-91,61,61,61,-161,-164,-163,-166,61,-169,-89,61,-102,-183,-92,-162,-181,61,61,61,-182,-171,]),'MINUS':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,124,125,126,129,130,131,132,135,137,140,143,148,150,153,154,155,156,157,158,159,160,161,163,164,165,167,168,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,250,251,252,254,256,258,259,260,268,269,270,271,272,273,274,275,276,277,280,281,283,287,289,290,291,293,296,297,298,299,300,301,302,303,305,307,314,315,316,317,319,320,321,322,323,325,327,328,329,331,333,334,335,336,337,339,340,342,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,385,386,387,389,391,395,396,397,398,399,400,402,406,408,410,],[58,58,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,93,-149,-120,58,58,58,58,58,58,58,58,58,58,58,58,58,-150,-151,-152,-153,-154,-155,-72,58,58,-34,-77,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-118,-119,58,58,58,58,58,58,58,58,93,58,-149,-149,-147,58,58,93,-149,-88,-149,58,93,93,-67,-142,-141,-146,93,-140,93,-145,58,58,58,58,93,-76,-21,58,93,58,-121,-122,-123,-124,-125,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,58,-157,93,-27,58,-45,-148,58,58,-52,-47,-79,58,58,58,-87,58,-90,58,58,58,58,58,58,58,93,93,93,93,-74,58,93,93,-168,58,93,-180,-156,58,58,93,58,93,58,93,93,58,93,93,58,-101,58,93,93,-160,58,58,-165,58,-73,93,58,93,-179,-178,-159,-152,93,-46,-168,58,-176,-80,-81,93,-168,93,-100,58,58,93,93,93,-75,93,-177,-158,-167,-170,-175,-91,58,58,58,-161,-164,-163,-166,58,-169,-89,58,93,-102,93,-183,93,93,-92,-162,-181,58,58,58,-182,93,-171,]),'PLUS':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,124,125,126,129,130,131,132,135,137,140,143,148,150,153,154,155,156,157,158,159,160,161,163,164,165,167,168,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,250,251,252,254,256,258,259,260,268,269,270,271,272,273,274,275,276,277,280,281,283,287,289,290,291,293,296,297,298,299,300,301,302,303,305,307,314,315,316,317,319,320,321,322,323,325,327,328,329,331,333,334,335,336,337,339,340,342,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,385,386,387,389,391,395,396,397,398,399,400,402,406,408,410,],[57,57,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,92,-149,-120,57,57,57,57,57,57,57,57,57,57,57,57,57,-150,-151,-152,-153,-154,-155,-72,57,57,-34,-77,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-118,-119,57,57,57,57,57,57,57,57,92,57,-149,-149,-147,57,57,92,-149,-88,-149,57,92,92,-67,-142,-141,-146,92,-140,92,-145,57,57,57,57,92,-76,-21,57,92,57,-121,-122,-123,-124,-125,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,57,-157,92,-27,57,-45,-148,57,57,-52,-47,-79,57,57,57,-87,57,-90,57,57,57,57,57,57,57,92,92,92,92,-74,57,92,92,-168,57,92,-180,-156,57,57,92,57,92,57,92,92,57,92,92,57,-101,57,92,92,-160,57,57,-165,57,-73,92,57,92,-179,-178,-159,-152,92,-46,-168,57,-176,-80,-81,92,-168,92,-100,57,57,92,92,92,-75,92,-177,-158,-167,-170,-175,-91,57,57,57,-161,-164,-163,-166,57,-169,-89,57,92,-102,92,-183,92,92,-92,-162,-181,57,57,57,-182,92,-171,]),'BITXOR':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,124,125,126,129,130,131,132,135,137,140,143,148,150,153,154,155,156,157,158,159,160,161,163,164,165,167,168,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,250,251,252,254,256,258,259,260,268,269,270,271,272,273,274,275,276,277,280,281,283,287,289,290,291,293,296,297,298,299,300,301,302,303,305,307,314,315,316,317,319,320,321,322,323,325,327,328,329,331,333,334,335,336,337,339,340,342,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,385,386,387,389,391,395,396,397,398,399,400,402,406,408,410,],[60,60,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,107,-149,-120,60,60,60,60,60,60,60,60,60,60,60,60,60,-150,-151,-152,-153,-154,-155,-72,60,60,-34,-77,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-118,-119,60,60,60,60,60,60,60,60,107,60,-149,-149,-147,60,60,107,-149,-88,-149,60,107,107,-67,-142,-141,-146,107,-140,107,-145,60,60,60,60,107,-76,-21,60,107,60,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,107,107,107,107,107,107,107,107,107,107,107,107,107,60,-157,107,-27,60,-45,-148,60,60,-52,-47,-79,60,60,60,-87,60,-90,60,60,60,60,60,60,60,107,107,107,107,-74,60,107,107,-168,60,107,-180,-156,60,60,107,60,107,60,107,107,60,107,107,60,-101,60,107,107,-160,60,60,-165,60,-73,107,60,107,-179,-178,-159,-152,107,-46,-168,60,-176,-80,-81,107,-168,107,-100,60,60,107,107,107,-75,107,-177,-158,-167,-170,-175,-91,60,60,60,-161,-164,-163,-166,60,-169,-89,60,107,-102,107,-183,107,107,-92,-162,-181,60,60,60,-182,107,-171,]),'BITNOT':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[62,62,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,62,62,62,62,62,62,62,62,62,62,62,62,62,-150,-151,-152,-153,-154,-155,-72,62,62,-34,-77,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-118,-119,62,62,62,62,62,62,62,62,62,-149,-149,-147,62,62,-88,62,-66,-67,-142,-141,-146,-143,-140,-144,-145,62,62,62,62,-76,-21,62,-43,62,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,62,-157,-188,-27,62,-45,-148,62,62,-52,-47,-79,62,62,62,-87,62,-90,62,62,62,62,62,62,62,-74,62,-44,-168,62,-180,-156,62,62,-29,62,62,-42,62,62,-101,62,-187,-160,62,62,-165,62,-73,62,-179,-178,-159,-28,-46,-168,62,-176,-80,-81,-100,62,62,-75,-41,-177,-158,-167,-170,-175,-91,62,62,62,-161,-164,-163,-166,62,-169,-89,62,-102,-183,-92,-162,-181,62,62,62,-182,-171,]),'ADDRESS':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[63,63,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,63,63,63,63,63,63,63,63,63,63,63,63,63,-150,-151,-152,-153,-154,-155,-72,63,63,-34,-77,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-118,-119,63,63,63,63,63,63,63,63,63,-149,-149,-147,63,63,-88,63,-66,-67,-142,-141,-146,-143,-140,-144,-145,63,63,63,63,-76,-21,63,-43,63,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,63,-157,-188,-27,63,-45,-148,63,63,-52,-47,-79,63,63,63,-87,63,-90,63,63,63,63,63,63,63,-74,63,-44,-168,63,-180,-156,63,63,-29,63,63,-42,63,63,-101,63,-187,-160,63,63,-165,63,-73,63,-179,-178,-159,-28,-46,-168,63,-176,-80,-81,-100,63,63,-75,-41,-177,-158,-167,-170,-175,-91,63,63,63,-161,-164,-163,-166,63,-169,-89,63,-102,-183,-92,-162,-181,63,63,63,-182,-171,]),'BITAND':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,124,125,126,129,130,131,132,135,137,140,143,148,150,153,154,155,156,157,158,159,160,161,163,164,165,167,168,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,250,251,252,254,256,258,259,260,268,269,270,271,272,273,274,275,276,277,280,281,283,287,289,290,291,293,296,297,298,299,300,301,302,303,305,307,314,315,316,317,319,320,321,322,323,325,327,328,329,331,333,334,335,336,337,339,340,342,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,385,386,387,389,391,395,396,397,398,399,400,402,406,408,410,],[59,59,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,105,-149,-120,59,59,59,59,59,59,59,59,59,59,59,59,59,-150,-151,-152,-153,-154,-155,-72,59,59,-34,-77,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-118,-119,59,59,59,59,59,59,59,59,105,59,-149,-149,-147,59,59,105,-149,-88,-149,59,105,105,-67,-142,-141,-146,105,-140,105,-145,59,59,59,59,105,-76,-21,59,105,59,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,105,105,105,105,105,105,105,105,105,105,105,105,105,59,-157,105,-27,59,-45,-148,59,59,-52,-47,-79,59,59,59,-87,59,-90,59,59,59,59,59,59,59,105,105,105,105,-74,59,105,105,-168,59,105,-180,-156,59,59,105,59,105,59,105,105,59,105,105,59,-101,59,105,105,-160,59,59,-165,59,-73,105,59,105,-179,-178,-159,-152,105,-46,-168,59,-176,-80,-81,105,-168,105,-100,59,59,105,105,105,-75,105,-177,-158,-167,-170,-175,-91,59,59,59,-161,-164,-163,-166,59,-169,-89,59,105,-102,105,-183,105,105,-92,-162,-181,59,59,59,-182,105,-171,]),'INT_LITERAL':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,79,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,278,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[64,64,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,64,127,64,64,64,64,64,64,64,64,64,64,64,64,-150,-151,-152,-153,-154,-155,-72,64,169,64,-34,-77,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-118,-119,64,64,64,64,64,64,64,64,64,-149,-149,-147,64,64,-88,64,-66,-67,-142,-141,-146,-143,-140,-144,-145,64,64,64,64,-76,-21,64,-43,64,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,64,-157,-188,-27,64,-45,-148,64,64,-52,-47,-79,64,64,64,-87,64,-90,64,64,64,64,64,64,64,-74,64,-44,-168,64,-180,-156,64,64,-29,64,324,64,-42,64,64,-101,64,-187,-160,64,64,-165,64,-73,64,-179,-178,-159,-28,-46,-168,64,-176,-80,-81,-100,64,64,-75,-41,-177,-158,-167,-170,-175,-91,64,64,64,-161,-164,-163,-166,64,-169,-89,64,-102,-183,-92,-162,-181,64,64,64,-182,-171,]),'FLOAT_LITERAL':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[65,65,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,65,65,65,65,65,65,65,65,65,65,65,65,65,-150,-151,-152,-153,-154,-155,-72,65,65,-34,-77,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-118,-119,65,65,65,65,65,65,65,65,65,-149,-149,-147,65,65,-88,65,-66,-67,-142,-141,-146,-143,-140,-144,-145,65,65,65,65,-76,-21,65,-43,65,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,65,-157,-188,-27,65,-45,-148,65,65,-52,-47,-79,65,65,65,-87,65,-90,65,65,65,65,65,65,65,-74,65,-44,-168,65,-180,-156,65,65,-29,65,65,-42,65,65,-101,65,-187,-160,65,65,-165,65,-73,65,-179,-178,-159,-28,-46,-168,65,-176,-80,-81,-100,65,65,-75,-41,-177,-158,-167,-170,-175,-91,65,65,65,-161,-164,-163,-166,65,-169,-89,65,-102,-183,-92,-162,-181,65,65,65,-182,-171,]),'RUNE_LITERAL':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[67,67,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,67,67,67,67,67,67,67,67,67,67,67,67,67,-150,-151,-152,-153,-154,-155,-72,67,67,-34,-77,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-118,-119,67,67,67,67,67,67,67,67,67,-149,-149,-147,67,67,-88,67,-66,-67,-142,-141,-146,-143,-140,-144,-145,67,67,67,67,-76,-21,67,-43,67,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,67,-157,-188,-27,67,-45,-148,67,67,-52,-47,-79,67,67,67,-87,67,-90,67,67,67,67,67,67,67,-74,67,-44,-168,67,-180,-156,67,67,-29,67,67,-42,67,67,-101,67,-187,-160,67,67,-165,67,-73,67,-179,-178,-159,-28,-46,-168,67,-176,-80,-81,-100,67,67,-75,-41,-177,-158,-167,-170,-175,-91,67,67,67,-161,-164,-163,-166,67,-169,-89,67,-102,-183,-92,-162,-181,67,67,67,-182,-171,]),'BOOL_LITERAL':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[68,68,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,68,68,68,68,68,68,68,68,68,68,68,68,68,-150,-151,-152,-153,-154,-155,-72,68,68,-34,-77,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-118,-119,68,68,68,68,68,68,68,68,68,-149,-149,-147,68,68,-88,68,-66,-67,-142,-141,-146,-143,-140,-144,-145,68,68,68,68,-76,-21,68,-43,68,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,68,-157,-188,-27,68,-45,-148,68,68,-52,-47,-79,68,68,68,-87,68,-90,68,68,68,68,68,68,68,-74,68,-44,-168,68,-180,-156,68,68,-29,68,68,-42,68,68,-101,68,-187,-160,68,68,-165,68,-73,68,-179,-178,-159,-28,-46,-168,68,-176,-80,-81,-100,68,68,-75,-41,-177,-158,-167,-170,-175,-91,68,68,68,-161,-164,-163,-166,68,-169,-89,68,-102,-183,-92,-162,-181,68,68,68,-182,-171,]),'NIL':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[69,69,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,69,69,69,69,69,69,69,69,69,69,69,69,69,-150,-151,-152,-153,-154,-155,-72,69,69,-34,-77,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-118,-119,69,69,69,69,69,69,69,69,69,-149,-149,-147,69,69,-88,69,-66,-67,-142,-141,-146,-143,-140,-144,-145,69,69,69,69,-76,-21,69,-43,69,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,69,-157,-188,-27,69,-45,-148,69,69,-52,-47,-79,69,69,69,-87,69,-90,69,69,69,69,69,69,69,-74,69,-44,-168,69,-180,-156,69,69,-29,69,69,-42,69,69,-101,69,-187,-160,69,69,-165,69,-73,69,-179,-178,-159,-28,-46,-168,69,-176,-80,-81,-100,69,69,-75,-41,-177,-158,-167,-170,-175,-91,69,69,69,-161,-164,-163,-166,69,-169,-89,69,-102,-183,-92,-162,-181,69,69,69,-182,-171,]),'MAKE':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[70,70,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,70,70,70,70,70,70,70,70,70,70,70,70,70,-150,-151,-152,-153,-154,-155,-72,70,70,-34,-77,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-118,-119,70,70,70,70,70,70,70,70,70,-149,-149,-147,70,70,-88,70,-66,-67,-142,-141,-146,-143,-140,-144,-145,70,70,70,70,-76,-21,70,-43,70,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,70,-157,-188,-27,70,-45,-148,70,70,-52,-47,-79,70,70,70,-87,70,-90,70,70,70,70,70,70,70,-74,70,-44,-168,70,-180,-156,70,70,-29,70,70,-42,70,70,-101,70,-187,-160,70,70,-165,70,-73,70,-179,-178,-159,-28,-46,-168,70,-176,-80,-81,-100,70,70,-75,-41,-177,-158,-167,-170,-175,-91,70,70,70,-161,-164,-163,-166,70,-169,-89,70,-102,-183,-92,-162,-181,70,70,70,-182,-171,]),'APPEND':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[71,71,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,71,71,71,71,71,71,71,71,71,71,71,71,71,-150,-151,-152,-153,-154,-155,-72,71,71,-34,-77,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-118,-119,71,71,71,71,71,71,71,71,71,-149,-149,-147,71,71,-88,71,-66,-67,-142,-141,-146,-143,-140,-144,-145,71,71,71,71,-76,-21,71,-43,71,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,71,-157,-188,-27,71,-45,-148,71,71,-52,-47,-79,71,71,71,-87,71,-90,71,71,71,71,71,71,71,-74,71,-44,-168,71,-180,-156,71,71,-29,71,71,-42,71,71,-101,71,-187,-160,71,71,-165,71,-73,71,-179,-178,-159,-28,-46,-168,71,-176,-80,-81,-100,71,71,-75,-41,-177,-158,-167,-170,-175,-91,71,71,71,-161,-164,-163,-166,71,-169,-89,71,-102,-183,-92,-162,-181,71,71,71,-182,-171,]),'LEN':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[72,72,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,72,72,72,72,72,72,72,72,72,72,72,72,72,-150,-151,-152,-153,-154,-155,-72,72,72,-34,-77,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-118,-119,72,72,72,72,72,72,72,72,72,-149,-149,-147,72,72,-88,72,-66,-67,-142,-141,-146,-143,-140,-144,-145,72,72,72,72,-76,-21,72,-43,72,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,72,-157,-188,-27,72,-45,-148,72,72,-52,-47,-79,72,72,72,-87,72,-90,72,72,72,72,72,72,72,-74,72,-44,-168,72,-180,-156,72,72,-29,72,72,-42,72,72,-101,72,-187,-160,72,72,-165,72,-73,72,-179,-178,-159,-28,-46,-168,72,-176,-80,-81,-100,72,72,-75,-41,-177,-158,-167,-170,-175,-91,72,72,72,-161,-164,-163,-166,72,-169,-89,72,-102,-183,-92,-162,-181,72,72,72,-182,-171,]),'DELETE':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,76,78,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,125,126,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,163,164,165,167,172,173,176,177,178,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,224,225,226,229,230,231,232,233,234,235,236,238,239,240,245,247,248,256,258,260,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,305,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,350,351,352,353,356,357,363,364,365,367,368,369,370,371,372,379,380,383,386,389,396,397,398,399,400,402,406,410,],[73,73,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,73,73,73,73,73,73,73,73,73,73,73,73,73,-150,-151,-152,-153,-154,-155,-72,73,73,-34,-77,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-118,-119,73,73,73,73,73,73,73,73,73,-149,-149,-147,73,73,-88,73,-66,-67,-142,-141,-146,-143,-140,-144,-145,73,73,73,73,-76,-21,73,-43,73,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,73,-157,-188,-27,73,-45,-148,73,73,-52,-47,-79,73,73,73,-87,73,-90,73,73,73,73,73,73,73,-74,73,-44,-168,73,-180,-156,73,73,-29,73,73,-42,73,73,-101,73,-187,-160,73,73,-165,73,-73,73,-179,-178,-159,-28,-46,-168,73,-176,-80,-81,-100,73,73,-75,-41,-177,-158,-167,-170,-175,-91,73,73,73,-161,-164,-163,-166,73,-169,-89,73,-102,-183,-92,-162,-181,73,73,73,-182,-171,]),'LBRACKET':([25,26,28,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,74,75,76,78,80,81,84,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,130,131,132,137,140,143,148,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,171,172,173,176,177,178,179,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,222,224,225,226,227,228,229,230,231,232,233,234,235,236,238,239,240,241,245,247,248,255,256,258,260,263,264,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,304,305,306,308,310,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,349,350,351,352,353,354,356,357,360,363,364,365,367,368,369,370,371,372,374,379,380,383,386,389,393,396,397,398,399,400,402,406,410,],[50,79,79,50,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,119,-120,50,50,50,50,50,50,50,50,50,50,50,50,50,-150,-151,-152,-153,-154,-155,166,-51,-72,50,171,79,79,50,-34,-77,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-118,-119,50,50,50,50,50,50,50,50,79,79,50,221,79,221,-147,50,50,221,-88,238,50,-66,-67,-142,-141,-146,-143,-140,-144,-145,79,50,50,50,79,50,79,79,-76,-21,50,-43,50,79,79,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,50,-157,-188,-27,50,-45,-148,50,278,50,-52,-47,-48,-49,-79,50,50,50,-87,50,-90,50,50,50,50,79,50,50,50,79,-74,50,-44,79,79,-168,50,-180,-156,50,50,-29,50,50,-42,50,50,-101,50,-187,-160,50,50,-165,50,79,-73,79,79,79,50,-179,-178,-159,-28,-46,-168,50,-176,-80,-81,-100,50,50,-75,79,-41,-177,-158,-167,79,-170,-175,383,-91,50,50,50,-161,-164,-163,-166,50,79,-169,-89,50,-102,-183,79,-92,-162,-181,50,50,50,-182,-171,]),'MAP':([25,26,28,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,75,76,78,81,84,85,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,122,123,125,126,128,129,130,131,132,140,148,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,170,171,172,173,176,177,178,179,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,212,214,215,217,218,219,220,221,222,224,225,226,227,228,229,230,231,232,233,234,235,236,238,239,240,241,245,247,248,255,256,258,260,263,264,268,269,271,272,273,274,275,276,280,281,287,291,293,296,298,299,300,301,302,303,304,305,306,308,310,314,316,317,319,321,322,323,325,327,328,329,335,336,337,344,349,350,351,352,353,354,356,357,363,364,365,367,368,369,370,371,372,374,379,380,383,386,389,393,396,397,398,399,400,402,406,410,],[74,80,80,74,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,74,74,74,74,74,74,74,74,74,74,74,74,74,-150,-151,-152,-153,-154,-155,-51,-72,74,80,80,74,-34,-77,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-118,-119,74,74,74,74,74,74,74,74,80,80,74,-149,80,-149,-147,74,74,-88,74,-66,-67,-142,-141,-146,-143,-140,-144,-145,80,74,74,74,80,74,80,80,-76,-21,74,-43,74,80,80,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,74,-157,-188,-27,74,-45,-148,74,80,74,-52,-47,-48,-49,-79,74,74,74,-87,74,-90,74,74,74,74,80,74,74,74,80,-74,74,-44,80,80,-168,74,-180,-156,74,74,-29,74,74,-42,74,74,-101,74,-187,-160,74,74,-165,74,80,-73,80,80,80,74,-179,-178,-159,-28,-46,-168,74,-176,-80,-81,-100,74,74,-75,80,-41,-177,-158,-167,80,-170,-175,-91,74,74,74,-161,-164,-163,-166,74,80,-169,-89,74,-102,-183,80,-92,-162,-181,74,74,74,-182,-171,]),'UNDERSCORE':([25,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,53,54,55,56,64,65,66,67,68,69,76,87,90,91,111,112,126,129,130,133,140,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,234,235,256,260,265,268,271,272,275,281,293,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,344,350,351,352,353,356,357,363,365,368,369,370,371,379,380,386,389,396,397,398,406,410,],[75,75,-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,75,75,75,75,-65,-150,-151,-152,-153,-154,-155,-72,185,-34,-77,-118,-119,-149,-149,-147,228,-88,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,75,-90,-74,-44,185,-168,-180,-156,-29,-42,-101,75,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,75,75,-75,-41,-177,-158,-167,-170,-175,-91,75,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'ASSIGN':([26,28,46,52,75,76,77,84,86,122,129,143,172,175,217,219,227,228,241,256,268,288,305,333,344,360,384,405,],[78,85,114,131,-51,-72,167,176,178,218,224,236,-76,258,274,276,-48,-49,218,-74,314,332,-73,314,-75,114,224,314,]),'RPAREN':([30,31,64,65,66,67,68,69,76,82,83,87,89,120,124,126,130,155,156,157,158,159,160,161,172,174,175,180,181,182,183,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,213,214,215,220,249,251,256,259,261,266,267,271,272,273,298,299,302,305,307,309,313,316,317,318,319,320,323,327,339,340,341,342,344,345,346,347,348,349,351,352,353,356,357,368,369,370,371,377,379,387,389,392,397,398,401,406,410,],[88,-10,-150,-151,-152,-153,-154,-155,-72,173,-23,-189,-9,214,220,-149,-147,-142,-141,-146,-143,-140,-144,-145,-76,-22,-24,264,-53,-54,-56,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,272,-157,-188,-148,299,302,-74,-26,-57,-60,-61,-180,-156,319,-187,-160,-165,-73,-25,-59,-55,-179,-178,352,-159,353,-168,-176,368,369,370,371,-75,-58,373,375,-71,-72,-177,-158,-167,-170,-175,-161,-164,-163,-166,-69,-169,397,-183,-70,-162,-181,-68,-182,-171,]),'CASE':([33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,151,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,242,243,244,256,260,268,271,272,275,281,292,293,294,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,338,344,350,351,352,353,356,357,363,365,366,368,369,370,371,379,380,386,389,396,397,398,406,410,],[-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,245,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,245,245,-104,-74,-44,-168,-180,-156,-29,-42,245,-101,-103,-189,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,-189,-106,245,-75,-41,-177,-158,-167,-170,-175,-91,-105,245,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'DEFAULT':([33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,56,64,65,66,67,68,69,76,90,91,111,112,126,129,130,140,151,153,154,155,156,157,158,159,160,161,172,173,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,214,215,217,219,220,225,226,229,233,235,242,243,244,256,260,268,271,272,275,281,292,293,294,296,298,299,302,305,316,317,319,321,322,323,327,328,329,335,336,337,338,344,350,351,352,353,356,357,363,365,366,368,369,370,371,379,380,386,389,396,397,398,406,410,],[-35,-78,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-149,-120,-65,-150,-151,-152,-153,-154,-155,-72,-34,-77,-118,-119,-149,-149,-147,-88,246,-66,-67,-142,-141,-146,-143,-140,-144,-145,-76,-21,-43,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-30,-36,-37,-38,-39,-40,-157,-188,-27,-45,-148,-52,-47,-79,-87,-90,246,246,-104,-74,-44,-168,-180,-156,-29,-42,246,-101,-103,-189,-187,-160,-165,-73,-179,-178,-159,-28,-46,-168,-176,-80,-81,-100,-189,-106,246,-75,-41,-177,-158,-167,-170,-175,-91,-105,246,-161,-164,-163,-166,-169,-89,-102,-183,-92,-162,-181,-182,-171,]),'ELSE':([33,90,229,],[-35,-34,282,]),'DIVIDE':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[95,-149,-150,-151,-152,-153,-154,-155,95,-149,-149,-147,95,-149,-149,95,95,-142,-141,-146,95,-140,95,-145,95,95,95,95,-123,-124,-125,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-157,95,-148,95,95,95,95,95,95,-168,95,-180,-156,95,95,95,95,95,95,95,95,-160,-165,95,95,-179,-178,-159,-152,95,-168,-176,95,-168,95,95,95,95,95,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,95,95,-183,95,95,-162,-181,-182,95,-171,]),'MOD':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[96,-149,-150,-151,-152,-153,-154,-155,96,-149,-149,-147,96,-149,-149,96,96,-142,-141,-146,96,-140,96,-145,96,96,96,96,-123,-124,-125,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-157,96,-148,96,96,96,96,96,96,-168,96,-180,-156,96,96,96,96,96,96,96,96,-160,-165,96,96,-179,-178,-159,-152,96,-168,-176,96,-168,96,96,96,96,96,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,96,96,-183,96,96,-162,-181,-182,96,-171,]),'AND':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[97,-149,-150,-151,-152,-153,-154,-155,97,-149,-149,-147,97,-149,-149,97,97,-142,-141,-146,97,-140,97,-145,97,97,-121,-122,-123,-124,-125,-126,97,-128,-129,-130,-131,-132,-133,97,97,97,97,97,97,97,97,97,97,97,97,97,-157,97,-148,97,97,97,97,97,97,-168,97,-180,-156,97,97,97,97,97,97,97,97,-160,-165,97,97,-179,-178,-159,-152,97,-168,-176,97,-168,97,97,97,97,97,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,97,97,-183,97,97,-162,-181,-182,97,-171,]),'OR':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[98,-149,-150,-151,-152,-153,-154,-155,98,-149,-149,-147,98,-149,-149,98,98,-142,-141,-146,98,-140,98,-145,98,98,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,98,98,98,98,98,98,98,98,98,98,98,98,98,-157,98,-148,98,98,98,98,98,98,-168,98,-180,-156,98,98,98,98,98,98,98,98,-160,-165,98,98,-179,-178,-159,-152,98,-168,-176,98,-168,98,98,98,98,98,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,98,98,-183,98,98,-162,-181,-182,98,-171,]),'EQ':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[99,-149,-150,-151,-152,-153,-154,-155,99,-149,-149,-147,99,-149,-149,99,99,-142,-141,-146,99,-140,99,-145,99,99,-121,-122,-123,-124,-125,99,99,-128,-129,-130,-131,-132,-133,99,99,99,99,99,99,99,99,99,99,99,99,99,-157,99,-148,99,99,99,99,99,99,-168,99,-180,-156,99,99,99,99,99,99,99,99,-160,-165,99,99,-179,-178,-159,-152,99,-168,-176,99,-168,99,99,99,99,99,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,99,99,-183,99,99,-162,-181,-182,99,-171,]),'NE':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[100,-149,-150,-151,-152,-153,-154,-155,100,-149,-149,-147,100,-149,-149,100,100,-142,-141,-146,100,-140,100,-145,100,100,-121,-122,-123,-124,-125,100,100,-128,-129,-130,-131,-132,-133,100,100,100,100,100,100,100,100,100,100,100,100,100,-157,100,-148,100,100,100,100,100,100,-168,100,-180,-156,100,100,100,100,100,100,100,100,-160,-165,100,100,-179,-178,-159,-152,100,-168,-176,100,-168,100,100,100,100,100,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,100,100,-183,100,100,-162,-181,-182,100,-171,]),'LT':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[101,-149,-150,-151,-152,-153,-154,-155,101,-149,-149,-147,101,-149,-149,101,101,-142,-141,-146,101,-140,101,-145,101,101,-121,-122,-123,-124,-125,101,101,101,101,-130,-131,-132,-133,101,101,101,101,101,101,101,101,101,101,101,101,101,-157,101,-148,101,101,101,101,101,101,-168,101,-180,-156,101,101,101,101,101,101,101,101,-160,-165,101,101,-179,-178,-159,-152,101,-168,-176,101,-168,101,101,101,101,101,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,101,101,-183,101,101,-162,-181,-182,101,-171,]),'LE':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[102,-149,-150,-151,-152,-153,-154,-155,102,-149,-149,-147,102,-149,-149,102,102,-142,-141,-146,102,-140,102,-145,102,102,-121,-122,-123,-124,-125,102,102,102,102,-130,-131,-132,-133,102,102,102,102,102,102,102,102,102,102,102,102,102,-157,102,-148,102,102,102,102,102,102,-168,102,-180,-156,102,102,102,102,102,102,102,102,-160,-165,102,102,-179,-178,-159,-152,102,-168,-176,102,-168,102,102,102,102,102,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,102,102,-183,102,102,-162,-181,-182,102,-171,]),'GT':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[103,-149,-150,-151,-152,-153,-154,-155,103,-149,-149,-147,103,-149,-149,103,103,-142,-141,-146,103,-140,103,-145,103,103,-121,-122,-123,-124,-125,103,103,103,103,-130,-131,-132,-133,103,103,103,103,103,103,103,103,103,103,103,103,103,-157,103,-148,103,103,103,103,103,103,-168,103,-180,-156,103,103,103,103,103,103,103,103,-160,-165,103,103,-179,-178,-159,-152,103,-168,-176,103,-168,103,103,103,103,103,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,103,103,-183,103,103,-162,-181,-182,103,-171,]),'GE':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[104,-149,-150,-151,-152,-153,-154,-155,104,-149,-149,-147,104,-149,-149,104,104,-142,-141,-146,104,-140,104,-145,104,104,-121,-122,-123,-124,-125,104,104,104,104,-130,-131,-132,-133,104,104,104,104,104,104,104,104,104,104,104,104,104,-157,104,-148,104,104,104,104,104,104,-168,104,-180,-156,104,104,104,104,104,104,104,104,-160,-165,104,104,-179,-178,-159,-152,104,-168,-176,104,-168,104,104,104,104,104,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,104,104,-183,104,104,-162,-181,-182,104,-171,]),'BITOR':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[106,-149,-150,-151,-152,-153,-154,-155,106,-149,-149,-147,106,-149,-149,106,106,-142,-141,-146,106,-140,106,-145,106,106,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,106,106,106,106,106,106,106,106,106,106,106,106,106,-157,106,-148,106,106,106,106,106,106,-168,106,-180,-156,106,106,106,106,106,106,106,106,-160,-165,106,106,-179,-178,-159,-152,106,-168,-176,106,-168,106,106,106,106,106,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,106,106,-183,106,106,-162,-181,-182,106,-171,]),'LSHIFT':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[108,-149,-150,-151,-152,-153,-154,-155,108,-149,-149,-147,108,-149,-149,108,108,-142,-141,-146,108,-140,108,-145,108,108,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,108,108,108,108,108,108,108,108,108,108,108,108,108,-157,108,-148,108,108,108,108,108,108,-168,108,-180,-156,108,108,108,108,108,108,108,108,-160,-165,108,108,-179,-178,-159,-152,108,-168,-176,108,-168,108,108,108,108,108,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,108,108,-183,108,108,-162,-181,-182,108,-171,]),'RSHIFT':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[109,-149,-150,-151,-152,-153,-154,-155,109,-149,-149,-147,109,-149,-149,109,109,-142,-141,-146,109,-140,109,-145,109,109,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,109,109,109,109,109,109,109,109,109,109,109,109,109,-157,109,-148,109,109,109,109,109,109,-168,109,-180,-156,109,109,109,109,109,109,109,109,-160,-165,109,109,-179,-178,-159,-152,109,-168,-176,109,-168,109,109,109,109,109,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,109,109,-183,109,109,-162,-181,-182,109,-171,]),'AND_NOT':([45,46,64,65,66,67,68,69,124,126,129,130,135,137,143,150,153,155,156,157,158,159,160,161,168,177,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,214,215,220,250,251,252,254,259,260,268,270,271,272,275,277,281,283,289,290,297,298,299,302,307,315,316,317,319,320,321,323,327,331,333,334,339,340,342,350,351,352,353,356,357,368,369,370,371,379,385,387,389,391,395,397,398,406,408,410,],[110,-149,-150,-151,-152,-153,-154,-155,110,-149,-149,-147,110,-149,-149,110,110,-142,-141,-146,110,-140,110,-145,110,110,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,110,110,110,110,110,110,110,110,110,110,110,110,110,-157,110,-148,110,110,110,110,110,110,-168,110,-180,-156,110,110,110,110,110,110,110,110,-160,-165,110,110,-179,-178,-159,-152,110,-168,-176,110,-168,110,110,110,110,110,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,110,110,-183,110,110,-162,-181,-182,110,-171,]),'INCREMENT':([46,360,],[111,381,]),'DECREMENT':([46,360,],[112,382,]),'DECLARE_ASSIGN':([46,52,75,137,138,143,147,227,228,],[113,132,-51,231,232,239,240,-48,-49,]),'PLUS_ASSIGN':([46,143,360,],[115,115,115,]),'MINUS_ASSIGN':([46,143,360,],[116,116,116,]),'TIMES_ASSIGN':([46,143,360,],[117,117,117,]),'DIVIDE_ASSIGN':([46,143,360,],[118,118,118,]),'DOT':([46,126,129,137,143,],[121,121,121,121,121,]),'COMMA':([46,52,64,65,66,67,68,69,75,76,122,123,126,130,137,138,143,147,153,154,155,156,157,158,159,160,161,172,179,181,183,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,213,214,215,220,225,226,227,228,249,250,252,256,261,266,267,271,272,284,285,290,295,298,299,302,305,309,313,316,317,318,319,320,322,323,326,327,339,340,341,344,345,346,347,348,349,351,352,353,355,356,357,368,369,370,371,377,379,388,389,390,392,397,398,401,403,404,406,407,408,409,410,412,413,],[-50,133,-150,-151,-152,-153,-154,-155,-51,-72,-50,133,-149,-147,-50,133,237,133,-188,248,-142,-141,-146,-143,-140,-144,-145,-76,262,265,-56,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,248,-157,-188,-148,248,248,-48,-49,300,301,303,-74,-57,-60,-61,-180,-156,248,248,-188,248,-187,-160,-165,-73,-59,-55,-179,-178,248,-159,-152,248,-168,248,-176,367,-188,248,-75,-58,374,376,-71,-72,-177,-158,-167,248,-170,-175,-161,-164,-163,-166,-69,-169,399,-183,-185,-70,-162,-181,-68,411,-173,-182,-184,-186,248,-171,-174,-172,]),'RBRACKET':([50,64,65,66,67,68,69,76,79,126,127,130,155,156,157,158,159,160,161,169,172,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,211,212,214,220,253,256,257,269,270,271,272,277,278,289,299,302,305,315,316,317,319,323,324,327,344,351,352,353,356,357,368,369,370,371,379,389,395,397,398,406,410,],[128,-150,-151,-152,-153,-154,-155,-72,170,-149,222,-147,-142,-141,-146,-143,-140,-144,-145,255,-76,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,268,271,-157,-148,304,-74,306,316,317,-180,-156,323,170,333,-160,-165,-73,351,-179,-178,-159,-168,354,-176,-75,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,-183,405,-162,-181,-182,-171,]),'SEMICOLON':([54,64,65,66,67,68,69,76,126,130,135,136,137,141,144,145,146,152,155,156,157,158,159,160,161,172,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,214,215,217,220,256,271,272,275,281,283,284,285,286,290,298,299,302,305,316,317,319,321,323,327,344,350,351,352,353,356,357,368,369,370,371,379,389,397,398,406,410,],[-189,-150,-151,-152,-153,-154,-155,-72,-149,-147,-82,230,-149,234,-93,-94,-95,247,-142,-141,-146,-143,-140,-144,-145,-76,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-36,-37,-38,-39,-40,-157,-188,-27,-148,-74,-180,-156,-29,-42,-83,-84,-85,330,-30,-187,-160,-165,-73,-179,-178,-159,-28,-168,-176,-75,-41,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,-183,-162,-181,-182,-171,]),'COLON':([64,65,66,67,68,69,119,126,130,155,156,157,158,159,160,161,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,211,214,215,220,221,238,246,271,272,277,289,295,298,299,302,316,317,319,323,327,351,352,353,356,357,368,369,370,371,379,389,391,397,398,406,410,],[-150,-151,-152,-153,-154,-155,212,-149,-147,-142,-141,-146,-143,-140,-144,-145,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,269,-157,-188,-148,212,212,296,-180,-156,269,269,336,-187,-160,-165,-179,-178,-159,-168,-176,-177,-158,-167,-170,-175,-161,-164,-163,-166,-169,-183,400,-162,-181,-182,-171,]),'ELLIPSIS':([179,],[263,]),'RANGE':([236,240,332,],[287,291,364,]),}
 
@@ -27,193 +27,193 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> package_decl imports declaraciones','programa',3,'p_programa','semantico_go.py',131),
-  ('package_decl -> PACKAGE ID','package_decl',2,'p_package_decl','semantico_go.py',135),
-  ('imports -> import_decl imports','imports',2,'p_imports','semantico_go.py',139),
-  ('imports -> import_decl','imports',1,'p_imports','semantico_go.py',140),
-  ('imports -> empty','imports',1,'p_imports','semantico_go.py',141),
-  ('import_decl -> IMPORT STRING_LITERAL','import_decl',2,'p_import_decl','semantico_go.py',145),
-  ('import_decl -> IMPORT LPAREN lista_imports RPAREN','import_decl',4,'p_import_decl','semantico_go.py',146),
-  ('import_decl -> empty','import_decl',1,'p_import_decl','semantico_go.py',147),
-  ('lista_imports -> lista_imports STRING_LITERAL','lista_imports',2,'p_lista_imports','semantico_go.py',151),
-  ('lista_imports -> STRING_LITERAL','lista_imports',1,'p_lista_imports','semantico_go.py',152),
-  ('declaraciones -> declaraciones declaracion','declaraciones',2,'p_declaraciones','semantico_go.py',156),
-  ('declaraciones -> declaracion','declaraciones',1,'p_declaraciones','semantico_go.py',157),
-  ('declaracion -> funcion','declaracion',1,'p_declaracion','semantico_go.py',161),
-  ('declaracion -> declaracion_var_global','declaracion',1,'p_declaracion','semantico_go.py',162),
-  ('declaracion -> bloque_var','declaracion',1,'p_declaracion','semantico_go.py',163),
-  ('declaracion -> declaracion_const','declaracion',1,'p_declaracion','semantico_go.py',164),
-  ('declaracion -> empty','declaracion',1,'p_declaracion','semantico_go.py',165),
-  ('declaracion_var_global -> VAR ID tipo','declaracion_var_global',3,'p_declaracion_var_global','semantico_go.py',169),
-  ('declaracion_var_global -> VAR ID tipo ASSIGN expresion','declaracion_var_global',5,'p_declaracion_var_global','semantico_go.py',170),
-  ('declaracion_var_global -> VAR ID ASSIGN expresion','declaracion_var_global',4,'p_declaracion_var_global','semantico_go.py',171),
-  ('bloque_var -> VAR LPAREN lista_decl_bloque RPAREN','bloque_var',4,'p_bloque_var','semantico_go.py',188),
-  ('lista_decl_bloque -> lista_decl_bloque decl_var_bloque','lista_decl_bloque',2,'p_lista_decl_bloque','semantico_go.py',192),
-  ('lista_decl_bloque -> decl_var_bloque','lista_decl_bloque',1,'p_lista_decl_bloque','semantico_go.py',193),
-  ('decl_var_bloque -> ID tipo','decl_var_bloque',2,'p_decl_var_bloque','semantico_go.py',197),
-  ('decl_var_bloque -> ID tipo ASSIGN expresion','decl_var_bloque',4,'p_decl_var_bloque','semantico_go.py',198),
-  ('decl_var_bloque -> ID ASSIGN expresion','decl_var_bloque',3,'p_decl_var_bloque','semantico_go.py',199),
-  ('declaracion_var -> VAR ID tipo','declaracion_var',3,'p_declaracion_var','semantico_go.py',216),
-  ('declaracion_var -> VAR ID tipo ASSIGN expresion','declaracion_var',5,'p_declaracion_var','semantico_go.py',217),
-  ('declaracion_var -> VAR ID ASSIGN expresion','declaracion_var',4,'p_declaracion_var','semantico_go.py',218),
-  ('declaracion_var -> ID DECLARE_ASSIGN expresion','declaracion_var',3,'p_declaracion_var','semantico_go.py',219),
-  ('funcion -> funcion_header bloque','funcion',2,'p_funcion','semantico_go.py',239),
-  ('funcion_header -> FUNC ID LPAREN parametros RPAREN tipo_retorno','funcion_header',6,'p_funcion_header','semantico_go.py',245),
-  ('funcion_header -> FUNC ID LPAREN parametros RPAREN','funcion_header',5,'p_funcion_header','semantico_go.py',246),
-  ('bloque -> LBRACE sentencias RBRACE','bloque',3,'p_bloque','semantico_go.py',260),
-  ('bloque -> LBRACE RBRACE','bloque',2,'p_bloque','semantico_go.py',261),
-  ('asignacion -> ID ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',265),
-  ('asignacion -> ID PLUS_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',266),
-  ('asignacion -> ID MINUS_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',267),
-  ('asignacion -> ID TIMES_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',268),
-  ('asignacion -> ID DIVIDE_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',269),
-  ('asignacion -> ID LBRACKET expresion RBRACKET ASSIGN expresion','asignacion',6,'p_asignacion','semantico_go.py',270),
-  ('asignacion -> TIMES ID ASSIGN expresion','asignacion',4,'p_asignacion','semantico_go.py',271),
-  ('declaracion_const -> CONST ID ASSIGN expresion','declaracion_const',4,'p_declaracion_const','semantico_go.py',307),
-  ('declaracion_const -> CONST ID tipo ASSIGN expresion','declaracion_const',5,'p_declaracion_const','semantico_go.py',308),
-  ('declaracion_var_multiple -> VAR lista_ids tipo','declaracion_var_multiple',3,'p_declaracion_var_multiple','semantico_go.py',320),
-  ('declaracion_var_multiple -> VAR lista_ids tipo ASSIGN lista_expresiones','declaracion_var_multiple',5,'p_declaracion_var_multiple','semantico_go.py',321),
-  ('declaracion_var_multiple -> lista_ids DECLARE_ASSIGN lista_expresiones','declaracion_var_multiple',3,'p_declaracion_var_multiple','semantico_go.py',322),
-  ('lista_ids -> lista_ids COMMA ID','lista_ids',3,'p_lista_ids','semantico_go.py',362),
-  ('lista_ids -> lista_ids COMMA UNDERSCORE','lista_ids',3,'p_lista_ids','semantico_go.py',363),
-  ('lista_ids -> ID','lista_ids',1,'p_lista_ids','semantico_go.py',364),
-  ('lista_ids -> UNDERSCORE','lista_ids',1,'p_lista_ids','semantico_go.py',365),
-  ('asignacion_multiple -> lista_ids ASSIGN lista_expresiones','asignacion_multiple',3,'p_asignacion_multiple','semantico_go.py',372),
-  ('parametros -> lista_parametros','parametros',1,'p_parametros','semantico_go.py',376),
-  ('parametros -> empty','parametros',1,'p_parametros','semantico_go.py',377),
-  ('lista_parametros -> lista_parametros COMMA parametro','lista_parametros',3,'p_lista_parametros','semantico_go.py',381),
-  ('lista_parametros -> parametro','lista_parametros',1,'p_lista_parametros','semantico_go.py',382),
-  ('parametro -> ID tipo','parametro',2,'p_parametro','semantico_go.py',389),
-  ('parametro -> ID COMMA ID tipo','parametro',4,'p_parametro','semantico_go.py',390),
-  ('parametro -> ID ELLIPSIS tipo','parametro',3,'p_parametro','semantico_go.py',391),
-  ('parametro -> TIMES ID','parametro',2,'p_parametro','semantico_go.py',392),
-  ('parametro -> UNDERSCORE tipo','parametro',2,'p_parametro','semantico_go.py',393),
-  ('tipo_retorno -> tipo','tipo_retorno',1,'p_tipo_retorno','semantico_go.py',429),
-  ('tipo_retorno -> LPAREN lista_tipos RPAREN','tipo_retorno',3,'p_tipo_retorno','semantico_go.py',430),
-  ('tipo_retorno -> LPAREN lista_retornos_nombrados RPAREN','tipo_retorno',3,'p_tipo_retorno','semantico_go.py',431),
-  ('return_statement -> RETURN','return_statement',1,'p_return_statement','semantico_go.py',435),
-  ('return_statement -> RETURN expresion','return_statement',2,'p_return_statement','semantico_go.py',436),
-  ('return_statement -> RETURN lista_expresiones','return_statement',2,'p_return_statement','semantico_go.py',437),
-  ('lista_retornos_nombrados -> lista_retornos_nombrados COMMA ID tipo','lista_retornos_nombrados',4,'p_lista_retornos_nombrados','semantico_go.py',445),
-  ('lista_retornos_nombrados -> ID tipo','lista_retornos_nombrados',2,'p_lista_retornos_nombrados','semantico_go.py',446),
-  ('lista_tipos -> lista_tipos COMMA tipo','lista_tipos',3,'p_lista_tipos','semantico_go.py',450),
-  ('lista_tipos -> tipo','lista_tipos',1,'p_lista_tipos','semantico_go.py',451),
-  ('tipo -> ID','tipo',1,'p_tipo','semantico_go.py',455),
-  ('tipo -> LBRACKET INT_LITERAL RBRACKET tipo','tipo',4,'p_tipo','semantico_go.py',456),
-  ('tipo -> LBRACKET RBRACKET tipo','tipo',3,'p_tipo','semantico_go.py',457),
-  ('tipo -> MAP LBRACKET tipo RBRACKET tipo','tipo',5,'p_tipo','semantico_go.py',458),
-  ('tipo -> TIMES tipo','tipo',2,'p_tipo','semantico_go.py',459),
-  ('sentencias -> sentencias sentencia','sentencias',2,'p_sentencias','semantico_go.py',463),
-  ('sentencias -> sentencia','sentencias',1,'p_sentencias','semantico_go.py',464),
-  ('if_statement -> IF condicion bloque','if_statement',3,'p_if_statement','semantico_go.py',468),
-  ('if_statement -> IF condicion bloque ELSE bloque','if_statement',5,'p_if_statement','semantico_go.py',469),
-  ('if_statement -> IF condicion bloque ELSE if_statement','if_statement',5,'p_if_statement','semantico_go.py',470),
-  ('condicion -> expresion','condicion',1,'p_condicion','semantico_go.py',477),
-  ('condicion -> declaracion_var_corta SEMICOLON expresion','condicion',3,'p_condicion','semantico_go.py',478),
-  ('declaracion_var_corta -> ID DECLARE_ASSIGN lista_expresiones','declaracion_var_corta',3,'p_declaracion_var_corta','semantico_go.py',482),
-  ('declaracion_var_corta -> lista_ids DECLARE_ASSIGN lista_expresiones','declaracion_var_corta',3,'p_declaracion_var_corta','semantico_go.py',483),
-  ('for_range_decl -> lista_ids DECLARE_ASSIGN RANGE expresion','for_range_decl',4,'p_for_range_decl','semantico_go.py',506),
-  ('for_statement -> FOR condicion bloque','for_statement',3,'p_for_statement','semantico_go.py',522),
-  ('for_statement -> FOR bloque','for_statement',2,'p_for_statement','semantico_go.py',523),
-  ('for_statement -> FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque','for_statement',7,'p_for_statement','semantico_go.py',524),
-  ('for_statement -> FOR for_range_decl bloque','for_statement',3,'p_for_statement','semantico_go.py',525),
-  ('for_statement -> FOR ID ASSIGN RANGE expresion bloque','for_statement',6,'p_for_statement','semantico_go.py',526),
-  ('for_statement -> FOR ID COMMA ID ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','semantico_go.py',527),
-  ('inicializacion -> declaracion_var','inicializacion',1,'p_inicializacion','semantico_go.py',533),
-  ('inicializacion -> asignacion','inicializacion',1,'p_inicializacion','semantico_go.py',534),
-  ('inicializacion -> empty','inicializacion',1,'p_inicializacion','semantico_go.py',535),
-  ('incremento -> asignacion','incremento',1,'p_incremento','semantico_go.py',539),
-  ('incremento -> ID INCREMENT','incremento',2,'p_incremento','semantico_go.py',540),
-  ('incremento -> ID DECREMENT','incremento',2,'p_incremento','semantico_go.py',541),
-  ('incremento -> empty','incremento',1,'p_incremento','semantico_go.py',542),
-  ('switch_statement -> SWITCH expresion LBRACE casos RBRACE','switch_statement',5,'p_switch_statement','semantico_go.py',546),
-  ('switch_statement -> SWITCH LBRACE casos RBRACE','switch_statement',4,'p_switch_statement','semantico_go.py',547),
-  ('switch_statement -> SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACE','switch_statement',7,'p_switch_statement','semantico_go.py',548),
-  ('casos -> casos caso','casos',2,'p_casos','semantico_go.py',569),
-  ('casos -> caso','casos',1,'p_casos','semantico_go.py',570),
-  ('caso -> CASE lista_expresiones COLON sentencias','caso',4,'p_caso','semantico_go.py',577),
-  ('caso -> DEFAULT COLON sentencias','caso',3,'p_caso','semantico_go.py',578),
-  ('sentencia -> declaracion_var','sentencia',1,'p_sentencia','semantico_go.py',586),
-  ('sentencia -> bloque_var','sentencia',1,'p_sentencia','semantico_go.py',587),
-  ('sentencia -> declaracion_const','sentencia',1,'p_sentencia','semantico_go.py',588),
-  ('sentencia -> asignacion','sentencia',1,'p_sentencia','semantico_go.py',589),
-  ('sentencia -> asignacion_multiple','sentencia',1,'p_sentencia','semantico_go.py',590),
-  ('sentencia -> declaracion_var_multiple','sentencia',1,'p_sentencia','semantico_go.py',591),
-  ('sentencia -> if_statement','sentencia',1,'p_sentencia','semantico_go.py',592),
-  ('sentencia -> for_statement','sentencia',1,'p_sentencia','semantico_go.py',593),
-  ('sentencia -> switch_statement','sentencia',1,'p_sentencia','semantico_go.py',594),
-  ('sentencia -> return_statement','sentencia',1,'p_sentencia','semantico_go.py',595),
-  ('sentencia -> expresion','sentencia',1,'p_sentencia','semantico_go.py',596),
-  ('sentencia -> ID INCREMENT','sentencia',2,'p_sentencia','semantico_go.py',597),
-  ('sentencia -> ID DECREMENT','sentencia',2,'p_sentencia','semantico_go.py',598),
-  ('sentencia -> empty','sentencia',1,'p_sentencia','semantico_go.py',599),
-  ('expresion -> expresion PLUS expresion','expresion',3,'p_expresion_binaria','semantico_go.py',603),
-  ('expresion -> expresion MINUS expresion','expresion',3,'p_expresion_binaria','semantico_go.py',604),
-  ('expresion -> expresion TIMES expresion','expresion',3,'p_expresion_binaria','semantico_go.py',605),
-  ('expresion -> expresion DIVIDE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',606),
-  ('expresion -> expresion MOD expresion','expresion',3,'p_expresion_binaria','semantico_go.py',607),
-  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_binaria','semantico_go.py',608),
-  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',609),
-  ('expresion -> expresion EQ expresion','expresion',3,'p_expresion_binaria','semantico_go.py',610),
-  ('expresion -> expresion NE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',611),
-  ('expresion -> expresion LT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',612),
-  ('expresion -> expresion LE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',613),
-  ('expresion -> expresion GT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',614),
-  ('expresion -> expresion GE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',615),
-  ('expresion -> expresion BITAND expresion','expresion',3,'p_expresion_binaria','semantico_go.py',616),
-  ('expresion -> expresion BITOR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',617),
-  ('expresion -> expresion BITXOR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',618),
-  ('expresion -> expresion LSHIFT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',619),
-  ('expresion -> expresion RSHIFT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',620),
-  ('expresion -> expresion AND_NOT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',621),
-  ('expresion -> NOT expresion','expresion',2,'p_expresion_unaria','semantico_go.py',645),
-  ('expresion -> MINUS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',646),
-  ('expresion -> PLUS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',647),
-  ('expresion -> BITXOR expresion','expresion',2,'p_expresion_unaria','semantico_go.py',648),
-  ('expresion -> BITNOT expresion','expresion',2,'p_expresion_unaria','semantico_go.py',649),
-  ('expresion -> ADDRESS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',650),
-  ('expresion -> BITAND expresion','expresion',2,'p_expresion_unaria','semantico_go.py',651),
-  ('expresion -> TIMES expresion','expresion',2,'p_expresion_unaria','semantico_go.py',652),
-  ('expresion -> LPAREN expresion RPAREN','expresion',3,'p_expresion_agrupada','semantico_go.py',656),
-  ('expresion -> ID','expresion',1,'p_expresion_primaria','semantico_go.py',660),
-  ('expresion -> INT_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',661),
-  ('expresion -> FLOAT_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',662),
-  ('expresion -> STRING_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',663),
-  ('expresion -> RUNE_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',664),
-  ('expresion -> BOOL_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',665),
-  ('expresion -> NIL','expresion',1,'p_expresion_primaria','semantico_go.py',666),
-  ('expresion -> ID LPAREN lista_expresiones RPAREN','expresion',4,'p_expresion_llamada','semantico_go.py',688),
-  ('expresion -> ID LPAREN RPAREN','expresion',3,'p_expresion_llamada','semantico_go.py',689),
-  ('expresion -> ID DOT ID LPAREN lista_expresiones RPAREN','expresion',6,'p_expresion_llamada','semantico_go.py',690),
-  ('expresion -> ID DOT ID LPAREN RPAREN','expresion',5,'p_expresion_llamada','semantico_go.py',691),
-  ('expresion -> MAKE LPAREN tipo RPAREN','expresion',4,'p_expresion_make','semantico_go.py',721),
-  ('expresion -> MAKE LPAREN tipo COMMA expresion RPAREN','expresion',6,'p_expresion_make','semantico_go.py',722),
-  ('expresion -> MAKE LPAREN tipo COMMA expresion COMMA expresion RPAREN','expresion',8,'p_expresion_make','semantico_go.py',723),
-  ('expresion -> APPEND LPAREN expresion COMMA lista_expresiones RPAREN','expresion',6,'p_expresion_append','semantico_go.py',727),
-  ('expresion -> APPEND LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_append','semantico_go.py',728),
-  ('expresion -> LEN LPAREN expresion RPAREN','expresion',4,'p_expresion_len','semantico_go.py',732),
-  ('expresion -> DELETE LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_delete','semantico_go.py',736),
-  ('expresion -> ID DOT ID LPAREN STRING_LITERAL RPAREN','expresion',6,'p_expresion_new','semantico_go.py',740),
-  ('expresion -> ID LBRACKET expresion RBRACKET','expresion',4,'p_expresion_array_acceso','semantico_go.py',744),
-  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',7,'p_array_literal','semantico_go.py',748),
-  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE','expresion',6,'p_array_literal','semantico_go.py',749),
-  ('expresion -> LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACE','expresion',10,'p_array_literal','semantico_go.py',750),
-  ('lista_filas_matriz -> lista_filas_matriz COMMA fila_matriz','lista_filas_matriz',3,'p_lista_filas_matriz','semantico_go.py',754),
-  ('lista_filas_matriz -> fila_matriz','lista_filas_matriz',1,'p_lista_filas_matriz','semantico_go.py',755),
-  ('fila_matriz -> LBRACE lista_expresiones RBRACE','fila_matriz',3,'p_fila_matriz','semantico_go.py',759),
-  ('expresion -> LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',6,'p_slice_literal','semantico_go.py',763),
-  ('expresion -> LBRACKET RBRACKET tipo LBRACE RBRACE','expresion',5,'p_slice_literal','semantico_go.py',764),
-  ('expresion -> ID LBRACKET expresion COLON expresion RBRACKET','expresion',6,'p_slice_operacion','semantico_go.py',768),
-  ('expresion -> ID LBRACKET COLON expresion RBRACKET','expresion',5,'p_slice_operacion','semantico_go.py',769),
-  ('expresion -> ID LBRACKET expresion COLON RBRACKET','expresion',5,'p_slice_operacion','semantico_go.py',770),
-  ('expresion -> ID LBRACKET COLON RBRACKET','expresion',4,'p_slice_operacion','semantico_go.py',771),
-  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE','expresion',8,'p_map_literal','semantico_go.py',775),
-  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE','expresion',9,'p_map_literal','semantico_go.py',776),
-  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACE','expresion',7,'p_map_literal','semantico_go.py',777),
-  ('pares_mapa -> pares_mapa COMMA par_mapa','pares_mapa',3,'p_pares_mapa','semantico_go.py',781),
-  ('pares_mapa -> par_mapa','pares_mapa',1,'p_pares_mapa','semantico_go.py',782),
-  ('par_mapa -> expresion COLON expresion','par_mapa',3,'p_par_mapa','semantico_go.py',786),
-  ('lista_expresiones -> lista_expresiones COMMA expresion','lista_expresiones',3,'p_lista_expresiones','semantico_go.py',790),
-  ('lista_expresiones -> expresion','lista_expresiones',1,'p_lista_expresiones','semantico_go.py',791),
-  ('empty -> <empty>','empty',0,'p_empty','semantico_go.py',801),
+  ('programa -> package_decl imports declaraciones','programa',3,'p_programa','semantico_go.py',132),
+  ('package_decl -> PACKAGE ID','package_decl',2,'p_package_decl','semantico_go.py',136),
+  ('imports -> import_decl imports','imports',2,'p_imports','semantico_go.py',140),
+  ('imports -> import_decl','imports',1,'p_imports','semantico_go.py',141),
+  ('imports -> empty','imports',1,'p_imports','semantico_go.py',142),
+  ('import_decl -> IMPORT STRING_LITERAL','import_decl',2,'p_import_decl','semantico_go.py',146),
+  ('import_decl -> IMPORT LPAREN lista_imports RPAREN','import_decl',4,'p_import_decl','semantico_go.py',147),
+  ('import_decl -> empty','import_decl',1,'p_import_decl','semantico_go.py',148),
+  ('lista_imports -> lista_imports STRING_LITERAL','lista_imports',2,'p_lista_imports','semantico_go.py',152),
+  ('lista_imports -> STRING_LITERAL','lista_imports',1,'p_lista_imports','semantico_go.py',153),
+  ('declaraciones -> declaraciones declaracion','declaraciones',2,'p_declaraciones','semantico_go.py',157),
+  ('declaraciones -> declaracion','declaraciones',1,'p_declaraciones','semantico_go.py',158),
+  ('declaracion -> funcion','declaracion',1,'p_declaracion','semantico_go.py',162),
+  ('declaracion -> declaracion_var_global','declaracion',1,'p_declaracion','semantico_go.py',163),
+  ('declaracion -> bloque_var','declaracion',1,'p_declaracion','semantico_go.py',164),
+  ('declaracion -> declaracion_const','declaracion',1,'p_declaracion','semantico_go.py',165),
+  ('declaracion -> empty','declaracion',1,'p_declaracion','semantico_go.py',166),
+  ('declaracion_var_global -> VAR ID tipo','declaracion_var_global',3,'p_declaracion_var_global','semantico_go.py',170),
+  ('declaracion_var_global -> VAR ID tipo ASSIGN expresion','declaracion_var_global',5,'p_declaracion_var_global','semantico_go.py',171),
+  ('declaracion_var_global -> VAR ID ASSIGN expresion','declaracion_var_global',4,'p_declaracion_var_global','semantico_go.py',172),
+  ('bloque_var -> VAR LPAREN lista_decl_bloque RPAREN','bloque_var',4,'p_bloque_var','semantico_go.py',189),
+  ('lista_decl_bloque -> lista_decl_bloque decl_var_bloque','lista_decl_bloque',2,'p_lista_decl_bloque','semantico_go.py',193),
+  ('lista_decl_bloque -> decl_var_bloque','lista_decl_bloque',1,'p_lista_decl_bloque','semantico_go.py',194),
+  ('decl_var_bloque -> ID tipo','decl_var_bloque',2,'p_decl_var_bloque','semantico_go.py',198),
+  ('decl_var_bloque -> ID tipo ASSIGN expresion','decl_var_bloque',4,'p_decl_var_bloque','semantico_go.py',199),
+  ('decl_var_bloque -> ID ASSIGN expresion','decl_var_bloque',3,'p_decl_var_bloque','semantico_go.py',200),
+  ('declaracion_var -> VAR ID tipo','declaracion_var',3,'p_declaracion_var','semantico_go.py',217),
+  ('declaracion_var -> VAR ID tipo ASSIGN expresion','declaracion_var',5,'p_declaracion_var','semantico_go.py',218),
+  ('declaracion_var -> VAR ID ASSIGN expresion','declaracion_var',4,'p_declaracion_var','semantico_go.py',219),
+  ('declaracion_var -> ID DECLARE_ASSIGN expresion','declaracion_var',3,'p_declaracion_var','semantico_go.py',220),
+  ('funcion -> funcion_header bloque','funcion',2,'p_funcion','semantico_go.py',240),
+  ('funcion_header -> FUNC ID LPAREN parametros RPAREN tipo_retorno','funcion_header',6,'p_funcion_header','semantico_go.py',246),
+  ('funcion_header -> FUNC ID LPAREN parametros RPAREN','funcion_header',5,'p_funcion_header','semantico_go.py',247),
+  ('bloque -> LBRACE sentencias RBRACE','bloque',3,'p_bloque','semantico_go.py',261),
+  ('bloque -> LBRACE RBRACE','bloque',2,'p_bloque','semantico_go.py',262),
+  ('asignacion -> ID ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',266),
+  ('asignacion -> ID PLUS_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',267),
+  ('asignacion -> ID MINUS_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',268),
+  ('asignacion -> ID TIMES_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',269),
+  ('asignacion -> ID DIVIDE_ASSIGN expresion','asignacion',3,'p_asignacion','semantico_go.py',270),
+  ('asignacion -> ID LBRACKET expresion RBRACKET ASSIGN expresion','asignacion',6,'p_asignacion','semantico_go.py',271),
+  ('asignacion -> TIMES ID ASSIGN expresion','asignacion',4,'p_asignacion','semantico_go.py',272),
+  ('declaracion_const -> CONST ID ASSIGN expresion','declaracion_const',4,'p_declaracion_const','semantico_go.py',308),
+  ('declaracion_const -> CONST ID tipo ASSIGN expresion','declaracion_const',5,'p_declaracion_const','semantico_go.py',309),
+  ('declaracion_var_multiple -> VAR lista_ids tipo','declaracion_var_multiple',3,'p_declaracion_var_multiple','semantico_go.py',321),
+  ('declaracion_var_multiple -> VAR lista_ids tipo ASSIGN lista_expresiones','declaracion_var_multiple',5,'p_declaracion_var_multiple','semantico_go.py',322),
+  ('declaracion_var_multiple -> lista_ids DECLARE_ASSIGN lista_expresiones','declaracion_var_multiple',3,'p_declaracion_var_multiple','semantico_go.py',323),
+  ('lista_ids -> lista_ids COMMA ID','lista_ids',3,'p_lista_ids','semantico_go.py',363),
+  ('lista_ids -> lista_ids COMMA UNDERSCORE','lista_ids',3,'p_lista_ids','semantico_go.py',364),
+  ('lista_ids -> ID','lista_ids',1,'p_lista_ids','semantico_go.py',365),
+  ('lista_ids -> UNDERSCORE','lista_ids',1,'p_lista_ids','semantico_go.py',366),
+  ('asignacion_multiple -> lista_ids ASSIGN lista_expresiones','asignacion_multiple',3,'p_asignacion_multiple','semantico_go.py',375),
+  ('parametros -> lista_parametros','parametros',1,'p_parametros','semantico_go.py',379),
+  ('parametros -> empty','parametros',1,'p_parametros','semantico_go.py',380),
+  ('lista_parametros -> lista_parametros COMMA parametro','lista_parametros',3,'p_lista_parametros','semantico_go.py',384),
+  ('lista_parametros -> parametro','lista_parametros',1,'p_lista_parametros','semantico_go.py',385),
+  ('parametro -> ID tipo','parametro',2,'p_parametro','semantico_go.py',394),
+  ('parametro -> ID COMMA ID tipo','parametro',4,'p_parametro','semantico_go.py',395),
+  ('parametro -> ID ELLIPSIS tipo','parametro',3,'p_parametro','semantico_go.py',396),
+  ('parametro -> TIMES ID','parametro',2,'p_parametro','semantico_go.py',397),
+  ('parametro -> UNDERSCORE tipo','parametro',2,'p_parametro','semantico_go.py',398),
+  ('tipo_retorno -> tipo','tipo_retorno',1,'p_tipo_retorno','semantico_go.py',434),
+  ('tipo_retorno -> LPAREN lista_tipos RPAREN','tipo_retorno',3,'p_tipo_retorno','semantico_go.py',435),
+  ('tipo_retorno -> LPAREN lista_retornos_nombrados RPAREN','tipo_retorno',3,'p_tipo_retorno','semantico_go.py',436),
+  ('return_statement -> RETURN','return_statement',1,'p_return_statement','semantico_go.py',440),
+  ('return_statement -> RETURN expresion','return_statement',2,'p_return_statement','semantico_go.py',441),
+  ('return_statement -> RETURN lista_expresiones','return_statement',2,'p_return_statement','semantico_go.py',442),
+  ('lista_retornos_nombrados -> lista_retornos_nombrados COMMA ID tipo','lista_retornos_nombrados',4,'p_lista_retornos_nombrados','semantico_go.py',450),
+  ('lista_retornos_nombrados -> ID tipo','lista_retornos_nombrados',2,'p_lista_retornos_nombrados','semantico_go.py',451),
+  ('lista_tipos -> lista_tipos COMMA tipo','lista_tipos',3,'p_lista_tipos','semantico_go.py',455),
+  ('lista_tipos -> tipo','lista_tipos',1,'p_lista_tipos','semantico_go.py',456),
+  ('tipo -> ID','tipo',1,'p_tipo','semantico_go.py',460),
+  ('tipo -> LBRACKET INT_LITERAL RBRACKET tipo','tipo',4,'p_tipo','semantico_go.py',461),
+  ('tipo -> LBRACKET RBRACKET tipo','tipo',3,'p_tipo','semantico_go.py',462),
+  ('tipo -> MAP LBRACKET tipo RBRACKET tipo','tipo',5,'p_tipo','semantico_go.py',463),
+  ('tipo -> TIMES tipo','tipo',2,'p_tipo','semantico_go.py',464),
+  ('sentencias -> sentencias sentencia','sentencias',2,'p_sentencias','semantico_go.py',468),
+  ('sentencias -> sentencia','sentencias',1,'p_sentencias','semantico_go.py',469),
+  ('if_statement -> IF condicion bloque','if_statement',3,'p_if_statement','semantico_go.py',473),
+  ('if_statement -> IF condicion bloque ELSE bloque','if_statement',5,'p_if_statement','semantico_go.py',474),
+  ('if_statement -> IF condicion bloque ELSE if_statement','if_statement',5,'p_if_statement','semantico_go.py',475),
+  ('condicion -> expresion','condicion',1,'p_condicion','semantico_go.py',482),
+  ('condicion -> declaracion_var_corta SEMICOLON expresion','condicion',3,'p_condicion','semantico_go.py',483),
+  ('declaracion_var_corta -> ID DECLARE_ASSIGN lista_expresiones','declaracion_var_corta',3,'p_declaracion_var_corta','semantico_go.py',487),
+  ('declaracion_var_corta -> lista_ids DECLARE_ASSIGN lista_expresiones','declaracion_var_corta',3,'p_declaracion_var_corta','semantico_go.py',488),
+  ('for_range_decl -> lista_ids DECLARE_ASSIGN RANGE expresion','for_range_decl',4,'p_for_range_decl','semantico_go.py',511),
+  ('for_statement -> FOR condicion bloque','for_statement',3,'p_for_statement','semantico_go.py',527),
+  ('for_statement -> FOR bloque','for_statement',2,'p_for_statement','semantico_go.py',528),
+  ('for_statement -> FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque','for_statement',7,'p_for_statement','semantico_go.py',529),
+  ('for_statement -> FOR for_range_decl bloque','for_statement',3,'p_for_statement','semantico_go.py',530),
+  ('for_statement -> FOR ID ASSIGN RANGE expresion bloque','for_statement',6,'p_for_statement','semantico_go.py',531),
+  ('for_statement -> FOR ID COMMA ID ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','semantico_go.py',532),
+  ('inicializacion -> declaracion_var','inicializacion',1,'p_inicializacion','semantico_go.py',538),
+  ('inicializacion -> asignacion','inicializacion',1,'p_inicializacion','semantico_go.py',539),
+  ('inicializacion -> empty','inicializacion',1,'p_inicializacion','semantico_go.py',540),
+  ('incremento -> asignacion','incremento',1,'p_incremento','semantico_go.py',544),
+  ('incremento -> ID INCREMENT','incremento',2,'p_incremento','semantico_go.py',545),
+  ('incremento -> ID DECREMENT','incremento',2,'p_incremento','semantico_go.py',546),
+  ('incremento -> empty','incremento',1,'p_incremento','semantico_go.py',547),
+  ('switch_statement -> SWITCH expresion LBRACE casos RBRACE','switch_statement',5,'p_switch_statement','semantico_go.py',551),
+  ('switch_statement -> SWITCH LBRACE casos RBRACE','switch_statement',4,'p_switch_statement','semantico_go.py',552),
+  ('switch_statement -> SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACE','switch_statement',7,'p_switch_statement','semantico_go.py',553),
+  ('casos -> casos caso','casos',2,'p_casos','semantico_go.py',574),
+  ('casos -> caso','casos',1,'p_casos','semantico_go.py',575),
+  ('caso -> CASE lista_expresiones COLON sentencias','caso',4,'p_caso','semantico_go.py',583),
+  ('caso -> DEFAULT COLON sentencias','caso',3,'p_caso','semantico_go.py',584),
+  ('sentencia -> declaracion_var','sentencia',1,'p_sentencia','semantico_go.py',592),
+  ('sentencia -> bloque_var','sentencia',1,'p_sentencia','semantico_go.py',593),
+  ('sentencia -> declaracion_const','sentencia',1,'p_sentencia','semantico_go.py',594),
+  ('sentencia -> asignacion','sentencia',1,'p_sentencia','semantico_go.py',595),
+  ('sentencia -> asignacion_multiple','sentencia',1,'p_sentencia','semantico_go.py',596),
+  ('sentencia -> declaracion_var_multiple','sentencia',1,'p_sentencia','semantico_go.py',597),
+  ('sentencia -> if_statement','sentencia',1,'p_sentencia','semantico_go.py',598),
+  ('sentencia -> for_statement','sentencia',1,'p_sentencia','semantico_go.py',599),
+  ('sentencia -> switch_statement','sentencia',1,'p_sentencia','semantico_go.py',600),
+  ('sentencia -> return_statement','sentencia',1,'p_sentencia','semantico_go.py',601),
+  ('sentencia -> expresion','sentencia',1,'p_sentencia','semantico_go.py',602),
+  ('sentencia -> ID INCREMENT','sentencia',2,'p_sentencia','semantico_go.py',603),
+  ('sentencia -> ID DECREMENT','sentencia',2,'p_sentencia','semantico_go.py',604),
+  ('sentencia -> empty','sentencia',1,'p_sentencia','semantico_go.py',605),
+  ('expresion -> expresion PLUS expresion','expresion',3,'p_expresion_binaria','semantico_go.py',609),
+  ('expresion -> expresion MINUS expresion','expresion',3,'p_expresion_binaria','semantico_go.py',610),
+  ('expresion -> expresion TIMES expresion','expresion',3,'p_expresion_binaria','semantico_go.py',611),
+  ('expresion -> expresion DIVIDE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',612),
+  ('expresion -> expresion MOD expresion','expresion',3,'p_expresion_binaria','semantico_go.py',613),
+  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_binaria','semantico_go.py',614),
+  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',615),
+  ('expresion -> expresion EQ expresion','expresion',3,'p_expresion_binaria','semantico_go.py',616),
+  ('expresion -> expresion NE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',617),
+  ('expresion -> expresion LT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',618),
+  ('expresion -> expresion LE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',619),
+  ('expresion -> expresion GT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',620),
+  ('expresion -> expresion GE expresion','expresion',3,'p_expresion_binaria','semantico_go.py',621),
+  ('expresion -> expresion BITAND expresion','expresion',3,'p_expresion_binaria','semantico_go.py',622),
+  ('expresion -> expresion BITOR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',623),
+  ('expresion -> expresion BITXOR expresion','expresion',3,'p_expresion_binaria','semantico_go.py',624),
+  ('expresion -> expresion LSHIFT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',625),
+  ('expresion -> expresion RSHIFT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',626),
+  ('expresion -> expresion AND_NOT expresion','expresion',3,'p_expresion_binaria','semantico_go.py',627),
+  ('expresion -> NOT expresion','expresion',2,'p_expresion_unaria','semantico_go.py',651),
+  ('expresion -> MINUS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',652),
+  ('expresion -> PLUS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',653),
+  ('expresion -> BITXOR expresion','expresion',2,'p_expresion_unaria','semantico_go.py',654),
+  ('expresion -> BITNOT expresion','expresion',2,'p_expresion_unaria','semantico_go.py',655),
+  ('expresion -> ADDRESS expresion','expresion',2,'p_expresion_unaria','semantico_go.py',656),
+  ('expresion -> BITAND expresion','expresion',2,'p_expresion_unaria','semantico_go.py',657),
+  ('expresion -> TIMES expresion','expresion',2,'p_expresion_unaria','semantico_go.py',658),
+  ('expresion -> LPAREN expresion RPAREN','expresion',3,'p_expresion_agrupada','semantico_go.py',662),
+  ('expresion -> ID','expresion',1,'p_expresion_primaria','semantico_go.py',666),
+  ('expresion -> INT_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',667),
+  ('expresion -> FLOAT_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',668),
+  ('expresion -> STRING_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',669),
+  ('expresion -> RUNE_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',670),
+  ('expresion -> BOOL_LITERAL','expresion',1,'p_expresion_primaria','semantico_go.py',671),
+  ('expresion -> NIL','expresion',1,'p_expresion_primaria','semantico_go.py',672),
+  ('expresion -> ID LPAREN lista_expresiones RPAREN','expresion',4,'p_expresion_llamada','semantico_go.py',694),
+  ('expresion -> ID LPAREN RPAREN','expresion',3,'p_expresion_llamada','semantico_go.py',695),
+  ('expresion -> ID DOT ID LPAREN lista_expresiones RPAREN','expresion',6,'p_expresion_llamada','semantico_go.py',696),
+  ('expresion -> ID DOT ID LPAREN RPAREN','expresion',5,'p_expresion_llamada','semantico_go.py',697),
+  ('expresion -> MAKE LPAREN tipo RPAREN','expresion',4,'p_expresion_make','semantico_go.py',727),
+  ('expresion -> MAKE LPAREN tipo COMMA expresion RPAREN','expresion',6,'p_expresion_make','semantico_go.py',728),
+  ('expresion -> MAKE LPAREN tipo COMMA expresion COMMA expresion RPAREN','expresion',8,'p_expresion_make','semantico_go.py',729),
+  ('expresion -> APPEND LPAREN expresion COMMA lista_expresiones RPAREN','expresion',6,'p_expresion_append','semantico_go.py',733),
+  ('expresion -> APPEND LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_append','semantico_go.py',734),
+  ('expresion -> LEN LPAREN expresion RPAREN','expresion',4,'p_expresion_len','semantico_go.py',738),
+  ('expresion -> DELETE LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_delete','semantico_go.py',742),
+  ('expresion -> ID DOT ID LPAREN STRING_LITERAL RPAREN','expresion',6,'p_expresion_new','semantico_go.py',746),
+  ('expresion -> ID LBRACKET expresion RBRACKET','expresion',4,'p_expresion_array_acceso','semantico_go.py',750),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',7,'p_array_literal','semantico_go.py',754),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE','expresion',6,'p_array_literal','semantico_go.py',755),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACE','expresion',10,'p_array_literal','semantico_go.py',756),
+  ('lista_filas_matriz -> lista_filas_matriz COMMA fila_matriz','lista_filas_matriz',3,'p_lista_filas_matriz','semantico_go.py',760),
+  ('lista_filas_matriz -> fila_matriz','lista_filas_matriz',1,'p_lista_filas_matriz','semantico_go.py',761),
+  ('fila_matriz -> LBRACE lista_expresiones RBRACE','fila_matriz',3,'p_fila_matriz','semantico_go.py',765),
+  ('expresion -> LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',6,'p_slice_literal','semantico_go.py',769),
+  ('expresion -> LBRACKET RBRACKET tipo LBRACE RBRACE','expresion',5,'p_slice_literal','semantico_go.py',770),
+  ('expresion -> ID LBRACKET expresion COLON expresion RBRACKET','expresion',6,'p_slice_operacion','semantico_go.py',774),
+  ('expresion -> ID LBRACKET COLON expresion RBRACKET','expresion',5,'p_slice_operacion','semantico_go.py',775),
+  ('expresion -> ID LBRACKET expresion COLON RBRACKET','expresion',5,'p_slice_operacion','semantico_go.py',776),
+  ('expresion -> ID LBRACKET COLON RBRACKET','expresion',4,'p_slice_operacion','semantico_go.py',777),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE','expresion',8,'p_map_literal','semantico_go.py',781),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE','expresion',9,'p_map_literal','semantico_go.py',782),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACE','expresion',7,'p_map_literal','semantico_go.py',783),
+  ('pares_mapa -> pares_mapa COMMA par_mapa','pares_mapa',3,'p_pares_mapa','semantico_go.py',787),
+  ('pares_mapa -> par_mapa','pares_mapa',1,'p_pares_mapa','semantico_go.py',788),
+  ('par_mapa -> expresion COLON expresion','par_mapa',3,'p_par_mapa','semantico_go.py',792),
+  ('lista_expresiones -> lista_expresiones COMMA expresion','lista_expresiones',3,'p_lista_expresiones','semantico_go.py',796),
+  ('lista_expresiones -> expresion','lista_expresiones',1,'p_lista_expresiones','semantico_go.py',797),
+  ('empty -> <empty>','empty',0,'p_empty','semantico_go.py',808),
 ]
@@ -0,0 +1,230 @@
+
+# parsetab_sintactico.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDleftEQNEleftLTLEGTGEleftPLUSMINUSleftTIMESDIVIDEMODrightNOTrightUMINUSrightADDRESSPOINTERADDRESS AND AND_ASSIGN AND_NOT APPEND ASSIGN BITAND BITNOT BITOR BITXOR BOOL_LITERAL BREAK CASE CHAN CHANNEL_OP COLON COMMA CONST CONTINUE DECLARE_ASSIGN DECREMENT DEFAULT DEFER DELETE DIVIDE DIVIDE_ASSIGN DOT ELLIPSIS ELSE EQ FALLTHROUGH FLOAT_LITERAL FOR FUNC GE GO GOTO GT ID IF IMPORT INCREMENT INTERFACE INT_LITERAL LBRACE LBRACKET LE LEN LPAREN LSHIFT LSHIFT_ASSIGN LT MAKE MAP MINUS MINUS_ASSIGN MOD MOD_ASSIGN NE NIL NOT OCTAL_LITERAL OR OR_ASSIGN PACKAGE PLUS PLUS_ASSIGN POINTER RANGE RBRACE RBRACKET RETURN RPAREN RSHIFT RSHIFT_ASSIGN RUNE_LITERAL SELECT SEMICOLON STRING_LITERAL STRUCT SWITCH TIMES TIMES_ASSIGN TYPE UNDERSCORE VAR XOR_ASSIGNprograma : package_decl imports declaracionespackage_decl : PACKAGE IDimports : import_decl imports\n               | import_decl\n               | emptyimport_decl : IMPORT STRING_LITERAL\n                   | IMPORT LPAREN lista_imports RPAREN\n                   | emptylista_imports : lista_imports STRING_LITERAL\n                     | STRING_LITERALdeclaraciones : declaraciones declaracion\n                     | declaraciondeclaracion : funcion\n                   | declaracion_var_global\n                   | bloque_var\n                   | bloque_const\n                   | declaracion_const\n                   | emptydeclaracion_var_global : VAR ID tipo\n                              | VAR ID tipo ASSIGN expresion\n                              | VAR ID ASSIGN expresionbloque_var : VAR LPAREN lista_decl_bloque RPARENlista_decl_bloque : lista_decl_bloque decl_var_bloque\n                         | decl_var_bloquedecl_var_bloque : ID tipo\n                       | ID tipo ASSIGN expresion\n                       | ID ASSIGN expresiondeclaracion_var : VAR ID tipo\n                       | VAR ID tipo ASSIGN expresion\n                       | VAR ID ASSIGN expresion\n                       | ID DECLARE_ASSIGN expresiondeclaracion_var_multiple : VAR lista_ids tipo\n                                | VAR lista_ids tipo ASSIGN lista_expresiones\n                                | lista_ids DECLARE_ASSIGN lista_expresioneslista_ids : lista_ids COMMA ID\n                 | lista_ids COMMA UNDERSCORE\n                 | ID\n                 | UNDERSCOREasignacion : ID ASSIGN expresion\n                  | ID PLUS_ASSIGN expresion\n                  | ID MINUS_ASSIGN expresion\n                  | ID TIMES_ASSIGN expresion\n                  | ID DIVIDE_ASSIGN expresion\n                  | ID LBRACKET expresion RBRACKET ASSIGN expresion\n                  | TIMES ID ASSIGN expresionasignacion_multiple : lista_ids ASSIGN lista_expresionesdeclaracion_const : CONST ID ASSIGN expresion\n                         | CONST ID tipo ASSIGN expresionbloque_const : CONST LPAREN lista_decl_const RPARENlista_decl_const : lista_decl_const decl_const_bloque\n                        | decl_const_bloquedecl_const_bloque : ID ASSIGN expresion\n                         | ID tipo ASSIGN expresionfuncion : FUNC ID LPAREN parametros RPAREN tipo_retorno bloque\n               | FUNC ID LPAREN parametros RPAREN bloqueparametros : lista_parametros\n                  | emptylista_parametros : lista_parametros COMMA parametro\n                        | parametroparametro : ID tipo\n                 | ID COMMA ID tipo\n                 | ID ELLIPSIS tipo\n                 | TIMES ID\n                 | UNDERSCORE tipotipo_retorno : tipo\n                    | LPAREN lista_tipos RPAREN\n                    | LPAREN lista_retornos_nombrados RPARENlista_retornos_nombrados : lista_retornos_nombrados COMMA ID tipo\n                                 | ID tipolista_tipos : lista_tipos COMMA tipo\n                   | tipotipo : ID\n            | LBRACKET INT_LITERAL RBRACKET tipo\n            | LBRACKET RBRACKET tipo\n            | MAP LBRACKET tipo RBRACKET tipo\n            | TIMES tipobloque : LBRACE sentencias RBRACE\n              | LBRACE RBRACEsentencias : sentencias sentencia\n                  | sentenciasentencia : declaracion_var\n                 | bloque_var\n                 | bloque_const\n                 | declaracion_const\n                 | asignacion\n                 | asignacion_multiple\n                 | declaracion_var_multiple\n                 | if_statement\n                 | for_statement\n                 | switch_statement\n                 | return_statement\n                 | expresion\n                 | impresion\n                 | ID INCREMENT\n                 | ID DECREMENT\n                 | emptyif_statement : IF condicion bloque\n                    | IF condicion bloque ELSE bloque\n                    | IF condicion bloque ELSE if_statementcondicion : expresion\n                 | declaracion_var_corta SEMICOLON expresiondeclaracion_var_corta : ID DECLARE_ASSIGN expresion\n                             | lista_ids DECLARE_ASSIGN expresionfor_statement : FOR condicion bloque\n                     | FOR bloque\n                     | FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque\n                     | FOR ID COMMA ID DECLARE_ASSIGN RANGE expresion bloque\n                     | FOR ID DECLARE_ASSIGN RANGE expresion bloque\n                     | FOR ID COMMA ID ASSIGN RANGE expresion bloque\n                     | FOR UNDERSCORE COMMA ID DECLARE_ASSIGN RANGE expresion bloque\n                     | FOR ID COMMA UNDERSCORE DECLARE_ASSIGN RANGE expresion bloque\n                     | FOR UNDERSCORE COMMA UNDERSCORE DECLARE_ASSIGN RANGE expresion bloqueinicializacion : declaracion_var\n                      | asignacion\n                      | emptyincremento : asignacion\n                  | ID INCREMENT\n                  | ID DECREMENT\n                  | emptyswitch_statement : SWITCH expresion LBRACE casos RBRACE\n                        | SWITCH LBRACE casos RBRACE\n                        | SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACEcasos : casos caso\n             | casocaso : CASE lista_expresiones COLON sentencias\n            | DEFAULT COLON sentenciasreturn_statement : RETURN\n                        | RETURN expresion\n                        | RETURN lista_expresionesimpresion : ID DOT ID LPAREN lista_expresiones RPAREN\n                 | ID DOT ID LPAREN RPARENexpresion : expresion PLUS expresion\n                 | expresion MINUS expresion\n                 | expresion TIMES expresion\n                 | expresion DIVIDE expresion\n                 | expresion MOD expresion\n                 | expresion AND expresion\n                 | expresion OR expresion\n                 | expresion EQ expresion\n                 | expresion NE expresion\n                 | expresion LT expresion\n                 | expresion LE expresion\n                 | expresion GT expresion\n                 | expresion GE expresion\n                 | expresion BITAND expresion\n                 | expresion BITOR expresion\n                 | expresion BITXOR expresion\n                 | expresion LSHIFT expresion\n                 | expresion RSHIFT expresion\n                 | expresion AND_NOT expresionexpresion : NOT expresion\n                 | MINUS expresion %prec UMINUS\n                 | PLUS expresion %prec UMINUS\n                 | BITXOR expresion\n                 | BITNOT expresion\n                 | ADDRESS expresion %prec ADDRESS\n                 | BITAND expresion %prec ADDRESS\n                 | TIMES expresion %prec POINTERexpresion : LPAREN expresion RPARENexpresion : ID\n                 | INT_LITERAL\n                 | FLOAT_LITERAL\n                 | STRING_LITERAL\n                 | RUNE_LITERAL\n                 | BOOL_LITERAL\n                 | NILexpresion : ID LPAREN lista_expresiones RPAREN\n                 | ID LPAREN RPAREN\n                 | ID DOT ID LPAREN lista_expresiones RPAREN\n                 | ID DOT ID LPAREN RPARENexpresion : MAKE LPAREN tipo RPAREN\n                 | MAKE LPAREN tipo COMMA expresion RPAREN\n                 | MAKE LPAREN tipo COMMA expresion COMMA expresion RPARENexpresion : APPEND LPAREN expresion COMMA lista_expresiones RPAREN\n                 | APPEND LPAREN expresion COMMA expresion RPARENexpresion : LEN LPAREN expresion RPARENexpresion : DELETE LPAREN expresion COMMA expresion RPARENexpresion : ID DOT ID LPAREN STRING_LITERAL RPARENexpresion : ID LBRACKET expresion RBRACKETexpresion : LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE\n                 | LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE\n                 | LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACElista_filas_matriz : lista_filas_matriz COMMA fila_matriz\n                          | fila_matrizfila_matriz : LBRACE lista_expresiones RBRACEexpresion : LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE\n                 | LBRACKET RBRACKET tipo LBRACE RBRACEexpresion : ID LBRACKET expresion COLON expresion RBRACKET\n                 | ID LBRACKET COLON expresion RBRACKET\n                 | ID LBRACKET expresion COLON RBRACKET\n                 | ID LBRACKET COLON RBRACKETexpresion : MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE\n                 | MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE\n                 | MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACEpares_mapa : pares_mapa COMMA par_mapa\n                  | par_mapapar_mapa : expresion COLON expresionlista_expresiones : lista_expresiones COMMA expresion\n                         | expresionempty :'
+    
+_lr_action_items = {'PACKAGE':([0,],[3,]),'$end':([1,2,4,5,6,8,9,10,11,12,13,14,15,16,20,21,23,32,33,46,56,57,67,68,69,70,71,72,82,83,87,91,100,123,124,125,126,127,128,129,130,140,146,151,156,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,197,199,224,227,230,231,234,240,246,286,289,290,298,335,336,337,339,340,341,342,345,346,375,377,399,401,422,437,],[0,-200,-200,-4,-5,-2,-1,-12,-13,-14,-15,-16,-17,-18,-3,-6,-11,-72,-19,-7,-160,-21,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-20,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-55,-168,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-54,-78,-167,-179,-191,-171,-176,-75,-77,-170,-190,-189,-187,-169,-178,-188,-172,-175,-174,-177,-181,-186,-180,-194,-173,-192,-193,-182,]),'IMPORT':([2,5,6,8,21,46,],[7,7,-8,-2,-6,-7,]),'FUNC':([2,4,5,6,8,9,10,11,12,13,14,15,16,20,21,23,32,33,46,56,57,67,68,69,70,71,72,82,83,87,91,100,123,124,125,126,127,128,129,130,140,146,151,156,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,197,199,224,227,230,231,234,240,246,286,289,290,298,335,336,337,339,340,341,342,345,346,375,377,399,401,422,437,],[-200,17,-4,-5,-2,17,-12,-13,-14,-15,-16,-17,-18,-3,-6,-11,-72,-19,-7,-160,-21,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-20,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-55,-168,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-54,-78,-167,-179,-191,-171,-176,-75,-77,-170,-190,-189,-187,-169,-178,-188,-172,-175,-174,-177,-181,-186,-180,-194,-173,-192,-193,-182,]),'VAR':([2,4,5,6,8,9,10,11,12,13,14,15,16,20,21,23,32,33,46,56,57,67,68,69,70,71,72,82,83,87,91,100,123,124,125,126,127,128,129,130,140,146,151,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,220,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-200,18,-4,-5,-2,18,-12,-13,-14,-15,-16,-17,-18,-3,-6,-11,-72,-19,-7,-160,-21,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-20,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-55,216,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-54,216,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,278,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,216,-180,-194,-131,-29,-33,-98,-99,-120,216,216,-173,-192,-44,-130,-108,216,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'CONST':([2,4,5,6,8,9,10,11,12,13,14,15,16,20,21,23,32,33,46,56,57,67,68,69,70,71,72,82,83,87,91,100,123,124,125,126,127,128,129,130,140,146,151,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-200,19,-4,-5,-2,19,-12,-13,-14,-15,-16,-17,-18,-3,-6,-11,-72,-19,-7,-160,-21,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-20,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-55,19,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-54,19,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,19,-180,-194,-131,-29,-33,-98,-99,-120,19,19,-173,-192,-44,-130,-108,19,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'ID':([3,17,18,19,25,26,27,28,31,32,34,37,38,39,40,41,42,43,44,48,53,54,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,82,83,84,85,86,87,88,89,91,92,94,95,96,97,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,135,137,138,139,140,142,143,144,145,146,147,149,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,185,188,189,190,191,196,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,219,220,221,222,223,224,225,226,227,228,230,231,232,233,234,235,238,239,240,242,244,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,270,277,278,282,283,284,286,289,290,296,298,301,302,303,304,305,306,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,332,334,335,336,337,338,339,340,341,342,343,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,387,395,396,397,399,401,402,403,404,405,410,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[8,24,25,28,32,40,43,32,48,-72,56,32,40,-24,32,43,-51,32,56,32,98,32,56,-160,56,56,56,56,56,56,56,56,56,-161,-162,-163,-164,-165,-166,32,32,-76,-22,-23,-25,56,-49,-50,56,-47,56,147,32,32,48,56,158,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-153,-152,-158,-157,-154,-151,-155,-156,32,56,56,56,32,32,32,-74,56,-27,-52,56,-48,32,196,214,-168,-199,56,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,32,-73,32,-26,-53,32,214,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,258,260,267,272,-38,267,56,-167,56,56,-179,56,-191,-171,56,56,-176,56,56,32,-75,32,301,-77,-79,-94,-95,56,56,56,56,56,56,56,309,32,32,-160,56,56,316,-105,260,328,-128,-129,-198,-170,-190,-189,56,-187,32,-31,-39,-40,-41,-42,-43,-28,56,-32,56,-46,-34,-35,-36,-97,56,56,56,-104,267,360,56,56,366,32,56,56,-169,-178,-188,56,-172,-175,-174,-177,32,-181,-186,56,-179,56,56,-30,56,-45,56,-121,214,-180,-194,56,-131,-29,-33,-98,-99,408,-120,214,214,-173,-192,56,56,-44,-130,429,56,56,56,-108,56,56,214,56,-193,-106,56,-122,-182,-107,-109,-111,-112,-110,]),'STRING_LITERAL':([7,22,29,30,32,34,44,47,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[21,30,47,-10,-72,69,69,-9,69,-160,69,69,69,69,69,69,69,69,69,-161,-162,-163,-164,-165,-166,-76,-22,69,-49,69,-47,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-153,-152,-158,-157,-154,-151,-155,-156,69,69,69,-74,69,69,-48,69,-168,-199,69,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,69,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,69,69,69,69,69,-167,69,287,-179,69,-191,-171,69,69,-176,69,69,-75,-77,-79,-94,-95,69,69,69,69,69,69,69,-160,69,69,-105,69,-128,-129,-198,-170,-190,-189,69,-187,-31,-39,-40,-41,-42,-43,-28,69,-32,69,-46,-34,-97,69,69,69,-104,69,69,69,69,69,-169,-178,-188,69,-172,-175,-174,-177,-181,-186,69,-179,287,69,-30,69,-45,69,-121,69,-180,-194,69,-131,-29,-33,-98,-99,-120,69,69,-173,-192,69,69,-44,-130,69,69,69,-108,69,69,69,69,-193,-106,69,-122,-182,-107,-109,-111,-112,-110,]),'LPAREN':([7,18,19,24,32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,82,83,86,87,89,91,92,96,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,158,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,267,270,272,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,309,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[22,26,27,31,-72,66,66,66,101,66,66,66,66,66,66,66,66,66,-161,-162,-163,-164,-165,-166,132,133,134,135,-76,-22,66,-49,66,-47,66,149,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-153,-152,-158,-157,-154,-151,-155,-156,66,66,66,-74,66,66,-48,66,-168,-199,226,66,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,66,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,101,-96,26,66,66,66,66,66,-167,66,66,-179,66,-191,-171,66,66,-176,66,66,-75,-77,-79,-94,-95,66,66,66,66,66,66,66,101,66,66,101,-105,101,66,-128,-129,-198,-170,-190,-189,66,-187,-31,-39,-40,-41,-42,-43,350,-28,66,-32,66,-46,-34,-97,66,66,66,-104,66,66,66,66,66,-169,-178,-188,66,-172,-175,-174,-177,-181,-186,66,-179,66,66,-30,66,-45,66,-121,66,-180,-194,66,-131,-29,-33,-98,-99,-120,66,66,-173,-192,66,66,-44,-130,66,66,66,-108,66,66,66,66,-193,-106,66,-122,-182,-107,-109,-111,-112,-110,]),'ASSIGN':([25,28,32,33,40,43,45,82,85,90,140,188,214,218,221,240,258,260,272,310,312,316,317,328,349,360,392,408,429,447,],[34,44,-72,55,86,89,92,-76,142,145,-74,-73,251,261,-38,-75,311,313,251,351,353,-35,-36,311,380,389,380,251,313,380,]),'LBRACKET':([25,28,32,34,36,37,40,43,44,48,54,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,78,80,81,82,83,86,87,89,91,92,95,96,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,135,137,138,139,140,142,145,146,147,149,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,185,188,189,196,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,221,222,223,224,225,226,227,228,230,231,232,233,234,235,238,239,240,242,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,267,270,272,277,282,283,284,286,289,290,296,298,301,302,303,304,305,306,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,325,326,328,332,334,335,336,337,338,339,340,341,342,343,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,408,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[35,35,-72,77,81,35,35,35,77,35,35,77,103,77,77,77,77,77,77,77,77,77,-161,-162,-163,-164,-165,-166,138,35,35,-76,-22,77,-49,77,-47,77,35,35,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-153,-152,-158,-157,-154,-151,-155,-156,35,77,77,77,35,35,35,-74,77,77,-48,35,35,77,-168,-199,77,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,236,-73,35,35,77,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,256,-96,77,77,77,-38,77,77,-167,77,77,-179,77,-191,-171,77,77,-176,77,77,35,-75,35,-77,-79,-94,-95,77,77,77,77,77,77,77,35,35,103,77,77,103,-105,326,77,-128,-129,-198,-170,-190,-189,77,-187,35,-31,-39,-40,-41,-42,-43,-28,77,-32,77,-46,-34,-35,-36,-97,77,77,77,-104,77,77,77,35,77,77,-169,-178,-188,77,-172,-175,-174,-177,35,-181,-186,77,-179,77,77,-30,77,-45,77,-121,77,-180,-194,77,-131,-29,-33,-98,-99,-120,77,77,-173,-192,77,77,-44,-130,428,77,77,77,-108,77,77,77,77,-193,-106,77,-122,-182,-107,-109,-111,-112,-110,]),'MAP':([25,28,32,34,37,40,43,44,48,54,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,82,83,86,87,89,91,92,95,96,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,135,137,138,139,140,142,145,146,147,149,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,185,188,189,196,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,221,222,223,224,225,226,227,228,230,231,232,233,234,235,238,239,240,242,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,270,277,282,283,284,286,289,290,296,298,301,302,303,304,305,306,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,325,326,328,332,334,335,336,337,338,339,340,341,342,343,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[36,36,-72,78,36,36,36,78,36,36,78,-160,78,78,78,78,78,78,78,78,78,-161,-162,-163,-164,-165,-166,36,36,-76,-22,78,-49,78,-47,78,36,36,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-153,-152,-158,-157,-154,-151,-155,-156,36,78,78,78,36,36,36,-74,78,78,-48,36,36,78,-168,-199,78,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,36,-73,36,36,78,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,78,78,78,-38,78,78,-167,78,78,-179,78,-191,-171,78,78,-176,78,78,36,-75,36,-77,-79,-94,-95,78,78,78,78,78,78,78,36,36,-160,78,78,-105,78,-128,-129,-198,-170,-190,-189,78,-187,36,-31,-39,-40,-41,-42,-43,-28,78,-32,78,-46,-34,-35,-36,-97,78,78,78,-104,78,78,78,36,78,78,-169,-178,-188,78,-172,-175,-174,-177,36,-181,-186,78,-179,78,78,-30,78,-45,78,-121,78,-180,-194,78,-131,-29,-33,-98,-99,-120,78,78,-173,-192,78,78,-44,-130,78,78,78,-108,78,78,78,78,-193,-106,78,-122,-182,-107,-109,-111,-112,-110,]),'TIMES':([25,28,31,32,34,37,40,43,44,48,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,82,83,86,87,89,91,92,95,96,97,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,138,139,140,142,143,144,145,146,147,149,153,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,185,188,189,190,191,196,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,242,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,267,270,272,277,279,282,283,284,286,287,288,289,290,291,292,294,296,298,301,302,303,304,305,306,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,325,326,328,332,334,335,336,337,338,339,340,341,342,343,345,346,347,349,350,351,352,353,354,356,357,358,362,363,364,368,371,372,373,375,377,379,380,382,383,384,385,386,387,391,392,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,424,425,428,430,431,432,433,434,435,437,439,440,441,442,443,444,],[37,37,53,-72,60,37,37,37,60,37,37,60,-160,106,60,60,60,60,60,60,60,60,60,-161,-162,-163,-164,-165,-166,37,37,-76,-22,60,-49,60,106,60,37,37,53,106,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-153,-152,-158,-157,106,-151,106,-156,106,37,60,60,60,37,37,37,-74,60,106,106,60,106,37,37,217,-168,106,106,60,106,106,-134,-135,-136,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-159,106,106,106,37,-73,37,106,106,37,217,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,106,-93,-160,-96,60,60,277,-38,60,60,-167,60,60,-179,60,106,-191,-171,60,60,-176,60,60,37,-75,37,-77,-79,-94,-95,60,60,60,60,60,60,60,37,37,-160,60,60,106,-160,-105,-160,60,106,106,-129,106,-170,-163,106,-190,-189,106,106,106,60,-187,37,106,106,106,106,106,106,106,-28,60,-32,60,-46,-34,-35,-36,-97,60,60,60,-104,60,60,60,37,60,60,-169,-178,-188,60,-172,-175,-174,-177,37,-181,-186,60,-179,60,60,106,60,106,106,106,106,60,106,106,-121,217,106,106,-180,-194,106,60,-131,106,-33,-98,-99,410,106,-179,-120,217,217,-173,-192,60,60,106,-130,60,60,60,-108,60,60,217,60,-193,106,-106,60,106,106,106,106,106,-122,-182,106,-107,-109,-111,-112,-110,]),'RPAREN':([29,30,31,32,38,39,41,42,47,49,50,51,52,56,67,68,69,70,71,72,82,84,85,88,93,98,99,101,123,124,125,126,127,128,129,130,131,140,143,144,148,154,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,183,188,190,191,192,193,194,195,196,224,226,227,230,231,234,240,245,284,285,286,287,289,290,291,292,293,294,298,300,335,336,337,339,340,341,342,345,346,348,350,373,375,377,381,399,401,422,437,],[46,-10,-200,-72,83,-24,87,-51,-9,96,-56,-57,-59,-160,-161,-162,-163,-164,-165,-166,-76,-23,-25,-50,-60,-63,-64,156,-153,-152,-158,-157,-154,-151,-155,-156,180,-74,-27,-52,-62,-58,224,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,231,234,-73,-26,-53,-61,241,243,-71,-72,-167,286,-179,-191,-171,-176,-75,-69,-198,335,-170,336,-190,-189,339,340,341,342,-187,-70,-169,-178,-188,-172,-175,-174,-177,-181,-186,-68,382,399,-180,-194,405,-173,-192,-193,-182,]),'UNDERSCORE':([31,32,56,67,68,69,70,71,72,82,83,87,91,97,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,219,220,222,223,224,227,230,231,234,240,246,247,248,249,260,263,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,323,324,327,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[54,-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,54,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,221,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,221,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,221,221,273,221,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,317,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,221,361,365,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,221,-180,-194,-131,-29,-33,-98,-99,-120,221,221,-173,-192,-44,-130,-108,221,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'COMMA':([32,48,50,52,56,67,68,69,70,71,72,82,93,98,99,123,124,125,126,127,128,129,130,140,148,154,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,188,192,193,194,195,196,214,218,221,224,227,230,231,234,240,245,258,259,267,268,272,273,282,283,284,285,286,287,289,290,291,292,293,297,298,300,314,315,316,317,335,336,337,339,340,341,342,344,345,346,348,370,375,376,377,378,381,384,399,401,420,421,422,423,424,436,437,445,446,],[-72,94,97,-59,-160,-161,-162,-163,-164,-165,-166,-76,-60,-63,-64,-153,-152,-158,-157,-154,-151,-155,-156,-74,-62,-58,225,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,232,233,235,-73,-61,242,244,-71,-72,-37,263,-38,-167,-179,-191,-171,-176,-75,-69,-37,263,-37,263,324,327,-199,225,-198,225,-170,-163,-190,-189,338,-199,225,225,-187,-70,225,225,-35,-36,-169,-178,-188,-172,-175,-174,-177,225,-181,-186,-68,225,-180,402,-194,-196,225,225,-173,-192,438,-184,-193,-195,-197,225,-182,-185,-183,]),'RBRACKET':([32,35,56,67,68,69,70,71,72,77,79,82,123,124,125,126,127,128,129,130,136,140,141,156,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,187,188,224,227,228,229,230,231,234,236,240,286,288,289,290,295,298,308,335,336,337,339,340,341,342,345,346,364,375,377,399,401,422,437,439,],[-72,80,-160,-161,-162,-163,-164,-165,-166,137,139,-76,-153,-152,-158,-157,-154,-151,-155,-156,185,-74,189,-168,227,230,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,239,-73,-167,-179,289,290,-191,-171,-176,80,-75,-170,337,-190,-189,343,-187,349,-169,-178,-188,-172,-175,-174,-177,-181,-186,392,-180,-194,-173,-192,-193,-182,447,]),'LBRACE':([32,56,67,68,69,70,71,72,82,96,123,124,125,126,127,128,129,130,140,150,152,156,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,186,188,220,222,224,227,230,231,234,237,240,241,243,260,264,265,267,269,272,279,286,289,290,298,299,303,304,305,306,307,335,336,337,339,340,341,342,345,346,354,355,356,372,374,375,377,387,391,392,399,400,401,404,406,407,409,422,426,427,430,431,432,433,434,437,438,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,153,-153,-152,-158,-157,-154,-151,-155,-156,-74,153,-65,-168,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,238,-73,153,280,-167,-179,-191,-171,-176,296,-75,-66,-67,-160,153,-100,-160,153,-160,329,-170,-190,-189,-187,347,-39,-40,-41,-42,-43,-169,-178,-188,-172,-175,-174,-177,-181,-186,-45,153,-101,398,400,-180,-194,-200,153,-179,-173,419,-192,-44,153,-116,-119,-193,-117,-118,153,153,153,153,153,-182,419,]),'RBRACE':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,238,240,246,247,248,249,260,270,282,283,284,286,289,290,296,297,298,302,303,304,305,306,307,310,312,314,315,318,322,330,331,335,336,337,339,340,341,342,344,345,346,347,349,352,354,367,368,369,371,375,376,377,378,382,383,384,385,386,395,396,397,399,401,402,404,405,414,417,418,420,421,422,423,424,425,435,436,437,440,441,442,443,444,445,446,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,199,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,246,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,298,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,345,346,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,368,-124,-169,-178,-188,-172,-175,-174,-177,375,-181,-186,377,-179,-30,-45,395,-121,-123,-200,-180,401,-194,-196,-131,-29,-33,-98,-99,-120,-200,-126,-173,-192,422,-44,-130,-108,-125,435,437,-184,-193,-195,-197,-106,-122,445,-182,-107,-109,-111,-112,-110,-185,-183,]),'IF':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,355,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,219,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,219,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,219,-121,219,-180,-194,-131,-29,-33,-98,-99,-120,219,219,-173,-192,-44,-130,-108,219,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'FOR':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,220,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,220,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,220,-180,-194,-131,-29,-33,-98,-99,-120,220,220,-173,-192,-44,-130,-108,220,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'SWITCH':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,222,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,222,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,222,-180,-194,-131,-29,-33,-98,-99,-120,222,222,-173,-192,-44,-130,-108,222,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'RETURN':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,153,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,335,336,337,339,340,341,342,345,346,349,352,354,368,371,375,377,382,383,384,385,386,395,396,397,399,401,404,405,414,417,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,223,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,223,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,-121,223,-180,-194,-131,-29,-33,-98,-99,-120,223,223,-173,-192,-44,-130,-108,223,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'NOT':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,63,63,63,-160,63,63,63,63,63,63,63,63,63,-161,-162,-163,-164,-165,-166,-76,-22,63,-49,63,-47,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-153,-152,-158,-157,-154,-151,-155,-156,63,63,63,-74,63,63,-48,63,-168,-199,63,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,63,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,63,63,63,63,63,-167,63,63,-179,63,-191,-171,63,63,-176,63,63,-75,-77,-79,-94,-95,63,63,63,63,63,63,63,-160,63,63,-105,63,-128,-129,-198,-170,-190,-189,63,-187,-31,-39,-40,-41,-42,-43,-28,63,-32,63,-46,-34,-97,63,63,63,-104,63,63,63,63,63,-169,-178,-188,63,-172,-175,-174,-177,-181,-186,63,-179,63,63,-30,63,-45,63,-121,63,-180,-194,63,-131,-29,-33,-98,-99,-120,63,63,-173,-192,63,63,-44,-130,63,63,63,-108,63,63,63,63,-193,-106,63,-122,-182,-107,-109,-111,-112,-110,]),'MINUS':([32,34,44,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,134,135,140,142,143,144,145,146,153,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,188,190,191,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,265,267,270,272,277,279,282,283,284,286,287,288,289,290,291,292,294,296,298,302,303,304,305,306,307,308,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,356,357,358,362,363,364,368,371,372,373,375,377,379,380,382,383,384,385,386,391,392,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,424,425,428,430,431,432,433,434,435,437,439,440,441,442,443,444,],[-72,59,59,59,-160,105,59,59,59,59,59,59,59,59,59,-161,-162,-163,-164,-165,-166,-76,-22,59,-49,59,105,59,105,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-153,-152,-158,-157,105,-151,105,-156,105,59,59,59,-74,59,105,105,59,105,59,-168,105,105,59,-132,-133,-134,-135,-136,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-159,105,105,105,-73,105,105,59,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,105,-93,-160,-96,59,59,59,59,59,-167,59,59,-179,59,105,-191,-171,59,59,-176,59,59,-75,-77,-79,-94,-95,59,59,59,59,59,59,59,-160,59,59,105,-160,-105,-160,59,105,105,-129,105,-170,-163,105,-190,-189,105,105,105,59,-187,105,105,105,105,105,105,105,-28,59,-32,59,-46,-34,-97,59,59,59,-104,59,59,59,59,59,-169,-178,-188,59,-172,-175,-174,-177,-181,-186,59,-179,59,59,105,59,105,105,105,105,59,105,105,-121,59,105,105,-180,-194,105,59,-131,105,-33,-98,-99,105,-179,-120,59,59,-173,-192,59,59,105,-130,59,59,59,-108,59,59,59,59,-193,105,-106,59,105,105,105,105,105,-122,-182,105,-107,-109,-111,-112,-110,]),'PLUS':([32,34,44,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,134,135,140,142,143,144,145,146,153,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,188,190,191,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,265,267,270,272,277,279,282,283,284,286,287,288,289,290,291,292,294,296,298,302,303,304,305,306,307,308,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,356,357,358,362,363,364,368,371,372,373,375,377,379,380,382,383,384,385,386,391,392,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,424,425,428,430,431,432,433,434,435,437,439,440,441,442,443,444,],[-72,58,58,58,-160,104,58,58,58,58,58,58,58,58,58,-161,-162,-163,-164,-165,-166,-76,-22,58,-49,58,104,58,104,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-153,-152,-158,-157,104,-151,104,-156,104,58,58,58,-74,58,104,104,58,104,58,-168,104,104,58,-132,-133,-134,-135,-136,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-159,104,104,104,-73,104,104,58,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,104,-93,-160,-96,58,58,58,58,58,-167,58,58,-179,58,104,-191,-171,58,58,-176,58,58,-75,-77,-79,-94,-95,58,58,58,58,58,58,58,-160,58,58,104,-160,-105,-160,58,104,104,-129,104,-170,-163,104,-190,-189,104,104,104,58,-187,104,104,104,104,104,104,104,-28,58,-32,58,-46,-34,-97,58,58,58,-104,58,58,58,58,58,-169,-178,-188,58,-172,-175,-174,-177,-181,-186,58,-179,58,58,104,58,104,104,104,104,58,104,104,-121,58,104,104,-180,-194,104,58,-131,104,-33,-98,-99,104,-179,-120,58,58,-173,-192,58,58,104,-130,58,58,58,-108,58,58,58,58,-193,104,-106,58,104,104,104,104,104,-122,-182,104,-107,-109,-111,-112,-110,]),'BITXOR':([32,34,44,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,134,135,140,142,143,144,145,146,153,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,188,190,191,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,265,267,270,272,277,279,282,283,284,286,287,288,289,290,291,292,294,296,298,302,303,304,305,306,307,308,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,356,357,358,362,363,364,368,371,372,373,375,377,379,380,382,383,384,385,386,391,392,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,424,425,428,430,431,432,433,434,435,437,439,440,441,442,443,444,],[-72,62,62,62,-160,119,62,62,62,62,62,62,62,62,62,-161,-162,-163,-164,-165,-166,-76,-22,62,-49,62,119,62,119,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-153,-152,-158,-157,119,-151,119,-156,119,62,62,62,-74,62,119,119,62,119,62,-168,119,119,62,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,119,119,119,119,119,119,-159,119,119,119,-73,119,119,62,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,119,-93,-160,-96,62,62,62,62,62,-167,62,62,-179,62,119,-191,-171,62,62,-176,62,62,-75,-77,-79,-94,-95,62,62,62,62,62,62,62,-160,62,62,119,-160,-105,-160,62,119,119,-129,119,-170,-163,119,-190,-189,119,119,119,62,-187,119,119,119,119,119,119,119,-28,62,-32,62,-46,-34,-97,62,62,62,-104,62,62,62,62,62,-169,-178,-188,62,-172,-175,-174,-177,-181,-186,62,-179,62,62,119,62,119,119,119,119,62,119,119,-121,62,119,119,-180,-194,119,62,-131,119,-33,-98,-99,119,-179,-120,62,62,-173,-192,62,62,119,-130,62,62,62,-108,62,62,62,62,-193,119,-106,62,119,119,119,119,119,-122,-182,119,-107,-109,-111,-112,-110,]),'BITNOT':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,64,64,64,-160,64,64,64,64,64,64,64,64,64,-161,-162,-163,-164,-165,-166,-76,-22,64,-49,64,-47,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-153,-152,-158,-157,-154,-151,-155,-156,64,64,64,-74,64,64,-48,64,-168,-199,64,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,64,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,64,64,64,64,64,-167,64,64,-179,64,-191,-171,64,64,-176,64,64,-75,-77,-79,-94,-95,64,64,64,64,64,64,64,-160,64,64,-105,64,-128,-129,-198,-170,-190,-189,64,-187,-31,-39,-40,-41,-42,-43,-28,64,-32,64,-46,-34,-97,64,64,64,-104,64,64,64,64,64,-169,-178,-188,64,-172,-175,-174,-177,-181,-186,64,-179,64,64,-30,64,-45,64,-121,64,-180,-194,64,-131,-29,-33,-98,-99,-120,64,64,-173,-192,64,64,-44,-130,64,64,64,-108,64,64,64,64,-193,-106,64,-122,-182,-107,-109,-111,-112,-110,]),'ADDRESS':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,65,65,65,-160,65,65,65,65,65,65,65,65,65,-161,-162,-163,-164,-165,-166,-76,-22,65,-49,65,-47,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-153,-152,-158,-157,-154,-151,-155,-156,65,65,65,-74,65,65,-48,65,-168,-199,65,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,65,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,65,65,65,65,65,-167,65,65,-179,65,-191,-171,65,65,-176,65,65,-75,-77,-79,-94,-95,65,65,65,65,65,65,65,-160,65,65,-105,65,-128,-129,-198,-170,-190,-189,65,-187,-31,-39,-40,-41,-42,-43,-28,65,-32,65,-46,-34,-97,65,65,65,-104,65,65,65,65,65,-169,-178,-188,65,-172,-175,-174,-177,-181,-186,65,-179,65,65,-30,65,-45,65,-121,65,-180,-194,65,-131,-29,-33,-98,-99,-120,65,65,-173,-192,65,65,-44,-130,65,65,65,-108,65,65,65,65,-193,-106,65,-122,-182,-107,-109,-111,-112,-110,]),'BITAND':([32,34,44,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,134,135,140,142,143,144,145,146,153,156,157,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,188,190,191,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,265,267,270,272,277,279,282,283,284,286,287,288,289,290,291,292,294,296,298,302,303,304,305,306,307,308,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,356,357,358,362,363,364,368,371,372,373,375,377,379,380,382,383,384,385,386,391,392,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,424,425,428,430,431,432,433,434,435,437,439,440,441,442,443,444,],[-72,61,61,61,-160,117,61,61,61,61,61,61,61,61,61,-161,-162,-163,-164,-165,-166,-76,-22,61,-49,61,117,61,117,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-153,-152,-158,-157,117,-151,117,-156,117,61,61,61,-74,61,117,117,61,117,61,-168,117,117,61,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,117,117,117,117,117,117,-159,117,117,117,-73,117,117,61,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,117,-93,-160,-96,61,61,61,61,61,-167,61,61,-179,61,117,-191,-171,61,61,-176,61,61,-75,-77,-79,-94,-95,61,61,61,61,61,61,61,-160,61,61,117,-160,-105,-160,61,117,117,-129,117,-170,-163,117,-190,-189,117,117,117,61,-187,117,117,117,117,117,117,117,-28,61,-32,61,-46,-34,-97,61,61,61,-104,61,61,61,61,61,-169,-178,-188,61,-172,-175,-174,-177,-181,-186,61,-179,61,61,117,61,117,117,117,117,61,117,117,-121,61,117,117,-180,-194,117,61,-131,117,-33,-98,-99,117,-179,-120,61,61,-173,-192,61,61,117,-130,61,61,61,-108,61,61,61,61,-193,117,-106,61,117,117,117,117,117,-122,-182,117,-107,-109,-111,-112,-110,]),'INT_LITERAL':([32,34,35,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,77,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,236,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,67,79,67,67,-160,67,67,67,67,67,67,67,67,67,-161,-162,-163,-164,-165,-166,136,-76,-22,67,-49,67,-47,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-153,-152,-158,-157,-154,-151,-155,-156,67,67,67,-74,67,67,-48,67,-168,-199,67,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,67,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,67,67,67,67,67,-167,67,67,-179,67,-191,-171,67,67,-176,67,295,67,-75,-77,-79,-94,-95,67,67,67,67,67,67,67,-160,67,67,-105,67,-128,-129,-198,-170,-190,-189,67,-187,-31,-39,-40,-41,-42,-43,-28,67,-32,67,-46,-34,-97,67,67,67,-104,67,67,67,67,67,-169,-178,-188,67,-172,-175,-174,-177,-181,-186,67,-179,67,67,-30,67,-45,67,-121,67,-180,-194,67,-131,-29,-33,-98,-99,-120,67,67,-173,-192,67,67,-44,-130,67,67,67,-108,67,67,67,67,-193,-106,67,-122,-182,-107,-109,-111,-112,-110,]),'FLOAT_LITERAL':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,68,68,68,-160,68,68,68,68,68,68,68,68,68,-161,-162,-163,-164,-165,-166,-76,-22,68,-49,68,-47,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-153,-152,-158,-157,-154,-151,-155,-156,68,68,68,-74,68,68,-48,68,-168,-199,68,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,68,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,68,68,68,68,68,-167,68,68,-179,68,-191,-171,68,68,-176,68,68,-75,-77,-79,-94,-95,68,68,68,68,68,68,68,-160,68,68,-105,68,-128,-129,-198,-170,-190,-189,68,-187,-31,-39,-40,-41,-42,-43,-28,68,-32,68,-46,-34,-97,68,68,68,-104,68,68,68,68,68,-169,-178,-188,68,-172,-175,-174,-177,-181,-186,68,-179,68,68,-30,68,-45,68,-121,68,-180,-194,68,-131,-29,-33,-98,-99,-120,68,68,-173,-192,68,68,-44,-130,68,68,68,-108,68,68,68,68,-193,-106,68,-122,-182,-107,-109,-111,-112,-110,]),'RUNE_LITERAL':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,70,70,70,-160,70,70,70,70,70,70,70,70,70,-161,-162,-163,-164,-165,-166,-76,-22,70,-49,70,-47,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-153,-152,-158,-157,-154,-151,-155,-156,70,70,70,-74,70,70,-48,70,-168,-199,70,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,70,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,70,70,70,70,70,-167,70,70,-179,70,-191,-171,70,70,-176,70,70,-75,-77,-79,-94,-95,70,70,70,70,70,70,70,-160,70,70,-105,70,-128,-129,-198,-170,-190,-189,70,-187,-31,-39,-40,-41,-42,-43,-28,70,-32,70,-46,-34,-97,70,70,70,-104,70,70,70,70,70,-169,-178,-188,70,-172,-175,-174,-177,-181,-186,70,-179,70,70,-30,70,-45,70,-121,70,-180,-194,70,-131,-29,-33,-98,-99,-120,70,70,-173,-192,70,70,-44,-130,70,70,70,-108,70,70,70,70,-193,-106,70,-122,-182,-107,-109,-111,-112,-110,]),'BOOL_LITERAL':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,71,71,71,-160,71,71,71,71,71,71,71,71,71,-161,-162,-163,-164,-165,-166,-76,-22,71,-49,71,-47,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-153,-152,-158,-157,-154,-151,-155,-156,71,71,71,-74,71,71,-48,71,-168,-199,71,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,71,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,71,71,71,71,71,-167,71,71,-179,71,-191,-171,71,71,-176,71,71,-75,-77,-79,-94,-95,71,71,71,71,71,71,71,-160,71,71,-105,71,-128,-129,-198,-170,-190,-189,71,-187,-31,-39,-40,-41,-42,-43,-28,71,-32,71,-46,-34,-97,71,71,71,-104,71,71,71,71,71,-169,-178,-188,71,-172,-175,-174,-177,-181,-186,71,-179,71,71,-30,71,-45,71,-121,71,-180,-194,71,-131,-29,-33,-98,-99,-120,71,71,-173,-192,71,71,-44,-130,71,71,71,-108,71,71,71,71,-193,-106,71,-122,-182,-107,-109,-111,-112,-110,]),'NIL':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,72,72,72,-160,72,72,72,72,72,72,72,72,72,-161,-162,-163,-164,-165,-166,-76,-22,72,-49,72,-47,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-153,-152,-158,-157,-154,-151,-155,-156,72,72,72,-74,72,72,-48,72,-168,-199,72,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,72,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,72,72,72,72,72,-167,72,72,-179,72,-191,-171,72,72,-176,72,72,-75,-77,-79,-94,-95,72,72,72,72,72,72,72,-160,72,72,-105,72,-128,-129,-198,-170,-190,-189,72,-187,-31,-39,-40,-41,-42,-43,-28,72,-32,72,-46,-34,-97,72,72,72,-104,72,72,72,72,72,-169,-178,-188,72,-172,-175,-174,-177,-181,-186,72,-179,72,72,-30,72,-45,72,-121,72,-180,-194,72,-131,-29,-33,-98,-99,-120,72,72,-173,-192,72,72,-44,-130,72,72,72,-108,72,72,72,72,-193,-106,72,-122,-182,-107,-109,-111,-112,-110,]),'MAKE':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,73,73,73,-160,73,73,73,73,73,73,73,73,73,-161,-162,-163,-164,-165,-166,-76,-22,73,-49,73,-47,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-153,-152,-158,-157,-154,-151,-155,-156,73,73,73,-74,73,73,-48,73,-168,-199,73,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,73,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,73,73,73,73,73,-167,73,73,-179,73,-191,-171,73,73,-176,73,73,-75,-77,-79,-94,-95,73,73,73,73,73,73,73,-160,73,73,-105,73,-128,-129,-198,-170,-190,-189,73,-187,-31,-39,-40,-41,-42,-43,-28,73,-32,73,-46,-34,-97,73,73,73,-104,73,73,73,73,73,-169,-178,-188,73,-172,-175,-174,-177,-181,-186,73,-179,73,73,-30,73,-45,73,-121,73,-180,-194,73,-131,-29,-33,-98,-99,-120,73,73,-173,-192,73,73,-44,-130,73,73,73,-108,73,73,73,73,-193,-106,73,-122,-182,-107,-109,-111,-112,-110,]),'APPEND':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,74,74,74,-160,74,74,74,74,74,74,74,74,74,-161,-162,-163,-164,-165,-166,-76,-22,74,-49,74,-47,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-153,-152,-158,-157,-154,-151,-155,-156,74,74,74,-74,74,74,-48,74,-168,-199,74,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,74,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,74,74,74,74,74,-167,74,74,-179,74,-191,-171,74,74,-176,74,74,-75,-77,-79,-94,-95,74,74,74,74,74,74,74,-160,74,74,-105,74,-128,-129,-198,-170,-190,-189,74,-187,-31,-39,-40,-41,-42,-43,-28,74,-32,74,-46,-34,-97,74,74,74,-104,74,74,74,74,74,-169,-178,-188,74,-172,-175,-174,-177,-181,-186,74,-179,74,74,-30,74,-45,74,-121,74,-180,-194,74,-131,-29,-33,-98,-99,-120,74,74,-173,-192,74,74,-44,-130,74,74,74,-108,74,74,74,74,-193,-106,74,-122,-182,-107,-109,-111,-112,-110,]),'LEN':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,75,75,75,-160,75,75,75,75,75,75,75,75,75,-161,-162,-163,-164,-165,-166,-76,-22,75,-49,75,-47,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-153,-152,-158,-157,-154,-151,-155,-156,75,75,75,-74,75,75,-48,75,-168,-199,75,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,75,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,75,75,75,75,75,-167,75,75,-179,75,-191,-171,75,75,-176,75,75,-75,-77,-79,-94,-95,75,75,75,75,75,75,75,-160,75,75,-105,75,-128,-129,-198,-170,-190,-189,75,-187,-31,-39,-40,-41,-42,-43,-28,75,-32,75,-46,-34,-97,75,75,75,-104,75,75,75,75,75,-169,-178,-188,75,-172,-175,-174,-177,-181,-186,75,-179,75,75,-30,75,-45,75,-121,75,-180,-194,75,-131,-29,-33,-98,-99,-120,75,75,-173,-192,75,75,-44,-130,75,75,75,-108,75,75,75,75,-193,-106,75,-122,-182,-107,-109,-111,-112,-110,]),'DELETE':([32,34,44,55,56,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,82,83,86,87,89,91,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,134,135,140,142,145,146,153,156,157,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,217,219,220,222,223,224,225,226,227,228,230,231,232,233,234,235,238,240,246,247,248,249,250,251,252,253,254,255,256,260,261,262,270,277,282,283,284,286,289,290,296,298,302,303,304,305,306,307,310,311,312,313,314,315,318,319,320,321,322,323,325,326,332,334,335,336,337,338,339,340,341,342,345,346,347,349,350,351,352,353,354,362,368,371,375,377,380,382,383,384,385,386,395,396,397,399,401,402,403,404,405,411,412,413,414,415,416,417,419,422,425,428,435,437,440,441,442,443,444,],[-72,76,76,76,-160,76,76,76,76,76,76,76,76,76,-161,-162,-163,-164,-165,-166,-76,-22,76,-49,76,-47,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-153,-152,-158,-157,-154,-151,-155,-156,76,76,76,-74,76,76,-48,76,-168,-199,76,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,76,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,76,76,76,76,76,-167,76,76,-179,76,-191,-171,76,76,-176,76,76,-75,-77,-79,-94,-95,76,76,76,76,76,76,76,-160,76,76,-105,76,-128,-129,-198,-170,-190,-189,76,-187,-31,-39,-40,-41,-42,-43,-28,76,-32,76,-46,-34,-97,76,76,76,-104,76,76,76,76,76,-169,-178,-188,76,-172,-175,-174,-177,-181,-186,76,-179,76,76,-30,76,-45,76,-121,76,-180,-194,76,-131,-29,-33,-98,-99,-120,76,76,-173,-192,76,76,-44,-130,76,76,76,-108,76,76,76,76,-193,-106,76,-122,-182,-107,-109,-111,-112,-110,]),'CASE':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,280,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,329,330,331,335,336,337,339,340,341,342,345,346,349,352,354,367,368,369,371,375,377,382,383,384,385,386,395,396,397,398,399,401,404,405,414,417,418,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,332,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,332,332,-124,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,332,-121,-123,-200,-180,-194,-131,-29,-33,-98,-99,-120,-200,-126,332,-173,-192,-44,-130,-108,-125,332,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'DEFAULT':([32,56,67,68,69,70,71,72,82,83,87,91,123,124,125,126,127,128,129,130,140,146,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,223,224,227,230,231,234,240,246,247,248,249,260,270,280,282,283,284,286,289,290,298,302,303,304,305,306,307,310,312,314,315,318,322,329,330,331,335,336,337,339,340,341,342,345,346,349,352,354,367,368,369,371,375,377,382,383,384,385,386,395,396,397,398,399,401,404,405,414,417,418,422,425,435,437,440,441,442,443,444,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-22,-49,-47,-153,-152,-158,-157,-154,-151,-155,-156,-74,-48,-168,-199,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-78,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-160,-96,-127,-167,-179,-191,-171,-176,-75,-77,-79,-94,-95,-160,-105,333,-128,-129,-198,-170,-190,-189,-187,-31,-39,-40,-41,-42,-43,-28,-32,-46,-34,-97,-104,333,333,-124,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,-30,-45,333,-121,-123,-200,-180,-194,-131,-29,-33,-98,-99,-120,-200,-126,333,-173,-192,-44,-130,-108,-125,333,-193,-106,-122,-182,-107,-109,-111,-112,-110,]),'SEMICOLON':([32,56,67,68,69,70,71,72,82,123,124,125,126,127,128,129,130,140,156,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,188,220,224,227,230,231,234,240,265,266,267,271,274,275,276,281,286,289,290,298,303,304,305,306,307,310,335,336,337,339,340,341,342,345,346,352,354,356,357,358,359,363,375,377,383,399,401,404,422,437,],[-72,-160,-161,-162,-163,-164,-165,-166,-76,-153,-152,-158,-157,-154,-151,-155,-156,-74,-168,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-73,-200,-167,-179,-191,-171,-176,-75,-100,319,-160,323,-113,-114,-115,334,-170,-190,-189,-187,-39,-40,-41,-42,-43,-28,-169,-178,-188,-172,-175,-174,-177,-181,-186,-30,-45,-101,-102,-103,387,-31,-180,-194,-29,-173,-192,-44,-193,-182,]),'ELLIPSIS':([48,],[95,]),'DIVIDE':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,107,-161,-162,-163,-164,-165,-166,107,107,-153,-152,-158,-157,107,-151,107,-156,107,107,107,107,-168,107,107,107,107,-134,-135,-136,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-159,107,107,107,107,107,107,-160,-167,-179,107,-191,-171,-176,-160,107,-160,-160,107,107,107,-170,-163,107,-190,-189,107,107,107,-187,107,107,107,107,107,107,107,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,107,107,107,107,107,107,107,107,107,-180,-194,107,-170,107,107,-179,-173,-192,107,-169,-193,107,107,107,107,107,107,-182,107,]),'MOD':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,108,-161,-162,-163,-164,-165,-166,108,108,-153,-152,-158,-157,108,-151,108,-156,108,108,108,108,-168,108,108,108,108,-134,-135,-136,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-159,108,108,108,108,108,108,-160,-167,-179,108,-191,-171,-176,-160,108,-160,-160,108,108,108,-170,-163,108,-190,-189,108,108,108,-187,108,108,108,108,108,108,108,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,108,108,108,108,108,108,108,108,108,-180,-194,108,-170,108,108,-179,-173,-192,108,-169,-193,108,108,108,108,108,108,-182,108,]),'AND':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,109,-161,-162,-163,-164,-165,-166,109,109,-153,-152,-158,-157,109,-151,109,-156,109,109,109,109,-168,109,109,-132,-133,-134,-135,-136,-137,109,-139,-140,-141,-142,-143,-144,109,109,109,109,109,109,-159,109,109,109,109,109,109,-160,-167,-179,109,-191,-171,-176,-160,109,-160,-160,109,109,109,-170,-163,109,-190,-189,109,109,109,-187,109,109,109,109,109,109,109,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,109,109,109,109,109,109,109,109,109,-180,-194,109,-170,109,109,-179,-173,-192,109,-169,-193,109,109,109,109,109,109,-182,109,]),'OR':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,110,-161,-162,-163,-164,-165,-166,110,110,-153,-152,-158,-157,110,-151,110,-156,110,110,110,110,-168,110,110,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,110,110,110,110,110,110,-159,110,110,110,110,110,110,-160,-167,-179,110,-191,-171,-176,-160,110,-160,-160,110,110,110,-170,-163,110,-190,-189,110,110,110,-187,110,110,110,110,110,110,110,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,110,110,110,110,110,110,110,110,110,-180,-194,110,-170,110,110,-179,-173,-192,110,-169,-193,110,110,110,110,110,110,-182,110,]),'EQ':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,111,-161,-162,-163,-164,-165,-166,111,111,-153,-152,-158,-157,111,-151,111,-156,111,111,111,111,-168,111,111,-132,-133,-134,-135,-136,111,111,-139,-140,-141,-142,-143,-144,111,111,111,111,111,111,-159,111,111,111,111,111,111,-160,-167,-179,111,-191,-171,-176,-160,111,-160,-160,111,111,111,-170,-163,111,-190,-189,111,111,111,-187,111,111,111,111,111,111,111,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,111,111,111,111,111,111,111,111,111,-180,-194,111,-170,111,111,-179,-173,-192,111,-169,-193,111,111,111,111,111,111,-182,111,]),'NE':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,112,-161,-162,-163,-164,-165,-166,112,112,-153,-152,-158,-157,112,-151,112,-156,112,112,112,112,-168,112,112,-132,-133,-134,-135,-136,112,112,-139,-140,-141,-142,-143,-144,112,112,112,112,112,112,-159,112,112,112,112,112,112,-160,-167,-179,112,-191,-171,-176,-160,112,-160,-160,112,112,112,-170,-163,112,-190,-189,112,112,112,-187,112,112,112,112,112,112,112,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,112,112,112,112,112,112,112,112,112,-180,-194,112,-170,112,112,-179,-173,-192,112,-169,-193,112,112,112,112,112,112,-182,112,]),'LT':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,113,-161,-162,-163,-164,-165,-166,113,113,-153,-152,-158,-157,113,-151,113,-156,113,113,113,113,-168,113,113,-132,-133,-134,-135,-136,113,113,113,113,-141,-142,-143,-144,113,113,113,113,113,113,-159,113,113,113,113,113,113,-160,-167,-179,113,-191,-171,-176,-160,113,-160,-160,113,113,113,-170,-163,113,-190,-189,113,113,113,-187,113,113,113,113,113,113,113,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,113,113,113,113,113,113,113,113,113,-180,-194,113,-170,113,113,-179,-173,-192,113,-169,-193,113,113,113,113,113,113,-182,113,]),'LE':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,114,-161,-162,-163,-164,-165,-166,114,114,-153,-152,-158,-157,114,-151,114,-156,114,114,114,114,-168,114,114,-132,-133,-134,-135,-136,114,114,114,114,-141,-142,-143,-144,114,114,114,114,114,114,-159,114,114,114,114,114,114,-160,-167,-179,114,-191,-171,-176,-160,114,-160,-160,114,114,114,-170,-163,114,-190,-189,114,114,114,-187,114,114,114,114,114,114,114,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,114,114,114,114,114,114,114,114,114,-180,-194,114,-170,114,114,-179,-173,-192,114,-169,-193,114,114,114,114,114,114,-182,114,]),'GT':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,115,-161,-162,-163,-164,-165,-166,115,115,-153,-152,-158,-157,115,-151,115,-156,115,115,115,115,-168,115,115,-132,-133,-134,-135,-136,115,115,115,115,-141,-142,-143,-144,115,115,115,115,115,115,-159,115,115,115,115,115,115,-160,-167,-179,115,-191,-171,-176,-160,115,-160,-160,115,115,115,-170,-163,115,-190,-189,115,115,115,-187,115,115,115,115,115,115,115,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,115,115,115,115,115,115,115,115,115,-180,-194,115,-170,115,115,-179,-173,-192,115,-169,-193,115,115,115,115,115,115,-182,115,]),'GE':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,116,-161,-162,-163,-164,-165,-166,116,116,-153,-152,-158,-157,116,-151,116,-156,116,116,116,116,-168,116,116,-132,-133,-134,-135,-136,116,116,116,116,-141,-142,-143,-144,116,116,116,116,116,116,-159,116,116,116,116,116,116,-160,-167,-179,116,-191,-171,-176,-160,116,-160,-160,116,116,116,-170,-163,116,-190,-189,116,116,116,-187,116,116,116,116,116,116,116,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,116,116,116,116,116,116,116,116,116,-180,-194,116,-170,116,116,-179,-173,-192,116,-169,-193,116,116,116,116,116,116,-182,116,]),'BITOR':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,118,-161,-162,-163,-164,-165,-166,118,118,-153,-152,-158,-157,118,-151,118,-156,118,118,118,118,-168,118,118,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,118,118,118,118,118,118,-159,118,118,118,118,118,118,-160,-167,-179,118,-191,-171,-176,-160,118,-160,-160,118,118,118,-170,-163,118,-190,-189,118,118,118,-187,118,118,118,118,118,118,118,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,118,118,118,118,118,118,118,118,118,-180,-194,118,-170,118,118,-179,-173,-192,118,-169,-193,118,118,118,118,118,118,-182,118,]),'LSHIFT':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,120,-161,-162,-163,-164,-165,-166,120,120,-153,-152,-158,-157,120,-151,120,-156,120,120,120,120,-168,120,120,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,120,120,120,120,120,120,-159,120,120,120,120,120,120,-160,-167,-179,120,-191,-171,-176,-160,120,-160,-160,120,120,120,-170,-163,120,-190,-189,120,120,120,-187,120,120,120,120,120,120,120,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,120,120,120,120,120,120,120,120,120,-180,-194,120,-170,120,120,-179,-173,-192,120,-169,-193,120,120,120,120,120,120,-182,120,]),'RSHIFT':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,121,-161,-162,-163,-164,-165,-166,121,121,-153,-152,-158,-157,121,-151,121,-156,121,121,121,121,-168,121,121,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,121,121,121,121,121,121,-159,121,121,121,121,121,121,-160,-167,-179,121,-191,-171,-176,-160,121,-160,-160,121,121,121,-170,-163,121,-190,-189,121,121,121,-187,121,121,121,121,121,121,121,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,121,121,121,121,121,121,121,121,121,-180,-194,121,-170,121,121,-179,-173,-192,121,-169,-193,121,121,121,121,121,121,-182,121,]),'AND_NOT':([56,57,67,68,69,70,71,72,91,100,123,124,125,126,127,128,129,130,131,143,144,146,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,184,190,191,212,214,224,227,229,230,231,234,260,265,267,272,279,282,284,286,287,288,289,290,291,292,294,298,302,303,304,305,306,307,308,335,336,337,339,340,341,342,345,346,349,352,354,356,357,358,363,364,372,373,375,377,379,382,383,391,392,399,401,404,405,422,424,430,431,432,433,434,437,439,],[-160,122,-161,-162,-163,-164,-165,-166,122,122,-153,-152,-158,-157,122,-151,122,-156,122,122,122,122,-168,122,122,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,122,122,122,122,122,122,-159,122,122,122,122,122,122,-160,-167,-179,122,-191,-171,-176,-160,122,-160,-160,122,122,122,-170,-163,122,-190,-189,122,122,122,-187,122,122,122,122,122,122,122,-169,-178,-188,-172,-175,-174,-177,-181,-186,-179,122,122,122,122,122,122,122,122,122,-180,-194,122,-170,122,122,-179,-173,-192,122,-169,-193,122,122,122,122,122,122,-182,122,]),'COLON':([56,67,68,69,70,71,72,103,123,124,125,126,127,128,129,130,156,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,224,227,230,231,234,256,284,286,289,290,298,308,326,333,335,336,337,339,340,341,342,345,346,364,370,375,377,379,399,401,422,437,],[-160,-161,-162,-163,-164,-165,-166,160,-153,-152,-158,-157,-154,-151,-155,-156,-168,-199,228,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-159,-167,-179,-191,-171,-176,160,-198,-170,-190,-189,-187,228,160,371,-169,-178,-188,-172,-175,-174,-177,-181,-186,228,396,-180,-194,403,-173,-192,-193,-182,]),'DOT':([56,214,260,267,272,],[102,257,102,102,102,]),'ELSE':([199,246,318,],[-78,-77,355,]),'INCREMENT':([214,408,],[248,426,]),'DECREMENT':([214,408,],[249,427,]),'DECLARE_ASSIGN':([214,218,221,267,268,272,273,316,317,360,361,365,366,],[250,262,-38,320,321,325,-38,-35,-36,388,390,393,394,]),'PLUS_ASSIGN':([214,272,408,],[252,252,252,]),'MINUS_ASSIGN':([214,272,408,],[253,253,253,]),'TIMES_ASSIGN':([214,272,408,],[254,254,254,]),'DIVIDE_ASSIGN':([214,272,408,],[255,255,255,]),'RANGE':([325,388,389,390,393,394,],[362,411,412,413,415,416,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'programa':([0,],[1,]),'package_decl':([0,],[2,]),'imports':([2,5,],[4,20,]),'import_decl':([2,5,],[5,5,]),'empty':([2,4,5,9,31,153,198,220,371,387,396,397,417,],[6,16,6,16,51,215,215,276,215,409,215,215,215,]),'declaraciones':([4,],[9,]),'declaracion':([4,9,],[10,23,]),'funcion':([4,9,],[11,11,]),'declaracion_var_global':([4,9,],[12,12,]),'bloque_var':([4,9,153,198,371,396,397,417,],[13,13,202,202,202,202,202,202,]),'bloque_const':([4,9,153,198,371,396,397,417,],[14,14,203,203,203,203,203,203,]),'declaracion_const':([4,9,153,198,371,396,397,417,],[15,15,204,204,204,204,204,204,]),'lista_imports':([22,],[29,]),'tipo':([25,28,37,40,43,48,54,80,81,95,96,132,137,138,139,147,149,185,189,196,239,242,258,259,301,328,343,],[33,45,82,85,90,93,99,140,141,148,152,181,186,187,188,192,195,237,240,245,299,300,310,312,348,310,374,]),'lista_decl_bloque':([26,],[38,]),'decl_var_bloque':([26,38,],[39,84,]),'lista_decl_const':([27,],[41,]),'decl_const_bloque':([27,41,],[42,88,]),'parametros':([31,],[49,]),'lista_parametros':([31,],[50,]),'parametro':([31,97,],[52,154,]),'expresion':([34,44,55,58,59,60,61,62,63,64,65,66,86,89,92,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,133,134,135,142,145,153,160,198,217,219,220,222,223,225,226,228,232,233,235,238,250,251,252,253,254,255,256,261,262,277,296,311,313,319,320,321,323,325,326,332,334,338,347,350,351,353,362,371,380,396,397,402,403,411,412,413,415,416,417,419,428,],[57,91,100,123,124,125,126,127,128,129,130,131,143,144,146,157,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,183,184,190,191,212,229,212,125,265,265,279,282,284,157,288,291,292,294,157,302,303,304,305,306,307,308,157,157,125,157,352,354,356,357,358,265,363,364,157,372,373,379,157,383,157,391,212,404,212,212,379,424,430,431,432,433,434,212,157,439,]),'tipo_retorno':([96,],[150,]),'bloque':([96,150,220,264,269,355,391,406,430,431,432,433,434,],[151,197,270,318,322,385,414,425,440,441,442,443,444,]),'lista_expresiones':([101,223,226,233,238,261,262,296,332,350,353,419,],[155,283,285,293,297,314,315,344,370,381,384,436,]),'lista_tipos':([149,],[193,]),'lista_retornos_nombrados':([149,],[194,]),'sentencias':([153,371,396,],[198,397,417,]),'sentencia':([153,198,371,396,397,417,],[200,247,200,200,247,247,]),'declaracion_var':([153,198,220,371,396,397,417,],[201,201,274,201,201,201,201,]),'asignacion':([153,198,220,371,387,396,397,417,],[205,205,275,205,407,205,205,205,]),'asignacion_multiple':([153,198,371,396,397,417,],[206,206,206,206,206,206,]),'declaracion_var_multiple':([153,198,371,396,397,417,],[207,207,207,207,207,207,]),'if_statement':([153,198,355,371,396,397,417,],[208,208,386,208,208,208,208,]),'for_statement':([153,198,371,396,397,417,],[209,209,209,209,209,209,]),'switch_statement':([153,198,371,396,397,417,],[210,210,210,210,210,210,]),'return_statement':([153,198,371,396,397,417,],[211,211,211,211,211,211,]),'impresion':([153,198,371,396,397,417,],[213,213,213,213,213,213,]),'lista_ids':([153,198,216,219,220,222,323,371,396,397,417,],[218,218,259,268,268,268,268,218,218,218,218,]),'condicion':([219,220,323,],[264,269,359,]),'declaracion_var_corta':([219,220,222,323,],[266,266,281,266,]),'inicializacion':([220,],[271,]),'casos':([280,329,398,],[330,367,418,]),'caso':([280,329,330,367,398,418,],[331,331,369,369,331,369,]),'pares_mapa':([347,],[376,]),'par_mapa':([347,402,],[378,423,]),'incremento':([387,],[406,]),'lista_filas_matriz':([400,],[420,]),'fila_matriz':([400,438,],[421,446,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> programa","S'",1,None,None,None),
+  ('programa -> package_decl imports declaraciones','programa',3,'p_programa','sintactico_go.py',38),
+  ('package_decl -> PACKAGE ID','package_decl',2,'p_package_decl','sintactico_go.py',42),
+  ('imports -> import_decl imports','imports',2,'p_imports','sintactico_go.py',46),
+  ('imports -> import_decl','imports',1,'p_imports','sintactico_go.py',47),
+  ('imports -> empty','imports',1,'p_imports','sintactico_go.py',48),
+  ('import_decl -> IMPORT STRING_LITERAL','import_decl',2,'p_import_decl','sintactico_go.py',52),
+  ('import_decl -> IMPORT LPAREN lista_imports RPAREN','import_decl',4,'p_import_decl','sintactico_go.py',53),
+  ('import_decl -> empty','import_decl',1,'p_import_decl','sintactico_go.py',54),
+  ('lista_imports -> lista_imports STRING_LITERAL','lista_imports',2,'p_lista_imports','sintactico_go.py',58),
+  ('lista_imports -> STRING_LITERAL','lista_imports',1,'p_lista_imports','sintactico_go.py',59),
+  ('declaraciones -> declaraciones declaracion','declaraciones',2,'p_declaraciones','sintactico_go.py',63),
+  ('declaraciones -> declaracion','declaraciones',1,'p_declaraciones','sintactico_go.py',64),
+  ('declaracion -> funcion','declaracion',1,'p_declaracion','sintactico_go.py',68),
+  ('declaracion -> declaracion_var_global','declaracion',1,'p_declaracion','sintactico_go.py',69),
+  ('declaracion -> bloque_var','declaracion',1,'p_declaracion','sintactico_go.py',70),
+  ('declaracion -> bloque_const','declaracion',1,'p_declaracion','sintactico_go.py',71),
+  ('declaracion -> declaracion_const','declaracion',1,'p_declaracion','sintactico_go.py',72),
+  ('declaracion -> empty','declaracion',1,'p_declaracion','sintactico_go.py',73),
+  ('declaracion_var_global -> VAR ID tipo','declaracion_var_global',3,'p_declaracion_var_global','sintactico_go.py',77),
+  ('declaracion_var_global -> VAR ID tipo ASSIGN expresion','declaracion_var_global',5,'p_declaracion_var_global','sintactico_go.py',78),
+  ('declaracion_var_global -> VAR ID ASSIGN expresion','declaracion_var_global',4,'p_declaracion_var_global','sintactico_go.py',79),
+  ('bloque_var -> VAR LPAREN lista_decl_bloque RPAREN','bloque_var',4,'p_bloque_var','sintactico_go.py',83),
+  ('lista_decl_bloque -> lista_decl_bloque decl_var_bloque','lista_decl_bloque',2,'p_lista_decl_bloque','sintactico_go.py',87),
+  ('lista_decl_bloque -> decl_var_bloque','lista_decl_bloque',1,'p_lista_decl_bloque','sintactico_go.py',88),
+  ('decl_var_bloque -> ID tipo','decl_var_bloque',2,'p_decl_var_bloque','sintactico_go.py',92),
+  ('decl_var_bloque -> ID tipo ASSIGN expresion','decl_var_bloque',4,'p_decl_var_bloque','sintactico_go.py',93),
+  ('decl_var_bloque -> ID ASSIGN expresion','decl_var_bloque',3,'p_decl_var_bloque','sintactico_go.py',94),
+  ('declaracion_var -> VAR ID tipo','declaracion_var',3,'p_declaracion_var','sintactico_go.py',98),
+  ('declaracion_var -> VAR ID tipo ASSIGN expresion','declaracion_var',5,'p_declaracion_var','sintactico_go.py',99),
+  ('declaracion_var -> VAR ID ASSIGN expresion','declaracion_var',4,'p_declaracion_var','sintactico_go.py',100),
+  ('declaracion_var -> ID DECLARE_ASSIGN expresion','declaracion_var',3,'p_declaracion_var','sintactico_go.py',101),
+  ('declaracion_var_multiple -> VAR lista_ids tipo','declaracion_var_multiple',3,'p_declaracion_var_multiple','sintactico_go.py',105),
+  ('declaracion_var_multiple -> VAR lista_ids tipo ASSIGN lista_expresiones','declaracion_var_multiple',5,'p_declaracion_var_multiple','sintactico_go.py',106),
+  ('declaracion_var_multiple -> lista_ids DECLARE_ASSIGN lista_expresiones','declaracion_var_multiple',3,'p_declaracion_var_multiple','sintactico_go.py',107),
+  ('lista_ids -> lista_ids COMMA ID','lista_ids',3,'p_lista_ids','sintactico_go.py',111),
+  ('lista_ids -> lista_ids COMMA UNDERSCORE','lista_ids',3,'p_lista_ids','sintactico_go.py',112),
+  ('lista_ids -> ID','lista_ids',1,'p_lista_ids','sintactico_go.py',113),
+  ('lista_ids -> UNDERSCORE','lista_ids',1,'p_lista_ids','sintactico_go.py',114),
+  ('asignacion -> ID ASSIGN expresion','asignacion',3,'p_asignacion','sintactico_go.py',118),
+  ('asignacion -> ID PLUS_ASSIGN expresion','asignacion',3,'p_asignacion','sintactico_go.py',119),
+  ('asignacion -> ID MINUS_ASSIGN expresion','asignacion',3,'p_asignacion','sintactico_go.py',120),
+  ('asignacion -> ID TIMES_ASSIGN expresion','asignacion',3,'p_asignacion','sintactico_go.py',121),
+  ('asignacion -> ID DIVIDE_ASSIGN expresion','asignacion',3,'p_asignacion','sintactico_go.py',122),
+  ('asignacion -> ID LBRACKET expresion RBRACKET ASSIGN expresion','asignacion',6,'p_asignacion','sintactico_go.py',123),
+  ('asignacion -> TIMES ID ASSIGN expresion','asignacion',4,'p_asignacion','sintactico_go.py',124),
+  ('asignacion_multiple -> lista_ids ASSIGN lista_expresiones','asignacion_multiple',3,'p_asignacion_multiple','sintactico_go.py',128),
+  ('declaracion_const -> CONST ID ASSIGN expresion','declaracion_const',4,'p_declaracion_const','sintactico_go.py',132),
+  ('declaracion_const -> CONST ID tipo ASSIGN expresion','declaracion_const',5,'p_declaracion_const','sintactico_go.py',133),
+  ('bloque_const -> CONST LPAREN lista_decl_const RPAREN','bloque_const',4,'p_bloque_const','sintactico_go.py',137),
+  ('lista_decl_const -> lista_decl_const decl_const_bloque','lista_decl_const',2,'p_lista_decl_const','sintactico_go.py',141),
+  ('lista_decl_const -> decl_const_bloque','lista_decl_const',1,'p_lista_decl_const','sintactico_go.py',142),
+  ('decl_const_bloque -> ID ASSIGN expresion','decl_const_bloque',3,'p_decl_const_bloque','sintactico_go.py',146),
+  ('decl_const_bloque -> ID tipo ASSIGN expresion','decl_const_bloque',4,'p_decl_const_bloque','sintactico_go.py',147),
+  ('funcion -> FUNC ID LPAREN parametros RPAREN tipo_retorno bloque','funcion',7,'p_funcion','sintactico_go.py',151),
+  ('funcion -> FUNC ID LPAREN parametros RPAREN bloque','funcion',6,'p_funcion','sintactico_go.py',152),
+  ('parametros -> lista_parametros','parametros',1,'p_parametros','sintactico_go.py',156),
+  ('parametros -> empty','parametros',1,'p_parametros','sintactico_go.py',157),
+  ('lista_parametros -> lista_parametros COMMA parametro','lista_parametros',3,'p_lista_parametros','sintactico_go.py',161),
+  ('lista_parametros -> parametro','lista_parametros',1,'p_lista_parametros','sintactico_go.py',162),
+  ('parametro -> ID tipo','parametro',2,'p_parametro','sintactico_go.py',166),
+  ('parametro -> ID COMMA ID tipo','parametro',4,'p_parametro','sintactico_go.py',167),
+  ('parametro -> ID ELLIPSIS tipo','parametro',3,'p_parametro','sintactico_go.py',168),
+  ('parametro -> TIMES ID','parametro',2,'p_parametro','sintactico_go.py',169),
+  ('parametro -> UNDERSCORE tipo','parametro',2,'p_parametro','sintactico_go.py',170),
+  ('tipo_retorno -> tipo','tipo_retorno',1,'p_tipo_retorno','sintactico_go.py',174),
+  ('tipo_retorno -> LPAREN lista_tipos RPAREN','tipo_retorno',3,'p_tipo_retorno','sintactico_go.py',175),
+  ('tipo_retorno -> LPAREN lista_retornos_nombrados RPAREN','tipo_retorno',3,'p_tipo_retorno','sintactico_go.py',176),
+  ('lista_retornos_nombrados -> lista_retornos_nombrados COMMA ID tipo','lista_retornos_nombrados',4,'p_lista_retornos_nombrados','sintactico_go.py',180),
+  ('lista_retornos_nombrados -> ID tipo','lista_retornos_nombrados',2,'p_lista_retornos_nombrados','sintactico_go.py',181),
+  ('lista_tipos -> lista_tipos COMMA tipo','lista_tipos',3,'p_lista_tipos','sintactico_go.py',185),
+  ('lista_tipos -> tipo','lista_tipos',1,'p_lista_tipos','sintactico_go.py',186),
+  ('tipo -> ID','tipo',1,'p_tipo','sintactico_go.py',190),
+  ('tipo -> LBRACKET INT_LITERAL RBRACKET tipo','tipo',4,'p_tipo','sintactico_go.py',191),
+  ('tipo -> LBRACKET RBRACKET tipo','tipo',3,'p_tipo','sintactico_go.py',192),
+  ('tipo -> MAP LBRACKET tipo RBRACKET tipo','tipo',5,'p_tipo','sintactico_go.py',193),
+  ('tipo -> TIMES tipo','tipo',2,'p_tipo','sintactico_go.py',194),
+  ('bloque -> LBRACE sentencias RBRACE','bloque',3,'p_bloque','sintactico_go.py',198),
+  ('bloque -> LBRACE RBRACE','bloque',2,'p_bloque','sintactico_go.py',199),
+  ('sentencias -> sentencias sentencia','sentencias',2,'p_sentencias','sintactico_go.py',203),
+  ('sentencias -> sentencia','sentencias',1,'p_sentencias','sintactico_go.py',204),
+  ('sentencia -> declaracion_var','sentencia',1,'p_sentencia','sintactico_go.py',208),
+  ('sentencia -> bloque_var','sentencia',1,'p_sentencia','sintactico_go.py',209),
+  ('sentencia -> bloque_const','sentencia',1,'p_sentencia','sintactico_go.py',210),
+  ('sentencia -> declaracion_const','sentencia',1,'p_sentencia','sintactico_go.py',211),
+  ('sentencia -> asignacion','sentencia',1,'p_sentencia','sintactico_go.py',212),
+  ('sentencia -> asignacion_multiple','sentencia',1,'p_sentencia','sintactico_go.py',213),
+  ('sentencia -> declaracion_var_multiple','sentencia',1,'p_sentencia','sintactico_go.py',214),
+  ('sentencia -> if_statement','sentencia',1,'p_sentencia','sintactico_go.py',215),
+  ('sentencia -> for_statement','sentencia',1,'p_sentencia','sintactico_go.py',216),
+  ('sentencia -> switch_statement','sentencia',1,'p_sentencia','sintactico_go.py',217),
+  ('sentencia -> return_statement','sentencia',1,'p_sentencia','sintactico_go.py',218),
+  ('sentencia -> expresion','sentencia',1,'p_sentencia','sintactico_go.py',219),
+  ('sentencia -> impresion','sentencia',1,'p_sentencia','sintactico_go.py',220),
+  ('sentencia -> ID INCREMENT','sentencia',2,'p_sentencia','sintactico_go.py',221),
+  ('sentencia -> ID DECREMENT','sentencia',2,'p_sentencia','sintactico_go.py',222),
+  ('sentencia -> empty','sentencia',1,'p_sentencia','sintactico_go.py',223),
+  ('if_statement -> IF condicion bloque','if_statement',3,'p_if_statement','sintactico_go.py',227),
+  ('if_statement -> IF condicion bloque ELSE bloque','if_statement',5,'p_if_statement','sintactico_go.py',228),
+  ('if_statement -> IF condicion bloque ELSE if_statement','if_statement',5,'p_if_statement','sintactico_go.py',229),
+  ('condicion -> expresion','condicion',1,'p_condicion','sintactico_go.py',233),
+  ('condicion -> declaracion_var_corta SEMICOLON expresion','condicion',3,'p_condicion','sintactico_go.py',234),
+  ('declaracion_var_corta -> ID DECLARE_ASSIGN expresion','declaracion_var_corta',3,'p_declaracion_var_corta','sintactico_go.py',238),
+  ('declaracion_var_corta -> lista_ids DECLARE_ASSIGN expresion','declaracion_var_corta',3,'p_declaracion_var_corta','sintactico_go.py',239),
+  ('for_statement -> FOR condicion bloque','for_statement',3,'p_for_statement','sintactico_go.py',243),
+  ('for_statement -> FOR bloque','for_statement',2,'p_for_statement','sintactico_go.py',244),
+  ('for_statement -> FOR inicializacion SEMICOLON condicion SEMICOLON incremento bloque','for_statement',7,'p_for_statement','sintactico_go.py',245),
+  ('for_statement -> FOR ID COMMA ID DECLARE_ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','sintactico_go.py',246),
+  ('for_statement -> FOR ID DECLARE_ASSIGN RANGE expresion bloque','for_statement',6,'p_for_statement','sintactico_go.py',247),
+  ('for_statement -> FOR ID COMMA ID ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','sintactico_go.py',248),
+  ('for_statement -> FOR UNDERSCORE COMMA ID DECLARE_ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','sintactico_go.py',249),
+  ('for_statement -> FOR ID COMMA UNDERSCORE DECLARE_ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','sintactico_go.py',250),
+  ('for_statement -> FOR UNDERSCORE COMMA UNDERSCORE DECLARE_ASSIGN RANGE expresion bloque','for_statement',8,'p_for_statement','sintactico_go.py',251),
+  ('inicializacion -> declaracion_var','inicializacion',1,'p_inicializacion','sintactico_go.py',255),
+  ('inicializacion -> asignacion','inicializacion',1,'p_inicializacion','sintactico_go.py',256),
+  ('inicializacion -> empty','inicializacion',1,'p_inicializacion','sintactico_go.py',257),
+  ('incremento -> asignacion','incremento',1,'p_incremento','sintactico_go.py',261),
+  ('incremento -> ID INCREMENT','incremento',2,'p_incremento','sintactico_go.py',262),
+  ('incremento -> ID DECREMENT','incremento',2,'p_incremento','sintactico_go.py',263),
+  ('incremento -> empty','incremento',1,'p_incremento','sintactico_go.py',264),
+  ('switch_statement -> SWITCH expresion LBRACE casos RBRACE','switch_statement',5,'p_switch_statement','sintactico_go.py',268),
+  ('switch_statement -> SWITCH LBRACE casos RBRACE','switch_statement',4,'p_switch_statement','sintactico_go.py',269),
+  ('switch_statement -> SWITCH declaracion_var_corta SEMICOLON expresion LBRACE casos RBRACE','switch_statement',7,'p_switch_statement','sintactico_go.py',270),
+  ('casos -> casos caso','casos',2,'p_casos','sintactico_go.py',274),
+  ('casos -> caso','casos',1,'p_casos','sintactico_go.py',275),
+  ('caso -> CASE lista_expresiones COLON sentencias','caso',4,'p_caso','sintactico_go.py',279),
+  ('caso -> DEFAULT COLON sentencias','caso',3,'p_caso','sintactico_go.py',280),
+  ('return_statement -> RETURN','return_statement',1,'p_return_statement','sintactico_go.py',284),
+  ('return_statement -> RETURN expresion','return_statement',2,'p_return_statement','sintactico_go.py',285),
+  ('return_statement -> RETURN lista_expresiones','return_statement',2,'p_return_statement','sintactico_go.py',286),
+  ('impresion -> ID DOT ID LPAREN lista_expresiones RPAREN','impresion',6,'p_impresion','sintactico_go.py',290),
+  ('impresion -> ID DOT ID LPAREN RPAREN','impresion',5,'p_impresion','sintactico_go.py',291),
+  ('expresion -> expresion PLUS expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',295),
+  ('expresion -> expresion MINUS expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',296),
+  ('expresion -> expresion TIMES expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',297),
+  ('expresion -> expresion DIVIDE expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',298),
+  ('expresion -> expresion MOD expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',299),
+  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',300),
+  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',301),
+  ('expresion -> expresion EQ expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',302),
+  ('expresion -> expresion NE expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',303),
+  ('expresion -> expresion LT expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',304),
+  ('expresion -> expresion LE expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',305),
+  ('expresion -> expresion GT expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',306),
+  ('expresion -> expresion GE expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',307),
+  ('expresion -> expresion BITAND expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',308),
+  ('expresion -> expresion BITOR expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',309),
+  ('expresion -> expresion BITXOR expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',310),
+  ('expresion -> expresion LSHIFT expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',311),
+  ('expresion -> expresion RSHIFT expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',312),
+  ('expresion -> expresion AND_NOT expresion','expresion',3,'p_expresion_binaria','sintactico_go.py',313),
+  ('expresion -> NOT expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',317),
+  ('expresion -> MINUS expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',318),
+  ('expresion -> PLUS expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',319),
+  ('expresion -> BITXOR expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',320),
+  ('expresion -> BITNOT expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',321),
+  ('expresion -> ADDRESS expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',322),
+  ('expresion -> BITAND expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',323),
+  ('expresion -> TIMES expresion','expresion',2,'p_expresion_unaria','sintactico_go.py',324),
+  ('expresion -> LPAREN expresion RPAREN','expresion',3,'p_expresion_agrupada','sintactico_go.py',328),
+  ('expresion -> ID','expresion',1,'p_expresion_primaria','sintactico_go.py',332),
+  ('expresion -> INT_LITERAL','expresion',1,'p_expresion_primaria','sintactico_go.py',333),
+  ('expresion -> FLOAT_LITERAL','expresion',1,'p_expresion_primaria','sintactico_go.py',334),
+  ('expresion -> STRING_LITERAL','expresion',1,'p_expresion_primaria','sintactico_go.py',335),
+  ('expresion -> RUNE_LITERAL','expresion',1,'p_expresion_primaria','sintactico_go.py',336),
+  ('expresion -> BOOL_LITERAL','expresion',1,'p_expresion_primaria','sintactico_go.py',337),
+  ('expresion -> NIL','expresion',1,'p_expresion_primaria','sintactico_go.py',338),
+  ('expresion -> ID LPAREN lista_expresiones RPAREN','expresion',4,'p_expresion_llamada','sintactico_go.py',342),
+  ('expresion -> ID LPAREN RPAREN','expresion',3,'p_expresion_llamada','sintactico_go.py',343),
+  ('expresion -> ID DOT ID LPAREN lista_expresiones RPAREN','expresion',6,'p_expresion_llamada','sintactico_go.py',344),
+  ('expresion -> ID DOT ID LPAREN RPAREN','expresion',5,'p_expresion_llamada','sintactico_go.py',345),
+  ('expresion -> MAKE LPAREN tipo RPAREN','expresion',4,'p_expresion_make','sintactico_go.py',349),
+  ('expresion -> MAKE LPAREN tipo COMMA expresion RPAREN','expresion',6,'p_expresion_make','sintactico_go.py',350),
+  ('expresion -> MAKE LPAREN tipo COMMA expresion COMMA expresion RPAREN','expresion',8,'p_expresion_make','sintactico_go.py',351),
+  ('expresion -> APPEND LPAREN expresion COMMA lista_expresiones RPAREN','expresion',6,'p_expresion_append','sintactico_go.py',355),
+  ('expresion -> APPEND LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_append','sintactico_go.py',356),
+  ('expresion -> LEN LPAREN expresion RPAREN','expresion',4,'p_expresion_len','sintactico_go.py',360),
+  ('expresion -> DELETE LPAREN expresion COMMA expresion RPAREN','expresion',6,'p_expresion_delete','sintactico_go.py',364),
+  ('expresion -> ID DOT ID LPAREN STRING_LITERAL RPAREN','expresion',6,'p_expresion_new','sintactico_go.py',368),
+  ('expresion -> ID LBRACKET expresion RBRACKET','expresion',4,'p_expresion_array_acceso','sintactico_go.py',372),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',7,'p_array_literal','sintactico_go.py',376),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET tipo LBRACE RBRACE','expresion',6,'p_array_literal','sintactico_go.py',377),
+  ('expresion -> LBRACKET INT_LITERAL RBRACKET LBRACKET INT_LITERAL RBRACKET tipo LBRACE lista_filas_matriz RBRACE','expresion',10,'p_array_literal','sintactico_go.py',378),
+  ('lista_filas_matriz -> lista_filas_matriz COMMA fila_matriz','lista_filas_matriz',3,'p_lista_filas_matriz','sintactico_go.py',382),
+  ('lista_filas_matriz -> fila_matriz','lista_filas_matriz',1,'p_lista_filas_matriz','sintactico_go.py',383),
+  ('fila_matriz -> LBRACE lista_expresiones RBRACE','fila_matriz',3,'p_fila_matriz','sintactico_go.py',387),
+  ('expresion -> LBRACKET RBRACKET tipo LBRACE lista_expresiones RBRACE','expresion',6,'p_slice_literal','sintactico_go.py',391),
+  ('expresion -> LBRACKET RBRACKET tipo LBRACE RBRACE','expresion',5,'p_slice_literal','sintactico_go.py',392),
+  ('expresion -> ID LBRACKET expresion COLON expresion RBRACKET','expresion',6,'p_slice_operacion','sintactico_go.py',396),
+  ('expresion -> ID LBRACKET COLON expresion RBRACKET','expresion',5,'p_slice_operacion','sintactico_go.py',397),
+  ('expresion -> ID LBRACKET expresion COLON RBRACKET','expresion',5,'p_slice_operacion','sintactico_go.py',398),
+  ('expresion -> ID LBRACKET COLON RBRACKET','expresion',4,'p_slice_operacion','sintactico_go.py',399),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa RBRACE','expresion',8,'p_map_literal','sintactico_go.py',403),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE pares_mapa COMMA RBRACE','expresion',9,'p_map_literal','sintactico_go.py',404),
+  ('expresion -> MAP LBRACKET tipo RBRACKET tipo LBRACE RBRACE','expresion',7,'p_map_literal','sintactico_go.py',405),
+  ('pares_mapa -> pares_mapa COMMA par_mapa','pares_mapa',3,'p_pares_mapa','sintactico_go.py',409),
+  ('pares_mapa -> par_mapa','pares_mapa',1,'p_pares_mapa','sintactico_go.py',410),
+  ('par_mapa -> expresion COLON expresion','par_mapa',3,'p_par_mapa','sintactico_go.py',414),
+  ('lista_expresiones -> lista_expresiones COMMA expresion','lista_expresiones',3,'p_lista_expresiones','sintactico_go.py',418),
+  ('lista_expresiones -> expresion','lista_expresiones',1,'p_lista_expresiones','sintactico_go.py',419),
+  ('empty -> <empty>','empty',0,'p_empty','sintactico_go.py',423),
+]
@@ -0,0 +1,129 @@
+"""
+Perfilado bajo demanda del Analizador de Código Go
+Guarda perfiles de cProfile de análisis reales en un directorio acotado y
+resume las funciones más costosas (reglas t_*, acciones p_*, find_column...)
+sumando todos los perfiles guardados.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import marshal
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+
+# Configuración (modificable por variables de entorno)
+PERFIL_MUESTREO = float(os.environ.get('ANALYZER_PERFIL_MUESTREO', '0'))
+PERFIL_CABECERA = os.environ.get('ANALYZER_PERFIL_CABECERA', '0') != '0'
+PERFIL_DIR = os.environ.get('ANALYZER_PERFIL_DIR', 'perfiles')
+PERFIL_MAX = int(os.environ.get('ANALYZER_PERFIL_MAX', '50'))
+
+_lock = threading.Lock()
+
+
+def should_profile(cabecera):
+    """Decide si se perfila la petición: por la cabecera X-Analyzer-Profile (si está habilitada) o por muestreo."""
+    if PERFIL_CABECERA and cabecera in ('1', 'true'):
+        return True
+    return PERFIL_MUESTREO > 0 and random.random() < PERFIL_MUESTREO
+
+
+def save_profile(estadisticas, request_id, directorio=None):
+    """
+    Guarda las estadísticas (el diccionario de cProfile) en formato de pstats
+    y elimina los perfiles más antiguos si se supera ANALYZER_PERFIL_MAX.
+    Devuelve el nombre del archivo.
+    """
+    directorio = directorio or PERFIL_DIR
+    # El id puede venir del cliente (X-Request-ID): sólo se conservan caracteres seguros
+    request_id = re.sub(r'[^A-Za-z0-9_-]', '', request_id)[:64]
+    nombre = f"perfil-{time.strftime('%Y%m%d-%H%M%S')}-{request_id}.prof"
+    with _lock:
+        os.makedirs(directorio, exist_ok=True)
+        with open(os.path.join(directorio, nombre), 'wb') as archivo:
+            marshal.dump(estadisticas, archivo)
+        perfiles = _list_profiles(directorio)
+        for antiguo in perfiles[:max(0, len(perfiles) - PERFIL_MAX)]:
+            try:
+                os.remove(antiguo)
+            except OSError:
+                pass
+    return nombre
+
+
+def _list_profiles(directorio):
+    """Perfiles guardados, del más antiguo al más reciente."""
+    if not os.path.isdir(directorio):
+        return []
+    rutas = [os.path.join(directorio, nombre) for nombre in os.listdir(directorio) if nombre.endswith('.prof')]
+    return sorted(rutas, key=os.path.getmtime)
+
+
+def summarize_profiles(directorio=None, top=20, orden='tottime', filtro=None):
+    """
+    Suma todos los perfiles guardados y devuelve las funciones más costosas.
+    orden: 'tottime' (tiempo propio) o 'cumtime' (tiempo acumulado con las llamadas internas).
+    filtro: sólo funciones cuyo nombre empieza por ese prefijo (por ejemplo 't_' o 'p_').
+    """
+    rutas = _list_profiles(directorio or PERFIL_DIR)
+    if not rutas:
+        return {'perfiles': 0, 'funciones': []}
+    estadisticas = pstats.Stats()
+    for ruta in rutas:
+        try:
+            estadisticas.add(ruta)
+        except (OSError, EOFError, ValueError, TypeError):
+            continue
+
+    filas = []
+    for (archivo, linea, funcion), (_, llamadas, tottime, cumtime, _) in estadisticas.stats.items():
+        if filtro and not funcion.startswith(filtro):
+            continue
+        filas.append((funcion, os.path.basename(archivo), linea, llamadas, tottime, cumtime))
+    columna = 5 if orden == 'cumtime' else 4
+    filas.sort(key=lambda fila: fila[columna], reverse=True)
+
+    return {
+        'perfiles': len(rutas),
+        'orden': orden,
+        'funciones': [{
+            'funcion': funcion,
+            'archivo': archivo,
+            'linea': linea,
+            'llamadas': llamadas,
+            'tottime': round(tottime, 6),
+            'cumtime': round(cumtime, 6),
+        } for funcion, archivo, linea, llamadas, tottime, cumtime in filas[:top]]
+    }
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Resume las funciones más costosas de los perfiles guardados.')
+    argumentos.add_argument('directorio', nargs='?', default=PERFIL_DIR)
+    argumentos.add_argument('--top', type=int, default=20)
+    argumentos.add_argument('--orden', choices=('tottime', 'cumtime'), default='tottime')
+    argumentos.add_argument('--filtro', help="prefijo del nombre de la función, por ejemplo 'p_' o 't_'")
+    opciones = argumentos.parse_args()
+
+    resumen = summarize_profiles(opciones.directorio, opciones.top, opciones.orden, opciones.filtro)
+    if not resumen['perfiles']:
+        print(f"No hay perfiles en '{opciones.directorio}'")
+        sys.exit(1)
+    print(f"Perfiles analizados: {resumen['perfiles']} (orden: {opciones.orden})\n")
+    print(f"{'Función':40} {'Archivo':24} {'Llamadas':>10} {'tottime':>10} {'cumtime':>10}")
+    print('=' * 98)
+    for fila in resumen['funciones']:
+        ubicacion = f"{fila['archivo']}:{fila['linea']}"
+        print(f"{fila['funcion'][:40]:40} {ubicacion[:24]:24} {fila['llamadas']:>10} "
+              f"{fila['tottime']:>10.4f} {fila['cumtime']:>10.4f}")
@@ -0,0 +1,140 @@
+"""
+Consultas por posición sobre el análisis semántico
+El análisis semántico registra el sitio de cada nombre del código: dónde se declara
+cada símbolo y cada lugar donde se usa (ver semantico_go.record_declaration y
+record_use). IndicePosiciones ordena esos sitios una vez y responde en tiempo
+logarítmico qué hay en una línea y columna (hover), dónde está su declaración (ir a
+la definición) y todos sus usos (referencias).
+La caché guarda el índice de cada análisis completo por el hash del código, así que
+el editor consulta posiciones sin volver a analizar.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import os
+import threading
+from bisect import bisect_right
+from operator import itemgetter
+
+from analisis_go import CacheResultados
+
+
+class IndicePosiciones:
+    """
+    Índice de intervalos sobre los sitios (línea, columna, columna final, nombre,
+    destino, huella) de un archivo, a partir de result['sitios'] del análisis
+    semántico: los bloques de cada función con su desplazamiento de línea y el sitio
+    de cada declaración global del archivo. Los nombres no se solapan, así que basta
+    con ordenarlos por su inicio y buscar con bisect el último que empieza antes de
+    la posición. Las estructuras se construyen la primera vez que se consulta: muchos
+    análisis nunca reciben una consulta.
+    """
+
+    def __init__(self, sitios):
+        self.pendientes = sitios
+        self.lock = threading.Lock()
+        self.sitios = None
+        self.inicios = None
+        self.usos = None
+        self.declaraciones = None
+
+    def _build(self):
+        with self.lock:
+            if self.sitios is None:
+                sitios = sorted(self._resolve(self.pendientes), key=itemgetter(0, 1))
+                declaraciones = {sitio[:2]: sitio for sitio in sitios if sitio[4] is None}
+                usos = {}
+                for i, sitio in enumerate(sitios):
+                    clave = self._declaration_key(sitio)
+                    if sitio[5] is None and clave in declaraciones:
+                        # Un uso de una declaración del archivo tiene la huella de ésta
+                        sitio = sitios[i] = sitio[:5] + (declaraciones[clave][5],)
+                    usos.setdefault(clave, []).append(sitio)
+                self.inicios = [(linea, columna) for linea, columna, *_ in sitios]
+                self.usos = usos
+                self.declaraciones = declaraciones
+                self.sitios = sitios
+                self.pendientes = None
+        return self.sitios
+
+    @staticmethod
+    def _resolve(pendientes):
+        """Sitios de todos los bloques con la línea del archivo y los destinos 'global' resueltos."""
+        globales = pendientes['globales']
+        for desplazamiento, bloque in pendientes['bloques']:
+            for linea, columna, fin, nombre, destino, huella in bloque:
+                if destino == 'global':
+                    # Si no se declara en este archivo está en otro del paquete
+                    destino = globales.get(nombre, 'externo')
+                elif isinstance(destino, tuple):
+                    destino = (destino[0] + desplazamiento, destino[1])
+                yield linea + desplazamiento, columna, fin, nombre, destino, huella
+
+    @staticmethod
+    def _declaration_key(sitio):
+        """Lo que comparten una declaración y sus usos: el sitio de la declaración."""
+        linea, columna, _, nombre, destino, huella = sitio
+        if destino is None:
+            return (linea, columna)
+        if destino == 'externo':
+            # Declarado fuera del archivo: los usos se agrupan por nombre y por dónde vive
+            return ('externo', nombre, huella[1])
+        return tuple(destino)
+
+    def at(self, linea, columna):
+        """Sitio que contiene la posición (línea y columna desde 1), o None."""
+        sitios = self._build()
+        i = bisect_right(self.inicios, (linea, columna)) - 1
+        if i >= 0 and sitios[i][0] == linea and columna < sitios[i][2]:
+            return sitios[i]
+        return None
+
+    def hover(self, linea, columna):
+        """Nombre y símbolo en la posición, con el sitio de su declaración, o None."""
+        sitio = self.at(linea, columna)
+        if sitio is None:
+            return None
+        # Sin huella sólo si el uso apunta a una declaración que no se registró
+        tipo, ambito, es_constante, tipo_retorno, params = sitio[5] or ('unknown', None, False, None, ())
+        resultado = site_to_dict(sitio)
+        resultado.update({
+            'type': tipo,
+            'scope': ambito,
+            'is_const': es_constante,
+            'return_type': tipo_retorno,
+            'params': list(params),
+            'definition': self._definition(sitio),
+        })
+        return resultado
+
+    def definition(self, linea, columna):
+        """Sitio de la declaración del nombre en la posición (None si está fuera del archivo)."""
+        sitio = self.at(linea, columna)
+        return self._definition(sitio) if sitio is not None else None
+
+    def _definition(self, sitio):
+        declaracion = self.declaraciones.get(self._declaration_key(sitio))
+        return site_to_dict(declaracion) if declaracion is not None else None
+
+    def references(self, linea, columna, incluir_declaracion=True):
+        """Todos los sitios del mismo símbolo que el de la posición, en orden."""
+        sitio = self.at(linea, columna)
+        if sitio is None:
+            return []
+        return [site_to_dict(candidato) for candidato in self.usos[self._declaration_key(sitio)]
+                if incluir_declaracion or candidato[4] is not None]
+
+
+def site_to_dict(sitio):
+    return {
+        'name': sitio[3],
+        'line': sitio[0],
+        'column': sitio[1],
+        'end_column': sitio[2],
+    }
+
+
+# Índices de los últimos análisis completos, por el hash del código (el de cache_resultados)
+cache_posiciones = CacheResultados(int(os.environ.get('ANALYZER_CACHE_POSICIONES', '32')), copiar=False)
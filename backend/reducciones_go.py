@@ -0,0 +1,148 @@
+"""
+Perfil de reducciones de la gramática del Analizador de Código Go
+Cuenta las reducciones y acumula el tiempo de cada regla p_* y de cada estado
+del parser LALR durante un análisis, para saber qué producciones dominan con
+código real. Desactivado no tiene ningún coste: las acciones originales sólo se
+envuelven mientras el perfil está activo.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+
+
+class PerfilReducciones:
+    """Reducciones y tiempo acumulado por regla p_*, por producción y por estado del parser."""
+
+    def __init__(self):
+        self.reglas = {}
+        self.producciones = {}
+        self.estados = {}
+
+    @contextmanager
+    def activar(self, parser):
+        """Envuelve las acciones del parser mientras dura el bloque y las restaura al salir."""
+        originales = [produccion.callable for produccion in parser.productions]
+        for produccion in parser.productions:
+            if produccion.callable is not None:
+                produccion.callable = self._envolver(produccion.callable, produccion.str)
+        try:
+            yield self
+        finally:
+            for produccion, funcion in zip(parser.productions, originales):
+                produccion.callable = funcion
+
+    def _envolver(self, funcion, produccion):
+        regla = funcion.__name__
+        reglas = self.reglas
+        producciones = self.producciones
+        estados = self.estados
+        reloj = time.perf_counter
+
+        def medir(p):
+            # PLY guarda en parser.state el estado en el que se decidió la reducción
+            estado = p.parser.state
+            inicio = reloj()
+            try:
+                return funcion(p)
+            finally:
+                duracion = reloj() - inicio
+                for tabla, clave in ((reglas, regla), (producciones, produccion), (estados, estado)):
+                    datos = tabla.get(clave)
+                    if datos is None:
+                        datos = tabla[clave] = [0, 0.0, {}]
+                    datos[0] += 1
+                    datos[1] += duracion
+                datos[2][regla] = datos[2].get(regla, 0) + 1
+        return medir
+
+    @staticmethod
+    def _ordenar(tabla, orden, top):
+        columna = 0 if orden == 'conteo' else 1
+        filas = sorted(tabla.items(), key=lambda item: item[1][columna], reverse=True)
+        return filas[:top] if top else filas
+
+    def to_dict(self, orden='tiempo', top=None):
+        """Resumen ordenado por 'tiempo' (acumulado) o por 'conteo' de reducciones."""
+        total = sum(datos[0] for datos in self.reglas.values())
+        return {
+            'reducciones': total,
+            'reglas': [{
+                'regla': regla, 'reducciones': datos[0], 'segundos': round(datos[1], 6)
+            } for regla, datos in self._ordenar(self.reglas, orden, top)],
+            'producciones': [{
+                'produccion': produccion, 'reducciones': datos[0], 'segundos': round(datos[1], 6)
+            } for produccion, datos in self._ordenar(self.producciones, orden, top)],
+            'estados': [{
+                'estado': estado, 'reducciones': datos[0], 'segundos': round(datos[1], 6),
+                'regla_principal': max(datos[2], key=datos[2].get)
+            } for estado, datos in self._ordenar(self.estados, orden, top)],
+        }
+
+    def report(self, orden='tiempo', top=20):
+        """Reporte de texto ordenado, para el CLI."""
+        resumen = self.to_dict(orden, top)
+        total = resumen['reducciones'] or 1
+        lineas = [f"Reducciones totales: {resumen['reducciones']} (orden: {orden})", '']
+        lineas.append(f"{'Regla':40} {'Reducciones':>12} {'%':>7} {'Tiempo (ms)':>12}")
+        lineas.append('=' * 74)
+        for fila in resumen['reglas']:
+            lineas.append(f"{fila['regla'][:40]:40} {fila['reducciones']:>12} "
+                          f"{100 * fila['reducciones'] / total:>6.1f}% {fila['segundos'] * 1000:>12.3f}")
+        lineas += ['', f"{'Producción':56} {'Reducciones':>12} {'Tiempo (ms)':>12}", '=' * 82]
+        for fila in resumen['producciones']:
+            lineas.append(f"{fila['produccion'][:56]:56} {fila['reducciones']:>12} {fila['segundos'] * 1000:>12.3f}")
+        lineas += ['', f"{'Estado':>8}  {'Regla principal':38} {'Reducciones':>12} {'Tiempo (ms)':>12}", '=' * 74]
+        for fila in resumen['estados']:
+            lineas.append(f"{fila['estado']:>8}  {fila['regla_principal'][:38]:38} {fila['reducciones']:>12} "
+                          f"{fila['segundos'] * 1000:>12.3f}")
+        return '\n'.join(lineas)
+
+
+def profile_reductions(code_string, fase='sintactico', perfil=None):
+    """
+    Analiza el código con el parser de la fase indicada ('sintactico' o 'semantico')
+    y devuelve su perfil. Si se pasa un perfil, los datos se acumulan en él.
+    """
+    if fase == 'semantico':
+        import semantico_go as modulo
+        analizar = modulo.analyze_semantic_string
+    else:
+        import sintactico_go as modulo
+        analizar = modulo.analyze_syntax_string
+    perfil = perfil or PerfilReducciones()
+    with perfil.activar(modulo.get_parser()):
+        analizar(code_string)
+    return perfil
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Perfil de reducciones por regla y por estado del parser.')
+    argumentos.add_argument('archivos', nargs='+', help='archivos .go a analizar')
+    argumentos.add_argument('--fase', choices=('sintactico', 'semantico'), default='sintactico')
+    argumentos.add_argument('--orden', choices=('tiempo', 'conteo'), default='tiempo')
+    argumentos.add_argument('--top', type=int, default=20)
+    opciones = argumentos.parse_args()
+
+    # Un solo perfil acumulado para todos los archivos
+    perfil = PerfilReducciones()
+    for nombre in opciones.archivos:
+        try:
+            with open(nombre, 'r', encoding='utf-8') as archivo:
+                codigo = archivo.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error al leer '{nombre}': {e}")
+            sys.exit(1)
+        profile_reductions(codigo, opciones.fase, perfil)
+
+    print(f"\nPerfil de reducciones ({opciones.fase}) de {len(opciones.archivos)} archivo(s)\n")
+    print(perfil.report(opciones.orden, opciones.top))
@@ -10,7 +10,16 @@ Integrantes:
 import ply.yacc as yacc
 import ply.lex as lex
 import lexico_go
+import paralelo_go
+import stdlib_go
+from itertools import repeat
+from types import MappingProxyType
+from bisect import bisect_left, bisect_right
+import hashlib
+import re
+import threading
 from lexico_go import tokens
+from instrumentacion_go import subfase
 from datetime import datetime
 import sys
 import os
@@ -30,18 +39,34 @@ class Symbol:
         self.is_const = is_const
         self.return_type = return_type
         self.params = params if params is not None else []  # Lista de tipos de parámetros
+        self.sitio = None  # (línea, columna) del nombre en su declaración
 
 class SymbolTable:
-    def __init__(self):
-        self.scopes = [{}]
-        self.current_scope_level = 0
+    def __init__(self, global_index=None):
+        # Con un índice global (segunda fase) el nivel 0 es ese índice, de sólo lectura,
+        # y lo que se declare en el código analizado va al nivel 1
+        self.scopes = [global_index, {}] if global_index is not None else [{}]
+        self.base_level = len(self.scopes) - 1
+        self.current_scope_level = self.base_level
+        # Si es un conjunto, lookup anota los nombres que llegan al nivel 0
+        self.referencias = None
+        # Sitios de los nombres del código analizado (ver record_declaration y record_use)
+        self.sitios = []
         
+    def __getstate__(self):
+        # El índice global de sólo lectura no se serializa (por ejemplo, al devolver la
+        # tabla desde un worker aislado): es de otros archivos y sólo sirve para analizar
+        estado = dict(self.__dict__)
+        if self.base_level:
+            estado['scopes'] = [None] + self.scopes[1:]
+        return estado
+
     def enter_scope(self):
         self.scopes.append({})
         self.current_scope_level += 1
     
     def exit_scope(self):
-        if self.current_scope_level > 0:
+        if self.current_scope_level > self.base_level:
             self.scopes.pop()
             self.current_scope_level -= 1
     
@@ -49,17 +74,20 @@ class SymbolTable:
         self.scopes[self.current_scope_level][symbol.name] = symbol
     
     def lookup(self, name):
-        for i in range(self.current_scope_level, -1, -1):
+        for i in range(self.current_scope_level, 0, -1):
             if name in self.scopes[i]:
                 return self.scopes[i][name]
-        return None
+        if self.referencias is not None:
+            self.referencias.add(name)
+        return self.scopes[0].get(name)
     
     def lookup_current_scope(self, name):
         return self.scopes[self.current_scope_level].get(name)
     
     def to_dict(self):
+        # El índice global de sólo lectura (si lo hay) no se muestra: es de otros archivos o de la primera fase
         result = []
-        for level, scope in enumerate(self.scopes):
+        for level, scope in enumerate(self.scopes[self.base_level:]):
             scope_data = []
             for name, symbol in scope.items():
                 scope_data.append({
@@ -80,10 +108,10 @@ class SymbolTable:
 # Tipos compatibles
 NUMERIC_TYPES = {'int', 'int8', 'int16', 'int32', 'int64', 
                  'uint', 'uint8', 'uint16', 'uint32', 'uint64',
-                 'float32', 'float64'}
+                 'float32', 'float64', 'byte', 'rune'}
 
 INTEGER_TYPES = {'int', 'int8', 'int16', 'int32', 'int64',
-                 'uint', 'uint8', 'uint16', 'uint32', 'uint64'}
+                 'uint', 'uint8', 'uint16', 'uint32', 'uint64', 'byte', 'rune'}
 
 FLOAT_TYPES = {'float32', 'float64'}
 
@@ -99,14 +127,78 @@ _semantic_errors = []
 _symbol_table = None
 _current_function = None
 _inside_loop = 0
+_solo_cuerpos = False
+_params_cabecera = set()  # Parámetros de la cabecera que se está analizando
+_retornos_nombrados = False  # La cabecera que se está analizando tiene retornos con nombre
+_inicios_linea = [0]  # Posición donde empieza cada línea del código que se está analizando
 
 def add_error(message, line=0):
     global _semantic_errors
+    # En la segunda fase sólo cuentan los errores dentro del cuerpo de una función:
+    # los de las declaraciones ya los reportó la primera
+    if _solo_cuerpos and _current_function is None:
+        return
     _semantic_errors.append({
         'message': message,
         'line': line
     })
 
+def position_of(lexpos):
+    """
+    (línea, columna) de una posición del código que se está analizando, ambas desde 1
+    como en lexico_go. Las líneas coinciden con las del lexer: las cadenas no pueden
+    contener saltos de línea y los comentarios multilínea sí los cuentan.
+    """
+    i = bisect_right(_inicios_linea, lexpos) - 1
+    return i + 1, lexpos - _inicios_linea[i] + 1
+
+def record_declaration(symbol, lexpos, largo=None):
+    """Inserta el símbolo en el ámbito actual y registra el sitio de su nombre."""
+    _symbol_table.insert(symbol)
+    record_site(symbol, lexpos, largo)
+
+def record_site(symbol, lexpos, largo=None):
+    """
+    Registra el sitio donde se declara el símbolo como (línea, columna, columna final,
+    nombre, destino, huella), con destino None por ser una declaración. En la segunda
+    fase la cabecera de la función no se registra: sus sitios ya los registró la primera.
+    """
+    line, columna = position_of(lexpos)
+    symbol.sitio = (line, columna)
+    if _solo_cuerpos and _current_function is None:
+        return
+    _symbol_table.sitios.append((line, columna, columna + (largo or len(symbol.name)), symbol.name,
+                                 None, fingerprint(symbol)))
+
+def record_use(symbol, name, lexpos):
+    """
+    Registra un uso de name que se resolvió a symbol. El destino es el sitio de su
+    declaración (la huella se toma de ahí), o 'global' si está en el índice global de
+    sólo lectura: ese se resuelve por nombre al construir el IndicePosiciones, porque
+    su línea puede cambiar sin que cambie la función que lo usa (y CacheFunciones
+    reutiliza sus sitios), y lleva su huella por si se declara en otro archivo.
+    """
+    if symbol is None:
+        return
+    tabla = _symbol_table
+    if tabla.base_level and tabla.scopes[0].get(name) is symbol:
+        destino, huella = 'global', fingerprint(symbol)
+    elif symbol.sitio is not None:
+        destino, huella = symbol.sitio, None
+    else:
+        return
+    # position_of en línea: es la función más llamada del registro de sitios
+    i = bisect_right(_inicios_linea, lexpos) - 1
+    columna = lexpos - _inicios_linea[i] + 1
+    tabla.sitios.append((i + 1, columna, columna + len(name), name, destino, huella))
+
+class ListaIds(list):
+    """Nombres de lista_ids junto con la posición de cada uno, para registrar sus sitios."""
+
+    def __init__(self, name, lexpos):
+        super().__init__([name])
+        self.posiciones = [lexpos]
+
 # ============================================================================
 # PRECEDENCIA
 # ============================================================================
@@ -145,12 +237,25 @@ def p_import_decl(p):
     '''import_decl : IMPORT STRING_LITERAL
                    | IMPORT LPAREN lista_imports RPAREN
                    | empty'''
-    pass
+    if len(p) == 3:
+        declare_import(p[2], p.lineno(2), p.lexpos(2))
 
 def p_lista_imports(p):
     '''lista_imports : lista_imports STRING_LITERAL
                      | STRING_LITERAL'''
-    pass
+    if len(p) == 3:
+        declare_import(p[2], p.lineno(2), p.lexpos(2))
+    else:
+        declare_import(p[1], p.lineno(1), p.lexpos(1))
+
+def declare_import(literal, line, lexpos):
+    # El paquete se declara con el último elemento de su ruta ("math/rand" -> rand);
+    # sus firmas se buscan en stdlib_go al resolver una llamada
+    ruta = literal.strip('"')
+    nombre = ruta.rsplit('/', 1)[-1]
+    if not _symbol_table.lookup_current_scope(nombre):
+        # El sitio abarca la cadena con sus comillas
+        record_declaration(Symbol(nombre, 'package', ruta, 'import', line), lexpos, len(literal) + 2)
 
 def p_declaraciones(p):
     '''declaraciones : declaraciones declaracion
@@ -177,12 +282,12 @@ def p_declaracion_var_global(p):
         add_error(f"Variable '{var_name}' ya declarada", line)
     else:
         if len(p) == 4:
-            _symbol_table.insert(Symbol(var_name, p[3], None, 'global', line))
+            record_declaration(Symbol(var_name, p[3], None, 'global', line), p.lexpos(2))
         elif len(p) == 6:
-            _symbol_table.insert(Symbol(var_name, p[3], None, 'global', line))
+            record_declaration(Symbol(var_name, p[3], None, 'global', line), p.lexpos(2))
         else:
             expr_type = p[4].get('type') if isinstance(p[4], dict) else 'unknown'
-            _symbol_table.insert(Symbol(var_name, expr_type, None, 'global', line))
+            record_declaration(Symbol(var_name, expr_type, None, 'global', line), p.lexpos(2))
 
 def p_bloque_var(p):
     '''bloque_var : VAR LPAREN lista_decl_bloque RPAREN'''
@@ -205,12 +310,12 @@ def p_decl_var_bloque(p):
         add_error(f"Variable '{var_name}' ya declarada", line)
     else:
         if len(p) == 3:  # ID tipo
-            _symbol_table.insert(Symbol(var_name, p[2], None, 'global', line))
+            record_declaration(Symbol(var_name, p[2], None, 'global', line), p.lexpos(1))
         elif len(p) == 4:  # ID ASSIGN expresion
             expr_type = p[3].get('type') if isinstance(p[3], dict) else 'int'
-            _symbol_table.insert(Symbol(var_name, expr_type, None, 'global', line))
+            record_declaration(Symbol(var_name, expr_type, None, 'global', line), p.lexpos(1))
         else:  # ID tipo ASSIGN expresion (len == 5)
-            _symbol_table.insert(Symbol(var_name, p[2], None, 'global', line))
+            record_declaration(Symbol(var_name, p[2], None, 'global', line), p.lexpos(1))
 
 def p_declaracion_var(p):
     '''declaracion_var : VAR ID tipo
@@ -220,40 +325,48 @@ def p_declaracion_var(p):
     global _symbol_table
     var_name = p[2] if p[1] == 'var' else p[1]
     line = p.lineno(2) if p[1] == 'var' else p.lineno(1)
+    lexpos = p.lexpos(2) if p[1] == 'var' else p.lexpos(1)
     
     if _symbol_table.lookup_current_scope(var_name):
         add_error(f"Variable '{var_name}' ya declarada", line)
     else:
         if len(p) == 4 and p[1] == 'var':
-            _symbol_table.insert(Symbol(var_name, p[3], None, 'local', line))
+            record_declaration(Symbol(var_name, p[3], None, 'local', line), lexpos)
         elif len(p) == 4:
             expr_type = p[3].get('type') if isinstance(p[3], dict) else 'int'
-            _symbol_table.insert(Symbol(var_name, expr_type, None, 'local', line))
+            record_declaration(Symbol(var_name, expr_type, None, 'local', line), lexpos)
         elif len(p) == 6:
-            _symbol_table.insert(Symbol(var_name, p[3], None, 'local', line))
+            record_declaration(Symbol(var_name, p[3], None, 'local', line), lexpos)
         else:
             expr_type = p[4].get('type') if isinstance(p[4], dict) else 'int'
-            _symbol_table.insert(Symbol(var_name, expr_type, None, 'local', line))
+            record_declaration(Symbol(var_name, expr_type, None, 'local', line), lexpos)
 
 def p_funcion(p):
     '''funcion : funcion_header bloque'''
     global _current_function, _symbol_table
     _symbol_table.exit_scope()
     _current_function = None
+    if _solo_cuerpos:
+        # Cada función ve sólo el índice global, su nombre y sus propios parámetros
+        _symbol_table.scopes[_symbol_table.base_level].clear()
 
 def p_funcion_header(p):
     '''funcion_header : FUNC ID LPAREN parametros RPAREN tipo_retorno
                       | FUNC ID LPAREN parametros RPAREN'''
-    global _current_function, _symbol_table
+    global _current_function, _symbol_table, _retornos_nombrados
     func_name = p[2]
     line = p.lineno(2)
     return_type = p[6] if len(p) == 7 else 'void'
     params = p[4] if p[4] is not None else []
 
     if not _symbol_table.lookup_current_scope(func_name):
-        _symbol_table.insert(Symbol(func_name, 'func', None, 'global', line, return_type=return_type, params=params))
+        record_declaration(Symbol(func_name, 'func', None, 'global', line, return_type=return_type, params=params),
+                           p.lexpos(2))
 
-    _current_function = {'name': func_name, 'return_type': return_type, 'line': line, 'params': params}
+    _current_function = {'name': func_name, 'return_type': return_type, 'line': line, 'params': params,
+                         'retornos_nombrados': _retornos_nombrados}
+    _params_cabecera.clear()
+    _retornos_nombrados = False
     _symbol_table.enter_scope()
 
 def p_bloque(p):
@@ -274,15 +387,18 @@ def p_asignacion(p):
     if p[1] == '*':
         var_name = p[2]
         line = p.lineno(2)
+        lexpos = p.lexpos(2)
     else:
         var_name = p[1]
         line = p.lineno(1)
+        lexpos = p.lexpos(1)
     
     symbol = _symbol_table.lookup(var_name)
     
     if not symbol:
         add_error(f"Error Semántico: Variable '{var_name}' no declarada", line)
         return
+    record_use(symbol, var_name, lexpos)
 
     # VALIDACIÓN DE CONSTANTES
     if symbol.is_const:
@@ -300,6 +416,10 @@ def p_asignacion(p):
                 pass
             elif tipo_variable == 'composite':
                 pass
+            elif tipo_variable in NUMERIC_TYPES and tipo_expresion in NUMERIC_TYPES and \
+                    not (tipo_variable in INTEGER_TYPES and tipo_expresion in FLOAT_TYPES):
+                # Una constante entera (o de otro tipo numérico) se convierte sola; un float a entero no
+                pass
             else:
                  add_error(f"Error Semántico: No se puede asignar tipo '{tipo_expresion}' a variable de tipo '{tipo_variable}'", line)
 
@@ -314,7 +434,7 @@ def p_declaracion_const(p):
         add_error(f"Constante '{const_name}' ya declarada", line)
     else:
         expr_type = 'int' if len(p) == 5 else p[3]
-        _symbol_table.insert(Symbol(const_name, expr_type, None, 'global', line, is_const=True))
+        record_declaration(Symbol(const_name, expr_type, None, 'global', line, is_const=True), p.lexpos(2))
 
 def p_declaracion_var_multiple(p):
     '''declaracion_var_multiple : VAR lista_ids tipo
@@ -324,19 +444,19 @@ def p_declaracion_var_multiple(p):
 
     if p[1] == 'var':
         # Casos: VAR lista_ids tipo o VAR lista_ids tipo ASSIGN lista_expresiones
-        ids = p[2] if isinstance(p[2], list) else [p[2]]
+        ids = p[2]
         var_type = p[3]
         line = p.lineno(1)
 
-        for var_id in ids:
+        for var_id, lexpos in zip(ids, ids.posiciones):
             if var_id != '_':
                 if _symbol_table.lookup_current_scope(var_id):
                     add_error(f"Variable '{var_id}' ya declarada", line)
                 else:
-                    _symbol_table.insert(Symbol(var_id, var_type, None, 'local', line))
+                    record_declaration(Symbol(var_id, var_type, None, 'local', line), lexpos)
     else:
         # Caso: lista_ids DECLARE_ASSIGN lista_expresiones
-        ids = p[1] if isinstance(p[1], list) else [p[1]]
+        ids = p[1]
         line = p.lineno(2)
         
         exprs = p[3] if isinstance(p[3], list) else []
@@ -356,7 +476,7 @@ def p_declaracion_var_multiple(p):
                         inferred_type = 'bool'
                     # ----------------------------------------
                     
-                    _symbol_table.insert(Symbol(var_id, inferred_type, None, 'local', line))
+                    record_declaration(Symbol(var_id, inferred_type, None, 'local', line), ids.posiciones[i])
 
 def p_lista_ids(p):
     '''lista_ids : lista_ids COMMA ID
@@ -364,13 +484,18 @@ def p_lista_ids(p):
                  | ID
                  | UNDERSCORE'''
     if len(p) == 4:  # lista_ids COMMA ID/UNDERSCORE
-        p[0] = p[1] + [p[3]]
+        # Se extiende la lista en su lugar: concatenar copia la lista en cada reducción
+        p[1].append(p[3])
+        p[1].posiciones.append(p.lexpos(3))
+        p[0] = p[1]
     else:  # ID o UNDERSCORE
-        p[0] = [p[1]]
+        p[0] = ListaIds(p[1], p.lexpos(1))
 
 def p_asignacion_multiple(p):
     '''asignacion_multiple : lista_ids ASSIGN lista_expresiones'''
-    pass
+    for var_id, lexpos in zip(p[1], p[1].posiciones):
+        if var_id != '_':
+            record_use(_symbol_table.lookup(var_id), var_id, lexpos)
 
 def p_parametros(p):
     '''parametros : lista_parametros
@@ -381,7 +506,9 @@ def p_lista_parametros(p):
     '''lista_parametros : lista_parametros COMMA parametro
                         | parametro'''
     if len(p) == 4:  
-        p[0] = p[1] + p[3] if p[3] is not None else p[1]
+        if p[3] is not None:
+            p[1].extend(p[3])
+        p[0] = p[1]
     else:  # parametro
         p[0] = p[1] if p[1] is not None else []
 
@@ -399,10 +526,7 @@ def p_parametro(p):
         line = p.lineno(1)
 
         if param_name != '_':
-            if _symbol_table.lookup_current_scope(param_name):
-                add_error(f"Parámetro '{param_name}' ya declarado", line)
-            else:
-                _symbol_table.insert(Symbol(param_name, param_type, None, 'parameter', line))
+            declare_parameter(param_name, param_type, line, p.lexpos(1))
 
         
         p[0] = [param_type]
@@ -412,19 +536,37 @@ def p_parametro(p):
         param_type = p[4]
         line = p.lineno(1)
 
-        for param_name in [param1, param2]:
+        for param_name, lexpos in [(param1, p.lexpos(1)), (param2, p.lexpos(3))]:
             if param_name != '_':
-                if _symbol_table.lookup_current_scope(param_name):
-                    add_error(f"Parámetro '{param_name}' ya declarado", line)
-                else:
-                    _symbol_table.insert(Symbol(param_name, param_type, None, 'parameter', line))
+                declare_parameter(param_name, param_type, line, lexpos)
 
         
         p[0] = [param_type, param_type]
+    elif len(p) == 4:  # ID ELLIPSIS tipo
+        # Parámetro variádico: dentro de la función es un slice y acepta cualquier número de argumentos
+        declare_parameter(p[1], 'unknown', p.lineno(1), p.lexpos(1))
+        p[0] = ['...']
     else:
         
         p[0] = ['unknown']
 
+def declare_parameter(param_name, param_type, line, lexpos):
+    """
+    Registra un parámetro. Los parámetros se reducen antes de abrir el ámbito de la
+    función, así que sólo se comparan con los de la misma cabecera y nunca
+    reemplazan a una variable global con el mismo nombre.
+    """
+    if param_name in _params_cabecera:
+        add_error(f"Parámetro '{param_name}' ya declarado", line)
+        return
+    _params_cabecera.add(param_name)
+    existente = _symbol_table.lookup_current_scope(param_name)
+    if existente is None or existente.scope == 'parameter':
+        record_declaration(Symbol(param_name, param_type, None, 'parameter', line), lexpos)
+    else:
+        # En la segunda fase el parámetro sí se declara y sus usos apuntan a este sitio
+        record_site(Symbol(param_name, param_type, None, 'parameter', line), lexpos)
+
 def p_tipo_retorno(p):
     '''tipo_retorno : tipo
                     | LPAREN lista_tipos RPAREN
@@ -438,13 +580,20 @@ def p_return_statement(p):
     global _current_function
     if _current_function and _current_function['name'] != 'main':
         expected = _current_function.get('return_type', 'void')
-        if len(p) == 2 and expected != 'void':
+        # Con retornos con nombre un return sin valores devuelve esas variables
+        if len(p) == 2 and expected != 'void' and not _current_function.get('retornos_nombrados'):
             add_error(f"Función '{_current_function['name']}' debe retornar valor", p.lineno(1))
 
 def p_lista_retornos_nombrados(p):
     '''lista_retornos_nombrados : lista_retornos_nombrados COMMA ID tipo
                                 | ID tipo'''
-    pass
+    # Los retornos con nombre son variables de la función, igual que los parámetros
+    global _retornos_nombrados
+    _retornos_nombrados = True
+    if len(p) == 3:
+        declare_parameter(p[1], p[2], p.lineno(1), p.lexpos(1))
+    else:
+        declare_parameter(p[3], p[4], p.lineno(3), p.lexpos(3))
 
 def p_lista_tipos(p):
     '''lista_tipos : lista_tipos COMMA tipo
@@ -457,7 +606,7 @@ def p_tipo(p):
             | LBRACKET RBRACKET tipo
             | MAP LBRACKET tipo RBRACKET tipo
             | TIMES tipo'''
-    p[0] = 'int' if len(p) == 2 else 'composite'
+    p[0] = p[1] if len(p) == 2 else 'composite'
 
 def p_sentencias(p):
     '''sentencias : sentencias sentencia
@@ -482,7 +631,7 @@ def p_declaracion_var_corta(p):
     '''declaracion_var_corta : ID DECLARE_ASSIGN lista_expresiones
                              | lista_ids DECLARE_ASSIGN lista_expresiones'''
     global _symbol_table
-    ids = [p[1]] if not isinstance(p[1], list) else p[1]
+    ids = ListaIds(p[1], p.lexpos(1)) if not isinstance(p[1], list) else p[1]
     exprs = p[3] if isinstance(p[3], list) else [p[3]]
     
     line = p.lineno(2)
@@ -500,7 +649,7 @@ def p_declaracion_var_corta(p):
             elif len(ids) == 2 and len(exprs) == 1 and i == 1:
                 inferred_type = 'bool'
 
-            _symbol_table.insert(Symbol(var_id, inferred_type, None, 'local', line))
+            record_declaration(Symbol(var_id, inferred_type, None, 'local', line), ids.posiciones[i])
 
 def p_for_range_decl(p):
     '''for_range_decl : lista_ids DECLARE_ASSIGN RANGE expresion'''
@@ -511,12 +660,13 @@ def p_for_range_decl(p):
     if len(ids) > 0:
         idx_name = ids[0]
         if idx_name != '_':
-            _symbol_table.insert(Symbol(idx_name, 'int', None, 'local', line))
+            record_declaration(Symbol(idx_name, 'int', None, 'local', line), ids.posiciones[0])
             
     if len(ids) > 1:
         val_name = ids[1]
         if val_name != '_':
-            _symbol_table.insert(Symbol(val_name, 'int', None, 'local', line))
+            # No se sigue el tipo de los elementos de slices y mapas
+            record_declaration(Symbol(val_name, 'unknown', None, 'local', line), ids.posiciones[1])
 
 def p_for_statement(p):
     '''for_statement : FOR condicion bloque
@@ -528,6 +678,10 @@ def p_for_statement(p):
     global _symbol_table, _inside_loop
     _inside_loop += 1
     _inside_loop -= 1
+    # for i = range ... y for i, v = range ... asignan variables ya declaradas
+    if len(p) in (7, 9):
+        for n in ((2,) if len(p) == 7 else (2, 4)):
+            record_use(_symbol_table.lookup(p[n]), p[n], p.lexpos(n))
 
 def p_inicializacion(p):
     '''inicializacion : declaracion_var
@@ -540,7 +694,8 @@ def p_incremento(p):
                   | ID INCREMENT
                   | ID DECREMENT
                   | empty'''
-    pass
+    if len(p) == 3:
+        record_use(_symbol_table.lookup(p[1]), p[1], p.lexpos(1))
 
 def p_switch_statement(p):
     '''switch_statement : SWITCH expresion LBRACE casos RBRACE
@@ -569,7 +724,8 @@ def p_casos(p):
     '''casos : casos caso
              | caso'''
     if len(p) == 3:
-        p[0] = p[1] + p[2] 
+        p[1].extend(p[2])
+        p[0] = p[1]
     else:
         p[0] = p[1]
 
@@ -597,7 +753,8 @@ def p_sentencia(p):
                  | ID INCREMENT
                  | ID DECREMENT
                  | empty'''
-    pass
+    if len(p) == 3:
+        record_use(_symbol_table.lookup(p[1]), p[1], p.lexpos(1))
 
 def p_expresion_binaria(p):
     '''expresion : expresion PLUS expresion
@@ -672,6 +829,7 @@ def p_expresion_primaria(p):
             add_error(f"Variable '{p[1]}' no declarada", p.lineno(1))
             p[0] = {'type': 'unknown'}
         else:
+            record_use(symbol, p[1], p.lexpos(1))
             p[0] = {'type': symbol.symbol_type}
     elif p.slice[1].type == 'INT_LITERAL':
         p[0] = {'type': 'int'}
@@ -697,25 +855,57 @@ def p_expresion_llamada(p):
         line = p.lineno(1)
 
         symbol = _symbol_table.lookup(func_name)
+        record_use(symbol, func_name, p.lexpos(1))
         if symbol and symbol.symbol_type == 'func':
-            arg_types = [arg.get('type', 'unknown') for arg in args] if isinstance(args, list) else []
-
-            if len(arg_types) != len(symbol.params):
-                add_error(f"Error Semántico: Función '{func_name}' espera {len(symbol.params)} argumentos, pero se pasaron {len(arg_types)}", line)
-            else:
-                for i, (arg_type, param_type) in enumerate(zip(arg_types, symbol.params)):
-                    if arg_type != 'unknown' and param_type != 'unknown':
-                        if arg_type != param_type:
-                            if not (arg_type in NUMERIC_TYPES and param_type in NUMERIC_TYPES):
-                                add_error(f"Error Semántico: Argumento {i+1} de '{func_name}': se esperaba tipo '{param_type}', pero se recibió '{arg_type}'", line)
-
+            check_call(func_name, symbol.params, args, line)
             p[0] = {'type': symbol.return_type if symbol.return_type else 'void'}
         elif not symbol:
             p[0] = {'type': 'unknown'}
         else:
             p[0] = {'type': 'void'}
     else:
-        p[0] = {'type': 'void'}
+        args = p[5] if len(p) == 7 and p[5] is not None else []
+        p[0] = {'type': qualified_call(p, args, 'void')}
+
+def check_call(func_name, params, args, line):
+    """Comprueba el número y el tipo de los argumentos de una llamada contra los parámetros."""
+    arg_types = [arg.get('type', 'unknown') for arg in args] if isinstance(args, list) else []
+    variadica = bool(params) and params[-1] == '...'
+    fijos = params[:-1] if variadica else params
+
+    if variadica and len(arg_types) < len(fijos):
+        add_error(f"Error Semántico: Función '{func_name}' espera al menos {len(fijos)} argumentos, pero se pasaron {len(arg_types)}", line)
+    elif not variadica and len(arg_types) != len(fijos):
+        add_error(f"Error Semántico: Función '{func_name}' espera {len(fijos)} argumentos, pero se pasaron {len(arg_types)}", line)
+    else:
+        for i, (arg_type, param_type) in enumerate(zip(arg_types, fijos)):
+            if arg_type != 'unknown' and param_type != 'unknown':
+                if arg_type != param_type:
+                    if not (arg_type in NUMERIC_TYPES and param_type in NUMERIC_TYPES):
+                        add_error(f"Error Semántico: Argumento {i+1} de '{func_name}': se esperaba tipo '{param_type}', pero se recibió '{arg_type}'", line)
+
+def qualified_call(p, args, default):
+    """
+    Llamada paquete.Función(...) (p[1] y p[3] de la producción): si el paquete está
+    importado y la función está en el índice de stdlib_go se comprueban los argumentos
+    y se devuelve su tipo de retorno. En otro caso (un paquete o una función que el
+    índice no conoce, o un método) se devuelve default sin comprobar nada.
+    """
+    package_name, func_name = p[1], p[3]
+    symbol = _symbol_table.lookup(package_name)
+    record_use(symbol, package_name, p.lexpos(1))
+    if symbol is None or symbol.symbol_type != 'package':
+        return default
+    firma = stdlib_go.lookup(symbol.value, func_name)
+    if firma is None:
+        return default
+    params, return_type = firma
+    # La función no se declara en el código: su sitio lleva la firma y destino 'externo'
+    line, columna = position_of(p.lexpos(3))
+    _symbol_table.sitios.append((line, columna, columna + len(func_name), func_name, 'externo',
+                                 ('func', symbol.value, False, return_type, tuple(params))))
+    check_call(f'{package_name}.{func_name}', params, args, p.lineno(1))
+    return return_type
 
 def p_expresion_make(p):
     '''expresion : MAKE LPAREN tipo RPAREN
@@ -738,10 +928,11 @@ def p_expresion_delete(p):
 
 def p_expresion_new(p):
     '''expresion : ID DOT ID LPAREN STRING_LITERAL RPAREN'''
-    p[0] = {'type': 'unknown'}
+    p[0] = {'type': qualified_call(p, [{'type': 'string'}], 'unknown')}
 
 def p_expresion_array_acceso(p):
     '''expresion : ID LBRACKET expresion RBRACKET'''
+    record_use(_symbol_table.lookup(p[1]), p[1], p.lexpos(1))
     p[0] = {'type': 'int'}
 
 def p_array_literal(p):
@@ -769,6 +960,7 @@ def p_slice_operacion(p):
                  | ID LBRACKET COLON expresion RBRACKET
                  | ID LBRACKET expresion COLON RBRACKET
                  | ID LBRACKET COLON RBRACKET'''
+    record_use(_symbol_table.lookup(p[1]), p[1], p.lexpos(1))
     p[0] = {'type': 'slice'}
 
 def p_map_literal(p):
@@ -792,7 +984,8 @@ def p_lista_expresiones(p):
     if len(p) == 4:
         prev_list = p[1] if isinstance(p[1], list) else [p[1]]
         expr_type = p[3].get('type', 'unknown') if isinstance(p[3], dict) else 'unknown'
-        p[0] = prev_list + [{'type': expr_type}]
+        prev_list.append({'type': expr_type})
+        p[0] = prev_list
     else:
         expr_type = p[1].get('type', 'unknown') if isinstance(p[1], dict) else 'unknown'
         p[0] = [{'type': expr_type}]
@@ -805,29 +998,213 @@ def p_error(p):
     if p and hasattr(p, 'parser'):
         p.parser.errok()
 
-parser = yacc.yacc()
+# Parser construido la primera vez que se usa, con sus tablas en parsetab_semantico.py
+parser = None
+
+def get_parser():
+    """Devuelve el parser semántico, construyéndolo la primera vez (ver sintactico_go.get_parser)."""
+    global parser
+    if parser is None:
+        parser = yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab_semantico',
+                           debugfile='parser_semantico.out')
+    return parser
 
-def analyze_semantic_string(code_string):
-    global _semantic_errors, _symbol_table, _current_function, _inside_loop
+_SALTO_LINEA = re.compile('\n')
+
+def _parse(code_string, symbol_table, solo_cuerpos=False):
+    """Analiza el código con el parser semántico y devuelve (errores, tabla de símbolos)."""
+    global _semantic_errors, _symbol_table, _current_function, _inside_loop, _solo_cuerpos, _retornos_nombrados
+    global _inicios_linea
     
     _semantic_errors = []
-    _symbol_table = SymbolTable()
+    _symbol_table = symbol_table
     _current_function = None
     _inside_loop = 0
+    _solo_cuerpos = solo_cuerpos
+    _params_cabecera.clear()
+    _retornos_nombrados = False
+    _inicios_linea = [0]
+    _inicios_linea.extend(salto.end() for salto in _SALTO_LINEA.finditer(code_string))
     
-    new_lexer = lex.lex(module=lexico_go)
+    new_lexer = lexico_go.get_lexer()
     
     try:
-        parser.parse(code_string, lexer=new_lexer)
+        get_parser().parse(code_string, lexer=new_lexer)
     except Exception as e:
         _semantic_errors.append({
             'message': f"Error crítico: {str(e)}",
             'line': 0
         })
+    finally:
+        _solo_cuerpos = False
+    
+    return _semantic_errors, _symbol_table
+
+def collect_declarations(code_string, externos=None):
+    """
+    Primera fase: analiza el código con los cuerpos de las funciones vacíos.
+    Devuelve (índice global, errores de las declaraciones, tabla de símbolos, funciones),
+    donde funciones son los fragmentos de paralelo_go.function_units.
+    El índice tiene las funciones (con params y return_type), variables globales y
+    constantes; no incluye los parámetros, que sólo son visibles en su función.
+    Con externos (las declaraciones de otros archivos del paquete) los nombres que el
+    archivo no declara se buscan ahí, y tabla.referencias anota los que se consultaron.
+    """
+    fronteras, cuerpos = paralelo_go.scan_declarations(code_string)
+    if externos is None:
+        tabla = SymbolTable()
+    else:
+        tabla = SymbolTable(MappingProxyType(externos))
+        tabla.referencias = set()
+    errores, tabla = _parse(paralelo_go.strip_bodies(code_string, cuerpos), tabla)
+    indice = {nombre: simbolo for nombre, simbolo in tabla.scopes[tabla.base_level].items()
+              if simbolo.scope != 'parameter'}
+    return indice, errores, tabla, paralelo_go.function_units(code_string, fronteras, cuerpos)
+
+def fingerprint(simbolo):
+    """Lo que la revisión de un cuerpo usa de un símbolo global (None si no existe)."""
+    if simbolo is None:
+        return None
+    return (simbolo.symbol_type, simbolo.scope, simbolo.is_const, simbolo.return_type, tuple(simbolo.params))
+
+def _check_bodies(funciones, indice):
+    """
+    Segunda fase: revisa cada función por separado contra el índice global. Así una
+    construcción que la gramática no reconoce sólo deja sin revisar su propia función
+    y el resultado no depende de cómo se repartan las funciones entre procesos.
+    Devuelve, por función, (errores con la línea relativa al fragmento, huellas, sitios),
+    donde huellas tiene la huella de cada nombre global que la función consultó y
+    sitios son los de record_declaration y record_use, también relativos al fragmento.
+    """
+    resultados = []
+    for texto, _ in funciones:
+        tabla = SymbolTable(MappingProxyType(indice))
+        tabla.referencias = set()
+        errores, _ = _parse(texto, tabla, solo_cuerpos=True)
+        huellas = {nombre: fingerprint(indice.get(nombre)) for nombre in tabla.referencias}
+        resultados.append((errores, huellas, tabla.sitios))
+    return resultados
+
+class CacheFunciones:
+    """
+    Resultados de la segunda fase por función, para re-analizar un documento que se
+    está editando. Cada entrada se indexa por el hash del texto de la función y guarda
+    sus errores, sus sitios y la huella de los símbolos globales que consultó; sirve mientras
+    ninguno de esos símbolos cambie de tipo o de firma (o aparezca o desaparezca).
+    Cada documento usa su propia caché: tras cada análisis sólo quedan sus funciones.
+    """
+
+    def __init__(self):
+        self.entradas = {}
+        self.lock = threading.Lock()
+        # Funciones revisadas y reutilizadas en el último análisis
+        self.revisadas = 0
+        self.reutilizadas = 0
+
+    @staticmethod
+    def key(texto):
+        return hashlib.sha256(texto.encode('utf-8')).digest()
+
+    def get(self, clave, indice):
+        resultado = self.entradas.get(clave)
+        if resultado is None:
+            return None
+        for nombre, huella in resultado[1].items():
+            if fingerprint(indice.get(nombre)) != huella:
+                return None
+        return resultado
+
+def _merge_errors(declaraciones, errores_cuerpos, funciones):
+    """
+    Junta los errores de ambas fases en el orden del análisis de una pasada: los de
+    cada cabecera o declaración global antes que los del cuerpo que le sigue.
+    """
+    # Línea donde empieza cada función (la línea 2 de su fragmento)
+    inicios = [desplazamiento + 2 for _, desplazamiento in funciones]
+    # Cada error de un cuerpo va con la última función que empieza en o antes de su línea
+    # (sorted es estable: dentro de un cuerpo se conserva el orden en que se reportaron)
+    por_cuerpo = sorted(((bisect_right(inicios, error['line']) - 1, error) for error in errores_cuerpos if error['line']),
+                        key=lambda par: par[0])
+    errores = []
+    i = 0
+    for error in declaraciones:
+        if not error['line']:
+            continue
+        # Una declaración en la línea L va antes de las funciones que empiezan en L o después
+        antes_de = bisect_left(inicios, error['line'])
+        while i < len(por_cuerpo) and por_cuerpo[i][0] < antes_de:
+            errores.append(por_cuerpo[i][1])
+            i += 1
+        errores.append(error)
+    errores.extend(error for _, error in por_cuerpo[i:])
+    # Los errores críticos (línea 0) van al final
+    errores.extend(error for error in declaraciones + errores_cuerpos if not error['line'])
+    return errores
+
+def check_pending(funciones, indice, procesos):
+    """Revisa las funciones, en el pool de procesos si procesos > 1 y suman bastante código."""
+    if procesos > 1 and len(funciones) > 1 and sum(len(texto) for texto, _ in funciones) >= paralelo_go.MIN_BYTES:
+        grupos = paralelo_go.group_units(funciones, procesos * paralelo_go.TROZOS_POR_PROCESO)
+        resultados = []
+        for parcial in paralelo_go.get_executor(procesos).map(_check_bodies, grupos, repeat(indice)):
+            resultados.extend(parcial)
+        return resultados
+    return _check_bodies(funciones, indice)
+
+def analyze_semantic_string(code_string, procesos=1, cache=None):
+    """
+    Análisis semántico en dos fases. La primera reúne las declaraciones de nivel
+    superior en un índice global; la segunda revisa el cuerpo de cada función contra
+    ese índice, así que las funciones y globales declaradas más abajo se resuelven.
+    Con procesos > 1 y un archivo grande, los cuerpos se revisan en un pool de procesos.
+    Con una CacheFunciones sólo se revisan las funciones cuyo texto cambió o que usan
+    un símbolo global cuya declaración cambió; el resultado es el mismo que sin caché.
+    """
+    indice, declaraciones, tabla, funciones = collect_declarations(code_string)
+    
+    if cache is None:
+        resultados = check_pending(funciones, indice, procesos)
+    else:
+        with cache.lock:
+            claves = [cache.key(texto) for texto, _ in funciones]
+            resultados = [cache.get(clave, indice) for clave in claves]
+            pendientes = [i for i, resultado in enumerate(resultados) if resultado is None]
+            revisados = check_pending([funciones[i] for i in pendientes], indice, procesos)
+            for i, resultado in zip(pendientes, revisados):
+                resultados[i] = resultado
+            cache.entradas = dict(zip(claves, resultados))
+            cache.revisadas = len(pendientes)
+            cache.reutilizadas = len(funciones) - len(pendientes)
+    
+    return build_semantic_result(declaraciones, tabla, funciones, resultados)
+
+def build_semantic_result(declaraciones, tabla, funciones, resultados):
+    """
+    Resultado del análisis a partir de la primera fase (errores de las declaraciones y
+    tabla de símbolos) y de los resultados de _check_bodies de cada función.
+    """
+    # Los errores guardados tienen la línea relativa a la función; se copian con la actual
+    errores_cuerpos = [dict(error, line=error['line'] + desplazamiento) if error['line'] else dict(error)
+                       for (errores, _, _), (_, desplazamiento) in zip(resultados, funciones)
+                       for error in errores]
+    
+    with subfase('tabla_simbolos'):
+        tabla_simbolos = tabla.to_dict()
+    
+    # Los sitios se guardan por bloques con el desplazamiento de línea de cada función;
+    # posiciones_go.IndicePosiciones los junta y resuelve sólo si se consultan
+    propios = tabla.scopes[tabla.base_level]
+    sitios = {
+        'globales': {nombre: simbolo.sitio for nombre, simbolo in propios.items()
+                     if simbolo.scope != 'parameter' and simbolo.sitio is not None},
+        'bloques': [(0, tabla.sitios)] + [(desplazamiento, sitios_funcion) for (_, _, sitios_funcion), (_, desplazamiento)
+                                          in zip(resultados, funciones)],
+    }
     
     return {
-        'errors': _semantic_errors,
-        'symbol_table': _symbol_table.to_dict()
+        'errors': _merge_errors(declaraciones, errores_cuerpos, funciones),
+        'symbol_table': tabla_simbolos,
+        'sitios': sitios
     }
 
 def get_git_username():
@@ -840,7 +1217,8 @@ def get_git_username():
     except:
         return 'usergit'
 
-def analyze_file(filename):
+def analyze_file(filename, paralelo=False):
+    """Analiza semánticamente un archivo de código Go (con paralelo=True, revisando los cuerpos en varios procesos)."""
     try:
         with open(filename, 'r', encoding='utf-8') as file:
             data = file.read()
@@ -848,7 +1226,11 @@ def analyze_file(filename):
         print(f"Error: El archivo '{filename}' no fue encontrado.")
         return
     
-    result = analyze_semantic_string(data)
+    if paralelo:
+        result = analyze_semantic_string(data, paralelo_go.PROCESOS)
+        paralelo_go.shutdown_executor()
+    else:
+        result = analyze_semantic_string(data)
     
     logs_dir = 'logs'
     if not os.path.exists(logs_dir):
@@ -903,8 +1285,8 @@ def analyze_file(filename):
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Uso: python semantico_go.py <archivo.go>")
+        print("Uso: python semantico_go.py <archivo.go> [--paralelo]")
         sys.exit(1)
     
     filename = sys.argv[1]
-    analyze_file(filename)
\ No newline at end of file
+    analyze_file(filename, '--paralelo' in sys.argv[2:])
\ No newline at end of file
@@ -0,0 +1,487 @@
+"""
+Sesiones de análisis en vivo del Analizador de Código Go
+El editor abre una sesión con su código y después sólo envía lo que edita,
+numerado por revisión. La sesión conserva el texto y el estado incremental de
+cada fase (CacheTokens, PuntosControl y CacheFunciones) y responde sólo los tokens, errores
+y símbolos que cambiaron desde la última revisión que devolvió, en lugar del
+resultado completo. Una revisión más vieja que la última aplicada se rechaza, y
+el análisis de una revisión que ya fue reemplazada por otra no se envía.
+Cada análisis corre con el presupuesto de limites_go (en un worker aislado, que
+guarda el estado incremental de las sesiones que analiza).
+Con varios procesos (workers de gunicorn) el texto, la revisión y lo último que
+se envió de cada sesión se guardan en ANALYZER_SESIONES_DIR, así que cualquier
+proceso puede continuar una sesión.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import os
+import pickle
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows no dispone de fcntl: las sesiones quedan en la memoria del proceso
+    fcntl = None
+
+from analisis_go import build_response, cache_resultados
+from limites_go import build_budget_response, call_with_budget, describe_limit
+from lexico_go import CacheTokens, analyze_code_string, common_prefix, common_suffix
+from posiciones_go import IndicePosiciones, cache_posiciones
+from semantico_go import CacheFunciones, analyze_semantic_string
+from sintactico_go import PuntosControl, analyze_syntax_string
+
+# Configuración de las sesiones (modificable por variables de entorno)
+MAX_SESIONES = int(os.environ.get('ANALYZER_MAX_SESIONES', '64'))
+TTL_SESIONES = int(os.environ.get('ANALYZER_TTL_SESIONES', '600'))
+MAX_BYTES_SESION = int(os.environ.get('ANALYZER_MAX_BYTES_SESION', str(1024 * 1024)))
+# Directorio compartido por los procesos de la API ('' = sesiones en la memoria de cada proceso)
+SESIONES_DIR = os.environ.get('ANALYZER_SESIONES_DIR', '') if fcntl is not None else ''
+
+# Identificador de una sesión (uuid4().hex); también da nombre a sus archivos
+ID_SESION = re.compile(r'[0-9a-f]{32}')
+
+# Listas del resultado que se envían como tramos: (fase, clave) en el formato de /api/analyze
+LISTAS = (
+    ('lexico', 'tokens'),
+    ('lexico', 'errores'),
+    ('sintactico', 'errores'),
+    ('semantico', 'errores'),
+    ('semantico', 'tabla_simbolos'),
+)
+
+
+class RevisionInvalida(Exception):
+    """La revisión no se puede aplicar; el cliente debe reenviar el código completo."""
+
+    def __init__(self, mensaje, revision):
+        super().__init__(mensaje)
+        self.revision = revision
+
+
+class SesionDemasiadoGrande(Exception):
+    """El código de la sesión supera ANALYZER_MAX_BYTES_SESION."""
+    pass
+
+
+class SesionNoEncontrada(Exception):
+    """La sesión se cerró o expiró (en otro proceso) mientras se usaba."""
+    pass
+
+
+# ============================================================================
+# TRAMOS
+# ============================================================================
+
+def _same_shifted(anterior, nuevo, lineas):
+    """Si nuevo es anterior con la línea desplazada (la línea 0, fin de archivo, no se desplaza)."""
+    linea = anterior.get('line')
+    if not lineas or not linea:
+        return anterior == nuevo
+    return nuevo.get('line') == linea + lineas and anterior == dict(nuevo, line=linea)
+
+
+def splice(anterior, nuevo, lineas):
+    """
+    Tramo que cambió entre dos listas de tokens, errores o símbolos: nuevo es
+    anterior[:inicio] + nuevos + anterior[fin:], con la línea de los elementos de
+    anterior[fin:] desplazada en lineas (lo que se insertó o borró más arriba).
+    """
+    limite = min(len(anterior), len(nuevo))
+    inicio = 0
+    while inicio < limite and anterior[inicio] == nuevo[inicio]:
+        inicio += 1
+    fin, fin_nuevo = len(anterior), len(nuevo)
+    while fin > inicio and fin_nuevo > inicio and _same_shifted(anterior[fin - 1], nuevo[fin_nuevo - 1], lineas):
+        fin -= 1
+        fin_nuevo -= 1
+    return {'inicio': inicio, 'fin': fin, 'nuevos': nuevo[inicio:fin_nuevo]}
+
+
+def apply_splice(anterior, tramo, lineas):
+    """Inverso de splice, como lo aplica el cliente."""
+    sufijo = anterior[tramo['fin']:]
+    if lineas:
+        sufijo = [dict(elemento, line=elemento['line'] + lineas) if elemento.get('line') else elemento
+                  for elemento in sufijo]
+    return anterior[:tramo['inicio']] + tramo['nuevos'] + sufijo
+
+
+def flatten_symbols(tabla_simbolos):
+    """Símbolos de todos los ámbitos en una sola lista, cada uno con su 'level'."""
+    return [dict(simbolo, level=ambito['level']) for ambito in tabla_simbolos for simbolo in ambito['symbols']]
+
+
+def group_symbols(simbolos):
+    """Inverso de flatten_symbols: la tabla de símbolos por ámbitos de /api/analyze."""
+    tabla = []
+    for simbolo in simbolos:
+        simbolo = dict(simbolo)
+        nivel = simbolo.pop('level')
+        if not tabla or tabla[-1]['level'] != nivel:
+            tabla.append({'level': nivel, 'symbols': []})
+        tabla[-1]['symbols'].append(simbolo)
+    return tabla
+
+
+def _lists(resultado):
+    """Las listas de LISTAS de un resultado, con la tabla de símbolos aplanada."""
+    listas = {}
+    for fase, clave in LISTAS:
+        valor = resultado[fase][clave]
+        listas[fase, clave] = flatten_symbols(valor) if clave == 'tabla_simbolos' else valor
+    return listas
+
+
+def apply_diff(resultado, diferencia):
+    """
+    Resultado (en el formato de /api/analyze) de la revisión de la diferencia, a
+    partir del resultado de su revisión base. Es lo que hace el cliente con cada
+    respuesta de una edición.
+    """
+    listas = _lists(resultado)
+    nuevo = {fase: {} for fase, _ in LISTAS}
+    for fase, clave in LISTAS:
+        valor = apply_splice(listas[fase, clave], diferencia[fase][clave], diferencia['lineas'])
+        nuevo[fase][clave] = group_symbols(valor) if clave == 'tabla_simbolos' else valor
+    return nuevo
+
+
+def text_change(anterior, nuevo):
+    """
+    La edición entre dos textos como un solo reemplazo {'desde', 'hasta', 'texto'},
+    con las posiciones en unidades UTF-16 como las del editor del navegador.
+    """
+    desde = common_prefix(anterior, nuevo)
+    sufijo = common_suffix(anterior, nuevo, min(len(anterior), len(nuevo)) - desde)
+    return {'desde': _units(anterior, desde), 'hasta': _units(anterior, len(anterior) - sufijo),
+            'texto': nuevo[desde:len(nuevo) - sufijo]}
+
+
+def _units(texto, indice):
+    """Posición en unidades UTF-16 del índice del texto."""
+    if texto.isascii():
+        return indice
+    return len(texto[:indice].encode('utf-16-le')) // 2
+
+
+def _index(texto, unidades):
+    """Índice del texto de una posición en unidades UTF-16."""
+    if texto.isascii():
+        return unidades
+    return len(texto.encode('utf-16-le')[:2 * unidades].decode('utf-16-le', 'ignore'))
+
+
+# ============================================================================
+# ANÁLISIS
+# ============================================================================
+
+# Estado incremental (CacheTokens, PuntosControl, CacheFunciones) de las últimas
+# sesiones analizadas en este proceso: un worker aislado o, sin aislamiento, la API
+_estados = OrderedDict()
+
+
+def analyze_revision(sesion_id, texto):
+    """
+    Analiza el texto de una sesión con su estado incremental en este proceso (uno
+    nuevo si es la primera vez que la analiza). Devuelve (resultado de /api/analyze,
+    sitios del semántico). Si el análisis se interrumpe, el estado se descarta.
+    """
+    tokens, puntos, cache = _estados.pop(sesion_id, None) or (CacheTokens(), PuntosControl(), CacheFunciones())
+    lexico = analyze_code_string(texto, cache=tokens)
+    sintactico = analyze_syntax_string(texto, puntos=puntos)
+    semantico = analyze_semantic_string(texto, cache=cache)
+    _estados[sesion_id] = tokens, puntos, cache
+    while len(_estados) > MAX_SESIONES:
+        _estados.popitem(last=False)
+    return build_response(lexico, sintactico, semantico), semantico['sitios']
+
+
+# ============================================================================
+# SESIONES
+# ============================================================================
+
+class Sesion:
+    """
+    Un documento del editor: su texto en la última revisión aplicada y las listas
+    del último resultado enviado, contra las que se calcula la diferencia de la
+    siguiente respuesta.
+    Con un directorio, el texto y lo enviado se guardan en sus archivos ('texto' y
+    'enviado') y se vuelven a leer, bajo el lock del archivo 'lock', cuando otro
+    proceso los cambió.
+    """
+
+    def __init__(self, code, sesion_id=None, directorio=''):
+        self.id = sesion_id or uuid.uuid4().hex
+        self.directorio = directorio
+        self.texto = code
+        self.revision = 0
+        self.enviado = None
+        self.revision_enviada = None
+        self.lineas_enviadas = 0
+        self.usada = time.time()
+        self.lock = threading.Lock()
+        # Versión (inodo, mtime) de cada archivo que tiene cargada este proceso
+        self.versiones = {}
+
+    def path(self, parte):
+        return os.path.join(self.directorio, f'{self.id}.{parte}')
+
+    def _state(self, parte):
+        if parte == 'texto':
+            return self.texto, self.revision
+        return self.enviado, self.revision_enviada, self.lineas_enviadas
+
+    def _restore(self, parte, estado):
+        if parte == 'texto':
+            self.texto, self.revision = estado
+        else:
+            self.enviado, self.revision_enviada, self.lineas_enviadas = estado
+
+    def _load(self):
+        """Relee los archivos de la sesión que cambiaron desde la última vez que este proceso los vio."""
+        for parte in ('texto', 'enviado'):
+            try:
+                info = os.stat(self.path(parte))
+            except FileNotFoundError:
+                if parte == 'texto':
+                    raise SesionNoEncontrada(f"La sesión {self.id} se cerró o expiró")
+                continue
+            version = (info.st_ino, info.st_mtime_ns)
+            if self.versiones.get(parte) != version:
+                with open(self.path(parte), 'rb') as archivo:
+                    self._restore(parte, pickle.load(archivo))
+                self.versiones[parte] = version
+
+    def save(self, parte):
+        """Guarda una parte del estado ('texto' o 'enviado') en su archivo; sin directorio no hace nada."""
+        if not self.directorio:
+            return
+        temporal = self.path(f'{parte}.{os.getpid()}.tmp')
+        with open(temporal, 'wb') as archivo:
+            pickle.dump(self._state(parte), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, self.path(parte))
+        info = os.stat(self.path(parte))
+        self.versiones[parte] = (info.st_ino, info.st_mtime_ns)
+
+    @contextmanager
+    def locked(self):
+        """
+        Acceso exclusivo a la sesión. Con un directorio, también entre procesos (flock)
+        y con el estado ya releído de sus archivos.
+        """
+        with self.lock:
+            if not self.directorio:
+                yield self
+                return
+            with open(self.path('lock'), 'ab') as cerrojo:
+                fcntl.flock(cerrojo, fcntl.LOCK_EX)
+                self._load()
+                yield self
+
+    def apply(self, revision, cambios=None, code=None):
+        """
+        Aplica la revisión: el código completo o los cambios {'desde', 'hasta', 'texto'}
+        (posiciones UTF-16 sobre el texto de la revisión anterior, en orden). Lanza
+        RevisionInvalida si ya se aplicó una revisión igual o más nueva o si faltan las
+        anteriores a unos cambios.
+        """
+        with self.locked():
+            if revision <= self.revision:
+                raise RevisionInvalida(f"La revisión {revision} es anterior a la actual", self.revision)
+            if code is None and revision != self.revision + 1:
+                raise RevisionInvalida(f"Faltan las revisiones anteriores a la {revision}", self.revision)
+            texto = self.texto if code is None else code
+            for cambio in cambios or ():
+                desde, hasta = _index(texto, cambio['desde']), _index(texto, cambio['hasta'])
+                if not 0 <= desde <= hasta <= len(texto):
+                    raise RevisionInvalida(f"Cambio fuera del texto en la revisión {revision}", self.revision)
+                texto = texto[:desde] + cambio['texto'] + texto[hasta:]
+            if len(texto.encode('utf-8')) > MAX_BYTES_SESION:
+                raise SesionDemasiadoGrande(f"El código supera los {MAX_BYTES_SESION} bytes de una sesión")
+            self.texto = texto
+            self.revision = revision
+            self.usada = time.time()
+            self.save('texto')
+
+    def analyze(self, revision):
+        """
+        Analiza la revisión y devuelve la diferencia con el último resultado enviado,
+        o None si mientras tanto llegó una revisión más nueva (la respuesta se descarta).
+        Si el análisis supera su presupuesto devuelve {'revision', 'incompleto'} (o, si
+        aún no se envió ningún resultado, el de build_budget_response con 'sesion') y
+        la siguiente diferencia se calcula contra el último resultado enviado.
+        """
+        with self.locked():
+            if self.revision != revision:
+                return None
+            texto = self.texto
+        ejecucion = call_with_budget(analyze_revision, (self.id, texto))
+        limite = ejecucion['limite']
+        if limite is not None:
+            incompleto = {'fase': limite['fase'], 'motivo': limite['motivo'], 'mensaje': describe_limit(limite)}
+            with self.locked():
+                if self.revision != revision:
+                    return None
+                if self.enviado is None:
+                    return dict(build_budget_response({'resultados': {}, 'limite': limite}),
+                                sesion=self.id, revision=revision)
+            return {'revision': revision, 'incompleto': incompleto}
+        resultado, sitios = ejecucion['resultado']
+        # Con la clave el editor consulta posiciones (/api/hover...) como tras /api/analyze
+        clave = cache_resultados.key(texto)
+        cache_posiciones.put(clave, IndicePosiciones(sitios))
+
+        with self.locked():
+            if self.revision != revision:
+                return None
+            listas = _lists(resultado)
+            lineas = texto.count('\n')
+            if self.enviado is None:
+                respuesta = dict(resultado, sesion=self.id)
+            else:
+                desplazamiento = lineas - self.lineas_enviadas
+                respuesta = {'base': self.revision_enviada, 'lineas': desplazamiento}
+                for fase, lista in LISTAS:
+                    tramo = splice(self.enviado[fase, lista], listas[fase, lista], desplazamiento)
+                    respuesta.setdefault(fase, {})[lista] = tramo
+            self.enviado, self.revision_enviada, self.lineas_enviadas = listas, revision, lineas
+            self.save('enviado')
+        respuesta.update(revision=revision, clave=clave)
+        return respuesta
+
+
+class Sesiones:
+    """
+    Sesiones abiertas; se cierran tras TTL_SESIONES segundos sin uso.
+    Sin directorio viven en la memoria del proceso. Con directorio, sus archivos son
+    la fuente de verdad (la última escritura marca su uso) y el proceso sólo conserva
+    sus últimas MAX_SESIONES sesiones usadas, con su estado incremental.
+    """
+
+    def __init__(self, maximo=MAX_SESIONES, ttl=TTL_SESIONES, directorio=SESIONES_DIR):
+        self.maximo = maximo
+        self.ttl = ttl
+        self.directorio = directorio
+        self.sesiones = OrderedDict()
+        self.lock = threading.Lock()
+
+    def open(self, code):
+        """
+        Crea una sesión y devuelve (sesión, resultado completo de la revisión 0). Si el
+        análisis lanza una excepción (por ejemplo PoolSaturado), la sesión se cierra.
+        """
+        if len(code.encode('utf-8')) > MAX_BYTES_SESION:
+            raise SesionDemasiadoGrande(f"El código supera los {MAX_BYTES_SESION} bytes de una sesión")
+        if self.directorio:
+            os.makedirs(self.directorio, exist_ok=True)
+        sesion = Sesion(code, directorio=self.directorio)
+        sesion.save('texto')
+        with self.lock:
+            self._limpiar()
+            self.sesiones[sesion.id] = sesion
+            # Sin espacio se cierra la sesión usada hace más tiempo
+            while len(self.sesiones) > self.maximo:
+                self.sesiones.popitem(last=False)
+        if self.directorio:
+            self._limpiar_directorio()
+        try:
+            return sesion, sesion.analyze(0)
+        except BaseException:
+            # Sin el primer resultado el cliente no conoce la sesión: no debe quedar abierta
+            self.close(sesion.id)
+            raise
+
+    def get(self, sesion_id):
+        with self.lock:
+            self._limpiar()
+            sesion = self.sesiones.get(sesion_id)
+            if sesion is not None:
+                self.sesiones.move_to_end(sesion_id)
+            if not self.directorio:
+                return sesion
+            # La sesión pudo abrirse, usarse o cerrarse en otro proceso
+            usada = self._used(sesion_id)
+            if usada is None or usada < time.time() - self.ttl:
+                self.sesiones.pop(sesion_id, None)
+                if usada is not None:
+                    self._remove(sesion_id)
+                return None
+            if sesion is None:
+                sesion = Sesion(None, sesion_id, self.directorio)
+                self.sesiones[sesion_id] = sesion
+                while len(self.sesiones) > self.maximo:
+                    self.sesiones.popitem(last=False)
+            return sesion
+
+    def close(self, sesion_id):
+        with self.lock:
+            cerrada = self.sesiones.pop(sesion_id, None) is not None
+            if self.directorio:
+                cerrada = self._used(sesion_id) is not None
+                self._remove(sesion_id)
+            return cerrada
+
+    def _limpiar(self):
+        if self.directorio:
+            return
+        limite = time.time() - self.ttl
+        expiradas = [sesion_id for sesion_id, sesion in self.sesiones.items() if sesion.usada < limite]
+        for sesion_id in expiradas:
+            del self.sesiones[sesion_id]
+
+    def _used(self, sesion_id):
+        """Última escritura de los archivos de la sesión, o None si no existe."""
+        if not ID_SESION.fullmatch(sesion_id):
+            return None
+        tiempos = []
+        for parte in ('texto', 'enviado'):
+            try:
+                tiempos.append(os.stat(os.path.join(self.directorio, f'{sesion_id}.{parte}')).st_mtime)
+            except FileNotFoundError:
+                if parte == 'texto':
+                    return None
+        return max(tiempos)
+
+    def _remove(self, sesion_id):
+        for parte in ('texto', 'enviado', 'lock'):
+            try:
+                os.remove(os.path.join(self.directorio, f'{sesion_id}.{parte}'))
+            except FileNotFoundError:
+                pass
+
+    def _limpiar_directorio(self):
+        """
+        Cierra las sesiones del directorio expiradas y, sin espacio, las usadas hace más
+        tiempo. También borra los archivos viejos de sesiones sin texto (cerradas en
+        medio de un análisis que después guardó lo enviado).
+        """
+        usadas = []
+        limite = time.time() - self.ttl
+        for nombre in os.listdir(self.directorio):
+            sesion_id, _, parte = nombre.partition('.')
+            if parte == 'texto':
+                usada = self._used(sesion_id)
+                if usada is not None:
+                    usadas.append((usada, sesion_id))
+            elif not os.path.exists(os.path.join(self.directorio, f'{sesion_id}.texto')):
+                try:
+                    if os.stat(os.path.join(self.directorio, nombre)).st_mtime < limite:
+                        os.remove(os.path.join(self.directorio, nombre))
+                except FileNotFoundError:
+                    pass
+        usadas.sort()
+        sobrantes = len(usadas) - self.maximo
+        for i, (usada, sesion_id) in enumerate(usadas):
+            if i < sobrantes or usada < limite:
+                self._remove(sesion_id)
+
+
+sesiones = Sesiones()
@@ -13,9 +13,11 @@ import ply.lex as lex
 import lexico_go
 from lexico_go import tokens
 from datetime import datetime
+from bisect import bisect_right
 import sys
 import os
 import subprocess
+import threading
 
 # Precedencia de operadores
 precedence = (
@@ -453,21 +455,41 @@ def p_error(p):
             parser.errors_list.append(error_obj)
 
 
-# Construir el parser
-parser = yacc.yacc()
+# Parser construido la primera vez que se usa (ver get_parser)
+parser = None
+
+def get_parser():
+    """
+    Devuelve el parser sintáctico, construyéndolo la primera vez.
+    Cada parser tiene su propio módulo de tablas: con un parsetab.py compartido cada
+    parser sobrescribía las tablas del otro y las tablas LALR se regeneraban en cada
+    arranque. Mientras la gramática no cambie, las tablas se leen de parsetab_sintactico.py.
+    """
+    global parser
+    if parser is None:
+        parser = yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab_sintactico',
+                           debugfile='parser_sintactico.out')
+    return parser
 
 # ============================================================================
 # Para usar en API REST
 # ============================================================================
 
-def analyze_syntax_string(code_string):
+def analyze_syntax_string(code_string, puntos=None):
     """
     Analiza sintácticamente código Go recibido como string (para API).
+    Con unos PuntosControl del mismo documento sólo se vuelve a analizar la parte
+    afectada por la última edición; el resultado es el mismo.
     """
+    if puntos is not None:
+        with puntos.lock:
+            return {'errors': [dict(error) for error in _analyze_incremental(code_string, puntos)]}
+    
     # Crear nuevo lexer
-    new_lexer = lex.lex(module=lexico_go)
+    new_lexer = lexico_go.get_lexer()
     
     # Inicializar lista de errores
+    get_parser()
     parser.errors_list = []
     
     # Parsear
@@ -484,6 +506,208 @@ def analyze_syntax_string(code_string):
         'errors': parser.errors_list
     }
 
+# ============================================================================
+# ANÁLISIS INCREMENTAL CON PUNTOS DE CONTROL
+# ============================================================================
+
+_APERTURAS = frozenset(('LPAREN', 'LBRACE', 'LBRACKET'))
+_CIERRES = frozenset(('RPAREN', 'RBRACE', 'RBRACKET'))
+_DECLARACIONES = frozenset(('FUNC', 'VAR', 'CONST', 'TYPE'))
+
+
+class PuntosControl:
+    """
+    Estado del análisis sintáctico de un documento que se edita. Guarda un punto de
+    control al inicio de cada declaración de nivel superior: (posición, línea, pila de
+    estados LR, errores reportados hasta ahí). Tras una edición el análisis se retoma
+    desde el último punto antes del cambio y se detiene en el primer punto posterior
+    cuya pila coincide con la del análisis anterior; el resto se reutiliza.
+    Cada documento usa sus propios PuntosControl.
+    """
+
+    def __init__(self):
+        self.code = None
+        self.puntos = []
+        self.posiciones = []
+        self.errores = []
+        # Posiciones desde las que el lexer leyó hasta el final del archivo (ver _drive)
+        self.contaminados = []
+        self.lock = threading.Lock()
+        # Bytes que se volvieron a analizar en el último análisis
+        self.reanalizados = 0
+
+
+def _drive(code, inicio, linea, pila, errores, puntos, contaminados, sincronizar=None):
+    """
+    Ejecuta el autómata LR con las tablas de get_parser() desde la posición 'inicio'
+    (en la línea 'linea') y la pila de estados 'pila'. Reporta los errores igual que
+    parser.parse con p_error: el token inesperado se descarta y el análisis sigue en
+    el mismo estado; al final del archivo se detiene. Añade a 'puntos' un punto de
+    control por cada declaración de nivel superior; si sincronizar(punto) devuelve
+    True se detiene ahí y lo devuelve (None si llegó al final).
+    Una cadena o un comentario sin cerrar hace que el lexer lea hasta el final del
+    archivo, así que los puntos posteriores dependen de lo que venga después y no
+    sirven para retomar: se añade a 'contaminados' una posición en o antes de cada uno.
+    """
+    get_parser()
+    acciones = parser.action
+    saltos = parser.goto
+    producciones = parser.productions
+    por_defecto = parser.defaulted_states
+
+    lexer = lexico_go.get_lexer()
+    lexer.input(code)
+    lexer.lexpos = inicio
+    lexer.lineno = linea
+    lexer.errors_list = []
+    previo = None
+
+    pila = list(pila)
+    estado = pila[-1]
+    profundidad = 0
+    token = None
+    tipo = None
+    punto = (inicio, linea, tuple(pila), len(errores))
+    puntos.append(punto)
+    if sincronizar and sincronizar(punto):
+        return punto
+    while True:
+        if estado in por_defecto:
+            accion = por_defecto[estado]
+        else:
+            if tipo is None:
+                token = lexer.token()
+                if lexer.errors_list:
+                    # Una comilla ilegal es una cadena sin cerrar
+                    if any(error['char'] == '"' for error in lexer.errors_list):
+                        contaminados.append(previo.lexpos if previo is not None else inicio)
+                    lexer.errors_list = []
+                previo = token
+                if token is None:
+                    tipo = '$end'
+                else:
+                    tipo = token.type
+                    if tipo == 'DIVIDE' and code.startswith('*', token.lexpos + 1):
+                        # '/' seguido de '*' es un comentario sin cerrar
+                        contaminados.append(token.lexpos)
+                    elif tipo in _APERTURAS:
+                        profundidad += 1
+                    elif tipo in _CIERRES:
+                        profundidad = max(0, profundidad - 1)
+                    elif (tipo in _DECLARACIONES and profundidad == 0 and token.lexpos != inicio
+                          and code[token.lexpos - 1] == '\n'):
+                        # Las pilas iguales se comparten para que los puntos ocupen poco
+                        pila_punto = tuple(pila)
+                        if pila_punto == puntos[-1][2]:
+                            pila_punto = puntos[-1][2]
+                        punto = (token.lexpos, token.lineno, pila_punto, len(errores))
+                        puntos.append(punto)
+                        if sincronizar and sincronizar(punto):
+                            return punto
+            accion = acciones[estado].get(tipo)
+
+        if accion is None:
+            if tipo == '$end':
+                errores.append({
+                    'message': "Error de sintaxis: fin de archivo inesperado",
+                    'token': 'EOF',
+                    'line': 0
+                })
+                return None
+            errores.append({
+                'message': f"Error de sintaxis en '{token.value}'",
+                'token': token.type,
+                'line': token.lineno
+            })
+            tipo = None
+        elif accion > 0:
+            pila.append(accion)
+            estado = accion
+            tipo = None
+        elif accion < 0:
+            produccion = producciones[-accion]
+            if produccion.len:
+                del pila[-produccion.len:]
+            estado = saltos[pila[-1]][produccion.name]
+            pila.append(estado)
+        else:
+            return None
+
+
+def _analyze_incremental(code_string, estado):
+    anterior = estado.code
+    if anterior is None:
+        inicio_cambio = fin_cambio = 0
+        k = 0
+        inicio, linea, pila, errores_previos = 0, 1, (0,), 0
+    else:
+        inicio_cambio = lexico_go.common_prefix(anterior, code_string)
+        if inicio_cambio == len(anterior) == len(code_string):
+            estado.reanalizados = 0
+            return estado.errores
+        sufijo = lexico_go.common_suffix(anterior, code_string, min(len(anterior), len(code_string)) - inicio_cambio)
+        fin_cambio = len(code_string) - sufijo
+        # Último punto en o antes del cambio (y antes de cualquier cadena o comentario sin
+        # cerrar): el código anterior a él no cambió ni se leyó más allá de él
+        limite = min(inicio_cambio, estado.contaminados[0]) if estado.contaminados else inicio_cambio
+        k = bisect_right(estado.posiciones, limite) - 1
+        inicio, linea, pila, errores_previos = estado.puntos[k]
+    desplazamiento = len(code_string) - (len(anterior) if anterior is not None else 0)
+
+    sincronizado = {}
+
+    def sincronizar(punto):
+        # Desde fin_cambio el código es el mismo que antes, desplazado
+        if anterior is None or punto[0] < fin_cambio:
+            return False
+        posicion = punto[0] - desplazamiento
+        j = bisect_right(estado.posiciones, posicion) - 1
+        if j > k and estado.posiciones[j] == posicion and estado.puntos[j][2] == punto[2]:
+            sincronizado['j'] = j
+            return True
+        return False
+
+    errores = estado.errores[:errores_previos]
+    puntos = estado.puntos[:k]
+    try:
+        contaminados = []
+        final = _drive(code_string, inicio, linea, pila, errores, puntos, contaminados, sincronizar)
+    except Exception as e:
+        errores.append({
+            'message': f"Error crítico: {str(e)}",
+            'token': 'CRITICAL',
+            'line': 0
+        })
+        estado.code = None
+        estado.puntos, estado.posiciones, estado.errores = [], [], []
+        estado.contaminados = []
+        estado.reanalizados = len(code_string)
+        return errores
+
+    if final is None:
+        estado.reanalizados = len(code_string) - inicio
+    else:
+        # El resto es el análisis anterior con las líneas y posiciones desplazadas
+        j = sincronizado['j']
+        _, linea_anterior, _, errores_anteriores = estado.puntos[j]
+        lineas = final[1] - linea_anterior
+        diferencia = final[3] - errores_anteriores
+        errores.extend(dict(error, line=error['line'] + lineas) if error['line'] else error
+                       for error in estado.errores[errores_anteriores:])
+        puntos.extend((posicion + desplazamiento, linea_punto + lineas, pila_punto, n + diferencia)
+                      for posicion, linea_punto, pila_punto, n in estado.puntos[j + 1:])
+        estado.reanalizados = final[0] - inicio
+        contaminados.extend(posicion + desplazamiento for posicion in estado.contaminados
+                            if posicion >= final[0] - desplazamiento)
+
+    estado.code = code_string
+    estado.puntos = puntos
+    estado.posiciones = [punto[0] for punto in puntos]
+    estado.errores = errores
+    estado.contaminados = contaminados
+    return errores
+
+
 # ============================================================================
 # Para usar en CLI
 # ============================================================================
@@ -499,8 +723,8 @@ def get_git_username():
     except:
         return 'usergit'
 
-def analyze_file(filename):
-    """Analiza sintácticamente un archivo de código Go."""
+def analyze_file(filename, paralelo=False):
+    """Analiza sintácticamente un archivo de código Go (con paralelo=True, repartido entre procesos)."""
     try:
         with open(filename, 'r', encoding='utf-8') as file:
             data = file.read()
@@ -511,7 +735,12 @@ def analyze_file(filename):
         print(f"Error al leer el archivo: {e}")
         return
     
-    result = analyze_syntax_string(data)
+    if paralelo:
+        import paralelo_go
+        result = paralelo_go.analyze_syntax_parallel(data)
+        paralelo_go.shutdown_executor()
+    else:
+        result = analyze_syntax_string(data)
     
     # Crear carpeta de logs si no existe
     logs_dir = 'logs'
@@ -560,8 +789,8 @@ def analyze_file(filename):
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Uso: python sintactico_go.py <archivo.go>")
+        print("Uso: python sintactico_go.py <archivo.go> [--paralelo]")
         sys.exit(1)
     
     filename = sys.argv[1]
-    analyze_file(filename)
\ No newline at end of file
+    analyze_file(filename, '--paralelo' in sys.argv[2:])
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""
+Índice de firmas de la biblioteca estándar de Go
+Las firmas de stdlib_go.txt se compilan una vez (python stdlib_go.py --generar)
+en stdlib_go.idx, un archivo binario compacto con un directorio de paquetes y una
+sección por paquete. El análisis semántico lo abre con mmap la primera vez que
+resuelve una llamada como strings.Split(...) a un paquete importado, y sólo
+decodifica la sección de ese paquete; los análisis que no llaman a la biblioteca
+estándar no lo leen.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+FUENTE = os.path.join(BACKEND_DIR, 'stdlib_go.txt')
+INDICE = os.path.join(BACKEND_DIR, 'stdlib_go.idx')
+
+# Cabecera: marca, hash de la fuente, versión del formato y número de paquetes.
+# Cada entrada del directorio: largo de la ruta, ruta, desplazamiento y largo de su sección.
+_MARCA = b'GOSTDIDX'
+_VERSION = 1
+_CABECERA = struct.Struct('<8s8sHH')
+_ENTRADA = struct.Struct('<II')
+
+_FUNCION = re.compile(r'^(\w+)\(([^)]*)\)\s*(.*)$')
+
+
+# ============================================================================
+# GENERACIÓN DEL ÍNDICE
+# ============================================================================
+
+def _param_type(tipo):
+    """Tipo de un parámetro como lo usa semantico_go ('unknown' no se comprueba)."""
+    if tipo.startswith(('[]', 'map[', '*', 'func', 'chan')) or tipo in ('any', 'interface{}'):
+        return 'unknown'
+    return tipo
+
+
+def _return_type(retorno):
+    """Tipo del retorno como lo devuelve p_tipo_retorno (y las expresiones de slice o map)."""
+    retorno = retorno.strip()
+    if not retorno:
+        return 'void'
+    if retorno.startswith('('):
+        tipos = [tipo.strip() for tipo in retorno[1:-1].split(',') if tipo.strip()]
+        if len(tipos) != 1:
+            return 'multiple'
+        retorno = tipos[0]
+    if retorno.startswith('[]'):
+        return 'slice'
+    if retorno.startswith('map['):
+        return 'map'
+    if retorno in ('any', 'interface{}'):
+        return 'unknown'
+    return retorno
+
+
+def parse_source(texto):
+    """Devuelve {ruta: {función: (params, retorno)}} a partir del texto de stdlib_go.txt."""
+    paquetes = {}
+    actual = None
+    for numero, linea in enumerate(texto.splitlines(), 1):
+        linea = linea.split('#', 1)[0].strip()
+        if not linea:
+            continue
+        if linea.startswith('[') and linea.endswith(']'):
+            actual = paquetes.setdefault(linea[1:-1], {})
+            continue
+        coincidencia = _FUNCION.match(linea)
+        if actual is None or coincidencia is None:
+            raise ValueError(f"Línea {numero} de {os.path.basename(FUENTE)} no válida: {linea}")
+        nombre, parametros, retorno = coincidencia.groups()
+        params = []
+        for tipo in (tipo.strip() for tipo in parametros.split(',') if tipo.strip()):
+            # Igual que p_parametro: un parámetro variádico se marca con '...' al final
+            params.append('...' if tipo.startswith('...') else _param_type(tipo))
+        actual[nombre] = (params, _return_type(retorno))
+    return paquetes
+
+
+def build_index(texto):
+    """Codifica las firmas del texto en el formato binario de stdlib_go.idx."""
+    paquetes = parse_source(texto)
+    secciones = []
+    for ruta in sorted(paquetes):
+        lineas = [f"{nombre}\t{','.join(params)}\t{retorno}\n"
+                  for nombre, (params, retorno) in sorted(paquetes[ruta].items())]
+        secciones.append((ruta.encode('utf-8'), ''.join(lineas).encode('utf-8')))
+
+    huella = hashlib.sha256(texto.encode('utf-8')).digest()[:8]
+    directorio = _CABECERA.size + sum(1 + len(ruta) + _ENTRADA.size for ruta, _ in secciones)
+    partes = [_CABECERA.pack(_MARCA, huella, _VERSION, len(secciones))]
+    desplazamiento = directorio
+    for ruta, seccion in secciones:
+        partes.append(bytes([len(ruta)]) + ruta + _ENTRADA.pack(desplazamiento, len(seccion)))
+        desplazamiento += len(seccion)
+    partes.extend(seccion for _, seccion in secciones)
+    return b''.join(partes)
+
+
+def generate(fuente=FUENTE, destino=INDICE):
+    """Regenera stdlib_go.idx a partir de stdlib_go.txt. Devuelve el número de paquetes."""
+    with open(fuente, 'r', encoding='utf-8') as archivo:
+        datos = build_index(archivo.read())
+    temporal = destino + '.tmp'
+    with open(temporal, 'wb') as archivo:
+        archivo.write(datos)
+    os.replace(temporal, destino)
+    return _CABECERA.unpack_from(datos)[3]
+
+
+# ============================================================================
+# LECTURA PEREZOSA
+# ============================================================================
+
+class IndiceFirmas:
+    """
+    Vista de sólo lectura sobre stdlib_go.idx. Al abrirse sólo se lee el directorio;
+    la sección de cada paquete se decodifica la primera vez que se consulta.
+    """
+
+    def __init__(self, ruta=INDICE):
+        with open(ruta, 'rb') as archivo:
+            self.datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        marca, self.huella, version, cantidad = _CABECERA.unpack_from(self.datos)
+        if marca != _MARCA or version != _VERSION:
+            raise ValueError(f"'{ruta}' no es un índice de firmas válido")
+        self.directorio = {}
+        posicion = _CABECERA.size
+        for _ in range(cantidad):
+            largo = self.datos[posicion]
+            nombre = self.datos[posicion + 1:posicion + 1 + largo].decode('utf-8')
+            posicion += 1 + largo
+            self.directorio[nombre] = _ENTRADA.unpack_from(self.datos, posicion)
+            posicion += _ENTRADA.size
+        self.paquetes = {}
+
+    def package(self, ruta):
+        """Firmas {función: (params, retorno)} del paquete, o None si no está en el índice."""
+        firmas = self.paquetes.get(ruta)
+        if firmas is None and ruta in self.directorio:
+            desplazamiento, largo = self.directorio[ruta]
+            firmas = {}
+            for linea in self.datos[desplazamiento:desplazamiento + largo].decode('utf-8').splitlines():
+                nombre, params, retorno = linea.split('\t')
+                firmas[nombre] = (params.split(',') if params else [], retorno)
+            self.paquetes[ruta] = firmas
+        return firmas
+
+
+_indice = None
+_indice_lock = threading.Lock()
+
+
+def get_index():
+    """
+    Devuelve el índice del proceso, abriéndolo la primera vez. Si falta o no
+    corresponde a stdlib_go.txt se regenera (como PLY con sus tablas).
+    """
+    global _indice
+    with _indice_lock:
+        if _indice is None:
+            try:
+                _indice = IndiceFirmas()
+                with open(FUENTE, 'rb') as archivo:
+                    vigente = hashlib.sha256(archivo.read()).digest()[:8] == _indice.huella
+            except (OSError, ValueError):
+                vigente = False
+            if not vigente:
+                generate()
+                _indice = IndiceFirmas()
+        return _indice
+
+
+def lookup(ruta, funcion):
+    """Firma (params, retorno) de ruta.funcion, o None si no está en el índice."""
+    firmas = get_index().package(ruta)
+    if firmas is None:
+        return None
+    return firmas.get(funcion)
+
+
+# ============================================================================
+# Para usar en CLI
+# ============================================================================
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--generar':
+        print(f"{generate()} paquetes escritos en {INDICE} ({os.path.getsize(INDICE)} bytes)")
+    elif len(sys.argv) == 3:
+        firma = lookup(sys.argv[1], sys.argv[2])
+        print(firma if firma is not None else 'No está en el índice')
+    else:
+        print("Uso: python stdlib_go.py --generar | python stdlib_go.py <paquete> <función>")
+        sys.exit(1)
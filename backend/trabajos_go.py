@@ -0,0 +1,249 @@
+"""
+Cola de trabajos asíncronos para el Analizador de Código Go
+Permite enviar análisis grandes sin bloquear un worker de Flask: el cliente
+recibe un identificador de trabajo y consulta su estado hasta que termina.
+Con varios procesos (workers de gunicorn) el proceso que recibe un trabajo lo
+ejecuta y guarda su estado en ANALYZER_TRABAJOS_DIR, así que cualquier proceso
+puede responder su consulta.
+Integrantes:
+- Jair Palaguachi (JairPalaguachi)
+- Javier Gutiérrez (SKEIILATT)
+- Leonardo Macías (leodamac)
+"""
+
+import os
+import pickle
+import queue
+import re
+import threading
+import time
+import uuid
+
+from limites_go import FASES, analyze_with_budget
+from bitacora_go import log_request
+
+# Configuración de la cola (modificable por variables de entorno)
+MAX_COLA_TRABAJOS = int(os.environ.get('ANALYZER_MAX_COLA', '32'))
+WORKERS_TRABAJOS = int(os.environ.get('ANALYZER_WORKERS_TRABAJOS', '2'))
+UMBRAL_SINCRONO = int(os.environ.get('ANALYZER_UMBRAL_SINCRONO', str(64 * 1024)))
+TTL_TRABAJOS = int(os.environ.get('ANALYZER_TTL_TRABAJOS', '600'))
+# Directorio compartido por los procesos de la API ('' = trabajos en la memoria de cada proceso)
+TRABAJOS_DIR = os.environ.get('ANALYZER_TRABAJOS_DIR', '')
+
+# Identificador de un trabajo (uuid4().hex); también da nombre a su archivo
+ID_TRABAJO = re.compile(r'[0-9a-f]{32}')
+
+
+class ColaLlena(Exception):
+    """La cola alcanzó su capacidad máxima; el cliente debe reintentar más tarde."""
+
+    def __init__(self, retry_after):
+        super().__init__('La cola de análisis está llena')
+        self.retry_after = retry_after
+
+
+class ColaNoDisponible(Exception):
+    """La cola fue detenida y no acepta más trabajos."""
+    pass
+
+
+class Trabajo:
+    def __init__(self, code, filename=None):
+        self.id = uuid.uuid4().hex
+        self.code = code
+        self.filename = filename
+        self.estado = 'en_cola'
+        self.progreso = {nombre: 'pendiente' for nombre, _ in FASES}
+        self.resultado = None
+        self.error = None
+        self.creado = time.time()
+        self.iniciado = None
+        self.terminado = None
+
+    def to_dict(self):
+        data = {
+            'job_id': self.id,
+            'estado': self.estado,
+            'progreso': dict(self.progreso),
+        }
+        if self.filename:
+            data['filename'] = self.filename
+        if self.resultado is not None:
+            data['resultado'] = self.resultado
+        if self.error is not None:
+            data['error'] = self.error
+        if self.terminado is not None:
+            data['duracion'] = round(self.terminado - (self.iniciado or self.creado), 4)
+        return data
+
+
+class ColaTrabajos:
+    """
+    Cola acotada con un conjunto fijo de hilos despachadores.
+    Cada hilo ejecuta su trabajo en un worker aislado con presupuesto de tiempo y memoria,
+    de modo que el análisis no compite por el GIL ni por el estado global de los parsers.
+    Con un directorio, cada cambio de estado de un trabajo se escribe en su archivo
+    (sólo lo escribe el proceso que lo ejecuta, con os.replace) y las consultas lo leen
+    de ahí; los archivos se borran TTL_TRABAJOS segundos después de su última escritura.
+    """
+
+    def __init__(self, max_cola=MAX_COLA_TRABAJOS, workers=WORKERS_TRABAJOS, ttl=TTL_TRABAJOS,
+                 directorio=TRABAJOS_DIR):
+        self.cola = queue.Queue(maxsize=max_cola)
+        self.trabajos = {}
+        self.ttl = ttl
+        self.directorio = directorio
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.activo = True
+        self.duracion_media = 1.0
+        self.hilos = []
+        for i in range(workers):
+            hilo = threading.Thread(target=self._despachar, name=f'trabajos-{i}', daemon=True)
+            hilo.start()
+            self.hilos.append(hilo)
+
+    def submit(self, code, filename=None):
+        """Encola un trabajo y lo devuelve; lanza ColaLlena si no hay espacio."""
+        if not self.activo:
+            raise ColaNoDisponible('La cola de análisis no está disponible')
+        self._limpiar()
+        trabajo = Trabajo(code, filename)
+        with self.lock:
+            self.trabajos[trabajo.id] = trabajo
+        self._save(trabajo)
+        try:
+            self.cola.put_nowait(trabajo)
+        except queue.Full:
+            with self.lock:
+                del self.trabajos[trabajo.id]
+            self._remove(trabajo.id)
+            raise ColaLlena(self.retry_after())
+        return trabajo
+
+    def get(self, job_id):
+        """Estado del trabajo (el de Trabajo.to_dict), o None si no existe o expiró."""
+        if not self.directorio:
+            with self.lock:
+                trabajo = self.trabajos.get(job_id)
+            return trabajo.to_dict() if trabajo is not None else None
+        if not ID_TRABAJO.fullmatch(job_id):
+            return None
+        try:
+            with open(self._path(job_id), 'rb') as archivo:
+                return pickle.load(archivo)
+        except FileNotFoundError:
+            return None
+
+    def _path(self, job_id):
+        return os.path.join(self.directorio, f'{job_id}.trabajo')
+
+    def _save(self, trabajo):
+        """Escribe el estado del trabajo en su archivo; sin directorio no hace nada."""
+        if not self.directorio:
+            return
+        os.makedirs(self.directorio, exist_ok=True)
+        # Cada hilo escribe su propio temporal: el despachador y la petición pueden coincidir
+        temporal = f'{self._path(trabajo.id)}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporal, 'wb') as archivo:
+            pickle.dump(trabajo.to_dict(), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, self._path(trabajo.id))
+
+    def _remove(self, job_id):
+        if self.directorio:
+            try:
+                os.remove(self._path(job_id))
+            except FileNotFoundError:
+                pass
+
+    def _progress(self, trabajo, fase, estado):
+        trabajo.progreso[fase] = estado
+        self._save(trabajo)
+
+    def retry_after(self):
+        """Segundos estimados hasta que se libere espacio en la cola."""
+        pendientes = self.cola.qsize() + self.workers
+        return max(1, int(self.duracion_media * pendientes / max(1, self.workers)))
+
+    def shutdown(self):
+        self.activo = False
+        for _ in self.hilos:
+            self.cola.put(None)
+
+    def _limpiar(self):
+        """
+        Elimina los trabajos terminados cuyo tiempo de vida expiró y, con un directorio,
+        los archivos sin escribir desde hace más de TTL_TRABAJOS segundos (también los
+        de trabajos que quedaron sin terminar porque su proceso se detuvo).
+        """
+        limite = time.time() - self.ttl
+        with self.lock:
+            expirados = [job_id for job_id, trabajo in self.trabajos.items()
+                         if trabajo.terminado is not None and trabajo.terminado < limite]
+            for job_id in expirados:
+                del self.trabajos[job_id]
+        if not self.directorio or not os.path.isdir(self.directorio):
+            return
+        for nombre in os.listdir(self.directorio):
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                if os.stat(ruta).st_mtime < limite:
+                    os.remove(ruta)
+            except FileNotFoundError:
+                pass
+
+    def _despachar(self):
+        while True:
+            trabajo = self.cola.get()
+            if trabajo is None:
+                break
+            try:
+                self._ejecutar(trabajo)
+            finally:
+                self.cola.task_done()
+
+    def _ejecutar(self, trabajo):
+        trabajo.estado = 'procesando'
+        trabajo.iniciado = time.time()
+        self._save(trabajo)
+        try:
+            resultado = analyze_with_budget(trabajo.code,
+                                            on_fase=lambda fase, estado: self._progress(trabajo, fase, estado))
+            if trabajo.filename:
+                resultado['filename'] = trabajo.filename
+                resultado['code'] = trabajo.code
+            trabajo.resultado = resultado
+            trabajo.estado = 'incompleto' if 'incompleto' in resultado else 'completado'
+        except Exception as e:
+            trabajo.error = f'Error interno del servidor: {str(e)}'
+            trabajo.estado = 'error'
+        finally:
+            trabajo.terminado = time.time()
+            duracion = trabajo.terminado - trabajo.iniciado
+            self.duracion_media = 0.8 * self.duracion_media + 0.2 * duracion
+            log_request({
+                'job_id': trabajo.id,
+                'code': trabajo.code,
+                'resultado': trabajo.estado,
+                'duracion_ms': round(duracion * 1000, 3),
+                'espera_ms': round((trabajo.iniciado - trabajo.creado) * 1000, 3),
+            }, trabajo.estado == 'completado', duracion, evento='trabajo')
+            trabajo.code = None
+            self._save(trabajo)
+            if self.directorio:
+                # El archivo es el que responde las consultas
+                with self.lock:
+                    self.trabajos.pop(trabajo.id, None)
+
+
+_cola = None
+_cola_lock = threading.Lock()
+
+
+def get_queue():
+    """Devuelve la cola compartida del proceso, creándola la primera vez."""
+    global _cola
+    with _cola_lock:
+        if _cola is None:
+            _cola = ColaTrabajos()
+        return _cola
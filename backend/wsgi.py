@@ -0,0 +1,11 @@
+"""
+Punto de entrada WSGI para el servidor de producción.
+Uso: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from analisis_go import warm_up
+from app import app
+
+# Se construyen el lexer y ambos parsers al importar este módulo: con
+# preload_app el import ocurre en el proceso maestro, antes del fork.
+warm_up()
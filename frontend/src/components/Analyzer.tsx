@@ -1,6 +1,14 @@
-import React, { useState, useRef } from 'react';
+import React, { useState, useRef, useEffect } from 'react';
 import axios from 'axios';
-import { type AnalysisResult } from '../services/types';
+import {
+  type AnalysisResult,
+  type DiferenciaSesion,
+  type RespuestaEdicion,
+  type ResultadoSesion,
+  type SimboloPosicion,
+  type Sitio
+} from '../services/types';
+import { applyDiff, textChange } from '../services/sesion';
 import './Analyzer.css';
 
 function Analyzer() {
@@ -9,8 +17,109 @@ function Analyzer() {
   const [loading, setLoading] = useState<boolean>(false);
   const [filename, setFilename] = useState<string>('');
   const [activeTab, setActiveTab] = useState<'errores' | 'tokens' | 'estructura'>('errores');
+  const [analyzedCode, setAnalyzedCode] = useState<string>('');
+  const [simbolo, setSimbolo] = useState<SimboloPosicion | null>(null);
+  const hoverTimer = useRef<number | undefined>(undefined);
   const textareaRef = useRef<HTMLTextAreaElement>(null);
   const lineNumbersRef = useRef<HTMLDivElement>(null);
+  // Análisis en vivo: sesión del servidor, último texto que aplicó y resultado de la
+  // última revisión recibida (la base de la siguiente diferencia)
+  const sesionRef = useRef<{ id: string; revision: number; texto: string; completo: boolean } | null>(null);
+  const resultadoRef = useRef<AnalysisResult | null>(null);
+  const codeRef = useRef<string>('');
+  const editTimer = useRef<number | undefined>(undefined);
+  const sincronizando = useRef<boolean>(false);
+  const pendiente = useRef<boolean>(false);
+  const generacion = useRef<number>(0);
+  // Identifica este editor ante el servidor: un análisis nuevo cancela el anterior que siga en curso
+  const editorId = useRef<string>(crypto.randomUUID?.() ?? Math.random().toString(36).slice(2));
+
+  codeRef.current = code;
+
+  // Descarta la sesión en vivo (Analizar, abrir un archivo o limpiar empiezan de cero)
+  const resetSession = () => {
+    window.clearTimeout(editTimer.current);
+    generacion.current += 1;
+    pendiente.current = false;
+    const sesion = sesionRef.current;
+    sesionRef.current = null;
+    if (sesion) axios.delete(`/api/sessions/${sesion.id}`).catch(() => undefined);
+  };
+
+  const showResults = (resultado: AnalysisResult, texto: string) => {
+    resultadoRef.current = resultado;
+    setResults(resultado);
+    setAnalyzedCode(texto);
+  };
+
+  // Envía el texto actual a la sesión (abriéndola si hace falta) y aplica la
+  // diferencia que responde. Hay una sola petición en curso: las ediciones que
+  // llegan mientras tanto se envían juntas al terminar
+  const syncSession = async () => {
+    if (sincronizando.current) {
+      pendiente.current = true;
+      return;
+    }
+    sincronizando.current = true;
+    const actual = generacion.current;
+    try {
+      do {
+        pendiente.current = false;
+        const texto = codeRef.current;
+        const sesion = sesionRef.current;
+        if (!sesion) {
+          const response = await axios.post<ResultadoSesion>('/api/sessions', { code: texto });
+          if (generacion.current !== actual) return;
+          sesionRef.current = { id: response.data.sesion, revision: response.data.revision, texto, completo: false };
+          showResults(response.data, texto);
+          continue;
+        }
+        if (texto === sesion.texto) continue;
+
+        const revision = sesion.revision + 1;
+        const cuerpo = sesion.completo
+          ? { revision, code: texto }
+          : { revision, cambios: [textChange(sesion.texto, texto)] };
+        try {
+          const response = await axios.post<RespuestaEdicion>(`/api/sessions/${sesion.id}/edits`, cuerpo);
+          if (generacion.current !== actual) return;
+          Object.assign(sesion, { revision, texto, completo: false });
+          if (response.data.sesion) {
+            showResults(response.data as unknown as ResultadoSesion, texto);
+          } else if (!response.data.reemplazada && !response.data.incompleto && resultadoRef.current) {
+            showResults(applyDiff(resultadoRef.current, response.data as DiferenciaSesion), texto);
+          }
+        } catch (error: any) {
+          if (generacion.current !== actual) return;
+          const status = error.response?.status;
+          if (status === 404) {
+            // La sesión expiró: se abre otra con el texto actual
+            sesionRef.current = null;
+          } else if (status === 409) {
+            // Revisiones desincronizadas: se reenvía el código completo
+            Object.assign(sesion, { revision: error.response.data.revision, completo: true });
+          } else {
+            sesionRef.current = null;
+            return;
+          }
+          pendiente.current = true;
+        }
+      } while (pendiente.current);
+    } catch {
+      // Sin sesión el editor sigue funcionando con el botón Analizar
+      if (generacion.current === actual) sesionRef.current = null;
+    } finally {
+      sincronizando.current = false;
+    }
+  };
+
+  // Con un resultado en pantalla, cada edición se analiza en vivo tras una pausa
+  useEffect(() => {
+    if (!resultadoRef.current || code === (sesionRef.current?.texto ?? analyzedCode)) return;
+    window.clearTimeout(editTimer.current);
+    editTimer.current = window.setTimeout(syncSession, 300);
+    return () => window.clearTimeout(editTimer.current);
+  }, [code]);
 
   const analyzeCode = async () => {
     if (!code.trim()) {
@@ -18,14 +127,20 @@ function Analyzer() {
       return;
     }
 
+    resetSession();
     setLoading(true);
     try {
       const response = await axios.post<AnalysisResult>('/api/analyze', {
         code: code
+      }, {
+        headers: { 'X-Editor-ID': editorId.current }
       });
-      setResults(response.data);
+      showResults(response.data, code);
+      setSimbolo(null);
       setFilename('');
     } catch (error: any) {
+      // Lo reemplazó un análisis más nuevo de este editor, que muestra su resultado
+      if (error.response?.data?.cancelado) return;
       alert('Error al analizar el código: ' + (error.response?.data?.error || error.message));
     }
     setLoading(false);
@@ -40,6 +155,7 @@ function Analyzer() {
       return;
     }
 
+    resetSession();
     setLoading(true);
     try {
       const formData = new FormData();
@@ -49,14 +165,16 @@ function Analyzer() {
         '/api/analyze-file',
         formData,
         {
-          headers: { 'Content-Type': 'multipart/form-data' }
+          headers: { 'Content-Type': 'multipart/form-data', 'X-Editor-ID': editorId.current }
         }
       );
 
-      setResults(response.data);
       setCode(response.data.code || '');
+      showResults(response.data, response.data.code || '');
+      setSimbolo(null);
       setFilename(response.data.filename || '');
     } catch (error: any) {
+      if (error.response?.data?.cancelado) return;
       alert('Error al analizar el archivo: ' + (error.response?.data?.error || error.message));
     }
     setLoading(false);
@@ -78,6 +196,8 @@ function Analyzer() {
   };
 
   const clearEditor = () => {
+    resetSession();
+    resultadoRef.current = null;
     setCode('');
     setResults(null);
     setFilename('');
@@ -93,6 +213,84 @@ function Analyzer() {
     );
   };
 
+  // Línea y columna (desde 1, como el lexer) del cursor en el editor
+  const caretPosition = (): { line: number; column: number } | null => {
+    const textarea = textareaRef.current;
+    if (!textarea) return null;
+    const offset = textarea.selectionStart;
+    const anteriores = code.slice(0, offset).split('\n');
+    let column = anteriores[anteriores.length - 1].length + 1;
+    // Con el cursor justo detrás de un nombre se consulta su última letra
+    if (!/\w/.test(code.charAt(offset)) && /\w/.test(code.charAt(offset - 1))) {
+      column -= 1;
+    }
+    return { line: anteriores.length, column };
+  };
+
+  // Consulta por posición sobre el último análisis; si el servidor ya no lo tiene
+  // guardado (404) se repite enviando el código
+  const positionQuery = async <T,>(ruta: string, line: number, column: number): Promise<T> => {
+    try {
+      const response = await axios.post<T>(ruta, { clave: results?.clave, line, column });
+      return response.data;
+    } catch (error: any) {
+      if (error.response?.status !== 404) throw error;
+      const response = await axios.post<T>(ruta, { code: analyzedCode, line, column });
+      return response.data;
+    }
+  };
+
+  const selectSite = (sitio: Sitio) => {
+    const textarea = textareaRef.current;
+    if (!textarea) return;
+    const lineas = code.split('\n');
+    let offset = 0;
+    for (let i = 0; i < sitio.line - 1 && i < lineas.length; i++) {
+      offset += lineas[i].length + 1;
+    }
+    textarea.focus();
+    textarea.setSelectionRange(offset + sitio.column - 1, offset + sitio.end_column - 1);
+  };
+
+  // Hover sobre el símbolo del cursor (el editor es un textarea: no hay posición del ratón)
+  const handleCaret = () => {
+    window.clearTimeout(hoverTimer.current);
+    if (!results?.clave || code !== analyzedCode) {
+      setSimbolo(null);
+      return;
+    }
+    const posicion = caretPosition();
+    if (!posicion) return;
+    hoverTimer.current = window.setTimeout(async () => {
+      try {
+        const data = await positionQuery<{ simbolo: SimboloPosicion | null }>(
+          '/api/hover', posicion.line, posicion.column
+        );
+        setSimbolo(data.simbolo);
+      } catch {
+        setSimbolo(null);
+      }
+    }, 150);
+  };
+
+  // Ctrl/Cmd + clic: ir a la definición
+  const handleEditorClick = async (event: React.MouseEvent<HTMLTextAreaElement>) => {
+    if (!(event.ctrlKey || event.metaKey) || !results?.clave || code !== analyzedCode) {
+      handleCaret();
+      return;
+    }
+    const posicion = caretPosition();
+    if (!posicion) return;
+    try {
+      const data = await positionQuery<{ definicion: Sitio | null }>(
+        '/api/definition', posicion.line, posicion.column
+      );
+      if (data.definicion) selectSite(data.definicion);
+    } catch (error: any) {
+      alert('Error al buscar la definición: ' + (error.response?.data?.error || error.message));
+    }
+  };
+
   const handleScroll = () => {
     if (lineNumbersRef.current && textareaRef.current) {
       lineNumbersRef.current.scrollTop = textareaRef.current.scrollTop;
@@ -164,12 +362,30 @@ function Analyzer() {
               value={code}
               onChange={(e) => setCode(e.target.value)}
               onScroll={handleScroll}
+              onClick={handleEditorClick}
+              onKeyUp={handleCaret}
               wrap="off"                       
               placeholder="// Escribe o pega tu código Go aquí&#10;package main&#10;&#10;import &quot;fmt&quot;&#10;&#10;func main() {&#10;    fmt.Println(&quot;Hola, mundo!&quot;)&#10;}"
               disabled={loading}
               spellCheck={false}
             />
           </div>
+          {simbolo && (
+            <div className="hover-info">
+              <code>
+                {simbolo.is_const ? 'const ' : ''}{simbolo.name}
+                {simbolo.type === 'func'
+                  ? `(${simbolo.params.join(', ')}) ${simbolo.return_type ?? ''}`
+                  : ` ${simbolo.type}`}
+              </code>
+              <span>
+                {simbolo.scope ? `ámbito ${simbolo.scope} · ` : ''}
+                {simbolo.definition
+                  ? `declarado en la línea ${simbolo.definition.line}`
+                  : 'declarado fuera de este archivo'}
+              </span>
+            </div>
+          )}
         </div>
 
        
@@ -0,0 +1,79 @@
+import {
+  type AnalysisResult,
+  type CambioTexto,
+  type DiferenciaSesion,
+  type Scope,
+  type SimboloNivel,
+  type Tramo
+} from './types';
+
+// Inverso de sesiones_go.splice: los elementos de anterior[fin:] se desplazan
+// en lineas (la línea 0, fin de archivo, no se desplaza)
+function applySplice<T extends { line: number }>(anterior: T[], tramo: Tramo<T>, lineas: number): T[] {
+  let sufijo = anterior.slice(tramo.fin);
+  if (lineas) {
+    sufijo = sufijo.map((elemento) => (elemento.line ? { ...elemento, line: elemento.line + lineas } : elemento));
+  }
+  return anterior.slice(0, tramo.inicio).concat(tramo.nuevos, sufijo);
+}
+
+function flattenSymbols(tabla: Scope[]): SimboloNivel[] {
+  return tabla.flatMap((ambito) => ambito.symbols.map((simbolo) => ({ ...simbolo, level: ambito.level })));
+}
+
+function groupSymbols(simbolos: SimboloNivel[]): Scope[] {
+  const tabla: Scope[] = [];
+  for (const { level, ...simbolo } of simbolos) {
+    if (tabla.length === 0 || tabla[tabla.length - 1].level !== level) {
+      tabla.push({ level, symbols: [] });
+    }
+    tabla[tabla.length - 1].symbols.push(simbolo);
+  }
+  return tabla;
+}
+
+// Resultado de la revisión de la diferencia a partir del de su revisión base
+export function applyDiff(resultado: AnalysisResult, diferencia: DiferenciaSesion): AnalysisResult {
+  const lineas = diferencia.lineas;
+  return {
+    ...resultado,
+    lexico: {
+      tokens: applySplice(resultado.lexico.tokens, diferencia.lexico.tokens, lineas),
+      errores: applySplice(resultado.lexico.errores, diferencia.lexico.errores, lineas)
+    },
+    sintactico: {
+      errores: applySplice(resultado.sintactico.errores, diferencia.sintactico.errores, lineas)
+    },
+    semantico: {
+      errores: applySplice(resultado.semantico.errores, diferencia.semantico.errores, lineas),
+      tabla_simbolos: groupSymbols(
+        applySplice(flattenSymbols(resultado.semantico.tabla_simbolos), diferencia.semantico.tabla_simbolos, lineas)
+      )
+    },
+    clave: diferencia.clave
+  };
+}
+
+const esAlto = (texto: string, i: number) => /[\uD800-\uDBFF]/.test(texto.charAt(i));
+const esBajo = (texto: string, i: number) => /[\uDC00-\uDFFF]/.test(texto.charAt(i));
+
+// La edición entre dos textos como un solo reemplazo; los índices de los strings
+// de JavaScript ya son unidades UTF-16, como las que espera el servidor
+export function textChange(anterior: string, nuevo: string): CambioTexto {
+  const limite = Math.min(anterior.length, nuevo.length);
+  let desde = 0;
+  while (desde < limite && anterior.charCodeAt(desde) === nuevo.charCodeAt(desde)) desde++;
+  // Un cambio no empieza ni termina en medio de un par sustituto
+  if (desde > 0 && esAlto(anterior, desde - 1)) desde--;
+  let sufijo = 0;
+  while (
+    sufijo < limite - desde &&
+    anterior.charCodeAt(anterior.length - 1 - sufijo) === nuevo.charCodeAt(nuevo.length - 1 - sufijo)
+  ) sufijo++;
+  if (sufijo > 0 && esBajo(anterior, anterior.length - sufijo)) sufijo--;
+  return {
+    desde,
+    hasta: anterior.length - sufijo,
+    texto: nuevo.slice(desde, nuevo.length - sufijo)
+  };
+}
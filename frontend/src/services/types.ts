@@ -41,4 +41,68 @@ export interface AnalysisResult {
   };
   filename?: string;
   code?: string;
-}
\ No newline at end of file
+  clave?: string;
+}
+
+export interface Sitio {
+  name: string;
+  line: number;
+  column: number;
+  end_column: number;
+}
+
+export interface SimboloPosicion extends Sitio {
+  type: string;
+  scope: string | null;
+  is_const: boolean;
+  return_type: string | null;
+  params: string[];
+  definition: Sitio | null;
+}
+export interface CambioTexto {
+  desde: number;
+  hasta: number;
+  texto: string;
+}
+
+export interface Tramo<T> {
+  inicio: number;
+  fin: number;
+  nuevos: T[];
+}
+
+export interface SimboloNivel extends Symbol {
+  level: number;
+}
+
+export interface DiferenciaSesion {
+  base: number;
+  lineas: number;
+  revision: number;
+  clave: string;
+  lexico: {
+    tokens: Tramo<Token>;
+    errores: Tramo<Error>;
+  };
+  sintactico: {
+    errores: Tramo<Error>;
+  };
+  semantico: {
+    errores: Tramo<Error>;
+    tabla_simbolos: Tramo<SimboloNivel>;
+  };
+}
+
+export interface RespuestaEdicion extends Partial<DiferenciaSesion> {
+  revision: number;
+  reemplazada?: boolean;
+  // El análisis superó su presupuesto; la siguiente diferencia sigue siendo contra el último resultado
+  incompleto?: { fase: string | null; motivo: string; mensaje: string };
+  // Sin ningún resultado enviado antes (el primero quedó incompleto) llega el resultado completo
+  sesion?: string;
+}
+
+export interface ResultadoSesion extends AnalysisResult {
+  sesion: string;
+  revision: number;
+}